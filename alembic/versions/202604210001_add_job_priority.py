@@ -0,0 +1,52 @@
+"""Add job priority for per-type claim ordering.
+
+Revision ID: 202604210001
+Revises: 202604200001
+Create Date: 2026-04-21 00:01:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "202604210001"
+down_revision: str | Sequence[str] | None = "202604200001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_HIGH_PRIORITY_JOB_TYPES = (
+    "candidate_completed_notification",
+    "winoe_report_ready_notification",
+    "day_close_finalize_text",
+    "day_close_enforcement",
+)
+_LOW_PRIORITY_JOB_TYPES = (
+    "media_retention_purge",
+    "workspace_cleanup",
+    "trial_cleanup",
+)
+
+
+def _backfill_priority(priority: int, job_types: tuple[str, ...]) -> None:
+    jobs = sa.table("jobs", sa.column("job_type"), sa.column("priority"))
+    op.get_bind().execute(
+        jobs.update().where(jobs.c.job_type.in_(job_types)).values(priority=priority)
+    )
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("jobs") as batch_op:
+        batch_op.add_column(
+            sa.Column("priority", sa.Integer(), nullable=False, server_default="0")
+        )
+    _backfill_priority(100, _HIGH_PRIORITY_JOB_TYPES)
+    _backfill_priority(-100, _LOW_PRIORITY_JOB_TYPES)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("jobs") as batch_op:
+        batch_op.drop_column("priority")
@@ -0,0 +1,89 @@
+"""Add perf profile sessions for admin-armed sampling profiles.
+
+Revision ID: 202604220001
+Revises: 202604210001
+Create Date: 2026-04-22 00:01:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "202604220001"
+down_revision: str | Sequence[str] | None = "202604210001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE_NAME = "perf_profile_sessions"
+_INDEX_NAME = "ix_perf_profile_sessions_status_expires"
+
+
+def _has_table(table_name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table_name)
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    indexes = sa.inspect(op.get_bind()).get_indexes(table_name)
+    return any(index.get("name") == index_name for index in indexes)
+
+
+def upgrade() -> None:
+    if not _has_table(_TABLE_NAME):
+        op.create_table(
+            _TABLE_NAME,
+            sa.Column("id", sa.String(length=36), nullable=False),
+            sa.Column("target_kind", sa.String(length=16), nullable=False),
+            sa.Column("target", sa.String(length=255), nullable=False),
+            sa.Column("method", sa.String(length=16), nullable=True),
+            sa.Column("requested_count", sa.Integer(), nullable=False),
+            sa.Column(
+                "claimed_count", sa.Integer(), nullable=False, server_default="0"
+            ),
+            sa.Column(
+                "captured_count", sa.Integer(), nullable=False, server_default="0"
+            ),
+            sa.Column("interval_ms", sa.Integer(), nullable=False),
+            sa.Column(
+                "status",
+                sa.String(length=16),
+                nullable=False,
+                server_default=sa.text("'armed'"),
+            ),
+            sa.Column("sample_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column(
+                "collapsed_stacks",
+                sa.Text(),
+                nullable=False,
+                server_default=sa.text("''"),
+            ),
+            sa.Column("created_by", sa.String(length=255), nullable=True),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                nullable=False,
+                server_default=sa.func.now(),
+            ),
+            sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+    if not _has_index(_TABLE_NAME, _INDEX_NAME):
+        op.create_index(
+            _INDEX_NAME,
+            _TABLE_NAME,
+            ["status", "expires_at"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    if not _has_table(_TABLE_NAME):
+        return
+    if _has_index(_TABLE_NAME, _INDEX_NAME):
+        op.drop_index(_INDEX_NAME, table_name=_TABLE_NAME)
+    op.drop_table(_TABLE_NAME)
@@ -0,0 +1,89 @@
+"""Add the submission test-results preview and keyset index.
+
+Revision ID: 202604230001
+Revises: 202604220001
+Create Date: 2026-04-23 00:01:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "202604230001"
+down_revision: str | Sequence[str] | None = "202604220001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE_NAME = "submissions"
+_COLUMN_NAME = "test_results_preview"
+_INDEX_NAME = "ix_submissions_submitted_at_id"
+_BACKFILL_BATCH_SIZE = 500
+
+
+def _has_column(table_name: str, column_name: str) -> bool:
+    columns = sa.inspect(op.get_bind()).get_columns(table_name)
+    return any(column.get("name") == column_name for column in columns)
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    indexes = sa.inspect(op.get_bind()).get_indexes(table_name)
+    return any(index.get("name") == index_name for index in indexes)
+
+
+def _backfill_previews() -> None:
+    from app.submissions.presentation.submissions_presentation_submissions_test_results_preview_utils import (
+        build_test_results_preview,
+    )
+
+    bind = op.get_bind()
+    submissions = sa.table(
+        _TABLE_NAME,
+        sa.column("id", sa.Integer),
+        sa.column("test_output", sa.Text),
+        sa.column(_COLUMN_NAME, sa.Text),
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(submissions.c.id, submissions.c.test_output)
+            .where(
+                submissions.c.id > last_id,
+                submissions.c.test_output.is_not(None),
+            )
+            .order_by(submissions.c.id)
+            .limit(_BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        bind.execute(
+            sa.update(submissions)
+            .where(submissions.c.id == sa.bindparam("row_id"))
+            .values({_COLUMN_NAME: sa.bindparam("preview")}),
+            [
+                {
+                    "row_id": row.id,
+                    "preview": build_test_results_preview(row.test_output),
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    if not _has_column(_TABLE_NAME, _COLUMN_NAME):
+        op.add_column(_TABLE_NAME, sa.Column(_COLUMN_NAME, sa.Text(), nullable=True))
+        _backfill_previews()
+    if not _has_index(_TABLE_NAME, _INDEX_NAME):
+        op.create_index(_INDEX_NAME, _TABLE_NAME, ["submitted_at", "id"], unique=False)
+
+
+def downgrade() -> None:
+    if _has_index(_TABLE_NAME, _INDEX_NAME):
+        op.drop_index(_INDEX_NAME, table_name=_TABLE_NAME)
+    if _has_column(_TABLE_NAME, _COLUMN_NAME):
+        op.drop_column(_TABLE_NAME, _COLUMN_NAME)
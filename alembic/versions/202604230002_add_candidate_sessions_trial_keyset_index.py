@@ -0,0 +1,37 @@
+"""Add the candidate sessions (trial_id, id) keyset index.
+
+Revision ID: 202604230002
+Revises: 202604230001
+Create Date: 2026-04-23 00:02:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "202604230002"
+down_revision: str | Sequence[str] | None = "202604230001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE_NAME = "candidate_sessions"
+_INDEX_NAME = "ix_candidate_sessions_trial_id_id"
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    indexes = sa.inspect(op.get_bind()).get_indexes(table_name)
+    return any(index.get("name") == index_name for index in indexes)
+
+
+def upgrade() -> None:
+    if not _has_index(_TABLE_NAME, _INDEX_NAME):
+        op.create_index(_INDEX_NAME, _TABLE_NAME, ["trial_id", "id"], unique=False)
+
+
+def downgrade() -> None:
+    if _has_index(_TABLE_NAME, _INDEX_NAME):
+        op.drop_index(_INDEX_NAME, table_name=_TABLE_NAME)
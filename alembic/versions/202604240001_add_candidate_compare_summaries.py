@@ -0,0 +1,72 @@
+"""Add the candidate compare summaries read model.
+
+Revision ID: 202604240001
+Revises: 202604230002
+Create Date: 2026-04-24 00:01:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "202604240001"
+down_revision: str | Sequence[str] | None = "202604230002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE_NAME = "candidate_compare_summaries"
+_INDEX_NAME = "ix_candidate_compare_summaries_trial_report_status"
+
+
+def _has_table(table_name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table_name)
+
+
+def _backfill() -> None:
+    from app.trials.services.trials_services_trials_candidates_compare_read_model_service import (
+        refresh_compare_summaries,
+    )
+
+    bind = op.get_bind()
+    session_ids = bind.execute(sa.text("SELECT id FROM candidate_sessions")).scalars()
+    refresh_compare_summaries(bind, list(session_ids))
+
+
+def upgrade() -> None:
+    if _has_table(_TABLE_NAME):
+        return
+    op.create_table(
+        _TABLE_NAME,
+        sa.Column("candidate_session_id", sa.Integer(), nullable=False),
+        sa.Column("trial_id", sa.Integer(), nullable=False),
+        sa.Column("candidate_name", sa.String(length=255), nullable=True),
+        sa.Column("status", sa.String(length=32), nullable=False),
+        sa.Column("winoe_report_status", sa.String(length=32), nullable=False),
+        sa.Column("overall_winoe_score", sa.Float(), nullable=True),
+        sa.Column("recommendation", sa.String(length=32), nullable=True),
+        sa.Column("day_completion", sa.JSON(), nullable=False),
+        sa.Column("activity_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["candidate_session_id"], ["candidate_sessions.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["trial_id"], ["trials.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("candidate_session_id"),
+    )
+    op.create_index(
+        _INDEX_NAME,
+        _TABLE_NAME,
+        ["trial_id", "winoe_report_status", "candidate_session_id"],
+        unique=False,
+    )
+    _backfill()
+
+
+def downgrade() -> None:
+    if _has_table(_TABLE_NAME):
+        op.drop_index(_INDEX_NAME, table_name=_TABLE_NAME)
+        op.drop_table(_TABLE_NAME)
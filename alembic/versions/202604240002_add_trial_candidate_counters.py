@@ -0,0 +1,71 @@
+"""Add per-trial candidate counters for the trial list.
+
+Revision ID: 202604240002
+Revises: 202604240001
+Create Date: 2026-04-24 00:02:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "202604240002"
+down_revision: str | Sequence[str] | None = "202604240001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE_NAME = "trial_candidate_counters"
+_TRIALS_INDEX_NAME = "ix_trials_created_by_created_at"
+
+
+def _has_table(table_name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table_name)
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    indexes = sa.inspect(op.get_bind()).get_indexes(table_name)
+    return any(index.get("name") == index_name for index in indexes)
+
+
+def _backfill() -> None:
+    from app.trials.services.trials_services_trials_candidate_counters_service import (
+        refresh_trial_candidate_counters,
+    )
+
+    bind = op.get_bind()
+    trial_ids = bind.execute(sa.text("SELECT id FROM trials")).scalars()
+    refresh_trial_candidate_counters(bind, list(trial_ids))
+
+
+def upgrade() -> None:
+    if not _has_index("trials", _TRIALS_INDEX_NAME):
+        op.create_index(
+            _TRIALS_INDEX_NAME, "trials", ["created_by", "created_at"], unique=False
+        )
+    if _has_table(_TABLE_NAME):
+        return
+    op.create_table(
+        _TABLE_NAME,
+        sa.Column("trial_id", sa.Integer(), nullable=False),
+        sa.Column("invited_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("started_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("completed_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "report_ready_count", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["trial_id"], ["trials.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("trial_id"),
+    )
+    _backfill()
+
+
+def downgrade() -> None:
+    if _has_table(_TABLE_NAME):
+        op.drop_table(_TABLE_NAME)
+    if _has_index("trials", _TRIALS_INDEX_NAME):
+        op.drop_index(_TRIALS_INDEX_NAME, table_name="trials")
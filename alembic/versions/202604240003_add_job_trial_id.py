@@ -0,0 +1,122 @@
+"""Add jobs.trial_id with a partial dead-letter index.
+
+Revision ID: 202604240003
+Revises: 202604240002
+Create Date: 2026-04-24 00:03:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "202604240003"
+down_revision: str | Sequence[str] | None = "202604240002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE_NAME = "jobs"
+_COLUMN_NAME = "trial_id"
+_INDEX_NAME = "ix_jobs_trial_dead_letter"
+_BACKFILL_BATCH_SIZE = 1000
+
+
+def _has_column(table_name: str, column_name: str) -> bool:
+    columns = sa.inspect(op.get_bind()).get_columns(table_name)
+    return any(column.get("name") == column_name for column in columns)
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    indexes = sa.inspect(op.get_bind()).get_indexes(table_name)
+    return any(index.get("name") == index_name for index in indexes)
+
+
+def _backfill_from_metadata(jobs: sa.TableClause) -> None:
+    from app.shared.jobs.repositories.shared_jobs_repositories_models_repository import (
+        trial_id_from_job_metadata,
+    )
+
+    bind = op.get_bind()
+    last_id = ""
+    while True:
+        rows = bind.execute(
+            sa.select(jobs.c.id, jobs.c.payload_json, jobs.c.correlation_id)
+            .where(jobs.c.id > last_id)
+            .order_by(jobs.c.id)
+            .limit(_BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        updates = [
+            {"row_id": row.id, "scoped_trial_id": trial_id}
+            for row in rows
+            if (
+                trial_id := trial_id_from_job_metadata(
+                    row.payload_json, row.correlation_id
+                )
+            )
+            is not None
+        ]
+        if updates:
+            bind.execute(
+                sa.update(jobs)
+                .where(jobs.c.id == sa.bindparam("row_id"))
+                .values({_COLUMN_NAME: sa.bindparam("scoped_trial_id")}),
+                updates,
+            )
+        last_id = rows[-1].id
+
+
+def _backfill_from_candidate_sessions(jobs: sa.TableClause) -> None:
+    candidate_sessions = sa.table(
+        "candidate_sessions", sa.column("id"), sa.column("trial_id")
+    )
+    op.get_bind().execute(
+        sa.update(jobs)
+        .where(
+            jobs.c.trial_id.is_(None),
+            jobs.c.candidate_session_id.is_not(None),
+        )
+        .values(
+            trial_id=sa.select(candidate_sessions.c.trial_id)
+            .where(candidate_sessions.c.id == jobs.c.candidate_session_id)
+            .scalar_subquery()
+        )
+    )
+
+
+def upgrade() -> None:
+    if not _has_column(_TABLE_NAME, _COLUMN_NAME):
+        with op.batch_alter_table(_TABLE_NAME) as batch_op:
+            batch_op.add_column(sa.Column(_COLUMN_NAME, sa.Integer(), nullable=True))
+        jobs = sa.table(
+            _TABLE_NAME,
+            sa.column("id", sa.String),
+            sa.column("payload_json", sa.JSON),
+            sa.column("correlation_id", sa.String),
+            sa.column("candidate_session_id", sa.Integer),
+            sa.column(_COLUMN_NAME, sa.Integer),
+        )
+        _backfill_from_metadata(jobs)
+        _backfill_from_candidate_sessions(jobs)
+    if not _has_index(_TABLE_NAME, _INDEX_NAME):
+        dead_letter = sa.text("status = 'dead_letter'")
+        op.create_index(
+            _INDEX_NAME,
+            _TABLE_NAME,
+            ["trial_id", "company_id", "updated_at", "created_at"],
+            unique=False,
+            postgresql_where=dead_letter,
+            sqlite_where=dead_letter,
+        )
+
+
+def downgrade() -> None:
+    if _has_index(_TABLE_NAME, _INDEX_NAME):
+        op.drop_index(_INDEX_NAME, table_name=_TABLE_NAME)
+    if _has_column(_TABLE_NAME, _COLUMN_NAME):
+        with op.batch_alter_table(_TABLE_NAME) as batch_op:
+            batch_op.drop_column(_COLUMN_NAME)
@@ -0,0 +1,45 @@
+"""Add a partial index for finished-job throughput counts.
+
+Revision ID: 202604240004
+Revises: 202604240003
+Create Date: 2026-04-24 00:04:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "202604240004"
+down_revision: str | Sequence[str] | None = "202604240003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE_NAME = "jobs"
+_INDEX_NAME = "ix_jobs_finished_status_updated"
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    indexes = sa.inspect(op.get_bind()).get_indexes(table_name)
+    return any(index.get("name") == index_name for index in indexes)
+
+
+def upgrade() -> None:
+    if not _has_index(_TABLE_NAME, _INDEX_NAME):
+        finished = sa.text("status IN ('succeeded', 'dead_letter')")
+        op.create_index(
+            _INDEX_NAME,
+            _TABLE_NAME,
+            ["status", "updated_at", "job_type"],
+            unique=False,
+            postgresql_where=finished,
+            sqlite_where=finished,
+        )
+
+
+def downgrade() -> None:
+    if _has_index(_TABLE_NAME, _INDEX_NAME):
+        op.drop_index(_INDEX_NAME, table_name=_TABLE_NAME)
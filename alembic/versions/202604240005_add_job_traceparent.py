@@ -0,0 +1,48 @@
+"""Add jobs.traceparent for the enqueuing request's trace.
+
+Revision ID: 202604240005
+Revises: 202604240004
+Create Date: 2026-04-24 00:05:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "202604240005"
+down_revision: str | Sequence[str] | None = "202604240004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE_NAME = "jobs"
+_COLUMN_NAME = "traceparent"
+
+
+def _has_column(table_name: str, column_name: str) -> bool:
+    columns = sa.inspect(op.get_bind()).get_columns(table_name)
+    return any(column.get("name") == column_name for column in columns)
+
+
+def upgrade() -> None:
+    if not _has_column(_TABLE_NAME, _COLUMN_NAME):
+        op.add_column(
+            _TABLE_NAME,
+            sa.Column(_COLUMN_NAME, sa.String(length=55), nullable=True),
+        )
+    # Jobs enqueued without a correlation id briefly stored the enqueuing
+    # traceparent there; move those to the new column.
+    op.execute(
+        sa.text(
+            "UPDATE jobs SET traceparent = correlation_id, correlation_id = NULL "
+            "WHERE correlation_id LIKE '00-%' AND length(correlation_id) = 55"
+        )
+    )
+
+
+def downgrade() -> None:
+    if _has_column(_TABLE_NAME, _COLUMN_NAME):
+        op.drop_column(_TABLE_NAME, _COLUMN_NAME)
@@ -4,15 +4,29 @@ from __future__ import annotations
 
 import json
 import re
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
 from pydantic import BaseModel
 
+from app.shared.utils import shared_utils_perf_utils as perf
+
 
 class AIProviderExecutionError(RuntimeError):
     """Raised when an upstream AI provider call fails or returns invalid output."""
 
 
+@contextmanager
+def _provider_wait(provider: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        perf.record_external_wait(provider, (time.perf_counter() - started) * 1000.0)
+
+
 def api_key_configured(api_key: str | None) -> bool:
     """Return whether an API key is present and not just a placeholder."""
     normalized = (api_key or "").strip()
@@ -115,9 +129,10 @@ def _call_openai_prompt_json(
         request_kwargs["text"] = {"verbosity": verbosity}
     if temperature is not None:
         request_kwargs["temperature"] = temperature
-    response = client.responses.create(
-        **request_kwargs,
-    )
+    with _provider_wait("openai"):
+        response = client.responses.create(
+            **request_kwargs,
+        )
     output_text = getattr(response, "output_text", None)
     if not isinstance(output_text, str) or not output_text.strip():
         raise AIProviderExecutionError("openai_empty_structured_output")
@@ -190,7 +205,8 @@ def call_openai_json_schema(
     if temperature is not None:
         request_kwargs["temperature"] = temperature
     try:
-        response = client.responses.create(**request_kwargs)
+        with _provider_wait("openai"):
+            response = client.responses.create(**request_kwargs)
     except Exception as exc:  # pragma: no cover - network/provider variability
         if _openai_schema_validation_error(exc):
             try:
@@ -256,28 +272,30 @@ def call_anthropic_json(
         max_retries=max_retries,
     )
     try:
-        response = client.messages.create(
-            model=model,
-            max_tokens=max_tokens,
-            system=system_prompt.strip(),
-            tools=[
-                {
-                    "name": response_model.__name__,
-                    "description": "Return the structured response payload.",
-                    "input_schema": tool_schema,
-                }
-            ],
-            tool_choice={"type": "tool", "name": response_model.__name__},
-            messages=[{"role": "user", "content": user_prompt}],
-        )
-    except Exception:  # pragma: no cover - network/provider variability
-        try:
+        with _provider_wait("anthropic"):
             response = client.messages.create(
                 model=model,
                 max_tokens=max_tokens,
-                system=system_text,
+                system=system_prompt.strip(),
+                tools=[
+                    {
+                        "name": response_model.__name__,
+                        "description": "Return the structured response payload.",
+                        "input_schema": tool_schema,
+                    }
+                ],
+                tool_choice={"type": "tool", "name": response_model.__name__},
                 messages=[{"role": "user", "content": user_prompt}],
             )
+    except Exception:  # pragma: no cover - network/provider variability
+        try:
+            with _provider_wait("anthropic"):
+                response = client.messages.create(
+                    model=model,
+                    max_tokens=max_tokens,
+                    system=system_text,
+                    messages=[{"role": "user", "content": user_prompt}],
+                )
         except (
             Exception
         ) as fallback_exc:  # pragma: no cover - network/provider variability
@@ -36,6 +36,7 @@ class CandidateSession(Base):
             func.lower(column("invite_email")),
             unique=True,
         ),
+        Index("ix_candidate_sessions_trial_id_id", "trial_id", "id"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -13,6 +13,29 @@ class DatabaseSettings(BaseSettings):
 
     DATABASE_URL: str = Field(default="")
     DATABASE_URL_SYNC: str = Field(default="")
+    # Optional streaming replica for read-only routes (empty = primary only).
+    DATABASE_READ_URL: str = Field(default="")
+    DB_READ_MAX_LAG_SECONDS: float = 5.0
+    DB_READ_LAG_CHECK_SECONDS: float = 2.0
+    DB_READ_YOUR_WRITES_SECONDS: float = 10.0
+    # Pool/engine tuning, per process role (see ``PROCESS_ROLE``).
+    DB_API_POOL_SIZE: int = 10
+    DB_API_MAX_OVERFLOW: int = 10
+    DB_API_POOL_TIMEOUT_SECONDS: float = 10.0
+    DB_API_POOL_RECYCLE_SECONDS: int = 1800
+    DB_API_POOL_PRE_PING: str = "idle"
+    DB_API_STATEMENT_CACHE_SIZE: int = 100
+    DB_API_STATEMENT_TIMEOUT_MS: int = 30_000
+    DB_API_RELEASE_IDLE_CONNECTIONS: bool = True
+    DB_WORKER_POOL_SIZE: int = 5
+    DB_WORKER_MAX_OVERFLOW: int = 5
+    DB_WORKER_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_WORKER_POOL_RECYCLE_SECONDS: int = 1800
+    DB_WORKER_POOL_PRE_PING: str = "idle"
+    DB_WORKER_STATEMENT_CACHE_SIZE: int = 100
+    DB_WORKER_STATEMENT_TIMEOUT_MS: int = 300_000
+    DB_WORKER_RELEASE_IDLE_CONNECTIONS: bool = False
+    DB_POOL_PRE_PING_IDLE_SECONDS: float = 30.0
 
     model_config = SettingsConfigDict(extra="ignore", env_prefix="WINOE_")
 
@@ -28,3 +51,11 @@ class DatabaseSettings(BaseSettings):
     def async_url(self) -> str:
         """Async DSN for SQLAlchemy async engine (asyncpg)."""
         return to_async_url(self.sync_url)
+
+    @property
+    def read_async_url(self) -> str | None:
+        """Async DSN for the read replica, or ``None`` when not configured."""
+        url = (self.DATABASE_READ_URL or "").strip()
+        if not url:
+            return None
+        return to_async_url(normalize_sync_url(url))
@@ -6,7 +6,34 @@ import os
 from collections.abc import Iterable
 
 _SECTIONS: dict[str, tuple[list[str], str]] = {
-    "database": (["DATABASE_URL", "DATABASE_URL_SYNC"], "WINOE_"),
+    "database": (
+        [
+            "DATABASE_URL",
+            "DATABASE_URL_SYNC",
+            "DATABASE_READ_URL",
+            "DB_READ_MAX_LAG_SECONDS",
+            "DB_READ_LAG_CHECK_SECONDS",
+            "DB_READ_YOUR_WRITES_SECONDS",
+            "DB_API_POOL_SIZE",
+            "DB_API_MAX_OVERFLOW",
+            "DB_API_POOL_TIMEOUT_SECONDS",
+            "DB_API_POOL_RECYCLE_SECONDS",
+            "DB_API_POOL_PRE_PING",
+            "DB_API_STATEMENT_CACHE_SIZE",
+            "DB_API_STATEMENT_TIMEOUT_MS",
+            "DB_API_RELEASE_IDLE_CONNECTIONS",
+            "DB_WORKER_POOL_SIZE",
+            "DB_WORKER_MAX_OVERFLOW",
+            "DB_WORKER_POOL_TIMEOUT_SECONDS",
+            "DB_WORKER_POOL_RECYCLE_SECONDS",
+            "DB_WORKER_POOL_PRE_PING",
+            "DB_WORKER_STATEMENT_CACHE_SIZE",
+            "DB_WORKER_STATEMENT_TIMEOUT_MS",
+            "DB_WORKER_RELEASE_IDLE_CONNECTIONS",
+            "DB_POOL_PRE_PING_IDLE_SECONDS",
+        ],
+        "WINOE_",
+    ),
     "auth": (
         [
             "AUTH0_DOMAIN",
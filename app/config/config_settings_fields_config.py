@@ -27,13 +27,24 @@ class SettingsFields(BaseSettings):
     )
 
     ENV: str = "local"
+    PROCESS_ROLE: str = "api"
     API_PREFIX: str = "/api"
     RATE_LIMIT_ENABLED: bool | None = None
     MAX_REQUEST_BODY_BYTES: int = 1_048_576
+    READINESS_REFRESH_INTERVAL_SECONDS: float = 10.0
     DEBUG_PERF: bool = False
     PERF_SPANS_ENABLED: bool = False
     PERF_SQL_FINGERPRINTS_ENABLED: bool = False
     PERF_SPAN_SAMPLE_RATE: float = 1.0
+    PERF_N_PLUS_ONE_THRESHOLD: int = 0
+    PERF_N_PLUS_ONE_STRICT: bool = False
+    PERF_ROUTE_HISTOGRAMS_ENABLED: bool = False
+    PERF_LOOP_LAG_MONITOR_ENABLED: bool = False
+    PERF_LOOP_LAG_THRESHOLD_MS: float = 100.0
+    PERF_TRACE_EXPORTER: str = ""
+    PERF_TRACE_FILE_PATH: str = "perf-traces.jsonl"
+    PERF_TRACE_SERVICE_NAME: str = "winoe-backend"
+    PERF_PROFILER_ENABLED: bool = False
     TRUSTED_PROXY_CIDRS: list[str] | str = Field(default_factory=list)
     DEMO_MODE: bool = False
     DEMO_ADMIN_ALLOWLIST_EMAILS: list[str] | str = Field(default_factory=list)
@@ -44,6 +55,12 @@ class SettingsFields(BaseSettings):
     DEMO_ADMIN_JOB_STALE_SECONDS: int = 900
     WORKER_HEARTBEAT_INTERVAL_SECONDS: int = 15
     WORKER_HEARTBEAT_STALE_SECONDS: int = 60
+    WORKER_CONCURRENCY: int = 1
+    WORKER_PROCESSES: int = 1
+    WORKER_METRICS_HOST: str = "0.0.0.0"
+    WORKER_METRICS_PORT: int = 0
+    WORKER_WAKEUP_SAFETY_POLL_SECONDS: float = 5.0
+    WORKER_LEASE_SECONDS: int = 300
     AI_RUNTIME_MODE: str = "real"
     DEV_AUTH_BYPASS: str | None = Field(
         default=None,
@@ -0,0 +1,770 @@
+"""Synthetic large-tenant seed for load, benchmark, and query-plan work.
+
+Unlike the YC demo seed, nothing here goes through the ORM unit of work:
+primary keys are allocated up front so related rows can reference each other
+without ``RETURNING`` round trips, and each table is written in bulk per
+chunk of candidate sessions. On PostgreSQL (asyncpg) rows are streamed with
+``COPY``; other dialects fall back to executemany Core inserts. Output is a
+pure function of the config, so the same seed reproduces the same dataset.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+import uuid
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from hashlib import sha256
+from typing import Any
+
+from sqlalchemy import Table, func, insert, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import JSON, DateTime
+
+from app.evaluations.repositories.evaluations_repositories_evaluations_core_model import (
+    EVALUATION_RECOMMENDATION_HIRE,
+    EVALUATION_RECOMMENDATION_LEAN_HIRE,
+    EVALUATION_RECOMMENDATION_NO_HIRE,
+    EVALUATION_RECOMMENDATION_STRONG_HIRE,
+    EVALUATION_RUN_STATUS_COMPLETED,
+    EvaluationDayScore,
+    EvaluationRun,
+)
+from app.evaluations.services.evaluations_services_evaluations_winoe_report_jobs_service import (
+    EVALUATION_RUN_JOB_TYPE,
+)
+from app.media.services.media_services_media_transcription_jobs_service import (
+    TRANSCRIBE_RECORDING_JOB_TYPE,
+)
+from app.shared.database.shared_database_models_model import (
+    CandidateSession,
+    Company,
+    RecordingAsset,
+    ScenarioVersion,
+    Submission,
+    Task,
+    Transcript,
+    Trial,
+    User,
+    WinoeReport,
+)
+from app.shared.database.shared_database_read_model_utils import note_rows_written
+from app.shared.jobs.repositories.shared_jobs_repositories_models_repository import (
+    JOB_STATUS_DEAD_LETTER,
+    JOB_STATUS_SUCCEEDED,
+    Job,
+)
+from app.submissions.presentation.submissions_presentation_submissions_test_results_preview_utils import (
+    build_test_results_preview,
+)
+from app.trials.constants.trials_constants_trials_blueprints_constants import (
+    DEFAULT_5_DAY_BLUEPRINT,
+)
+from app.trials.constants.trials_constants_trials_defaults_constants import (
+    DEFAULT_TEMPLATE_KEY,
+)
+from app.trials.repositories.trials_repositories_trials_trial_status_constants import (
+    TRIAL_STATUS_ACTIVE_INVITING,
+    TRIAL_STATUS_GENERATING,
+)
+
+LARGE_TENANT_COMPANY_PREFIX = "Synthetic Tenant"
+_NOTICE_VERSION = "synthetic-v1"
+_RECORDING_DAY = 4
+_CODE_DAYS = frozenset({2, 3})
+_DAY_COUNT = len(DEFAULT_5_DAY_BLUEPRINT)
+_ID_TABLES = (
+    Company,
+    User,
+    Trial,
+    ScenarioVersion,
+    Task,
+    CandidateSession,
+    RecordingAsset,
+    Transcript,
+    Submission,
+    EvaluationRun,
+    EvaluationDayScore,
+    WinoeReport,
+)
+_ROLES = (
+    ("Backend Engineer", "Python, FastAPI, PostgreSQL"),
+    ("Platform Engineer", "Go, Kubernetes, Terraform"),
+    ("Full Stack Engineer", "TypeScript, React, Node.js"),
+    ("Data Engineer", "Python, Airflow, Snowflake"),
+    ("Mobile Engineer", "Kotlin, Swift, GraphQL"),
+)
+_SENIORITIES = ("Junior", "Mid", "Senior", "Staff")
+_FIRST_NAMES = (
+    "Alex", "Bailey", "Casey", "Devon", "Emerson", "Finley", "Harper", "Indra",
+    "Jules", "Kai", "Logan", "Morgan", "Noor", "Oakley", "Parker", "Quinn",
+    "Riley", "Sasha", "Taylor", "Umi", "Vic", "Wren", "Yael", "Zion",
+)  # fmt: skip
+_LAST_NAMES = (
+    "Abara", "Brooks", "Castillo", "Dubois", "Eriksen", "Fujita", "Garcia",
+    "Haddad", "Ivanova", "Jensen", "Kowalski", "Lindqvist", "Mensah", "Nakamura",
+    "Okafor", "Petrov", "Quispe", "Rossi", "Santos", "Tanaka", "Usman", "Varga",
+)  # fmt: skip
+_TIMEZONES = ("America/New_York", "America/Los_Angeles", "Europe/London", "Asia/Tokyo")
+_RECOMMENDATIONS = (
+    (0.85, EVALUATION_RECOMMENDATION_STRONG_HIRE),
+    (0.7, EVALUATION_RECOMMENDATION_HIRE),
+    (0.55, EVALUATION_RECOMMENDATION_LEAN_HIRE),
+    (0.0, EVALUATION_RECOMMENDATION_NO_HIRE),
+)
+
+
+@dataclass(slots=True)
+class LargeTenantSeedConfig:
+    """Shape of the synthetic dataset."""
+
+    companies: int = 3
+    trials_per_company: int = 4
+    candidates_per_trial: int = 1000
+    seed: int = 1
+    batch_size: int = 2000
+    anchor: datetime = datetime(2026, 1, 5, 12, tzinfo=UTC)
+    not_started_ratio: float = 0.15
+    in_progress_ratio: float = 0.25
+    dead_letter_ratio: float = 0.02
+    use_copy: bool = True
+
+
+@dataclass(slots=True)
+class LargeTenantSeedSummary:
+    """What the synthetic seed wrote."""
+
+    company_ids: list[int]
+    trial_ids: list[int]
+    row_counts: dict[str, int] = field(default_factory=dict)
+    used_copy: bool = False
+    elapsed_seconds: float = 0.0
+
+
+def _stable_hex(*parts: object, length: int = 40) -> str:
+    seed = "\u241f".join(str(part) for part in parts)
+    return sha256(seed.encode("utf-8")).hexdigest()[:length]
+
+
+def _stable_uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _recommendation_for(score: float) -> str:
+    for threshold, recommendation in _RECOMMENDATIONS:
+        if score >= threshold:
+            return recommendation
+    return EVALUATION_RECOMMENDATION_NO_HIRE
+
+
+def _chunks(count: int, size: int) -> Iterator[range]:
+    for start in range(0, count, size):
+        yield range(start, min(start + size, count))
+
+
+def large_tenant_company_name(seed: int, company_index: int) -> str:
+    """Return the deterministic company name for one synthetic tenant."""
+    return f"{LARGE_TENANT_COMPANY_PREFIX} {seed}-{company_index + 1:04d}"
+
+
+class _IdAllocator:
+    """Hands out primary keys above the current maximum of each table."""
+
+    def __init__(self, next_ids: dict[str, int]) -> None:
+        self._next = dict(next_ids)
+
+    def take(self, table: str) -> int:
+        value = self._next[table]
+        self._next[table] = value + 1
+        return value
+
+
+async def _load_next_ids(db: AsyncSession) -> dict[str, int]:
+    next_ids: dict[str, int] = {}
+    for model in _ID_TABLES:
+        current = await db.scalar(select(func.max(model.id)))
+        next_ids[model.__tablename__] = int(current or 0) + 1
+    return next_ids
+
+
+def _copy_value(column: Any, value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(column.type, JSON):
+        return json.dumps(value)
+    if isinstance(column.type, DateTime) and not column.type.timezone:
+        return value.replace(tzinfo=None)
+    return value
+
+
+def copy_records(
+    table: Table, rows: Sequence[dict[str, Any]]
+) -> tuple[list[str], list[tuple[Any, ...]]]:
+    """Return ``COPY`` column names and encoded records for ``rows``."""
+    columns = list(rows[0])
+    typed = [table.c[name] for name in columns]
+    records = [
+        tuple(
+            _copy_value(column, row[name])
+            for column, name in zip(typed, columns, strict=True)
+        )
+        for row in rows
+    ]
+    return columns, records
+
+
+async def _copy_driver(db: AsyncSession) -> Any | None:
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    driver = raw.driver_connection
+    return driver if hasattr(driver, "copy_records_to_table") else None
+
+
+async def _write_rows(
+    db: AsyncSession,
+    model: Any,
+    rows: Sequence[dict[str, Any]],
+    *,
+    use_copy: bool,
+    counts: dict[str, int],
+) -> None:
+    table: Table = model.__table__
+    counts[table.name] = counts.get(table.name, 0) + len(rows)
+    if not rows:
+        return
+    # Bulk writes skip the ORM, so derived read models refresh on commit.
+    note_rows_written(db, table.name, rows)
+    # Resolved per write: after a commit the session may hold a new connection.
+    copy_driver = await _copy_driver(db) if use_copy else None
+    if copy_driver is None:
+        await db.execute(insert(table), list(rows))
+        return
+    columns, records = copy_records(table, rows)
+    await copy_driver.copy_records_to_table(
+        table.name, records=records, columns=columns
+    )
+
+
+async def _sync_sequences(db: AsyncSession) -> None:
+    """Move PostgreSQL id sequences past the explicitly inserted keys."""
+    for model in _ID_TABLES:
+        name = model.__tablename__
+        await db.execute(
+            text(
+                "SELECT setval(pg_get_serial_sequence(:table, 'id'), "
+                f'(SELECT COALESCE(MAX(id), 1) FROM "{name}"))'
+            ),
+            {"table": name},
+        )
+
+
+class _Batch:
+    """Rows for one chunk, keyed by table, flushed in foreign-key order."""
+
+    _ORDER = (
+        CandidateSession,
+        RecordingAsset,
+        Transcript,
+        Submission,
+        Job,
+        EvaluationRun,
+        EvaluationDayScore,
+        WinoeReport,
+    )
+
+    def __init__(self) -> None:
+        self.rows: dict[str, list[dict[str, Any]]] = {
+            model.__tablename__: [] for model in self._ORDER
+        }
+
+    def add(self, model: Any, row: dict[str, Any]) -> None:
+        self.rows[model.__tablename__].append(row)
+
+    async def flush(
+        self, db: AsyncSession, *, use_copy: bool, counts: dict[str, int]
+    ) -> None:
+        for model in self._ORDER:
+            await _write_rows(
+                db,
+                model,
+                self.rows[model.__tablename__],
+                use_copy=use_copy,
+                counts=counts,
+            )
+
+
+@dataclass(slots=True)
+class _TrialContext:
+    company_id: int
+    company_index: int
+    trial_id: int
+    trial_index: int
+    scenario_version_id: int
+    task_ids: dict[int, int]
+
+
+class _Generator:
+    def __init__(self, config: LargeTenantSeedConfig, ids: _IdAllocator) -> None:
+        self.config = config
+        self.ids = ids
+        self.anchor = config.anchor
+
+    def _rng(self, *scope: object) -> random.Random:
+        return random.Random(_stable_hex(self.config.seed, *scope, length=16))
+
+    def company_rows(self, company_index: int) -> tuple[dict[str, Any], dict[str, Any]]:
+        company_id = self.ids.take(Company.__tablename__)
+        slug = f"tenant-{self.config.seed}-{company_index + 1:04d}"
+        company = {
+            "id": company_id,
+            "name": large_tenant_company_name(self.config.seed, company_index),
+            "created_at": self.anchor - timedelta(days=90),
+        }
+        talent_partner = {
+            "id": self.ids.take(User.__tablename__),
+            "name": f"Talent Partner {company_index + 1}",
+            "email": f"talent.partner@{slug}.synthetic.winoe.ai",
+            "role": "talent_partner",
+            "company_id": company_id,
+            "password_hash": "",
+            "created_at": self.anchor - timedelta(days=90),
+        }
+        return company, talent_partner
+
+    def trial_rows(
+        self, *, company_id: int, company_index: int, trial_index: int, user_id: int
+    ) -> tuple[_TrialContext, dict[str, Any], dict[str, Any], list[dict[str, Any]]]:
+        rng = self._rng("trial", company_index, trial_index)
+        role, tech_stack = rng.choice(_ROLES)
+        seniority = rng.choice(_SENIORITIES)
+        created_at = self.anchor - timedelta(days=30 + trial_index)
+        trial_id = self.ids.take(Trial.__tablename__)
+        trial = {
+            "id": trial_id,
+            "company_id": company_id,
+            "title": f"{seniority} {role} Trial {trial_index + 1}",
+            "role": role,
+            "tech_stack": tech_stack,
+            "seniority": seniority,
+            "scenario_template": "",
+            "template_key": DEFAULT_TEMPLATE_KEY,
+            "focus": f"Ship a {tech_stack} service end to end.",
+            "ai_notice_version": _NOTICE_VERSION,
+            "ai_eval_enabled_by_day": {str(day): True for day in range(1, 6)},
+            "day_window_overrides_enabled": False,
+            "created_by": user_id,
+            "status": TRIAL_STATUS_GENERATING,
+            "generating_at": created_at,
+            "created_at": created_at,
+        }
+        tasks: list[dict[str, Any]] = []
+        task_ids: dict[int, int] = {}
+        for blueprint in DEFAULT_5_DAY_BLUEPRINT:
+            task_id = self.ids.take(Task.__tablename__)
+            task_ids[blueprint["day_index"]] = task_id
+            tasks.append(
+                {
+                    "id": task_id,
+                    "trial_id": trial_id,
+                    "day_index": blueprint["day_index"],
+                    "type": blueprint["type"],
+                    "title": blueprint["title"],
+                    "description": blueprint["description"],
+                }
+            )
+        scenario_version_id = self.ids.take(ScenarioVersion.__tablename__)
+        scenario_version = {
+            "id": scenario_version_id,
+            "trial_id": trial_id,
+            "version_index": 1,
+            "status": "locked",
+            "storyline_md": f"Synthetic storyline for {trial['title']}.",
+            "task_prompts_json": [
+                {
+                    "dayIndex": blueprint["day_index"],
+                    "type": blueprint["type"],
+                    "title": blueprint["title"],
+                    "description": blueprint["description"],
+                }
+                for blueprint in DEFAULT_5_DAY_BLUEPRINT
+            ],
+            "rubric_json": {"dimensions": ["architecture", "testing", "judgment"]},
+            "focus_notes": trial["focus"],
+            "template_key": DEFAULT_TEMPLATE_KEY,
+            "tech_stack": tech_stack,
+            "seniority": seniority,
+            "model_name": "synthetic",
+            "model_version": "synthetic-1",
+            "prompt_version": "synthetic-1",
+            "rubric_version": "synthetic-1",
+            "locked_at": created_at + timedelta(days=1),
+            "created_at": created_at,
+        }
+        context = _TrialContext(
+            company_id=company_id,
+            company_index=company_index,
+            trial_id=trial_id,
+            trial_index=trial_index,
+            scenario_version_id=scenario_version_id,
+            task_ids=task_ids,
+        )
+        return context, trial, scenario_version, tasks
+
+    def _days_completed(self, rng: random.Random) -> int:
+        roll = rng.random()
+        if roll < self.config.not_started_ratio:
+            return 0
+        if roll < self.config.not_started_ratio + self.config.in_progress_ratio:
+            return rng.randint(1, _DAY_COUNT - 1)
+        return _DAY_COUNT
+
+    def _job_row(
+        self,
+        rng: random.Random,
+        *,
+        context: _TrialContext,
+        candidate_session_id: int,
+        job_type: str,
+        payload: dict[str, Any],
+        created_at: datetime,
+    ) -> dict[str, Any]:
+        dead = rng.random() < self.config.dead_letter_ratio
+        return {
+            "id": _stable_uuid(rng),
+            "job_type": job_type,
+            "status": JOB_STATUS_DEAD_LETTER if dead else JOB_STATUS_SUCCEEDED,
+            "attempt": 5 if dead else 1,
+            "max_attempts": 5,
+            "priority": 0,
+            "idempotency_key": f"synthetic:{job_type}:{candidate_session_id}",
+            "payload_json": payload,
+            "result_json": None if dead else {"status": "ok"},
+            "last_error": "synthetic failure" if dead else None,
+            "created_at": created_at,
+            "updated_at": created_at + timedelta(minutes=5),
+            "next_run_at": created_at,
+            "company_id": context.company_id,
+            "trial_id": context.trial_id,
+            "candidate_session_id": candidate_session_id,
+        }
+
+    def candidate_rows(
+        self, batch: _Batch, context: _TrialContext, candidate_index: int
+    ) -> None:
+        rng = self._rng(
+            "candidate", context.company_index, context.trial_index, candidate_index
+        )
+        first, last = rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES)
+        email = (
+            f"{first}.{last}.{context.company_index + 1}-{context.trial_index + 1}-"
+            f"{candidate_index + 1}@candidates.synthetic.winoe.ai"
+        ).lower()
+        days_completed = self._days_completed(rng)
+        invited_at = self.anchor - timedelta(days=rng.randint(6, 20))
+        started_at = invited_at + timedelta(hours=rng.randint(1, 48))
+        session_id = self.ids.take(CandidateSession.__tablename__)
+        started = days_completed > 0
+        completed = days_completed == _DAY_COUNT
+        batch.add(
+            CandidateSession,
+            {
+                "id": session_id,
+                "trial_id": context.trial_id,
+                "scenario_version_id": context.scenario_version_id,
+                "candidate_name": f"{first} {last}",
+                "invite_email": email,
+                "candidate_email": email if started else None,
+                "token": _stable_hex(self.config.seed, "token", session_id, length=32),
+                "status": (
+                    "completed"
+                    if completed
+                    else "in_progress"
+                    if started
+                    else "not_started"
+                ),
+                "claimed_at": started_at if started else None,
+                "started_at": started_at if started else None,
+                "completed_at": (
+                    started_at + timedelta(days=_DAY_COUNT) if completed else None
+                ),
+                "expires_at": invited_at + timedelta(days=30),
+                "invite_email_status": "sent",
+                "invite_email_sent_at": invited_at,
+                "invite_email_last_attempt_at": invited_at,
+                "scheduled_start_at": started_at if started else None,
+                "candidate_timezone": rng.choice(_TIMEZONES),
+                "github_username": f"{first}{last}{session_id}".lower()[:39],
+                "consent_version": _NOTICE_VERSION if started else None,
+                "consent_timestamp": started_at if started else None,
+                "ai_notice_version": _NOTICE_VERSION,
+            },
+        )
+        repo = f"winoe-synthetic/candidate-{session_id}"
+        shas = {
+            day: _stable_hex(self.config.seed, "commit", session_id, day)
+            for day in _CODE_DAYS
+        }
+        recording_id: int | None = None
+        for day_index in range(1, days_completed + 1):
+            submitted_at = started_at + timedelta(days=day_index - 1, hours=6)
+            task_id = context.task_ids[day_index]
+            if day_index == _RECORDING_DAY:
+                recording_id = self.ids.take(RecordingAsset.__tablename__)
+                duration = rng.randint(90, 600)
+                batch.add(
+                    RecordingAsset,
+                    {
+                        "id": recording_id,
+                        "candidate_session_id": session_id,
+                        "task_id": task_id,
+                        "storage_key": (
+                            f"synthetic/{self.config.seed}/{session_id}/handoff.mp4"
+                        ),
+                        "content_type": "video/mp4",
+                        "bytes": duration * 180_000,
+                        "asset_kind": "recording",
+                        "duration_seconds": duration,
+                        "status": "ready",
+                        "retention_expires_at": submitted_at + timedelta(days=90),
+                        "consent_version": _NOTICE_VERSION,
+                        "consent_timestamp": started_at,
+                        "ai_notice_version": _NOTICE_VERSION,
+                        "created_at": submitted_at,
+                    },
+                )
+                batch.add(
+                    Transcript,
+                    {
+                        "id": self.ids.take(Transcript.__tablename__),
+                        "recording_id": recording_id,
+                        "text": f"{first} walks through the design and tradeoffs.",
+                        "segments_json": [
+                            {"start": 0, "end": duration, "text": "Handoff demo."}
+                        ],
+                        "model_name": "synthetic-transcribe",
+                        "status": "ready",
+                        "created_at": submitted_at + timedelta(minutes=10),
+                    },
+                )
+                batch.add(
+                    Job,
+                    self._job_row(
+                        rng,
+                        context=context,
+                        candidate_session_id=session_id,
+                        job_type=TRANSCRIBE_RECORDING_JOB_TYPE,
+                        payload={"recordingId": recording_id},
+                        created_at=submitted_at,
+                    ),
+                )
+            is_code = day_index in _CODE_DAYS
+            passed = rng.randint(5, 40) if is_code else None
+            failed = rng.randint(0, 3) if is_code else None
+            test_output = (
+                f"pytest: {passed} passed, {failed} failed" if is_code else None
+            )
+            batch.add(
+                Submission,
+                {
+                    "id": self.ids.take(Submission.__tablename__),
+                    "candidate_session_id": session_id,
+                    "task_id": task_id,
+                    "recording_id": (
+                        recording_id if day_index == _RECORDING_DAY else None
+                    ),
+                    "submitted_at": submitted_at,
+                    "content_text": None if is_code else f"Day {day_index} notes.",
+                    "content_json": {"artifactType": "synthetic", "day": day_index},
+                    "code_repo_path": repo if is_code else None,
+                    "commit_sha": shas.get(day_index),
+                    "final_sha": shas[3] if day_index == 3 else None,
+                    "workflow_run_id": (
+                        f"synthetic-{session_id}-{day_index}" if is_code else None
+                    ),
+                    "workflow_run_attempt": 1 if is_code else None,
+                    "workflow_run_status": "completed" if is_code else None,
+                    "workflow_run_conclusion": (
+                        ("success" if not failed else "failure") if is_code else None
+                    ),
+                    "workflow_run_completed_at": submitted_at if is_code else None,
+                    "tests_passed": passed,
+                    "tests_failed": failed,
+                    "test_output": test_output,
+                    "test_results_preview": build_test_results_preview(test_output),
+                    "last_run_at": submitted_at if is_code else None,
+                },
+            )
+        if not completed:
+            return
+        generated_at = started_at + timedelta(days=_DAY_COUNT, hours=2)
+        day_scores = [round(rng.uniform(0.4, 0.98), 2) for _ in range(_DAY_COUNT)]
+        overall = round(sum(day_scores) / len(day_scores), 3)
+        confidence = round(rng.uniform(0.6, 0.95), 2)
+        recommendation = _recommendation_for(overall)
+        run_id = self.ids.take(EvaluationRun.__tablename__)
+        job = self._job_row(
+            rng,
+            context=context,
+            candidate_session_id=session_id,
+            job_type=EVALUATION_RUN_JOB_TYPE,
+            payload={"candidateSessionId": session_id},
+            created_at=generated_at - timedelta(hours=1),
+        )
+        batch.add(Job, job)
+        day_rows = [
+            {
+                "id": self.ids.take(EvaluationDayScore.__tablename__),
+                "run_id": run_id,
+                "day_index": day_index,
+                "score": score,
+                "rubric_results_json": {"overall": score},
+                "evidence_pointers_json": [],
+                "created_at": generated_at,
+            }
+            for day_index, score in enumerate(day_scores, start=1)
+        ]
+        batch.add(
+            EvaluationRun,
+            {
+                "id": run_id,
+                "candidate_session_id": session_id,
+                "scenario_version_id": context.scenario_version_id,
+                "status": EVALUATION_RUN_STATUS_COMPLETED,
+                "started_at": generated_at - timedelta(minutes=30),
+                "completed_at": generated_at,
+                "model_name": "synthetic-winoe-report",
+                "model_version": "synthetic-1",
+                "prompt_version": "synthetic-1",
+                "rubric_version": "synthetic-1",
+                "job_id": job["id"],
+                "basis_fingerprint": _stable_hex(
+                    self.config.seed, "basis", session_id, length=64
+                ),
+                "overall_winoe_score": overall,
+                "recommendation": recommendation,
+                "confidence": confidence,
+                "generated_at": generated_at,
+                "raw_report_json": {
+                    "overallWinoeScore": overall,
+                    "recommendation": recommendation,
+                    "confidence": confidence,
+                    "dayScores": [
+                        {"dayIndex": row["day_index"], "score": row["score"]}
+                        for row in day_rows
+                    ],
+                },
+                "metadata_json": {"aiPolicyProvider": "synthetic-seed"},
+                "day2_checkpoint_sha": shas[2],
+                "day3_final_sha": shas[3],
+                "cutoff_commit_sha": shas[3],
+                "transcript_reference": f"transcript:recording:{recording_id}",
+            },
+        )
+        for row in day_rows:
+            batch.add(EvaluationDayScore, row)
+        batch.add(
+            WinoeReport,
+            {
+                "id": self.ids.take(WinoeReport.__tablename__),
+                "candidate_session_id": session_id,
+                "generated_at": generated_at,
+            },
+        )
+
+
+async def seed_large_tenant_dataset(
+    db: AsyncSession, *, config: LargeTenantSeedConfig
+) -> LargeTenantSeedSummary:
+    """Bulk-write ``companies x trials x candidates`` of synthetic tenant data.
+
+    Commits once per chunk of ``batch_size`` candidate sessions. Assumes no
+    other writer is inserting into the same tables while it runs.
+    """
+    started = time.perf_counter()
+    names = [
+        large_tenant_company_name(config.seed, index)
+        for index in range(config.companies)
+    ]
+    existing = await db.scalar(
+        select(func.count()).select_from(Company).where(Company.name.in_(names))
+    )
+    if existing:
+        raise ValueError(
+            f"Synthetic tenants for seed {config.seed} already exist; "
+            "reset the database or pick another seed."
+        )
+    is_postgres = (await db.connection()).dialect.name == "postgresql"
+    generator = _Generator(config, _IdAllocator(await _load_next_ids(db)))
+    use_copy = is_postgres and config.use_copy and await _copy_driver(db) is not None
+    counts: dict[str, int] = {}
+    summary = LargeTenantSeedSummary(
+        company_ids=[], trial_ids=[], row_counts=counts, used_copy=use_copy
+    )
+
+    async def _write(model: Any, rows: list[dict[str, Any]]) -> None:
+        await _write_rows(db, model, rows, use_copy=use_copy, counts=counts)
+
+    for company_index in range(config.companies):
+        company, talent_partner = generator.company_rows(company_index)
+        await _write(Company, [company])
+        await _write(User, [talent_partner])
+        summary.company_ids.append(company["id"])
+        contexts: list[_TrialContext] = []
+        trials, versions, tasks = [], [], []
+        for trial_index in range(config.trials_per_company):
+            context, trial, version, trial_tasks = generator.trial_rows(
+                company_id=company["id"],
+                company_index=company_index,
+                trial_index=trial_index,
+                user_id=talent_partner["id"],
+            )
+            contexts.append(context)
+            trials.append(trial)
+            versions.append(version)
+            tasks.extend(trial_tasks)
+        # Trials must exist before their scenario versions, and an active trial
+        # must point at one, so insert as generating and activate afterwards.
+        await _write(Trial, trials)
+        await _write(ScenarioVersion, versions)
+        await _write(Task, tasks)
+        trial_ids = [context.trial_id for context in contexts]
+        await db.execute(
+            update(Trial)
+            .where(Trial.id.in_(trial_ids))
+            .values(
+                active_scenario_version_id=select(ScenarioVersion.id)
+                .where(ScenarioVersion.trial_id == Trial.id)
+                .scalar_subquery(),
+                status=TRIAL_STATUS_ACTIVE_INVITING,
+                ready_for_review_at=config.anchor - timedelta(days=25),
+                activated_at=config.anchor - timedelta(days=25),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        summary.trial_ids.extend(trial_ids)
+        await db.commit()
+        for context in contexts:
+            for chunk in _chunks(config.candidates_per_trial, config.batch_size):
+                batch = _Batch()
+                for candidate_index in chunk:
+                    generator.candidate_rows(batch, context, candidate_index)
+                await batch.flush(db, use_copy=use_copy, counts=counts)
+                await db.commit()
+    if is_postgres:
+        await _sync_sequences(db)
+        await db.commit()
+    summary.elapsed_seconds = time.perf_counter() - started
+    return summary
+
+
+__all__ = [
+    "LARGE_TENANT_COMPANY_PREFIX",
+    "LargeTenantSeedConfig",
+    "LargeTenantSeedSummary",
+    "copy_records",
+    "large_tenant_company_name",
+    "seed_large_tenant_dataset",
+]
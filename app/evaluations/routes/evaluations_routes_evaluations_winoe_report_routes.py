@@ -16,7 +16,7 @@ from app.evaluations.services import (
 )
 from app.shared.auth.shared_auth_current_user_utils import get_current_user
 from app.shared.auth.shared_auth_roles_utils import ensure_talent_partner
-from app.shared.database import get_session
+from app.shared.database import get_read_session, get_session
 from app.shared.database.shared_database_models_model import User
 from app.shared.http.shared_http_deprecation_headers import (
     mark_legacy_candidate_session_route,
@@ -103,7 +103,7 @@ async def get_winoe_report_route(
     candidate_trial_id: Annotated[int, Path(..., ge=1)],
     request: Request,
     response: Response,
-    db: Annotated[AsyncSession, Depends(get_session)],
+    db: Annotated[AsyncSession, Depends(get_read_session)],
     user: Annotated[User, Depends(get_current_user)],
 ) -> WinoeReportStatusResponse:
     """Handle the get winoe report API route."""
@@ -3,29 +3,87 @@
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator
+from typing import Annotated
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.config import settings
 
+from .shared_database_engine_utils import (
+    create_engine_for_role,
+    ensure_pool_size,
+    pool_options_for_role,
+)
+from .shared_database_read_routing_utils import (
+    RecentWriteTracker,
+    ReplicaLagMonitor,
+    principal_key,
+)
+from .shared_database_session_utils import LazyReleaseAsyncSession
+
+
+def _pool_options(worker_concurrency: int | None = None):
+    return pool_options_for_role(
+        settings.database,
+        settings.PROCESS_ROLE,
+        worker_concurrency=worker_concurrency or settings.WORKER_CONCURRENCY,
+    )
+
 
 def _create_engine():
-    return create_async_engine(
-        settings.database.async_url,
-        echo=False,
-        pool_pre_ping=True,
-        future=True,
+    url = settings.database.async_url
+    return create_engine_for_role(url, _pool_options())
+
+
+def _create_read_engine():
+    url = settings.database.read_async_url
+    if url is None:
+        return None
+    return create_engine_for_role(url, _pool_options())
+
+
+def _session_maker(bind, *, release_idle_connections: bool):
+    # API sessions give their connection back between read-only statements so
+    # a request waiting on GitHub or an AI provider does not hold one.
+    return async_sessionmaker(
+        bind=bind,
+        class_=LazyReleaseAsyncSession if release_idle_connections else AsyncSession,
+        autoflush=False,
+        autocommit=False,
+        expire_on_commit=False,
     )
 
 
 engine = _create_engine()
+_release_idle = _pool_options().release_idle_connections
+async_session_maker = _session_maker(engine, release_idle_connections=_release_idle)
 
-async_session_maker = async_sessionmaker(
-    bind=engine,
-    autoflush=False,
-    autocommit=False,
-    expire_on_commit=False,
+read_engine = _create_read_engine()
+read_session_maker = (
+    None
+    if read_engine is None
+    else _session_maker(read_engine, release_idle_connections=_release_idle)
 )
+replica_lag_monitor = ReplicaLagMonitor(
+    max_lag_seconds=settings.database.DB_READ_MAX_LAG_SECONDS,
+    check_interval_seconds=settings.database.DB_READ_LAG_CHECK_SECONDS,
+)
+recent_writes = RecentWriteTracker(
+    window_seconds=settings.database.DB_READ_YOUR_WRITES_SECONDS
+)
+
+
+def size_pools_for_worker_concurrency(concurrency: int) -> None:
+    """Grow the pools built at import time to fit ``concurrency`` job slots.
+
+    The engines are created from ``WORKER_CONCURRENCY`` when this module is
+    imported, before the worker CLI has parsed ``--concurrency``.
+    """
+    pool_size = _pool_options(worker_concurrency=concurrency).pool_size
+    for bound in (engine, read_engine):
+        if bound is not None:
+            ensure_pool_size(bound, pool_size=pool_size)
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -34,6 +92,29 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def get_read_session(
+    request: Request,
+    primary: Annotated[AsyncSession, Depends(get_session)],
+) -> AsyncGenerator[AsyncSession, None]:
+    """Yield a session for read-only routes, on the replica when safe.
+
+    Falls back to the request's primary session when no replica is
+    configured, the caller wrote within the read-your-writes window, or the
+    replica is lagging. The primary session is shared with the other
+    dependencies and only checks out a connection if it is used.
+    """
+    if (
+        read_engine is None
+        or read_session_maker is None
+        or recent_writes.wrote_recently(principal_key(request.headers))
+        or not await replica_lag_monitor.replica_usable(read_engine)
+    ):
+        yield primary
+        return
+    async with read_session_maker() as session:
+        yield session
+
+
 async def init_db_if_needed() -> None:
     """No-op: local/test environments must run Alembic against PostgreSQL."""
     return
@@ -0,0 +1,218 @@
+"""Engine and connection-pool construction per process role."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.shared import perf
+
+PROCESS_ROLE_API = "api"
+PROCESS_ROLE_WORKER = "worker"
+PROCESS_ROLES = (PROCESS_ROLE_API, PROCESS_ROLE_WORKER)
+PRE_PING_ALWAYS = "always"
+PRE_PING_IDLE = "idle"
+PRE_PING_NEVER = "never"
+PRE_PING_STRATEGIES = (PRE_PING_ALWAYS, PRE_PING_IDLE, PRE_PING_NEVER)
+# The worker holds one connection per execution slot plus the heartbeat
+# writer and the LISTEN connection.
+WORKER_RESERVED_CONNECTIONS = 2
+_CHECKED_IN_AT_KEY = "winoe_checked_in_at"
+
+
+@dataclass(frozen=True, slots=True)
+class EnginePoolOptions:
+    """Resolved pool and session tuning for one process role."""
+
+    role: str
+    pool_size: int
+    max_overflow: int
+    pool_timeout_seconds: float
+    pool_recycle_seconds: int
+    pre_ping: str
+    pre_ping_idle_seconds: float
+    statement_cache_size: int
+    statement_timeout_ms: int
+    release_idle_connections: bool = False
+
+
+def pool_options_for_role(
+    database_settings: Any, role: str, *, worker_concurrency: int = 1
+) -> EnginePoolOptions:
+    """Read ``DB_<ROLE>_*`` settings into pool options."""
+    normalized = (role or PROCESS_ROLE_API).strip().lower()
+    if normalized not in PROCESS_ROLES:
+        raise ValueError(
+            f"PROCESS_ROLE must be one of {', '.join(PROCESS_ROLES)}; got {role!r}"
+        )
+    prefix = f"DB_{normalized.upper()}_"
+
+    def _setting(name: str) -> Any:
+        return getattr(database_settings, prefix + name)
+
+    pre_ping = str(_setting("POOL_PRE_PING")).strip().lower()
+    if pre_ping not in PRE_PING_STRATEGIES:
+        raise ValueError(
+            f"{prefix}POOL_PRE_PING must be one of "
+            f"{', '.join(PRE_PING_STRATEGIES)}; got {pre_ping!r}"
+        )
+    pool_size = max(1, int(_setting("POOL_SIZE")))
+    if normalized == PROCESS_ROLE_WORKER:
+        # Fewer pooled connections than execution slots just moves the queue
+        # from the jobs table into the pool.
+        pool_size = max(
+            pool_size, max(1, worker_concurrency) + WORKER_RESERVED_CONNECTIONS
+        )
+    return EnginePoolOptions(
+        role=normalized,
+        pool_size=pool_size,
+        max_overflow=max(0, int(_setting("MAX_OVERFLOW"))),
+        pool_timeout_seconds=float(_setting("POOL_TIMEOUT_SECONDS")),
+        pool_recycle_seconds=int(_setting("POOL_RECYCLE_SECONDS")),
+        pre_ping=pre_ping,
+        pre_ping_idle_seconds=float(database_settings.DB_POOL_PRE_PING_IDLE_SECONDS),
+        statement_cache_size=max(0, int(_setting("STATEMENT_CACHE_SIZE"))),
+        statement_timeout_ms=max(0, int(_setting("STATEMENT_TIMEOUT_MS"))),
+        release_idle_connections=bool(_setting("RELEASE_IDLE_CONNECTIONS")),
+    )
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that reports how long each checkout waited."""
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except sa_exc.TimeoutError:
+            perf.record_pool_checkout_wait(
+                (time.perf_counter() - started) * 1000, timed_out=True
+            )
+            raise
+        perf.record_pool_checkout_wait((time.perf_counter() - started) * 1000)
+        return connection
+
+    def resized(self, pool_size: int) -> TimedAsyncAdaptedQueuePool:
+        """Return an empty copy of this pool holding ``pool_size`` connections."""
+        return self.__class__(
+            self._creator,
+            pool_size=pool_size,
+            max_overflow=self._max_overflow,
+            pre_ping=self._pre_ping,
+            use_lifo=self._pool.use_lifo,
+            timeout=self._timeout,
+            recycle=self._recycle,
+            echo=self.echo,
+            logging_name=self._orig_logging_name,
+            reset_on_return=self._reset_on_return,
+            _dispatch=self.dispatch,
+            dialect=self._dialect,
+        )
+
+
+def engine_kwargs(url: str, options: EnginePoolOptions) -> dict[str, Any]:
+    """Return ``create_async_engine`` keyword arguments for ``url``."""
+    kwargs: dict[str, Any] = {"echo": False, "future": True}
+    if make_url(url).get_backend_name() != "postgresql":
+        # SQLite/test engines keep SQLAlchemy's pool choice for the dialect.
+        kwargs["pool_pre_ping"] = True
+        return kwargs
+    connect_args: dict[str, Any] = {
+        "prepared_statement_cache_size": options.statement_cache_size,
+    }
+    if options.statement_timeout_ms:
+        connect_args["server_settings"] = {
+            "statement_timeout": str(options.statement_timeout_ms)
+        }
+    kwargs.update(
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_size=options.pool_size,
+        max_overflow=options.max_overflow,
+        pool_timeout=options.pool_timeout_seconds,
+        pool_recycle=options.pool_recycle_seconds,
+        pool_pre_ping=options.pre_ping == PRE_PING_ALWAYS,
+        connect_args=connect_args,
+    )
+    return kwargs
+
+
+def install_idle_pre_ping(engine: AsyncEngine, *, idle_seconds: float) -> None:
+    """Ping only connections that sat in the pool longer than ``idle_seconds``.
+
+    A connection that was checked in moments ago is almost certainly alive, so
+    this skips the extra round trip ``pool_pre_ping`` pays on every checkout.
+    A failed ping raises ``DisconnectionError``, which makes the pool discard
+    the connection and hand out a fresh one.
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "checkin")
+    def _on_checkin(_dbapi_connection: Any, connection_record: Any) -> None:
+        connection_record.info[_CHECKED_IN_AT_KEY] = time.monotonic()
+
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(
+        dbapi_connection: Any, connection_record: Any, _connection_proxy: Any
+    ) -> None:
+        checked_in_at = connection_record.info.pop(_CHECKED_IN_AT_KEY, None)
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        try:
+            alive = sync_engine.dialect.do_ping(dbapi_connection)
+        except Exception as exc:
+            raise sa_exc.DisconnectionError() from exc
+        if alive is False:
+            raise sa_exc.DisconnectionError()
+
+
+def ensure_pool_size(engine: AsyncEngine, *, pool_size: int) -> bool:
+    """Grow the engine's pool to ``pool_size`` in place; return whether it grew.
+
+    Modules hold the engine by reference, so the pool is swapped rather than
+    the engine rebuilt. Pool listeners carry over; idle connections of the old
+    pool are closed.
+    """
+    sync_engine = engine.sync_engine
+    pool = sync_engine.pool
+    if not isinstance(pool, TimedAsyncAdaptedQueuePool) or pool.size() >= pool_size:
+        return False
+    sync_engine.pool = pool.resized(pool_size)
+    pool.dispose()
+    return True
+
+
+def create_engine_for_role(url: str, options: EnginePoolOptions) -> AsyncEngine:
+    """Create the process engine with the role's pool tuning."""
+    perf.pool_checkout_stats.role = options.role
+    engine = create_async_engine(url, **engine_kwargs(url, options))
+    if (
+        engine.dialect.name == "postgresql"
+        and options.pre_ping == PRE_PING_IDLE
+        and options.pre_ping_idle_seconds >= 0
+    ):
+        install_idle_pre_ping(engine, idle_seconds=options.pre_ping_idle_seconds)
+    return engine
+
+
+__all__ = [
+    "PRE_PING_ALWAYS",
+    "PRE_PING_IDLE",
+    "PRE_PING_NEVER",
+    "PROCESS_ROLES",
+    "PROCESS_ROLE_API",
+    "PROCESS_ROLE_WORKER",
+    "EnginePoolOptions",
+    "TimedAsyncAdaptedQueuePool",
+    "create_engine_for_role",
+    "engine_kwargs",
+    "ensure_pool_size",
+    "install_idle_pre_ping",
+    "pool_options_for_role",
+]
@@ -27,6 +27,7 @@ from app.shared.jobs.repositories.shared_jobs_repositories_models_repository imp
 from app.shared.jobs.repositories.shared_jobs_repositories_worker_heartbeats_repository_model import (
     WorkerHeartbeat,
 )
+from app.shared.perf.shared_perf_profile_sessions_model import PerfProfileSession
 from app.submissions.repositories.github_native.workspaces.submissions_repositories_github_native_workspaces_submissions_github_native_workspaces_core_model import (
     Workspace,
     WorkspaceGroup,
@@ -56,6 +57,12 @@ from app.trials.repositories.scenario_edit_audits.trials_repositories_scenario_e
 from app.trials.repositories.scenario_versions.trials_repositories_scenario_versions_trials_scenario_versions_model import (
     ScenarioVersion,
 )
+from app.trials.repositories.trials_repositories_trials_candidate_compare_summary_model import (
+    CandidateCompareSummary,
+)
+from app.trials.repositories.trials_repositories_trials_candidate_counters_model import (
+    TrialCandidateCounters,
+)
 from app.trials.repositories.trials_repositories_trials_trial_model import (
     Trial,
 )
@@ -64,6 +71,7 @@ __all__ = [
     "Base",
     "TimestampMixin",
     "CandidateSession",
+    "CandidateCompareSummary",
     "CandidateDayAudit",
     "AdminActionAudit",
     "Company",
@@ -75,10 +83,12 @@ __all__ = [
     "MediaPurgeAudit",
     "NotificationDeliveryAudit",
     "WorkerHeartbeat",
+    "PerfProfileSession",
     "RecordingAsset",
     "ScenarioEditAudit",
     "ScenarioVersion",
     "Trial",
+    "TrialCandidateCounters",
     "Task",
     "TaskDraft",
     "Transcript",
@@ -0,0 +1,155 @@
+"""Denormalized read models kept in sync inside the writing transaction."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Table, delete, event, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, SessionTransaction
+
+_PENDING_KEY = "winoe_read_models_pending"
+
+
+@dataclass(frozen=True, slots=True)
+class ReadModel:
+    """A table derived from other tables, refreshed per affected key.
+
+    ``keys_for(table_name, row)`` maps a written row (an ORM object, a
+    ``RETURNING`` row or a mapping) of a watched table to the keys whose read
+    rows must be rebuilt; ``refresh(connection, keys)`` rebuilds them with
+    Core statements on the writing transaction's connection.
+    """
+
+    name: str
+    tables: frozenset[str]
+    keys_for: Callable[[str, Any], Iterable[Any]]
+    refresh: Callable[[Connection, set[Any]], None]
+
+
+_READ_MODELS: dict[str, ReadModel] = {}
+
+
+def register_read_model(read_model: ReadModel) -> None:
+    """Register (or replace) a read model by name."""
+    _READ_MODELS[read_model.name] = read_model
+
+
+def row_value(row: Any, name: str) -> Any:
+    """Return ``name`` from an ORM object, ``Row`` or mapping."""
+    if isinstance(row, dict):
+        return row.get(name)
+    return getattr(row, name, None)
+
+
+def upsert_read_rows(
+    connection: Connection,
+    table: Table,
+    rows: list[dict[str, Any]],
+    *,
+    key_columns: tuple[str, ...],
+) -> None:
+    """Insert ``rows`` into a read-model table, replacing rows by key."""
+    if not rows:
+        return
+    if connection.dialect.name in {"postgresql", "sqlite"}:
+        insert = pg_insert if connection.dialect.name == "postgresql" else sqlite_insert
+        stmt = insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(key_columns),
+            set_={
+                name: stmt.excluded[name] for name in rows[0] if name not in key_columns
+            },
+        )
+        connection.execute(stmt, rows)
+        return
+    if len(key_columns) == 1:
+        key_filter = table.c[key_columns[0]].in_([row[key_columns[0]] for row in rows])
+    else:
+        key_filter = tuple_(*(table.c[name] for name in key_columns)).in_(
+            [tuple(row[name] for name in key_columns) for row in rows]
+        )
+    connection.execute(delete(table).where(key_filter))
+    connection.execute(table.insert(), rows)
+
+
+def _sync_session(db: Any) -> Session | None:
+    session = getattr(db, "sync_session", db)
+    return session if isinstance(session, Session) else None
+
+
+def _note(session: Session, table_name: str, rows: Iterable[Any]) -> None:
+    pending: dict[str, set[Any]] | None = None
+    for read_model in _READ_MODELS.values():
+        if table_name not in read_model.tables:
+            continue
+        for row in rows:
+            keys = {key for key in read_model.keys_for(table_name, row) if key}
+            if not keys:
+                continue
+            if pending is None:
+                pending = session.info.setdefault(_PENDING_KEY, {})
+            pending.setdefault(read_model.name, set()).update(keys)
+
+
+def note_rows_written(db: Any, table_name: str, rows: Iterable[Any]) -> None:
+    """Record rows written with Core DML so read models refresh on commit.
+
+    ORM flushes are picked up automatically; bulk ``insert``/``update``
+    statements bypass the unit of work and must report what they touched.
+    """
+    session = _sync_session(db)
+    if session is not None:
+        _note(session, table_name, list(rows))
+
+
+def refresh_pending_read_models(session: Session) -> None:
+    """Rebuild every read row invalidated so far in this transaction."""
+    pending: dict[str, set[Any]] = session.info.pop(_PENDING_KEY, None) or {}
+    if not pending:
+        return
+    connection = session.connection()
+    for name, keys in pending.items():
+        read_model = _READ_MODELS.get(name)
+        if read_model is not None and keys:
+            read_model.refresh(connection, keys)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_rows(session: Session, _flush_context: Any) -> None:
+    if not _READ_MODELS:
+        return
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(obj, "__table__", None)
+        if table is not None:
+            _note(session, table.name, (obj,))
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _refresh_after_flush(session: Session, _flush_context: Any) -> None:
+    refresh_pending_read_models(session)
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_before_commit(session: Session) -> None:
+    refresh_pending_read_models(session)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_pending(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+__all__ = [
+    "ReadModel",
+    "note_rows_written",
+    "refresh_pending_read_models",
+    "register_read_model",
+    "row_value",
+    "upsert_read_rows",
+]
@@ -0,0 +1,147 @@
+"""Read-replica routing: lag checks and read-your-writes tracking."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections.abc import Awaitable, Callable, Mapping
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# An idle primary ships no WAL, so ``pg_last_xact_replay_timestamp`` keeps
+# ageing on a fully caught-up replica; report zero lag once replay has
+# reached everything received.
+_REPLICA_LAG_SQL = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN 0"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())"
+    " END"
+)
+_LAG_PROBE_TIMEOUT_SECONDS = 1.0
+_PRINCIPAL_HEADERS = ("authorization", "x-dev-user-email", "cookie")
+_MAX_TRACKED_PRINCIPALS = 10_000
+
+LagProbe = Callable[[AsyncEngine], Awaitable[float | None]]
+
+
+async def probe_replica_lag(engine: AsyncEngine) -> float | None:
+    """Return replication lag in seconds (``None`` when it cannot be told)."""
+    if engine.dialect.name != "postgresql":
+        return 0.0
+    async with engine.connect() as conn:
+        lag = (await conn.execute(_REPLICA_LAG_SQL)).scalar()
+    return None if lag is None else max(0.0, float(lag))
+
+
+class ReplicaLagMonitor:
+    """Cached answer to "is the replica fresh enough to read from?".
+
+    At most one probe runs per ``check_interval_seconds``; requests arriving
+    while a probe is in flight use the previous answer instead of queueing
+    behind it. A failed or timed-out probe marks the replica unusable until
+    the next check.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+        probe: LagProbe = probe_replica_lag,
+    ) -> None:
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self._probe = probe
+        self._lock = asyncio.Lock()
+        self._next_check_at = 0.0
+        self._usable = False
+        self.lag_seconds: float | None = None
+
+    async def replica_usable(self, engine: AsyncEngine) -> bool:
+        """Return whether reads may go to ``engine`` right now."""
+        if time.monotonic() < self._next_check_at or self._lock.locked():
+            return self._usable
+        async with self._lock:
+            try:
+                lag = await asyncio.wait_for(
+                    self._probe(engine), timeout=_LAG_PROBE_TIMEOUT_SECONDS
+                )
+            except Exception:
+                logger.warning("read_replica_probe_failed", exc_info=True)
+                lag = None
+            usable = lag is not None and lag <= self.max_lag_seconds
+            if usable != self._usable:
+                logger.info(
+                    "read_replica_routing_changed",
+                    extra={"usable": usable, "lag_seconds": lag},
+                )
+            self.lag_seconds = lag
+            self._usable = usable
+            self._next_check_at = time.monotonic() + self.check_interval_seconds
+        return self._usable
+
+
+def principal_key(headers: Mapping[str, str]) -> str | None:
+    """Return an opaque key for the caller's credentials, if any."""
+    for name in _PRINCIPAL_HEADERS:
+        value = (headers.get(name) or "").strip()
+        if value:
+            digest = hashlib.blake2b(value.encode(), digest_size=16).hexdigest()
+            return f"{name}:{digest}"
+    return None
+
+
+class RecentWriteTracker:
+    """Principals that wrote within the last ``window_seconds`` (this process).
+
+    Reads from those principals stay on the primary so they see their own
+    changes. The window is per API process; requests that land on another
+    process are still bounded by the replica lag threshold.
+    """
+
+    def __init__(self, *, window_seconds: float) -> None:
+        self.window_seconds = window_seconds
+        self._expires_at: dict[str, float] = {}
+
+    def mark(self, key: str | None) -> None:
+        """Record a successful write by ``key``."""
+        if not key or self.window_seconds <= 0:
+            return
+        now = time.monotonic()
+        if len(self._expires_at) >= _MAX_TRACKED_PRINCIPALS:
+            self._prune(now)
+        self._expires_at[key] = now + self.window_seconds
+
+    def wrote_recently(self, key: str | None) -> bool:
+        """Return whether ``key`` is still inside its read-your-writes window."""
+        if not key:
+            return False
+        expires_at = self._expires_at.get(key)
+        if expires_at is None:
+            return False
+        if time.monotonic() >= expires_at:
+            self._expires_at.pop(key, None)
+            return False
+        return True
+
+    def _prune(self, now: float) -> None:
+        self._expires_at = {
+            key: expires_at
+            for key, expires_at in self._expires_at.items()
+            if expires_at > now
+        }
+
+
+__all__ = [
+    "LagProbe",
+    "RecentWriteTracker",
+    "ReplicaLagMonitor",
+    "principal_key",
+    "probe_replica_lag",
+]
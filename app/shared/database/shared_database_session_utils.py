@@ -0,0 +1,133 @@
+"""Sessions that hand their connection back between read-only statements."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.orm.session import SessionTransaction, SessionTransactionOrigin
+
+_PINNED_KEY = "winoe_connection_pinned"
+
+
+class LazyReleaseSession(Session):
+    """Sync session that notes when its transaction must keep the connection.
+
+    Writes, flushes, ``FOR UPDATE`` reads and anything that is not a plain
+    ``SELECT`` (text statements may take advisory or ``SET LOCAL`` state) pin
+    the connection until the transaction ends.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        event.listen(self, "do_orm_execute", _pin_unless_plain_select)
+        event.listen(self, "after_flush", _pin_after_flush)
+        event.listen(self, "after_transaction_end", _unpin_after_root_end)
+
+
+def _pin(session: Session) -> None:
+    session.info[_PINNED_KEY] = True
+
+
+def _pin_unless_plain_select(orm_execute_state: ORMExecuteState) -> None:
+    statement = orm_execute_state.statement
+    if (
+        not orm_execute_state.is_select
+        or getattr(statement, "_for_update_arg", None) is not None
+    ):
+        _pin(orm_execute_state.session)
+
+
+def _pin_after_flush(session: Session, _flush_context: Any) -> None:
+    _pin(session)
+
+
+def _unpin_after_root_end(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(_PINNED_KEY, None)
+
+
+class LazyReleaseAsyncSession(AsyncSession):
+    """Async session that returns its connection to the pool when idle.
+
+    SQLAlchemy already checks a connection out only on the first statement,
+    but the autobegun transaction then holds it until commit or close, so a
+    request that reads the current user and then waits on GitHub or an AI
+    provider keeps a pooled connection the whole time. After each statement
+    run through this session, an autobegun transaction that has only read
+    (see ``LazyReleaseSession``) and has nothing pending is committed, which
+    releases the connection; the next statement checks one out again.
+
+    Under Postgres' default READ COMMITTED every statement takes its own
+    snapshot anyway, so ending the read-only transaction early does not
+    change what later statements see. ``stream`` keeps its connection (the
+    cursor is still open), as does ``connection``/``run_sync`` and anything
+    inside an explicit ``begin``/``begin_nested``. Requires
+    ``expire_on_commit=False`` so loaded objects stay usable.
+    """
+
+    sync_session_class = LazyReleaseSession
+
+    async def execute(self, *args: Any, **kwargs: Any) -> Any:
+        result = await super().execute(*args, **kwargs)
+        await self.release_idle_connection()
+        return result
+
+    async def scalar(self, *args: Any, **kwargs: Any) -> Any:
+        result = await super().scalar(*args, **kwargs)
+        await self.release_idle_connection()
+        return result
+
+    async def get(self, *args: Any, **kwargs: Any) -> Any:
+        result = await super().get(*args, **kwargs)
+        await self.release_idle_connection()
+        return result
+
+    async def get_one(self, *args: Any, **kwargs: Any) -> Any:
+        result = await super().get_one(*args, **kwargs)
+        await self.release_idle_connection()
+        return result
+
+    async def refresh(self, *args: Any, **kwargs: Any) -> None:
+        await super().refresh(*args, **kwargs)
+        await self.release_idle_connection()
+
+    async def connection(self, *args: Any, **kwargs: Any) -> Any:
+        _pin(self.sync_session)
+        return await super().connection(*args, **kwargs)
+
+    async def run_sync(self, *args: Any, **kwargs: Any) -> Any:
+        _pin(self.sync_session)
+        return await super().run_sync(*args, **kwargs)
+
+    async def stream(self, *args: Any, **kwargs: Any) -> Any:
+        _pin(self.sync_session)
+        return await super().stream(*args, **kwargs)
+
+    async def stream_scalars(self, *args: Any, **kwargs: Any) -> Any:
+        _pin(self.sync_session)
+        return await super().stream_scalars(*args, **kwargs)
+
+    def _can_release(self) -> bool:
+        sync_session = self.sync_session
+        transaction = sync_session.get_transaction()
+        return (
+            transaction is not None
+            and transaction.origin is SessionTransactionOrigin.AUTOBEGIN
+            and sync_session.get_nested_transaction() is None
+            and not sync_session.info.get(_PINNED_KEY)
+            and not sync_session.expire_on_commit
+            and not (sync_session.new or sync_session.deleted or sync_session.dirty)
+        )
+
+    async def release_idle_connection(self) -> bool:
+        """End a read-only autobegun transaction; return whether it did."""
+        if not self._can_release():
+            return False
+        await super().commit()
+        return True
+
+
+__all__ = ["LazyReleaseAsyncSession", "LazyReleaseSession"]
@@ -3,8 +3,10 @@
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 
-from app.shared.http import shared_http_readiness_service as readiness_service
-from app.shared.http.schemas import ReadinessPayload
+from app.shared.http.schemas import ReadinessLightPayload, ReadinessPayload
+from app.shared.http.shared_http_readiness_refresher_service import (
+    readiness_refresher,
+)
 
 router = APIRouter()
 
@@ -41,7 +43,35 @@ async def health_check():
 )
 async def readiness_check():
     """Readiness probe endpoint."""
-    payload = await readiness_service.build_readiness_payload()
+    payload = await readiness_refresher.payload()
+    if payload.get("status") != "ready":
+        return JSONResponse(status_code=503, content=payload)
+    return payload
+
+
+@router.get(
+    "/ready/light",
+    summary="Light Readiness Check",
+    description=(
+        "Status-only readiness probe served from the cached readiness snapshot, "
+        "falling back to a database connectivity query."
+    ),
+    response_model=ReadinessLightPayload,
+    responses={
+        200: {"description": "System is ready."},
+        503: {
+            "description": "System is not ready.",
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": "#/components/schemas/ReadinessLightPayload"}
+                }
+            },
+        },
+    },
+)
+async def light_readiness_check():
+    """Light readiness probe endpoint."""
+    payload = await readiness_refresher.light_payload()
     if payload.get("status") != "ready":
         return JSONResponse(status_code=503, content=payload)
     return payload
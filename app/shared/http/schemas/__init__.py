@@ -3,11 +3,13 @@
 from app.shared.http.schemas.shared_http_schemas_readiness_schema import (
     ReadinessCheckItem,
     ReadinessChecks,
+    ReadinessLightPayload,
     ReadinessPayload,
 )
 
 __all__ = [
     "ReadinessCheckItem",
     "ReadinessChecks",
+    "ReadinessLightPayload",
     "ReadinessPayload",
 ]
@@ -37,3 +37,10 @@ class ReadinessPayload(APIModel):
     checkedAt: str
     checks: ReadinessChecks
     demoMode: bool = False
+
+
+class ReadinessLightPayload(APIModel):
+    """Status-only readiness payload returned by GET /ready/light."""
+
+    status: ReadinessPayloadStatus
+    checkedAt: str
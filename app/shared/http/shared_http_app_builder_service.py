@@ -17,6 +17,7 @@ from app.shared.http.shared_http_middleware import (
     configure_legacy_candidate_trial_compatibility_headers,
     configure_perf_logging,
     configure_proxy_headers,
+    configure_read_your_writes,
     configure_request_limits,
     configure_security_headers,
 )
@@ -35,6 +36,7 @@ def create_app() -> FastAPI:
 
     app = FastAPI(title=f"{APP_NAME} Backend", version="0.1.0", lifespan=lifespan)
     configure_perf_logging(app)
+    configure_read_your_writes(app)
     configure_proxy_headers(app)
     configure_request_limits(app)
     configure_csrf_protection(app)
@@ -7,6 +7,11 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from app.shared.database import init_db_if_needed as _init_db_if_needed
+from app.shared.http.shared_http_readiness_refresher_service import (
+    readiness_refresh_interval_seconds,
+    readiness_refresher,
+)
+from app.shared.perf import monitor_event_loop_lag
 
 
 @asynccontextmanager
@@ -15,19 +20,25 @@ async def lifespan(_app: FastAPI):
     from app.api import main as api_main
 
     await getattr(api_main, "init_db_if_needed", _init_db_if_needed)()
-    try:
-        yield
-    finally:
+    async with (
+        monitor_event_loop_lag(),
+        readiness_refresher.running(
+            interval_seconds=readiness_refresh_interval_seconds()
+        ),
+    ):
         try:
-            from app.shared.http.dependencies.shared_http_dependencies_github_native_utils import (
-                _github_client_singleton,
-            )
-
-            client = _github_client_singleton()
-            await client.aclose()
-        except Exception:
-            # Best-effort cleanup; swallow errors to avoid blocking shutdown.
-            pass
+            yield
+        finally:
+            try:
+                from app.shared.http.dependencies.shared_http_dependencies_github_native_utils import (
+                    _github_client_singleton,
+                )
+
+                client = _github_client_singleton()
+                await client.aclose()
+            except Exception:
+                # Best-effort cleanup; swallow errors to avoid blocking shutdown.
+                pass
 
 
 __all__ = ["lifespan"]
@@ -12,6 +12,9 @@ from app.shared.http.shared_http_middleware_perf_middleware import (
     configure_core_logging,
     configure_perf_logging,
 )
+from app.shared.http.shared_http_middleware_read_routing_middleware import (
+    configure_read_your_writes,
+)
 
 __all__ = [
     "configure_core_logging",
@@ -20,6 +23,7 @@ __all__ = [
     "configure_legacy_candidate_trial_compatibility_headers",
     "configure_perf_logging",
     "configure_proxy_headers",
+    "configure_read_your_writes",
     "configure_request_limits",
     "configure_security_headers",
 ]
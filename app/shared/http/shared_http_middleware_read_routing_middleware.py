@@ -0,0 +1,59 @@
+"""Application module for http middleware read routing middleware workflows."""
+
+from __future__ import annotations
+
+from fastapi import FastAPI
+
+from app.shared.database.shared_database_read_routing_utils import (
+    RecentWriteTracker,
+    principal_key,
+)
+
+from .shared_http_middleware_http_request_middleware import _headers_map
+
+_STATE_CHANGING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+class ReadYourWritesMiddleware:
+    """Mark callers whose state-changing request succeeded.
+
+    ``get_read_session`` keeps those callers on the primary for the tracker's
+    window so a replica that has not replayed the write yet is never read.
+    """
+
+    def __init__(self, app, *, tracker: RecentWriteTracker) -> None:
+        self.app = app
+        self.tracker = tracker
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope.get("type") != "http"
+            or str(scope.get("method") or "").upper() not in _STATE_CHANGING_METHODS
+        ):
+            await self.app(scope, receive, send)
+            return
+        key = principal_key(_headers_map(scope.get("headers") or []))
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def _send(message):
+            if message.get("type") == "http.response.start" and (
+                int(message.get("status") or 500) < 400
+            ):
+                self.tracker.mark(key)
+            await send(message)
+
+        await self.app(scope, receive, _send)
+
+
+def configure_read_your_writes(app: FastAPI) -> None:
+    """Track writers when a read replica is configured."""
+    from app.shared.database import read_engine, recent_writes
+
+    if read_engine is None:
+        return
+    app.add_middleware(ReadYourWritesMiddleware, tracker=recent_writes)
+
+
+__all__ = ["ReadYourWritesMiddleware", "configure_read_your_writes"]
@@ -0,0 +1,128 @@
+"""Background refresh of the readiness payload."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from datetime import UTC, datetime
+from typing import Any
+
+from app.config import settings
+from app.shared.http import shared_http_readiness_service as readiness_service
+
+logger = logging.getLogger(__name__)
+
+READINESS_REFRESH_INTERVAL_SECONDS_DEFAULT = 10.0
+# A snapshot older than this many intervals means the refresher is stuck;
+# ``payload()`` then rebuilds inline instead of serving it.
+_STALE_AFTER_INTERVALS = 3
+
+
+def readiness_refresh_interval_seconds() -> float:
+    """Return how often the API process rebuilds the readiness payload."""
+    raw = getattr(
+        settings,
+        "READINESS_REFRESH_INTERVAL_SECONDS",
+        READINESS_REFRESH_INTERVAL_SECONDS_DEFAULT,
+    )
+    try:
+        return max(0.0, float(raw))
+    except (TypeError, ValueError):
+        return READINESS_REFRESH_INTERVAL_SECONDS_DEFAULT
+
+
+class ReadinessRefresher:
+    """In-memory readiness payload rebuilt by a background task.
+
+    While :meth:`running` is active, ``/ready`` is served from the latest
+    snapshot. Outside it (tests, scripts, or an interval of 0) every call
+    builds the payload inline, as before.
+    """
+
+    def __init__(self) -> None:
+        self._interval_seconds = 0.0
+        self._task: asyncio.Task[None] | None = None
+        self._lock = asyncio.Lock()
+        self._payload: dict[str, Any] | None = None
+        self._refreshed_at = 0.0
+
+    def snapshot(self) -> dict[str, Any] | None:
+        """Return the cached payload, or ``None`` when absent or stale."""
+        if self._task is None or self._payload is None:
+            return None
+        max_age = self._interval_seconds * _STALE_AFTER_INTERVALS
+        if time.monotonic() - self._refreshed_at > max_age:
+            return None
+        return self._payload
+
+    async def refresh(self) -> dict[str, Any]:
+        """Rebuild the payload; concurrent callers share one rebuild."""
+        started_at = time.monotonic()
+        async with self._lock:
+            if self._payload is not None and self._refreshed_at >= started_at:
+                return self._payload
+            payload = await readiness_service.build_readiness_payload()
+            self._payload = payload
+            self._refreshed_at = time.monotonic()
+            return payload
+
+    async def payload(self) -> dict[str, Any]:
+        """Return the full readiness payload for ``GET /ready``."""
+        cached = self.snapshot()
+        if cached is not None:
+            return cached
+        if self._task is None:
+            return await readiness_service.build_readiness_payload()
+        return await self.refresh()
+
+    async def light_payload(self) -> dict[str, Any]:
+        """Return status only, from the snapshot or a ``SELECT 1``."""
+        cached = self.snapshot()
+        if cached is not None:
+            return {"status": cached["status"], "checkedAt": cached["checkedAt"]}
+        check = await readiness_service.check_database_connectivity()
+        return {
+            "status": "ready" if check.status == "ready" else "not_ready",
+            "checkedAt": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+        }
+
+    async def _refresh_forever(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.warning("readiness_refresh_failed", exc_info=True)
+            await asyncio.sleep(self._interval_seconds)
+
+    @asynccontextmanager
+    async def running(self, *, interval_seconds: float) -> AsyncIterator[None]:
+        """Refresh in the background for the context lifetime."""
+        if interval_seconds <= 0:
+            yield
+            return
+        self._interval_seconds = float(interval_seconds)
+        # The module singleton may outlive an event loop (tests, reloads).
+        self._lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._refresh_forever())
+        try:
+            yield
+        finally:
+            task, self._task = self._task, None
+            self._payload = None
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+
+readiness_refresher = ReadinessRefresher()
+
+
+__all__ = [
+    "READINESS_REFRESH_INTERVAL_SECONDS_DEFAULT",
+    "ReadinessRefresher",
+    "readiness_refresh_interval_seconds",
+    "readiness_refresher",
+]
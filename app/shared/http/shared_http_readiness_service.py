@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, Literal
 
-from sqlalchemy import inspect
+from sqlalchemy import inspect, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.ai import (
@@ -80,6 +80,11 @@ class ReadinessCheck:
         return payload
 
 
+# Schema checks that passed, keyed by the Alembic head(s) they were run
+# against (``None`` when the database is not managed by Alembic).
+_SCHEMA_CHECKS_BY_HEAD: dict[tuple[str, ...] | None, ReadinessCheck] = {}
+
+
 def _utc_now(now: datetime | None = None) -> datetime:
     resolved = now or datetime.now(UTC)
     if resolved.tzinfo is None:
@@ -161,6 +166,30 @@ def _inspect_schema(sync_connection) -> ReadinessCheck:
     )
 
 
+def _migration_heads(sync_connection) -> tuple[str, ...] | None:
+    if not inspect(sync_connection).has_table("alembic_version"):
+        return None
+    rows = sync_connection.execute(text("SELECT version_num FROM alembic_version"))
+    return tuple(sorted(str(head) for head in rows.scalars()))
+
+
+def _inspect_schema_per_head(sync_connection) -> ReadinessCheck:
+    """Reflect the schema once per process and migration head.
+
+    Only passing checks are remembered, so a failing schema is re-inspected
+    on every readiness refresh until it is fixed.
+    """
+    heads = _migration_heads(sync_connection)
+    cached = _SCHEMA_CHECKS_BY_HEAD.get(heads)
+    if cached is not None:
+        return cached
+    check = _inspect_schema(sync_connection)
+    if check.status == "ready":
+        _SCHEMA_CHECKS_BY_HEAD.clear()
+        _SCHEMA_CHECKS_BY_HEAD[heads] = check
+    return check
+
+
 def _format_heartbeat_age(
     heartbeat: object,
     *,
@@ -178,7 +207,7 @@ async def check_database_readiness() -> ReadinessCheck:
     """Validate the database connection and schema shape."""
     try:
         async with engine.connect() as conn:
-            return await conn.run_sync(_inspect_schema)
+            return await conn.run_sync(_inspect_schema_per_head)
     except Exception:
         return _readiness_check(
             status="not_ready",
@@ -187,6 +216,24 @@ async def check_database_readiness() -> ReadinessCheck:
         )
 
 
+async def check_database_connectivity() -> ReadinessCheck:
+    """Validate only that the database answers a trivial query."""
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except Exception:
+        return _readiness_check(
+            status="not_ready",
+            code="database_unavailable",
+            detail="Database connection failed.",
+        )
+    return _readiness_check(
+        status="ready",
+        code="database_reachable",
+        detail="Database answered a connectivity query.",
+    )
+
+
 async def check_worker_readiness(
     *,
     session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
@@ -502,6 +549,7 @@ __all__ = [
     "ReadinessCheck",
     "build_readiness_payload",
     "check_ai_readiness",
+    "check_database_connectivity",
     "check_database_readiness",
     "check_email_readiness",
     "check_github_readiness",
@@ -11,6 +11,8 @@ _MODULE_ALIASES = {
     "heartbeat": "app.shared.jobs.shared_jobs_worker_heartbeat_service",
     "repositories": "app.shared.jobs.repositories",
     "schemas": "app.shared.jobs.schemas",
+    "supervisor": "app.shared.jobs.shared_jobs_worker_supervisor_service",
+    "wakeup": "app.shared.jobs.shared_jobs_wakeup_service",
     "worker_cli": "app.shared.jobs.shared_jobs_worker_cli_service",
     "worker": "app.shared.jobs.shared_jobs_worker_service",
     "worker_runtime": "app.shared.jobs.worker_runtime",
@@ -20,6 +20,7 @@ import app.shared.jobs.handlers.shared_jobs_handlers_transcribe_recording_handle
 import app.shared.jobs.handlers.shared_jobs_handlers_transcribe_recording_helpers_handler as transcribe_recording_helpers
 import app.shared.jobs.handlers.shared_jobs_handlers_transcribe_recording_runtime_handler as transcribe_recording_runtime
 import app.shared.jobs.handlers.shared_jobs_handlers_transcribe_recording_state_handler as transcribe_recording_state
+import app.shared.jobs.handlers.shared_jobs_handlers_trial_candidate_counters_reconcile_handler as trial_candidate_counters_reconcile
 import app.shared.jobs.handlers.shared_jobs_handlers_trial_cleanup_handler as trial_cleanup
 import app.shared.jobs.handlers.shared_jobs_handlers_workspace_cleanup_handler as workspace_cleanup
 import app.shared.jobs.handlers.shared_jobs_handlers_workspace_cleanup_processing_handler as workspace_cleanup_processing
@@ -64,6 +65,10 @@ from app.shared.jobs.handlers.shared_jobs_handlers_transcribe_recording_handler
     TRANSCRIBE_RECORDING_JOB_TYPE,
     handle_transcribe_recording,
 )
+from app.shared.jobs.handlers.shared_jobs_handlers_trial_candidate_counters_reconcile_handler import (
+    TRIAL_CANDIDATE_COUNTERS_RECONCILE_JOB_TYPE,
+    handle_trial_candidate_counters_reconcile,
+)
 from app.shared.jobs.handlers.shared_jobs_handlers_trial_cleanup_handler import (
     TRIAL_CLEANUP_JOB_TYPE,
     handle_trial_cleanup,
@@ -88,6 +93,8 @@ __all__ = [
     "WINOE_REPORT_READY_NOTIFICATION_JOB_TYPE",
     "handle_candidate_completed_notification",
     "handle_winoe_report_ready_notification",
+    "TRIAL_CANDIDATE_COUNTERS_RECONCILE_JOB_TYPE",
+    "handle_trial_candidate_counters_reconcile",
     "TRIAL_CLEANUP_JOB_TYPE",
     "handle_trial_cleanup",
     "SCENARIO_GENERATION_JOB_TYPE",
@@ -114,6 +121,7 @@ __all__ = [
     "scenario_generation_parse",
     "scenario_generation_paths",
     "scenario_generation_runtime",
+    "trial_candidate_counters_reconcile",
     "trial_cleanup",
     "transcribe_recording",
     "transcribe_recording_helpers",
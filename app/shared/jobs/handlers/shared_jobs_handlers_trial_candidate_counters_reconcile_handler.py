@@ -0,0 +1,51 @@
+"""Worker handler for trial candidate counters reconciliation jobs."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from app.shared.database import async_session_maker
+from app.shared.utils.shared_utils_parsing_utils import parse_positive_int
+from app.trials.services.trials_services_trials_candidate_counters_jobs_service import (
+    TRIAL_CANDIDATE_COUNTERS_RECONCILE_JOB_TYPE,
+)
+from app.trials.services.trials_services_trials_candidate_counters_service import (
+    RECONCILE_BATCH_SIZE,
+    reconcile_trial_candidate_counters,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def handle_trial_candidate_counters_reconcile(
+    payload_json: dict[str, Any],
+) -> dict[str, Any]:
+    """Recount trial candidate counters and repair drift."""
+    company_id = parse_positive_int(payload_json.get("companyId"))
+    batch_size = parse_positive_int(payload_json.get("batchSize"))
+    async with async_session_maker() as db:
+        result = await reconcile_trial_candidate_counters(
+            db,
+            company_id=company_id,
+            batch_size=batch_size or RECONCILE_BATCH_SIZE,
+        )
+    if result.repaired_count:
+        logger.warning(
+            "trial_candidate_counters_drift_repaired",
+            extra={
+                "companyId": company_id,
+                "repairedCount": result.repaired_count,
+                "trialIds": result.repaired_trial_ids[:50],
+            },
+        )
+    return {
+        "scannedCount": result.scanned_count,
+        "repairedCount": result.repaired_count,
+    }
+
+
+__all__ = [
+    "TRIAL_CANDIDATE_COUNTERS_RECONCILE_JOB_TYPE",
+    "handle_trial_candidate_counters_reconcile",
+]
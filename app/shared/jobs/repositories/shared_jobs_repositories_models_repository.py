@@ -2,11 +2,26 @@
 
 from __future__ import annotations
 
+import re
 import uuid
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    column,
+    event,
+    func,
+    select,
+    table,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.shared.database.shared_database_base_model import Base
@@ -18,6 +33,13 @@ JOB_STATUS_DEAD_LETTER = "dead_letter"
 
 TERMINAL_JOB_STATUSES = {JOB_STATUS_SUCCEEDED, JOB_STATUS_DEAD_LETTER}
 
+_TRIAL_CORRELATION_RE = re.compile(r"(?:^|:)trial:(\d+)(?:$|:)")
+_DEAD_LETTER_WHERE = text(f"status = '{JOB_STATUS_DEAD_LETTER}'")
+_FINISHED_WHERE = text(
+    f"status IN ('{JOB_STATUS_SUCCEEDED}', '{JOB_STATUS_DEAD_LETTER}')"
+)
+_candidate_sessions = table("candidate_sessions", column("id"), column("trial_id"))
+
 
 class Job(Base):
     """Durable background job row."""
@@ -27,6 +49,24 @@ class Job(Base):
         Index("ix_jobs_status_next_run_created", "status", "next_run_at", "created_at"),
         Index("ix_jobs_company_id", "company_id"),
         Index("ix_jobs_candidate_session_id", "candidate_session_id"),
+        Index(
+            "ix_jobs_trial_dead_letter",
+            "trial_id",
+            "company_id",
+            "updated_at",
+            "created_at",
+            postgresql_where=_DEAD_LETTER_WHERE,
+            sqlite_where=_DEAD_LETTER_WHERE,
+        ),
+        # Throughput metrics count finished jobs in a trailing window.
+        Index(
+            "ix_jobs_finished_status_updated",
+            "status",
+            "updated_at",
+            "job_type",
+            postgresql_where=_FINISHED_WHERE,
+            sqlite_where=_FINISHED_WHERE,
+        ),
         Index(
             "uq_jobs_company_job_type_idempotency_key",
             "company_id",
@@ -49,6 +89,9 @@ class Job(Base):
     max_attempts: Mapped[int] = mapped_column(
         Integer, nullable=False, default=5, server_default="5"
     )
+    priority: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
     idempotency_key: Mapped[str] = mapped_column(String(255), nullable=False)
     payload_json: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
     result_json: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
@@ -72,6 +115,9 @@ class Job(Base):
     )
     locked_by: Mapped[str | None] = mapped_column(String(255), nullable=True)
     correlation_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # W3C traceparent of the span that enqueued the job, so the job's span
+    # joins that trace.
+    traceparent: Mapped[str | None] = mapped_column(String(55), nullable=True)
 
     company_id: Mapped[int] = mapped_column(
         ForeignKey("companies.id"), nullable=False, index=False
@@ -79,3 +125,44 @@ class Job(Base):
     candidate_session_id: Mapped[int | None] = mapped_column(
         ForeignKey("candidate_sessions.id"), nullable=True, index=False
     )
+    # Denormalized Trial scope for failure summaries; filled on insert by
+    # ``_populate_trial_id``. No foreign key: jobs outlive their Trials and
+    # payload-declared ids are not validated.
+    trial_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+
+def _positive_int(value: Any) -> int | None:
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed > 0 else None
+
+
+def trial_id_from_job_metadata(
+    payload_json: Any, correlation_id: str | None
+) -> int | None:
+    """Infer a Trial id from a job's payload or correlation id."""
+    payload = payload_json if isinstance(payload_json, dict) else {}
+    for key in ("trialId", "trial_id"):
+        parsed = _positive_int(payload.get(key))
+        if parsed is not None:
+            return parsed
+    match = _TRIAL_CORRELATION_RE.search(correlation_id or "")
+    return _positive_int(match.group(1)) if match else None
+
+
+@event.listens_for(Job, "before_insert")
+@event.listens_for(Job, "before_update")
+def _populate_trial_id(_mapper, connection, target: Job) -> None:
+    if target.trial_id is not None:
+        return
+    target.trial_id = trial_id_from_job_metadata(
+        target.payload_json, target.correlation_id
+    )
+    if target.trial_id is None and target.candidate_session_id is not None:
+        target.trial_id = connection.scalar(
+            select(_candidate_sessions.c.trial_id).where(
+                _candidate_sessions.c.id == target.candidate_session_id
+            )
+        )
@@ -16,6 +16,7 @@ from app.shared.jobs.repositories import (
 )
 from app.shared.jobs.repositories.shared_jobs_repositories_repository_claim_repository import (
     claim_next_runnable,
+    claim_runnable_batch,
 )
 from app.shared.jobs.repositories.shared_jobs_repositories_repository_dead_letter_repository import (
     requeue_dead_letter_job,
@@ -25,6 +26,10 @@ from app.shared.jobs.repositories.shared_jobs_repositories_repository_lookup_rep
     get_by_id,
     get_by_id_for_principal,
 )
+from app.shared.jobs.repositories.shared_jobs_repositories_repository_queue_stats_repository import (
+    load_finished_counts_since,
+    load_live_queue_counts,
+)
 from app.shared.jobs.repositories.shared_jobs_repositories_repository_requeue_repository import (
     requeue_nonterminal_idempotent_job,
 )
@@ -47,6 +52,7 @@ from app.shared.jobs.repositories.shared_jobs_repositories_repository_status_rep
     mark_dead_letter,
     mark_failed_and_reschedule,
     mark_succeeded,
+    renew_lease,
 )
 from app.shared.jobs.repositories.shared_jobs_repositories_worker_heartbeats_repository import (
     get_latest_worker_heartbeat,
@@ -87,16 +93,20 @@ __all__ = [
     "MAX_JOB_ERROR_CHARS",
     "MAX_JOB_PAYLOAD_BYTES",
     "claim_next_runnable",
+    "claim_runnable_batch",
     "create_or_get_idempotent",
     "create_or_update_idempotent",
     "create_or_update_many_idempotent",
     "get_by_id",
     "get_by_id_for_principal",
     "get_latest_worker_heartbeat",
+    "load_finished_counts_since",
+    "load_live_queue_counts",
     "mark_dead_letter",
     "mark_failed_and_reschedule",
     "mark_worker_stopped",
     "mark_succeeded",
+    "renew_lease",
     "requeue_nonterminal_idempotent_job",
     "requeue_dead_letter_jobs",
     "requeue_dead_letter_job",
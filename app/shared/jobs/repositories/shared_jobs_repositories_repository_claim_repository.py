@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from datetime import timedelta
 
-from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy import and_, case, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.shared.jobs.repositories.shared_jobs_repositories_models_repository import (
@@ -16,6 +17,12 @@ from app.shared.jobs.repositories.shared_jobs_repositories_repository_lookup_rep
     get_by_id,
 )
 
+_OPTIMISTIC_CLAIM_ATTEMPTS = 8
+# Class key of the transaction-scoped advisory locks (one per capped job
+# type, keyed by ``hashtext(job_type)``) that make a type's running count and
+# the claim consuming its headroom atomic on PostgreSQL.
+_CAPPED_CLAIM_LOCK_CLASS = 0x4A0B5CA9
+
 
 def runnable_filter(now, *, stale_before):
     """Execute runnable filter."""
@@ -31,22 +38,243 @@ def runnable_filter(now, *, stale_before):
     )
 
 
-async def claim_next_runnable(
+def _claim_order():
+    return (
+        Job.priority.desc(),
+        func.coalesce(Job.next_run_at, Job.created_at).asc(),
+        Job.created_at.asc(),
+    )
+
+
+def _claimable_filter(now, *, stale_before, excluded_job_types: Sequence[str] = ()):
+    runnable = runnable_filter(now, stale_before=stale_before)
+    if not excluded_job_types:
+        return runnable
+    return and_(runnable, Job.job_type.not_in(list(excluded_job_types)))
+
+
+async def _job_type_headroom(
+    db: AsyncSession,
+    *,
+    max_in_flight: Mapping[str, int] | None,
+    stale_before,
+) -> dict[str, int]:
+    """Return the free slots of each capped job type.
+
+    A slot is taken by each job of that type running under a live
+    (non-stale) lease.
+    """
+    if not max_in_flight:
+        return {}
+    running = dict(
+        (
+            await db.execute(
+                select(Job.job_type, func.count())
+                .where(
+                    Job.status == JOB_STATUS_RUNNING,
+                    Job.locked_at > stale_before,
+                    Job.job_type.in_(list(max_in_flight)),
+                )
+                .group_by(Job.job_type)
+            )
+        ).all()
+    )
+    return {
+        job_type: max(0, int(cap) - int(running.get(job_type, 0)))
+        for job_type, cap in max_in_flight.items()
+    }
+
+
+def _saturated(type_headroom: Mapping[str, int]) -> list[str]:
+    return sorted(job_type for job_type, free in type_headroom.items() if free <= 0)
+
+
+def _within_headroom(now, *, stale_before, type_headroom: Mapping[str, int]):
+    """Admit at most ``type_headroom[type]`` best-ranked jobs of each capped type."""
+    limited = {job_type: free for job_type, free in type_headroom.items() if free > 0}
+    if not limited:
+        return None
+    ranked = (
+        select(
+            Job.id,
+            Job.job_type,
+            func.row_number()
+            .over(partition_by=Job.job_type, order_by=_claim_order())
+            .label("type_rank"),
+        )
+        .where(
+            runnable_filter(now, stale_before=stale_before),
+            Job.job_type.in_(sorted(limited)),
+        )
+        .subquery()
+    )
+    return or_(
+        Job.job_type.not_in(sorted(limited)),
+        Job.id.in_(
+            select(ranked.c.id).where(
+                ranked.c.type_rank <= case(limited, value=ranked.c.job_type, else_=0)
+            )
+        ),
+    )
+
+
+def _supports_skip_locked(db: AsyncSession) -> bool:
+    get_bind = getattr(db, "get_bind", None)
+    bind = get_bind() if callable(get_bind) else None
+    dialect_name = getattr(getattr(bind, "dialect", None), "name", "")
+    return dialect_name == "postgresql"
+
+
+def build_skip_locked_claim_statement(
+    *,
+    worker_id: str,
+    now,
+    lease_seconds: int,
+    limit: int,
+    excluded_job_types: Sequence[str] = (),
+    type_headroom: Mapping[str, int] | None = None,
+):
+    """Build one ``UPDATE ... RETURNING`` claiming up to ``limit`` runnable jobs.
+
+    Candidate rows are selected with ``FOR UPDATE SKIP LOCKED`` so concurrent
+    workers skip rows another transaction is claiming instead of racing for
+    the same highest-priority job. ``type_headroom`` caps how many jobs of
+    each listed type the statement may claim; types with no headroom are
+    excluded outright.
+    """
+    stale_before = now - timedelta(seconds=lease_seconds)
+    headroom = dict(type_headroom or {})
+    claimable = _claimable_filter(
+        now,
+        stale_before=stale_before,
+        excluded_job_types=sorted({*excluded_job_types, *_saturated(headroom)}),
+    )
+    capped = _within_headroom(now, stale_before=stale_before, type_headroom=headroom)
+    if capped is not None:
+        claimable = and_(claimable, capped)
+    candidate_ids = (
+        select(Job.id)
+        .where(claimable)
+        .order_by(*_claim_order())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return (
+        update(Job)
+        .where(Job.id.in_(candidate_ids.scalar_subquery()))
+        .values(
+            status=JOB_STATUS_RUNNING,
+            attempt=Job.attempt + 1,
+            locked_at=now,
+            locked_by=worker_id,
+            updated_at=now,
+        )
+        .returning(Job)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+
+
+def _claimed_sort_key(job: Job):
+    return (-(job.priority or 0), job.next_run_at or job.created_at, job.created_at)
+
+
+async def _lock_runnable_capped_types(
+    db: AsyncSession,
+    *,
+    now,
+    stale_before,
+    max_in_flight: Mapping[str, int] | None,
+) -> list[str]:
+    """Take the claim lock of every capped type that has runnable jobs.
+
+    Locks are taken in type order so two claimers cannot deadlock. Claims
+    that find no runnable capped job take no lock at all.
+    """
+    if not max_in_flight:
+        return []
+    runnable_types = sorted(
+        (
+            await db.execute(
+                select(Job.job_type)
+                .where(
+                    runnable_filter(now, stale_before=stale_before),
+                    Job.job_type.in_(sorted(max_in_flight)),
+                )
+                .distinct()
+            )
+        ).scalars()
+    )
+    for job_type in runnable_types:
+        await db.execute(
+            select(
+                func.pg_advisory_xact_lock(
+                    _CAPPED_CLAIM_LOCK_CLASS, func.hashtext(job_type)
+                )
+            )
+        )
+    return runnable_types
+
+
+async def _claim_batch_skip_locked(
     db: AsyncSession,
     *,
     worker_id: str,
     now,
     lease_seconds: int,
+    limit: int,
+    max_in_flight: Mapping[str, int] | None = None,
+) -> list[Job]:
+    stale_before = now - timedelta(seconds=lease_seconds)
+    locked_types = await _lock_runnable_capped_types(
+        db, now=now, stale_before=stale_before, max_in_flight=max_in_flight
+    )
+    type_headroom = await _job_type_headroom(
+        db,
+        max_in_flight={job_type: max_in_flight[job_type] for job_type in locked_types},
+        stale_before=stale_before,
+    )
+    # A capped type that became runnable after the check is left for the next
+    # claim rather than taken without its lock.
+    unlocked_capped = sorted(set(max_in_flight or ()) - set(locked_types))
+    stmt = build_skip_locked_claim_statement(
+        worker_id=worker_id,
+        now=now,
+        lease_seconds=lease_seconds,
+        limit=limit,
+        excluded_job_types=unlocked_capped,
+        type_headroom=type_headroom,
+    )
+    claimed = list((await db.execute(stmt)).scalars().all())
+    await db.commit()
+    return sorted(claimed, key=_claimed_sort_key)
+
+
+async def _claim_next_runnable_optimistic(
+    db: AsyncSession,
+    *,
+    worker_id: str,
+    now,
+    lease_seconds: int,
+    max_in_flight: Mapping[str, int] | None = None,
 ) -> Job | None:
-    """Claim next runnable."""
     stale_before = now - timedelta(seconds=lease_seconds)
-    order = (func.coalesce(Job.next_run_at, Job.created_at).asc(), Job.created_at.asc())
-    for _ in range(8):
+    excluded_job_types = _saturated(
+        await _job_type_headroom(
+            db, max_in_flight=max_in_flight, stale_before=stale_before
+        )
+    )
+    for _ in range(_OPTIMISTIC_CLAIM_ATTEMPTS):
         candidate_row = (
             await db.execute(
                 select(Job.id, Job.attempt)
-                .where(runnable_filter(now, stale_before=stale_before))
-                .order_by(*order)
+                .where(
+                    _claimable_filter(
+                        now,
+                        stale_before=stale_before,
+                        excluded_job_types=excluded_job_types,
+                    )
+                )
+                .order_by(*_claim_order())
                 .limit(1)
             )
         ).first()
@@ -73,3 +301,79 @@ async def claim_next_runnable(
             return await get_by_id(db, candidate_row.id)
         await db.rollback()
     return None
+
+
+async def claim_runnable_batch(
+    db: AsyncSession,
+    *,
+    worker_id: str,
+    now,
+    lease_seconds: int,
+    limit: int,
+    max_in_flight: Mapping[str, int] | None = None,
+) -> list[Job]:
+    """Claim up to ``limit`` runnable jobs for ``worker_id``.
+
+    Jobs are claimed highest ``priority`` first, then oldest due first. A job
+    type listed in ``max_in_flight`` never has more than that many jobs
+    running under a live lease, counting the ones claimed by this call.
+
+    PostgreSQL claims the whole batch in a single ``SKIP LOCKED`` round trip.
+    When a capped type has runnable jobs, claimers serialize on that type's
+    transaction-scoped advisory lock so concurrent slots and processes cannot
+    overrun its cap; claims of uncapped types never wait on it. Other
+    dialects (SQLite in tests) fall back to repeated optimistic claims, each
+    re-reading the running counts.
+    """
+    if limit < 1:
+        return []
+    if _supports_skip_locked(db):
+        return await _claim_batch_skip_locked(
+            db,
+            worker_id=worker_id,
+            now=now,
+            lease_seconds=lease_seconds,
+            limit=limit,
+            max_in_flight=max_in_flight,
+        )
+    claimed: list[Job] = []
+    for _ in range(limit):
+        job = await _claim_next_runnable_optimistic(
+            db,
+            worker_id=worker_id,
+            now=now,
+            lease_seconds=lease_seconds,
+            max_in_flight=max_in_flight,
+        )
+        if job is None:
+            break
+        claimed.append(job)
+    return claimed
+
+
+async def claim_next_runnable(
+    db: AsyncSession,
+    *,
+    worker_id: str,
+    now,
+    lease_seconds: int,
+    max_in_flight: Mapping[str, int] | None = None,
+) -> Job | None:
+    """Claim next runnable."""
+    if _supports_skip_locked(db):
+        claimed = await _claim_batch_skip_locked(
+            db,
+            worker_id=worker_id,
+            now=now,
+            lease_seconds=lease_seconds,
+            limit=1,
+            max_in_flight=max_in_flight,
+        )
+        return claimed[0] if claimed else None
+    return await _claim_next_runnable_optimistic(
+        db,
+        worker_id=worker_id,
+        now=now,
+        lease_seconds=lease_seconds,
+        max_in_flight=max_in_flight,
+    )
@@ -17,6 +17,11 @@ from app.shared.jobs.repositories.shared_jobs_repositories_repository_shared_rep
     normalize_idempotent_create_inputs,
     validate_payload_size,
 )
+from app.shared.jobs.shared_jobs_wakeup_service import notify_runnable_jobs
+from app.shared.jobs.worker_runtime.shared_jobs_worker_runtime_registry_service import (
+    get_job_priority,
+)
+from app.shared.perf import current_traceparent
 
 
 async def create_or_get_idempotent(
@@ -30,6 +35,7 @@ async def create_or_get_idempotent(
     max_attempts: int = 5,
     correlation_id: str | None = None,
     next_run_at: datetime | None = None,
+    priority: int | None = None,
     commit: bool = True,
 ) -> Job:
     """Create or get idempotent."""
@@ -42,6 +48,9 @@ async def create_or_get_idempotent(
         status=JOB_STATUS_QUEUED,
         attempt=0,
         max_attempts=max_attempts,
+        priority=priority
+        if priority is not None
+        else get_job_priority(normalized_type),
         idempotency_key=normalized_key,
         payload_json=payload_json,
         result_json=None,
@@ -50,6 +59,7 @@ async def create_or_get_idempotent(
         locked_at=None,
         locked_by=None,
         correlation_id=correlation_id,
+        traceparent=current_traceparent(),
         company_id=company_id,
         candidate_session_id=candidate_session_id,
     )
@@ -87,6 +97,7 @@ async def _insert_nested_or_get_existing(
         if existing is None:
             raise
         return existing
+    await notify_runnable_jobs(db, job_type=job.job_type, next_run_at=job.next_run_at)
     return job
 
 
@@ -100,6 +111,9 @@ async def _insert_commit_or_get_existing(
         return existing
     db.add(job)
     try:
+        await notify_runnable_jobs(
+            db, job_type=job.job_type, next_run_at=job.next_run_at
+        )
         await db.commit()
     except IntegrityError:
         await db.rollback()
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.shared.database.shared_database_read_model_utils import note_rows_written
 from app.shared.jobs.repositories.shared_jobs_repositories_models_repository import Job
 from app.shared.jobs.repositories.shared_jobs_repositories_repository_shared_repository import (
     IdempotentJobSpec,
@@ -48,10 +50,40 @@ async def _insert_rows(
         job_insert_row,
     )
 
-    await db.execute(
-        insert(Job),
-        [job_insert_row(company_id=company_id, spec=spec) for spec in new_specs],
+    rows = [job_insert_row(company_id=company_id, spec=spec) for spec in new_specs]
+    await _fill_session_trial_ids(db, rows)
+    await db.execute(insert(Job), rows)
+    # Core inserts are invisible to the ORM flush hooks that keep read models
+    # (e.g. the candidate compare summaries) in sync.
+    note_rows_written(db, Job.__tablename__, rows)
+
+
+async def _fill_session_trial_ids(
+    db: AsyncSession, rows: list[dict[str, object]]
+) -> None:
+    # Core inserts skip the ORM ``before_insert`` hook that scopes jobs to
+    # their candidate session's Trial, so resolve those in one query.
+    session_ids = {
+        row["candidate_session_id"]
+        for row in rows
+        if row["trial_id"] is None and row["candidate_session_id"] is not None
+    }
+    if not session_ids:
+        return
+    from app.shared.database.shared_database_models_model import CandidateSession
+
+    trial_by_session = dict(
+        (
+            await db.execute(
+                select(CandidateSession.id, CandidateSession.trial_id).where(
+                    CandidateSession.id.in_(sorted(session_ids))
+                )
+            )
+        ).all()
     )
+    for row in rows:
+        if row["trial_id"] is None:
+            row["trial_id"] = trial_by_session.get(row["candidate_session_id"])
 
 
 async def _recover_per_key(
@@ -17,6 +17,7 @@ from app.shared.jobs.repositories.shared_jobs_repositories_repository_specs_repo
     load_idempotent_jobs_for_keys,
     normalize_many_specs,
 )
+from app.shared.jobs.shared_jobs_wakeup_service import notify_runnable_jobs
 
 
 async def create_or_update_many_idempotent(
@@ -39,6 +40,7 @@ async def create_or_update_many_idempotent(
         await recover_bulk_insert_conflicts(
             db, company_id=company_id, new_specs=new_specs, existing_map=existing_map
         )
+    await _notify_runnable_new_jobs(new_specs, existing_map, db=db)
     if commit:
         await db.commit()
     else:
@@ -46,6 +48,24 @@ async def create_or_update_many_idempotent(
     return _resolve_jobs_in_order(normalized_specs, existing_map)
 
 
+async def _notify_runnable_new_jobs(
+    new_specs: list[IdempotentJobSpec],
+    existing_map: dict[tuple[str, str], Job],
+    *,
+    db: AsyncSession,
+) -> None:
+    notified_types: set[str] = set()
+    for spec in new_specs:
+        if spec.job_type in notified_types:
+            continue
+        if (spec.job_type, spec.idempotency_key) not in existing_map:
+            continue
+        if await notify_runnable_jobs(
+            db, job_type=spec.job_type, next_run_at=spec.next_run_at
+        ):
+            notified_types.add(spec.job_type)
+
+
 def _apply_updates_to_existing(
     normalized_specs: list[IdempotentJobSpec], existing_map: dict[tuple[str, str], Job]
 ) -> list[IdempotentJobSpec]:
@@ -18,6 +18,7 @@ from app.shared.jobs.repositories.shared_jobs_repositories_repository_shared_rep
     normalize_idempotent_create_inputs,
     validate_payload_size,
 )
+from app.shared.jobs.shared_jobs_wakeup_service import notify_runnable_jobs
 
 
 async def create_or_update_idempotent(
@@ -31,6 +32,7 @@ async def create_or_update_idempotent(
     max_attempts: int = 5,
     correlation_id: str | None = None,
     next_run_at: datetime | None = None,
+    priority: int | None = None,
     commit: bool = True,
 ) -> Job:
     """Create or update idempotent."""
@@ -66,6 +68,7 @@ async def create_or_update_idempotent(
         max_attempts=max_attempts,
         correlation_id=correlation_id,
         next_run_at=next_run_at,
+        priority=priority,
         commit=commit,
     )
     await _update_existing_if_mutable(
@@ -102,6 +105,7 @@ async def _update_existing_if_mutable(
         correlation_id=correlation_id,
         next_run_at=next_run_at,
     )
+    await notify_runnable_jobs(db, job_type=job.job_type, next_run_at=job.next_run_at)
     if commit:
         await db.commit()
         await db.refresh(job)
@@ -12,6 +12,7 @@ from app.shared.jobs.repositories.shared_jobs_repositories_models_repository imp
     JOB_STATUS_QUEUED,
     Job,
 )
+from app.shared.jobs.shared_jobs_wakeup_service import notify_runnable_jobs
 
 
 def _apply_dead_letter_requeue(job: Job, *, now: datetime) -> Job:
@@ -47,6 +48,7 @@ async def requeue_dead_letter_job(
     if job is None:
         return None
     _apply_dead_letter_requeue(job, now=now)
+    await notify_runnable_jobs(db, job_type=job.job_type, next_run_at=now)
     if commit:
         await db.commit()
     else:
@@ -72,6 +74,8 @@ async def requeue_dead_letter_jobs(
         return 0
     for job in jobs:
         _apply_dead_letter_requeue(job, now=now)
+    for job_type in sorted({job.job_type for job in jobs}):
+        await notify_runnable_jobs(db, job_type=job_type, next_run_at=now)
     await db.flush()
     await db.commit()
     return len(jobs)
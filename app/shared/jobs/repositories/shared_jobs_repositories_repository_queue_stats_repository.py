@@ -0,0 +1,66 @@
+"""Application module for jobs repositories repository queue stats repository workflows."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.jobs.repositories.shared_jobs_repositories_models_repository import (
+    JOB_STATUS_DEAD_LETTER,
+    JOB_STATUS_QUEUED,
+    JOB_STATUS_RUNNING,
+    JOB_STATUS_SUCCEEDED,
+    Job,
+)
+
+
+async def load_live_queue_counts(db: AsyncSession, *, now) -> list[Any]:
+    """Return queued/running counts and oldest runnable due time per job type."""
+    runnable = and_(
+        Job.status == JOB_STATUS_QUEUED,
+        or_(Job.next_run_at.is_(None), Job.next_run_at <= now),
+    )
+    due_at = func.coalesce(Job.next_run_at, Job.created_at)
+    stmt = (
+        select(
+            Job.job_type.label("job_type"),
+            func.sum(case((Job.status == JOB_STATUS_QUEUED, 1), else_=0)).label(
+                "queued"
+            ),
+            func.sum(case((runnable, 1), else_=0)).label("runnable"),
+            func.sum(case((Job.status == JOB_STATUS_RUNNING, 1), else_=0)).label(
+                "running"
+            ),
+            func.min(case((runnable, due_at), else_=None)).label("oldest_runnable_at"),
+        )
+        .where(Job.status.in_((JOB_STATUS_QUEUED, JOB_STATUS_RUNNING)))
+        .group_by(Job.job_type)
+        .order_by(Job.job_type)
+    )
+    return list((await db.execute(stmt)).all())
+
+
+async def load_finished_counts_since(db: AsyncSession, *, since) -> list[Any]:
+    """Return succeeded/dead-letter counts per job type updated since ``since``.
+
+    Served by the partial ``ix_jobs_finished_status_updated`` index, so the
+    scan is bounded by the window rather than the whole job history.
+    """
+    stmt = (
+        select(
+            Job.job_type.label("job_type"),
+            Job.status.label("status"),
+            func.count().label("count"),
+        )
+        .where(
+            Job.status.in_((JOB_STATUS_SUCCEEDED, JOB_STATUS_DEAD_LETTER)),
+            Job.updated_at >= since,
+        )
+        .group_by(Job.job_type, Job.status)
+    )
+    return list((await db.execute(stmt)).all())
+
+
+__all__ = ["load_finished_counts_since", "load_live_queue_counts"]
@@ -8,6 +8,7 @@ from typing import Any
 from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.shared.database.shared_database_read_model_utils import note_rows_written
 from app.shared.jobs.repositories.shared_jobs_repositories_models_repository import (
     JOB_STATUS_QUEUED,
     JOB_STATUS_RUNNING,
@@ -17,6 +18,7 @@ from app.shared.jobs.repositories.shared_jobs_repositories_repository_shared_rep
     load_idempotent_job,
     validate_payload_size,
 )
+from app.shared.jobs.shared_jobs_wakeup_service import notify_runnable_jobs
 
 
 async def requeue_nonterminal_idempotent_job(
@@ -58,9 +60,13 @@ async def requeue_nonterminal_idempotent_job(
             Job.status.in_((JOB_STATUS_QUEUED, JOB_STATUS_RUNNING)),
         )
         .values(**updates)
+        .returning(Job.job_type, Job.candidate_session_id)
     )
-    if result.rowcount == 0:
+    job_rows = result.all()
+    if not job_rows:
         return None
+    note_rows_written(db, Job.__tablename__, job_rows)
+    await notify_runnable_jobs(db, job_type=normalized_type, next_run_at=next_run_at)
     if commit:
         await db.commit()
     else:
@@ -31,6 +31,7 @@ class IdempotentJobSpec:
     max_attempts: int = 5
     correlation_id: str | None = None
     next_run_at: datetime | None = None
+    priority: int | None = None
 
 
 def validate_payload_size(payload_json: dict[str, Any]) -> None:
@@ -107,6 +108,8 @@ def apply_idempotent_job_updates(
     job.max_attempts = max_attempts
     job.correlation_id = correlation_id
     job.next_run_at = next_run_at or datetime.now(UTC)
+    # Re-derived from the new payload/session on flush.
+    job.trial_id = None
 
 
 __all__ = [
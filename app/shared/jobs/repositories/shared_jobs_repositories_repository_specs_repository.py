@@ -10,12 +10,17 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.shared.jobs.repositories.shared_jobs_repositories_models_repository import (
     JOB_STATUS_QUEUED,
     Job,
+    trial_id_from_job_metadata,
 )
 from app.shared.jobs.repositories.shared_jobs_repositories_repository_shared_repository import (
     IdempotentJobSpec,
     normalize_idempotent_create_inputs,
     validate_payload_size,
 )
+from app.shared.jobs.worker_runtime.shared_jobs_worker_runtime_registry_service import (
+    get_job_priority,
+)
+from app.shared.perf import current_traceparent
 
 
 def normalize_many_specs(specs: list[IdempotentJobSpec]) -> list[IdempotentJobSpec]:
@@ -37,6 +42,7 @@ def normalize_many_specs(specs: list[IdempotentJobSpec]) -> list[IdempotentJobSp
                 max_attempts=spec.max_attempts,
                 correlation_id=spec.correlation_id,
                 next_run_at=spec.next_run_at,
+                priority=spec.priority,
             )
         )
     return normalized_specs
@@ -49,6 +55,11 @@ def job_from_spec(*, company_id: int, spec: IdempotentJobSpec) -> Job:
         status=JOB_STATUS_QUEUED,
         attempt=0,
         max_attempts=spec.max_attempts,
+        priority=(
+            spec.priority
+            if spec.priority is not None
+            else get_job_priority(spec.job_type)
+        ),
         idempotency_key=spec.idempotency_key,
         payload_json=spec.payload_json,
         result_json=None,
@@ -57,6 +68,7 @@ def job_from_spec(*, company_id: int, spec: IdempotentJobSpec) -> Job:
         locked_at=None,
         locked_by=None,
         correlation_id=spec.correlation_id,
+        traceparent=current_traceparent(),
         company_id=company_id,
         candidate_session_id=spec.candidate_session_id,
     )
@@ -78,8 +90,10 @@ def job_insert_row(*, company_id: int, spec: IdempotentJobSpec) -> dict[str, obj
         "locked_at": job.locked_at,
         "locked_by": job.locked_by,
         "correlation_id": job.correlation_id,
+        "traceparent": job.traceparent,
         "company_id": job.company_id,
         "candidate_session_id": job.candidate_session_id,
+        "trial_id": trial_id_from_job_metadata(job.payload_json, job.correlation_id),
     }
 
 
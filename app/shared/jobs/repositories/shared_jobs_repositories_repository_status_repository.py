@@ -7,24 +7,52 @@ from typing import Any
 from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.shared.database.shared_database_read_model_utils import note_rows_written
 from app.shared.jobs.repositories.shared_jobs_repositories_models_repository import (
     JOB_STATUS_DEAD_LETTER,
     JOB_STATUS_QUEUED,
+    JOB_STATUS_RUNNING,
     JOB_STATUS_SUCCEEDED,
     Job,
 )
 from app.shared.jobs.repositories.shared_jobs_repositories_repository_shared_repository import (
     sanitize_error,
 )
+from app.shared.jobs.shared_jobs_wakeup_service import notify_runnable_jobs
+
+
+def _note_job_rows(db: AsyncSession, result: Any) -> list[Any]:
+    # Status changes are Core updates, so read models that depend on jobs
+    # (e.g. the candidate compare summaries) are told explicitly.
+    rows = result.all()
+    note_rows_written(db, Job.__tablename__, rows)
+    return rows
+
+
+def _job_held_by(job_id: str, worker_id: str | None) -> tuple[Any, ...]:
+    # With ``worker_id`` the write only lands while that worker still holds
+    # the lease, so a worker that lost its job cannot overwrite the new owner.
+    if worker_id is None:
+        return (Job.id == job_id,)
+    return (
+        Job.id == job_id,
+        Job.status == JOB_STATUS_RUNNING,
+        Job.locked_by == worker_id,
+    )
 
 
 async def mark_succeeded(
-    db: AsyncSession, *, job_id: str, result_json: dict[str, Any] | None, now
-) -> None:
-    """Mark succeeded."""
-    await db.execute(
+    db: AsyncSession,
+    *,
+    job_id: str,
+    result_json: dict[str, Any] | None,
+    now,
+    worker_id: str | None = None,
+) -> bool:
+    """Mark succeeded; False when ``worker_id`` no longer holds the job."""
+    result = await db.execute(
         update(Job)
-        .where(Job.id == job_id)
+        .where(*_job_held_by(job_id, worker_id))
         .values(
             status=JOB_STATUS_SUCCEEDED,
             result_json=result_json,
@@ -34,17 +62,42 @@ async def mark_succeeded(
             locked_by=None,
             updated_at=now,
         )
+        .returning(Job.job_type, Job.candidate_session_id)
+    )
+    job_rows = _note_job_rows(db, result)
+    await db.commit()
+    return bool(job_rows)
+
+
+async def renew_lease(db: AsyncSession, *, job_id: str, worker_id: str, now) -> bool:
+    """Extend the lease of a running job still held by ``worker_id``."""
+    result = await db.execute(
+        update(Job)
+        .where(
+            Job.id == job_id,
+            Job.status == JOB_STATUS_RUNNING,
+            Job.locked_by == worker_id,
+        )
+        .values(locked_at=now, updated_at=now)
+        .execution_options(synchronize_session=False)
     )
     await db.commit()
+    return result.rowcount == 1
 
 
 async def mark_failed_and_reschedule(
-    db: AsyncSession, *, job_id: str, error_str: str, next_run_at, now
-) -> None:
-    """Mark failed and reschedule."""
-    await db.execute(
+    db: AsyncSession,
+    *,
+    job_id: str,
+    error_str: str,
+    next_run_at,
+    now,
+    worker_id: str | None = None,
+) -> bool:
+    """Mark failed and reschedule; False when ``worker_id`` lost the job."""
+    result = await db.execute(
         update(Job)
-        .where(Job.id == job_id)
+        .where(*_job_held_by(job_id, worker_id))
         .values(
             status=JOB_STATUS_QUEUED,
             last_error=sanitize_error(error_str),
@@ -53,17 +106,28 @@ async def mark_failed_and_reschedule(
             locked_by=None,
             updated_at=now,
         )
+        .returning(Job.job_type, Job.candidate_session_id)
     )
+    job_rows = _note_job_rows(db, result)
+    for job_type in sorted({row.job_type for row in job_rows}):
+        # Immediate retries wake idle workers; backoffs wait for the safety poll.
+        await notify_runnable_jobs(db, job_type=job_type, next_run_at=next_run_at)
     await db.commit()
+    return bool(job_rows)
 
 
 async def mark_dead_letter(
-    db: AsyncSession, *, job_id: str, error_str: str, now
-) -> None:
-    """Mark dead letter."""
-    await db.execute(
+    db: AsyncSession,
+    *,
+    job_id: str,
+    error_str: str,
+    now,
+    worker_id: str | None = None,
+) -> bool:
+    """Mark dead letter; False when ``worker_id`` no longer holds the job."""
+    result = await db.execute(
         update(Job)
-        .where(Job.id == job_id)
+        .where(*_job_held_by(job_id, worker_id))
         .values(
             status=JOB_STATUS_DEAD_LETTER,
             last_error=sanitize_error(error_str),
@@ -72,5 +136,8 @@ async def mark_dead_letter(
             locked_by=None,
             updated_at=now,
         )
+        .returning(Job.job_type, Job.candidate_session_id)
     )
+    job_rows = _note_job_rows(db, result)
     await db.commit()
+    return bool(job_rows)
@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
-import re
 from datetime import datetime
-from typing import Any
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.shared.database.shared_database_models_model import CandidateSession, Job
+from app.shared.database.shared_database_models_model import Job
 from app.shared.jobs.repositories.shared_jobs_repositories_models_repository import (
     JOB_STATUS_DEAD_LETTER,
+    trial_id_from_job_metadata,
 )
 from app.shared.jobs.shared_jobs_failure_reasons_service import (
     failure_category,
@@ -19,8 +18,6 @@ from app.shared.jobs.shared_jobs_failure_reasons_service import (
 )
 from app.shared.types.shared_types_base_model import APIModel
 
-_TRIAL_CORRELATION_RE = re.compile(r"(?:^|:)trial:(\d+)(?:$|:)")
-
 
 class SafeFailedJobSummary(APIModel):
     """Operator-safe failed job metadata."""
@@ -68,28 +65,16 @@ class TrialBackgroundFailures(APIModel):
     latestFailure: TrialLatestFailureSummary | None = None
 
 
-def _positive_int(value: Any) -> int | None:
-    try:
-        parsed = int(value)
-    except (TypeError, ValueError):
-        return None
-    return parsed if parsed > 0 else None
-
-
 def trial_id_from_job(job: Job, candidate_trial_id: int | None = None) -> int | None:
     """Infer a related Trial id from durable job metadata."""
     if candidate_trial_id is not None:
         return candidate_trial_id
-    payload = job.payload_json if isinstance(job.payload_json, dict) else {}
-    for key in ("trialId", "trial_id"):
-        parsed = _positive_int(payload.get(key))
-        if parsed is not None:
-            return parsed
-    correlation_id = getattr(job, "correlation_id", None) or ""
-    match = _TRIAL_CORRELATION_RE.search(correlation_id)
-    if match:
-        return _positive_int(match.group(1))
-    return None
+    trial_id = getattr(job, "trial_id", None)
+    if trial_id is not None:
+        return trial_id
+    return trial_id_from_job_metadata(
+        job.payload_json, getattr(job, "correlation_id", None)
+    )
 
 
 def safe_failed_job_summary(
@@ -128,77 +113,54 @@ async def list_failed_jobs(
         )
         or 0
     )
-    rows = (
+    jobs = (
         await db.execute(
-            select(Job, CandidateSession.trial_id)
-            .outerjoin(
-                CandidateSession, CandidateSession.id == Job.candidate_session_id
-            )
+            select(Job)
             .where(Job.status == JOB_STATUS_DEAD_LETTER)
             .order_by(Job.updated_at.desc(), Job.created_at.desc())
             .limit(limit)
             .offset(offset)
         )
-    ).all()
+    ).scalars()
     return FailedJobsListResponse(
-        items=[
-            safe_failed_job_summary(job, candidate_trial_id=candidate_trial_id)
-            for job, candidate_trial_id in rows
-        ],
+        items=[safe_failed_job_summary(job) for job in jobs],
         limit=limit,
         offset=offset,
         total=total,
     )
 
 
-def _trial_failed_jobs_filter(trial_id: int):
-    return or_(
-        CandidateSession.trial_id == trial_id,
-        Job.correlation_id == f"trial:{trial_id}",
-        Job.correlation_id.like(f"trial:{trial_id}:%"),
-        Job.payload_json["trialId"].as_integer() == trial_id,
-        Job.payload_json["trial_id"].as_integer() == trial_id,
-    )
-
-
 async def trial_background_failures(
     db: AsyncSession, *, trial_id: int, company_id: int
 ) -> TrialBackgroundFailures:
-    """Return failed background job state scoped to one Trial."""
+    """Return failed background job state scoped to one Trial.
+
+    Both lookups are served by the partial ``ix_jobs_trial_dead_letter``
+    index on ``jobs.trial_id``.
+    """
     base_filter = (
+        Job.trial_id == trial_id,
         Job.company_id == company_id,
         Job.status == JOB_STATUS_DEAD_LETTER,
-        _trial_failed_jobs_filter(trial_id),
     )
     total = int(
-        await db.scalar(
-            select(func.count())
-            .select_from(Job)
-            .outerjoin(
-                CandidateSession, CandidateSession.id == Job.candidate_session_id
-            )
-            .where(*base_filter)
-        )
-        or 0
+        await db.scalar(select(func.count()).select_from(Job).where(*base_filter)) or 0
     )
-    latest_row = (
+    latest_job = (
         await db.execute(
-            select(Job, CandidateSession.trial_id)
-            .outerjoin(
-                CandidateSession, CandidateSession.id == Job.candidate_session_id
-            )
+            select(Job)
             .where(*base_filter)
             .order_by(Job.updated_at.desc(), Job.created_at.desc())
             .limit(1)
         )
-    ).first()
-    if latest_row is None:
+    ).scalar_one_or_none()
+    if latest_job is None:
         return TrialBackgroundFailures(
             hasFailedJobs=False,
             failedJobsCount=0,
             latestFailure=None,
         )
-    latest = safe_failed_job_summary(latest_row[0], candidate_trial_id=latest_row[1])
+    latest = safe_failed_job_summary(latest_job)
     return TrialBackgroundFailures(
         hasFailedJobs=True,
         failedJobsCount=total,
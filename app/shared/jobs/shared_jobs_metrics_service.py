@@ -0,0 +1,300 @@
+"""Job queue metrics: in-process handler counters plus DB queue aggregates."""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.jobs.repositories import repository as jobs_repo
+from app.shared.jobs.repositories.shared_jobs_repositories_models_repository import (
+    JOB_STATUS_DEAD_LETTER,
+    JOB_STATUS_SUCCEEDED,
+)
+from app.shared.types.shared_types_base_model import APIModel
+
+JOB_OUTCOME_SUCCEEDED = "succeeded"
+JOB_OUTCOME_RETRIED = "retried"
+JOB_OUTCOME_RESCHEDULED = "rescheduled"
+JOB_OUTCOME_DEAD_LETTER = "dead_letter"
+JOB_OUTCOME_LEASE_LOST = "lease_lost"
+
+JOB_DURATION_BUCKETS_SECONDS: tuple[float, ...] = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+    600.0,
+)
+
+
+@dataclass(slots=True)
+class _JobTypeCounters:
+    outcomes: dict[str, int] = field(default_factory=dict)
+    bucket_counts: list[int] = field(
+        default_factory=lambda: [0] * (len(JOB_DURATION_BUCKETS_SECONDS) + 1)
+    )
+    duration_sum_seconds: float = 0.0
+    duration_count: int = 0
+
+
+class JobTypeRuntimeMetrics(APIModel):
+    """Handler outcomes and duration histogram recorded by this process."""
+
+    jobType: str
+    outcomes: dict[str, int]
+    durationBucketsSeconds: list[float]
+    durationBucketCounts: list[int]
+    durationSumSeconds: float
+    durationCount: int
+
+
+class JobTypeQueueStats(APIModel):
+    """Database-derived queue state for one job type."""
+
+    jobType: str
+    queued: int = 0
+    runnable: int = 0
+    running: int = 0
+    oldestRunnableAgeSeconds: float | None = None
+    succeededInWindow: int = 0
+    deadLetterInWindow: int = 0
+
+
+class JobMetricsResponse(APIModel):
+    """Queue depth/lag plus in-process handler metrics."""
+
+    generatedAt: datetime
+    windowSeconds: int
+    queues: list[JobTypeQueueStats]
+    runtime: list[JobTypeRuntimeMetrics]
+
+
+class JobRuntimeMetrics:
+    """Thread-safe per-job-type outcome counters and duration histograms."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._by_type: dict[str, _JobTypeCounters] = {}
+
+    def record(self, job_type: str, *, outcome: str, duration_seconds: float) -> None:
+        """Record one handled job."""
+        duration = max(0.0, float(duration_seconds))
+        bucket_index = bisect.bisect_left(JOB_DURATION_BUCKETS_SECONDS, duration)
+        with self._lock:
+            counters = self._by_type.setdefault(job_type, _JobTypeCounters())
+            counters.outcomes[outcome] = counters.outcomes.get(outcome, 0) + 1
+            counters.bucket_counts[bucket_index] += 1
+            counters.duration_sum_seconds += duration
+            counters.duration_count += 1
+
+    def snapshot(self) -> list[JobTypeRuntimeMetrics]:
+        """Return a copy of the current counters sorted by job type."""
+        with self._lock:
+            return [
+                JobTypeRuntimeMetrics(
+                    jobType=job_type,
+                    outcomes=dict(counters.outcomes),
+                    durationBucketsSeconds=list(JOB_DURATION_BUCKETS_SECONDS),
+                    durationBucketCounts=list(counters.bucket_counts),
+                    durationSumSeconds=counters.duration_sum_seconds,
+                    durationCount=counters.duration_count,
+                )
+                for job_type, counters in sorted(self._by_type.items())
+            ]
+
+    def reset(self) -> None:
+        """Drop all recorded counters."""
+        with self._lock:
+            self._by_type.clear()
+
+
+job_runtime_metrics = JobRuntimeMetrics()
+
+DEFAULT_METRICS_WINDOW_SECONDS = 900
+
+
+def _as_aware(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+async def load_queue_stats(
+    db: AsyncSession, *, now: datetime, window_seconds: int
+) -> list[JobTypeQueueStats]:
+    """Aggregate queue depth, lag and recent finishes per job type."""
+    stats: dict[str, JobTypeQueueStats] = {}
+    for row in await jobs_repo.load_live_queue_counts(db, now=now):
+        oldest = row.oldest_runnable_at
+        stats[row.job_type] = JobTypeQueueStats(
+            jobType=row.job_type,
+            queued=int(row.queued or 0),
+            runnable=int(row.runnable or 0),
+            running=int(row.running or 0),
+            oldestRunnableAgeSeconds=(
+                max(0.0, (now - _as_aware(oldest)).total_seconds())
+                if oldest is not None
+                else None
+            ),
+        )
+    since = now - timedelta(seconds=window_seconds)
+    for row in await jobs_repo.load_finished_counts_since(db, since=since):
+        entry = stats.setdefault(row.job_type, JobTypeQueueStats(jobType=row.job_type))
+        if row.status == JOB_STATUS_SUCCEEDED:
+            entry.succeededInWindow = int(row.count)
+        elif row.status == JOB_STATUS_DEAD_LETTER:
+            entry.deadLetterInWindow = int(row.count)
+    return [stats[job_type] for job_type in sorted(stats)]
+
+
+async def build_job_metrics(
+    db: AsyncSession,
+    *,
+    now: datetime | None = None,
+    window_seconds: int = DEFAULT_METRICS_WINDOW_SECONDS,
+) -> JobMetricsResponse:
+    """Return DB queue aggregates plus this process's runtime counters."""
+    resolved_now = now or datetime.now(UTC)
+    return JobMetricsResponse(
+        generatedAt=resolved_now,
+        windowSeconds=window_seconds,
+        queues=await load_queue_stats(
+            db, now=resolved_now, window_seconds=window_seconds
+        ),
+        runtime=job_runtime_metrics.snapshot(),
+    )
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_bound(bound: float) -> str:
+    return f"{bound:g}"
+
+
+def render_prometheus_text(
+    *,
+    queues: Iterable[JobTypeQueueStats],
+    runtime: Iterable[JobTypeRuntimeMetrics],
+    window_seconds: int,
+) -> str:
+    """Render queue stats and runtime counters in Prometheus text format."""
+    queues = list(queues)
+    lines = [
+        "# HELP winoe_jobs_queued Queued jobs per type.",
+        "# TYPE winoe_jobs_queued gauge",
+    ]
+    lines += [
+        f'winoe_jobs_queued{{job_type="{_escape_label(q.jobType)}"}} {q.queued}'
+        for q in queues
+    ]
+    lines += [
+        "# HELP winoe_jobs_runnable Queued jobs whose next_run_at has passed.",
+        "# TYPE winoe_jobs_runnable gauge",
+    ]
+    lines += [
+        f'winoe_jobs_runnable{{job_type="{_escape_label(q.jobType)}"}} {q.runnable}'
+        for q in queues
+    ]
+    lines += [
+        "# HELP winoe_jobs_running Running jobs per type.",
+        "# TYPE winoe_jobs_running gauge",
+    ]
+    lines += [
+        f'winoe_jobs_running{{job_type="{_escape_label(q.jobType)}"}} {q.running}'
+        for q in queues
+    ]
+    lines += [
+        "# HELP winoe_jobs_oldest_runnable_age_seconds Queue lag per type.",
+        "# TYPE winoe_jobs_oldest_runnable_age_seconds gauge",
+    ]
+    lines += [
+        "winoe_jobs_oldest_runnable_age_seconds"
+        f'{{job_type="{_escape_label(q.jobType)}"}} {q.oldestRunnableAgeSeconds or 0:g}'
+        for q in queues
+    ]
+    lines += [
+        "# HELP winoe_jobs_finished_window Jobs finished in the trailing window.",
+        "# TYPE winoe_jobs_finished_window gauge",
+    ]
+    for q in queues:
+        label = _escape_label(q.jobType)
+        lines.append(
+            f'winoe_jobs_finished_window{{job_type="{label}",status="succeeded",'
+            f'window_seconds="{window_seconds}"}} {q.succeededInWindow}'
+        )
+        lines.append(
+            f'winoe_jobs_finished_window{{job_type="{label}",status="dead_letter",'
+            f'window_seconds="{window_seconds}"}} {q.deadLetterInWindow}'
+        )
+    runtime = list(runtime)
+    lines += [
+        "# HELP winoe_job_outcomes_total Handled jobs by outcome (this process).",
+        "# TYPE winoe_job_outcomes_total counter",
+    ]
+    for metrics in runtime:
+        label = _escape_label(metrics.jobType)
+        for outcome, count in sorted(metrics.outcomes.items()):
+            lines.append(
+                f'winoe_job_outcomes_total{{job_type="{label}",'
+                f'outcome="{_escape_label(outcome)}"}} {count}'
+            )
+    lines += [
+        "# HELP winoe_job_duration_seconds Handler duration (this process).",
+        "# TYPE winoe_job_duration_seconds histogram",
+    ]
+    for metrics in runtime:
+        label = _escape_label(metrics.jobType)
+        cumulative = 0
+        for bound, count in zip(
+            metrics.durationBucketsSeconds, metrics.durationBucketCounts, strict=False
+        ):
+            cumulative += count
+            lines.append(
+                f'winoe_job_duration_seconds_bucket{{job_type="{label}",'
+                f'le="{_format_bound(bound)}"}} {cumulative}'
+            )
+        lines.append(
+            f'winoe_job_duration_seconds_bucket{{job_type="{label}",le="+Inf"}} '
+            f"{metrics.durationCount}"
+        )
+        lines.append(
+            f'winoe_job_duration_seconds_sum{{job_type="{label}"}} '
+            f"{metrics.durationSumSeconds:g}"
+        )
+        lines.append(
+            f'winoe_job_duration_seconds_count{{job_type="{label}"}} '
+            f"{metrics.durationCount}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+__all__ = [
+    "DEFAULT_METRICS_WINDOW_SECONDS",
+    "JOB_DURATION_BUCKETS_SECONDS",
+    "JOB_OUTCOME_DEAD_LETTER",
+    "JOB_OUTCOME_LEASE_LOST",
+    "JOB_OUTCOME_RESCHEDULED",
+    "JOB_OUTCOME_RETRIED",
+    "JOB_OUTCOME_SUCCEEDED",
+    "JobMetricsResponse",
+    "JobRuntimeMetrics",
+    "JobTypeQueueStats",
+    "JobTypeRuntimeMetrics",
+    "build_job_metrics",
+    "job_runtime_metrics",
+    "load_queue_stats",
+    "render_prometheus_text",
+]
@@ -0,0 +1,258 @@
+"""Application module for jobs worker wake-up (LISTEN/NOTIFY) workflows."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from datetime import UTC, datetime
+from typing import Any, Protocol
+
+from sqlalchemy import event as sa_event
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+logger = logging.getLogger(__name__)
+
+JOBS_NOTIFY_CHANNEL = "winoe_jobs_runnable"
+_PENDING_WAKEUP_INFO_KEY = "winoe_jobs_wakeup_pending"
+RECONNECT_BACKOFF_INITIAL_SECONDS = 1.0
+RECONNECT_BACKOFF_MAX_SECONDS = 60.0
+
+
+class JobWakeupListener(Protocol):
+    """Blocks idle worker slots until a runnable job is announced."""
+
+    async def wait(self, *, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds; return True when woken by a notify."""
+        ...
+
+
+class _EventWakeupListener:
+    def __init__(self) -> None:
+        self._event = asyncio.Event()
+
+    def wake(self) -> None:
+        self._event.set()
+
+    async def wait(self, *, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=max(0.0, timeout))
+        except TimeoutError:
+            return False
+        self._event.clear()
+        return True
+
+
+class InMemoryJobWakeupHub:
+    """Process-local NOTIFY stand-in for non-PostgreSQL backends (tests/SQLite)."""
+
+    def __init__(self) -> None:
+        self._listeners: set[_EventWakeupListener] = set()
+
+    def notify(self) -> None:
+        """Wake every registered listener."""
+        for listener in list(self._listeners):
+            listener.wake()
+
+    @asynccontextmanager
+    async def listen(self) -> AsyncIterator[JobWakeupListener]:
+        """Register a listener for the lifetime of the context."""
+        listener = _EventWakeupListener()
+        self._listeners.add(listener)
+        try:
+            yield listener
+        finally:
+            self._listeners.discard(listener)
+
+
+in_memory_job_wakeup = InMemoryJobWakeupHub()
+
+
+class _PostgresWakeupListener(_EventWakeupListener):
+    """LISTEN on a dedicated connection, reconnecting with backoff when lost."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        super().__init__()
+        self._engine = engine
+        self._conn: Any = None
+        self.driver_connection: Any = None
+        self._reconnect_lock = asyncio.Lock()
+        self._backoff_seconds = RECONNECT_BACKOFF_INITIAL_SECONDS
+        self._next_attempt_at = 0.0
+        self._lost = False
+
+    def on_notify(self, *_args: Any) -> None:
+        self.wake()
+
+    async def connect(self) -> bool:
+        """Open the LISTEN connection; return False when it cannot be set up."""
+        conn = None
+        try:
+            conn = await self._engine.connect()
+            raw_connection = await conn.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+            await driver_connection.add_listener(JOBS_NOTIFY_CHANNEL, self.on_notify)
+        except Exception:
+            if conn is not None:
+                with suppress(Exception):
+                    await conn.close()
+            return False
+        self._conn, self.driver_connection = conn, driver_connection
+        return True
+
+    async def close(self) -> None:
+        """Drop the LISTEN connection, tolerating an already broken one."""
+        conn, driver_connection = self._conn, self.driver_connection
+        self._conn = self.driver_connection = None
+        if driver_connection is not None:
+            with suppress(Exception):
+                await driver_connection.remove_listener(
+                    JOBS_NOTIFY_CHANNEL, self.on_notify
+                )
+        if conn is not None:
+            with suppress(Exception):
+                await conn.close()
+
+    def _is_lost(self) -> bool:
+        if self.driver_connection is None:
+            return True
+        is_closed = getattr(self.driver_connection, "is_closed", None)
+        return bool(callable(is_closed) and is_closed())
+
+    async def _reconnect(self) -> bool:
+        async with self._reconnect_lock:
+            if not self._is_lost():
+                return False
+            if not self._lost:
+                self._lost = True
+                logger.warning(
+                    "jobs_wakeup_listener_lost", extra={"channel": JOBS_NOTIFY_CHANNEL}
+                )
+            now = time.monotonic()
+            if now < self._next_attempt_at:
+                return False
+            await self.close()
+            if await self.connect():
+                self._lost = False
+                self._backoff_seconds = RECONNECT_BACKOFF_INITIAL_SECONDS
+                self._next_attempt_at = 0.0
+                logger.info(
+                    "jobs_wakeup_listener_reconnected",
+                    extra={"channel": JOBS_NOTIFY_CHANNEL},
+                )
+                return True
+            logger.warning(
+                "jobs_wakeup_listener_reconnect_failed",
+                extra={
+                    "channel": JOBS_NOTIFY_CHANNEL,
+                    "retryInSeconds": self._backoff_seconds,
+                },
+            )
+            self._next_attempt_at = now + self._backoff_seconds
+            self._backoff_seconds = min(
+                self._backoff_seconds * 2, RECONNECT_BACKOFF_MAX_SECONDS
+            )
+            return False
+
+    async def wait(self, *, timeout: float) -> bool:
+        if self._is_lost() and await self._reconnect():
+            # Notifies sent while disconnected were dropped; rescan once.
+            return True
+        return await super().wait(timeout=timeout)
+
+
+def _dialect_name(bind: Any) -> str:
+    return str(getattr(getattr(bind, "dialect", None), "name", "") or "")
+
+
+def _is_runnable_now(next_run_at: datetime | None) -> bool:
+    if next_run_at is None:
+        return True
+    if next_run_at.tzinfo is None:
+        next_run_at = next_run_at.replace(tzinfo=UTC)
+    return next_run_at <= datetime.now(UTC)
+
+
+def _schedule_in_memory_wakeup(db: AsyncSession) -> None:
+    sync_session = getattr(db, "sync_session", None)
+    if sync_session is None:
+        in_memory_job_wakeup.notify()
+        return
+    if sync_session.info.get(_PENDING_WAKEUP_INFO_KEY):
+        return
+    sync_session.info[_PENDING_WAKEUP_INFO_KEY] = True
+
+    def _after_commit(session) -> None:
+        session.info.pop(_PENDING_WAKEUP_INFO_KEY, None)
+        in_memory_job_wakeup.notify()
+
+    sa_event.listen(sync_session, "after_commit", _after_commit, once=True)
+
+
+async def notify_runnable_jobs(
+    db: AsyncSession,
+    *,
+    job_type: str,
+    next_run_at: datetime | None,
+) -> bool:
+    """Announce a runnable job to idle workers when the transaction commits.
+
+    PostgreSQL queues ``pg_notify`` inside the caller's transaction, so a
+    rollback discards the wake-up. Other backends signal the in-memory hub
+    after commit. Jobs scheduled in the future (retry backoff included) are
+    left to the safety poll.
+    """
+    if not _is_runnable_now(next_run_at):
+        return False
+    get_bind = getattr(db, "get_bind", None)
+    bind = get_bind() if callable(get_bind) else None
+    if _dialect_name(bind) == "postgresql":
+        await db.execute(select(func.pg_notify(JOBS_NOTIFY_CHANNEL, job_type)))
+        return True
+    _schedule_in_memory_wakeup(db)
+    return True
+
+
+@asynccontextmanager
+async def open_job_wakeup_listener(
+    engine: AsyncEngine,
+) -> AsyncIterator[JobWakeupListener | None]:
+    """Yield a wake-up listener for ``engine``, or None to keep plain polling.
+
+    PostgreSQL holds one dedicated connection running ``LISTEN``; other
+    dialects use :data:`in_memory_job_wakeup`. Failing to LISTEN (for example
+    behind a transaction-pooling proxy) degrades to polling instead of
+    stopping the worker; a LISTEN connection lost later is reopened with
+    exponential backoff while the safety poll covers the gap.
+    """
+    if _dialect_name(engine) != "postgresql":
+        async with in_memory_job_wakeup.listen() as listener:
+            yield listener
+        return
+    listener = _PostgresWakeupListener(engine)
+    if not await listener.connect():
+        logger.warning(
+            "jobs_wakeup_listen_unavailable", extra={"channel": JOBS_NOTIFY_CHANNEL}
+        )
+        yield None
+        return
+    logger.info("jobs_wakeup_listening", extra={"channel": JOBS_NOTIFY_CHANNEL})
+    try:
+        yield listener
+    finally:
+        await listener.close()
+
+
+__all__ = [
+    "JOBS_NOTIFY_CHANNEL",
+    "RECONNECT_BACKOFF_INITIAL_SECONDS",
+    "RECONNECT_BACKOFF_MAX_SECONDS",
+    "InMemoryJobWakeupHub",
+    "JobWakeupListener",
+    "in_memory_job_wakeup",
+    "notify_runnable_jobs",
+    "open_job_wakeup_listener",
+]
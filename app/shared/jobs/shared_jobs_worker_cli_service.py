@@ -4,18 +4,37 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import copy
+import functools
 import logging
+import signal
 from datetime import UTC, datetime
 
 from app.config import settings
-from app.shared.database import async_session_maker
+from app.shared import perf
+from app.shared.database import (
+    async_session_maker,
+    engine,
+    size_pools_for_worker_concurrency,
+)
+from app.shared.database.shared_database_engine_utils import PROCESS_ROLE_WORKER
 from app.shared.jobs import shared_jobs_dead_letter_retry_service as dead_letter_retry
+from app.shared.jobs import shared_jobs_wakeup_service as job_wakeup
 from app.shared.jobs import shared_jobs_worker_heartbeat_service as heartbeat_service
+from app.shared.jobs import shared_jobs_worker_metrics_server_service as metrics_server
 from app.shared.jobs import shared_jobs_worker_service as worker_service
+from app.shared.jobs import shared_jobs_worker_supervisor_service as supervisor
 
 logger = logging.getLogger(__name__)
 
 
+def _positive_int(value: str) -> int:
+    parsed = int(value)
+    if parsed < 1:
+        raise argparse.ArgumentTypeError("must be >= 1")
+    return parsed
+
+
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Winoe worker CLI")
     subparsers = parser.add_subparsers(dest="command")
@@ -35,7 +54,13 @@ def _build_parser() -> argparse.ArgumentParser:
         "--idle-sleep-seconds",
         type=float,
         default=worker_service.DEFAULT_IDLE_SLEEP_SECONDS,
-        help="Sleep between idle queue polls",
+        help="Sleep between idle queue polls when LISTEN/NOTIFY is unavailable",
+    )
+    _worker_parser.add_argument(
+        "--safety-poll-seconds",
+        type=float,
+        default=settings.WORKER_WAKEUP_SAFETY_POLL_SECONDS,
+        help="Safety-net queue poll interval while waiting on LISTEN/NOTIFY",
     )
     _worker_parser.add_argument(
         "--heartbeat-interval-seconds",
@@ -43,6 +68,24 @@ def _build_parser() -> argparse.ArgumentParser:
         default=settings.WORKER_HEARTBEAT_INTERVAL_SECONDS,
         help="Heartbeat write interval",
     )
+    _worker_parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=max(1, settings.WORKER_CONCURRENCY),
+        help="Number of in-process job execution slots",
+    )
+    _worker_parser.add_argument(
+        "--processes",
+        type=_positive_int,
+        default=max(1, settings.WORKER_PROCESSES),
+        help="Number of supervised worker processes (1 runs in-process)",
+    )
+    _worker_parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=settings.WORKER_METRICS_PORT,
+        help="Serve Prometheus metrics on this port (0 disables; +n per process)",
+    )
 
     _retry_parser = subparsers.add_parser(
         "retry-dead-jobs", help="Retry dead-letter Winoe jobs"
@@ -61,13 +104,57 @@ def _build_parser() -> argparse.ArgumentParser:
 
 async def run_worker(args: argparse.Namespace) -> None:
     """Run the Winoe worker command."""
+    if str(settings.PROCESS_ROLE).strip().lower() != PROCESS_ROLE_WORKER:
+        logger.warning(
+            "worker_using_api_pool_settings",
+            extra={"hint": "set WINOE_PROCESS_ROLE=worker"},
+        )
+    size_pools_for_worker_concurrency(args.concurrency)
     worker_service.register_builtin_handlers()
-    await heartbeat_service.run_worker_forever(
-        session_maker=async_session_maker,
-        service_name=args.service_name,
-        instance_id=args.worker_id,
-        idle_sleep_seconds=args.idle_sleep_seconds,
-        heartbeat_interval_seconds=args.heartbeat_interval_seconds,
+    if perf.perf_logging_enabled():
+        perf.attach_sqlalchemy_listeners(engine)
+    async with (
+        metrics_server.serve_worker_metrics(
+            session_maker=async_session_maker,
+            host=settings.WORKER_METRICS_HOST,
+            port=args.metrics_port,
+        ),
+        job_wakeup.open_job_wakeup_listener(engine) as wakeup_listener,
+        perf.monitor_event_loop_lag(),
+    ):
+        await heartbeat_service.run_worker_forever(
+            session_maker=async_session_maker,
+            service_name=args.service_name,
+            instance_id=args.worker_id,
+            idle_sleep_seconds=args.idle_sleep_seconds,
+            heartbeat_interval_seconds=args.heartbeat_interval_seconds,
+            concurrency=args.concurrency,
+            wakeup_listener=wakeup_listener,
+            safety_poll_seconds=args.safety_poll_seconds,
+        )
+
+
+def _run_worker_child(args: argparse.Namespace, index: int) -> None:
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    # Forked children must not reuse pooled connections inherited from the
+    # supervisor; drop them without closing the parent's sockets.
+    engine.sync_engine.dispose(close=False)
+    child_args = copy.copy(args)
+    child_args.worker_id = supervisor.child_instance_id(args.worker_id, index)
+    child_args.processes = 1
+    if args.metrics_port > 0:
+        child_args.metrics_port = args.metrics_port + index
+    asyncio.run(run_worker(child_args))
+
+
+def run_supervised_workers(args: argparse.Namespace) -> None:
+    """Run ``args.processes`` worker processes under a restarting supervisor."""
+    supervisor.run_supervisor(
+        processes=args.processes,
+        start_process=supervisor.fork_process_factory(
+            functools.partial(_run_worker_child, args)
+        ),
     )
 
 
@@ -95,6 +182,9 @@ def main(argv: list[str] | None = None) -> None:  # pragma: no cover - thin CLI
     if args.command == "retry-dead-jobs":
         asyncio.run(retry_dead_jobs(args))
         return
+    if args.processes > 1:
+        run_supervised_workers(args)
+        return
     asyncio.run(run_worker(args))
 
 
@@ -19,6 +19,13 @@ from app.shared.jobs.repositories import repository as jobs_repo
 from app.shared.jobs.repositories.shared_jobs_repositories_worker_heartbeats_repository_model import (
     WORKER_HEARTBEAT_STATUS_STOPPED,
 )
+from app.shared.jobs.shared_jobs_wakeup_service import JobWakeupListener
+from app.shared.jobs.worker_runtime.shared_jobs_worker_runtime_batch_claim_service import (
+    JobBatchClaimer,
+)
+from app.shared.jobs.worker_runtime.shared_jobs_worker_runtime_types_model import (
+    DEFAULT_LEASE_SECONDS,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +116,128 @@ async def _heartbeat_loop(
         )
 
 
+def _slot_worker_id(instance_id: str, slot_index: int) -> str:
+    if slot_index == 0:
+        return instance_id
+    return f"{instance_id}/slot-{slot_index}"
+
+
+async def _wait_for_work(
+    *,
+    stop_event: asyncio.Event,
+    idle_sleep_seconds: float,
+    wakeup_listener: JobWakeupListener | None,
+    safety_poll_seconds: float,
+) -> None:
+    if wakeup_listener is None:
+        with suppress(TimeoutError):
+            await asyncio.wait_for(
+                stop_event.wait(), timeout=max(0.1, idle_sleep_seconds)
+            )
+        return
+    stop_waiter = asyncio.ensure_future(stop_event.wait())
+    wake_waiter = asyncio.ensure_future(
+        wakeup_listener.wait(timeout=max(0.1, safety_poll_seconds))
+    )
+    try:
+        await asyncio.wait(
+            {stop_waiter, wake_waiter}, return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        for waiter in (stop_waiter, wake_waiter):
+            if not waiter.done():
+                waiter.cancel()
+        await asyncio.gather(stop_waiter, wake_waiter, return_exceptions=True)
+
+
+async def _run_slot_iteration(
+    *,
+    session_maker: async_sessionmaker[AsyncSession],
+    worker_id: str,
+    stop_event: asyncio.Event,
+    idle_sleep_seconds: float,
+    wakeup_listener: JobWakeupListener | None = None,
+    safety_poll_seconds: float = 0.0,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    claimer: JobBatchClaimer | None = None,
+) -> None:
+    handled = await worker_service.run_once(
+        session_maker=session_maker,
+        worker_id=worker_id,
+        lease_seconds=lease_seconds,
+        claimer=claimer,
+    )
+    if handled:
+        await asyncio.sleep(0)
+        return
+    await _wait_for_work(
+        stop_event=stop_event,
+        idle_sleep_seconds=idle_sleep_seconds,
+        wakeup_listener=wakeup_listener,
+        safety_poll_seconds=safety_poll_seconds,
+    )
+
+
+async def _slot_loop(
+    *,
+    session_maker: async_sessionmaker[AsyncSession],
+    worker_id: str,
+    stop_event: asyncio.Event,
+    idle_sleep_seconds: float,
+    wakeup_listener: JobWakeupListener | None = None,
+    safety_poll_seconds: float = 0.0,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    claimer: JobBatchClaimer | None = None,
+) -> None:
+    while not stop_event.is_set():
+        await _run_slot_iteration(
+            session_maker=session_maker,
+            worker_id=worker_id,
+            stop_event=stop_event,
+            idle_sleep_seconds=idle_sleep_seconds,
+            wakeup_listener=wakeup_listener,
+            safety_poll_seconds=safety_poll_seconds,
+            lease_seconds=lease_seconds,
+            claimer=claimer,
+        )
+
+
+def _raise_if_task_failed(
+    task: asyncio.Task,
+    *,
+    event: str,
+    service_name: str,
+    instance_id: str,
+) -> None:
+    if not task.done():
+        return
+    try:
+        task.result()
+    except Exception:
+        logger.exception(
+            event,
+            extra={"service_name": service_name, "instance_id": instance_id},
+        )
+        raise
+
+
+async def _drain_slot_tasks(
+    slot_tasks: list[asyncio.Task],
+    *,
+    cancel: bool,
+) -> BaseException | None:
+    if cancel:
+        for task in slot_tasks:
+            task.cancel()
+    first_failure: BaseException | None = None
+    for outcome in await asyncio.gather(*slot_tasks, return_exceptions=True):
+        if isinstance(outcome, asyncio.CancelledError):
+            continue
+        if isinstance(outcome, BaseException) and first_failure is None:
+            first_failure = outcome
+    return first_failure
+
+
 async def run_worker_forever(
     *,
     session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
@@ -116,16 +245,48 @@ async def run_worker_forever(
     instance_id: str | None = None,
     idle_sleep_seconds: float = 1.0,
     heartbeat_interval_seconds: int | None = None,
+    concurrency: int | None = None,
+    wakeup_listener: JobWakeupListener | None = None,
+    safety_poll_seconds: float | None = None,
+    lease_seconds: int | None = None,
 ) -> None:
-    """Run the Winoe worker loop forever."""
+    """Run the Winoe worker loop forever.
+
+    ``concurrency`` controls how many execution slots claim and run jobs in
+    this process. Slot 0 runs on the calling task; additional slots run as
+    sibling tasks. On SIGINT/SIGTERM every slot stops claiming, finishes its
+    in-flight job, and the worker writes its stopped heartbeat afterwards.
+
+    With a ``wakeup_listener`` idle slots block until a job is announced and
+    only re-poll every ``safety_poll_seconds``; without one they poll every
+    ``idle_sleep_seconds``.
+
+    ``lease_seconds`` bounds how long a crashed slot's job stays locked;
+    in-flight jobs renew their lease so it need not cover the slowest handler.
+
+    The slots share one :class:`JobBatchClaimer`, so slots that go idle
+    together are refilled by a single claim query.
+    """
     resolved_instance_id = instance_id or _build_worker_instance_id()
     resolved_heartbeat_interval = (
         heartbeat_interval_seconds
         if heartbeat_interval_seconds is not None
         else settings.WORKER_HEARTBEAT_INTERVAL_SECONDS
     )
+    resolved_concurrency = max(
+        1, concurrency if concurrency is not None else settings.WORKER_CONCURRENCY
+    )
+    resolved_safety_poll_seconds = (
+        safety_poll_seconds
+        if safety_poll_seconds is not None
+        else settings.WORKER_WAKEUP_SAFETY_POLL_SECONDS
+    )
+    resolved_lease_seconds = max(
+        1, lease_seconds if lease_seconds is not None else settings.WORKER_LEASE_SECONDS
+    )
     started_at = datetime.now(UTC)
     stop_event = asyncio.Event()
+    claimer = JobBatchClaimer()
 
     try:
         loop = asyncio.get_running_loop()
@@ -141,6 +302,9 @@ async def run_worker_forever(
             "service_name": service_name,
             "instance_id": resolved_instance_id,
             "heartbeat_interval_seconds": resolved_heartbeat_interval,
+            "concurrency": resolved_concurrency,
+            "wakeup_listener": wakeup_listener is not None,
+            "lease_seconds": resolved_lease_seconds,
         },
     )
     heartbeat_task = asyncio.create_task(
@@ -153,36 +317,57 @@ async def run_worker_forever(
             heartbeat_interval_seconds=resolved_heartbeat_interval,
         )
     )
+    slot_tasks = [
+        asyncio.create_task(
+            _slot_loop(
+                session_maker=session_maker,
+                worker_id=_slot_worker_id(resolved_instance_id, slot_index),
+                stop_event=stop_event,
+                idle_sleep_seconds=idle_sleep_seconds,
+                wakeup_listener=wakeup_listener,
+                safety_poll_seconds=resolved_safety_poll_seconds,
+                lease_seconds=resolved_lease_seconds,
+                claimer=claimer,
+            )
+        )
+        for slot_index in range(1, resolved_concurrency)
+    ]
     failure: BaseException | None = None
     try:
         while not stop_event.is_set():
-            handled = await worker_service.run_once(
+            await _run_slot_iteration(
                 session_maker=session_maker,
                 worker_id=resolved_instance_id,
+                stop_event=stop_event,
+                idle_sleep_seconds=idle_sleep_seconds,
+                wakeup_listener=wakeup_listener,
+                safety_poll_seconds=resolved_safety_poll_seconds,
+                lease_seconds=resolved_lease_seconds,
+                claimer=claimer,
             )
-            if handled:
-                await asyncio.sleep(0)
-            else:
-                with suppress(TimeoutError):
-                    await asyncio.wait_for(
-                        stop_event.wait(), timeout=max(0.1, idle_sleep_seconds)
-                    )
-            if heartbeat_task.done():
-                try:
-                    heartbeat_task.result()
-                except Exception:
-                    logger.exception(
-                        "winoe_worker_heartbeat_failed",
-                        extra={
-                            "service_name": service_name,
-                            "instance_id": resolved_instance_id,
-                        },
-                    )
-                    raise
+            _raise_if_task_failed(
+                heartbeat_task,
+                event="winoe_worker_heartbeat_failed",
+                service_name=service_name,
+                instance_id=resolved_instance_id,
+            )
+            for slot_task in slot_tasks:
+                _raise_if_task_failed(
+                    slot_task,
+                    event="winoe_worker_slot_failed",
+                    service_name=service_name,
+                    instance_id=resolved_instance_id,
+                )
     except BaseException as exc:
         failure = exc
     finally:
         stop_event.set()
+        slot_failure = await _drain_slot_tasks(
+            slot_tasks,
+            cancel=isinstance(failure, asyncio.CancelledError),
+        )
+        if slot_failure is not None and failure is None:
+            failure = slot_failure
         if not heartbeat_task.done():
             heartbeat_task.cancel()
         try:
@@ -0,0 +1,105 @@
+"""Minimal Prometheus scrape endpoint served from a worker process."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.shared.jobs.shared_jobs_metrics_service import (
+    build_job_metrics,
+    render_prometheus_text,
+)
+from app.shared.perf import (
+    loop_lag_monitor,
+    perf_loop_lag_monitor_enabled,
+    pool_checkout_stats,
+    render_loop_lag_prometheus,
+    render_pool_checkout_prometheus,
+)
+
+logger = logging.getLogger(__name__)
+
+_READ_TIMEOUT_SECONDS = 5.0
+
+
+async def render_worker_metrics(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> str:
+    """Render queue aggregates plus this worker's handler, loop and pool metrics."""
+    async with session_maker() as db:
+        metrics = await build_job_metrics(db)
+    text = render_prometheus_text(
+        queues=metrics.queues,
+        runtime=metrics.runtime,
+        window_seconds=metrics.windowSeconds,
+    )
+    if perf_loop_lag_monitor_enabled():
+        text += render_loop_lag_prometheus(loop_lag_monitor.snapshot())
+    bind = getattr(session_maker, "kw", {}).get("bind")
+    text += render_pool_checkout_prometheus(
+        pool_checkout_stats.snapshot(getattr(bind, "pool", None))
+    )
+    return text
+
+
+def _http_response(status: str, body: str, content_type: str) -> bytes:
+    payload = body.encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(payload)}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    return head.encode("ascii") + payload
+
+
+@asynccontextmanager
+async def serve_worker_metrics(
+    *,
+    session_maker: async_sessionmaker[AsyncSession],
+    host: str,
+    port: int,
+) -> AsyncIterator[asyncio.AbstractServer | None]:
+    """Serve ``GET /metrics`` on ``host:port`` for the lifetime of the context.
+
+    A port of 0 disables the endpoint.
+    """
+    if port <= 0:
+        yield None
+        return
+
+    async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await asyncio.wait_for(
+                reader.readline(), timeout=_READ_TIMEOUT_SECONDS
+            )
+            parts = request_line.decode("latin-1").split()
+            if len(parts) < 2 or parts[0] != "GET" or parts[1] != "/metrics":
+                writer.write(_http_response("404 Not Found", "", "text/plain"))
+            else:
+                body = await render_worker_metrics(session_maker)
+                writer.write(
+                    _http_response("200 OK", body, "text/plain; version=0.0.4")
+                )
+            await writer.drain()
+        except Exception:
+            logger.exception("worker_metrics_request_failed")
+        finally:
+            writer.close()
+            with suppress(Exception):
+                await writer.wait_closed()
+
+    server = await asyncio.start_server(_handle, host=host, port=port)
+    logger.info("worker_metrics_listening", extra={"host": host, "port": port})
+    try:
+        yield server
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+__all__ = ["render_worker_metrics", "serve_worker_metrics"]
@@ -10,6 +10,9 @@ import socket
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.shared.database import async_session_maker
+from app.shared.jobs.worker_runtime.shared_jobs_worker_runtime_batch_claim_service import (
+    JobBatchClaimer,
+)
 from app.shared.jobs.worker_runtime.shared_jobs_worker_runtime_registry_service import (
     clear_handlers,
     has_handler,
@@ -51,16 +54,36 @@ async def run_forever(
     session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
     worker_id: str | None = None,
     idle_sleep_seconds: float = DEFAULT_IDLE_SLEEP_SECONDS,
+    concurrency: int = 1,
 ) -> None:  # pragma: no cover - exercised manually via CLI
-    """Run forever."""
+    """Run forever with ``concurrency`` independent claim/run slots."""
     resolved_worker_id = worker_id or _build_worker_id()
-    logger.info("jobs_worker_started", extra={"worker_id": resolved_worker_id})
-    while True:
-        handled = await _run_once(
-            session_maker=session_maker, worker_id=resolved_worker_id
+    logger.info(
+        "jobs_worker_started",
+        extra={"worker_id": resolved_worker_id, "concurrency": concurrency},
+    )
+    claimer = JobBatchClaimer()
+
+    async def _slot(slot_worker_id: str) -> None:
+        while True:
+            handled = await _run_once(
+                session_maker=session_maker,
+                worker_id=slot_worker_id,
+                claimer=claimer,
+            )
+            if not handled:
+                await asyncio.sleep(idle_sleep_seconds)
+
+    await asyncio.gather(
+        *(
+            _slot(
+                resolved_worker_id
+                if slot_index == 0
+                else f"{resolved_worker_id}/slot-{slot_index}"
+            )
+            for slot_index in range(max(1, concurrency))
         )
-        if not handled:
-            await asyncio.sleep(idle_sleep_seconds)
+    )
 
 
 def main() -> None:  # pragma: no cover - thin CLI wrapper
@@ -0,0 +1,159 @@
+"""Application module for Winoe multi-process worker supervisor workflows."""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import signal
+import threading
+import time
+from collections.abc import Callable
+from multiprocessing.process import BaseProcess
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SUPERVISOR_POLL_SECONDS = 0.5
+DEFAULT_DRAIN_TIMEOUT_SECONDS = 120.0
+MIN_RESTART_BACKOFF_SECONDS = 1.0
+MAX_RESTART_BACKOFF_SECONDS = 30.0
+
+ProcessFactory = Callable[[int], BaseProcess]
+
+
+def child_instance_id(base_instance_id: str | None, index: int) -> str | None:
+    """Return the heartbeat instance id for child ``index``.
+
+    Without an explicit base id each child falls back to its own host:pid.
+    """
+    if not base_instance_id:
+        return None
+    return f"{base_instance_id}/p{index}"
+
+
+def restart_backoff_seconds(consecutive_crashes: int) -> float:
+    """Return the delay before restarting a child that keeps crashing."""
+    if consecutive_crashes < 1:
+        return 0.0
+    return min(
+        MAX_RESTART_BACKOFF_SECONDS,
+        MIN_RESTART_BACKOFF_SECONDS * (2 ** (consecutive_crashes - 1)),
+    )
+
+
+def fork_process_factory(child_main: Callable[[int], None]) -> ProcessFactory:
+    """Return a factory starting ``child_main(index)`` in a forked process."""
+    method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+    context = multiprocessing.get_context(method)
+
+    def _start(index: int) -> BaseProcess:
+        process = context.Process(
+            target=child_main, args=(index,), name=f"winoe-worker-{index}"
+        )
+        process.start()
+        return process
+
+    return _start
+
+
+def _install_stop_handlers(stop_event: threading.Event) -> None:
+    def _handle(signum, _frame) -> None:
+        logger.info("worker_supervisor_stop_requested", extra={"signal": signum})
+        stop_event.set()
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, _handle)
+
+
+def _drain_children(
+    children: dict[int, BaseProcess], *, drain_timeout_seconds: float
+) -> None:
+    for process in children.values():
+        if process.is_alive():
+            process.terminate()
+    deadline = time.monotonic() + max(0.0, drain_timeout_seconds)
+    for process in children.values():
+        process.join(max(0.0, deadline - time.monotonic()))
+    for index, process in children.items():
+        if process.is_alive():
+            logger.warning(
+                "worker_supervisor_child_killed",
+                extra={"child_index": index, "pid": process.pid},
+            )
+            process.kill()
+            process.join()
+
+
+def run_supervisor(
+    *,
+    processes: int,
+    start_process: ProcessFactory,
+    stop_event: threading.Event | None = None,
+    poll_interval_seconds: float = DEFAULT_SUPERVISOR_POLL_SECONDS,
+    drain_timeout_seconds: float = DEFAULT_DRAIN_TIMEOUT_SECONDS,
+) -> None:
+    """Keep ``processes`` worker children alive until asked to stop.
+
+    Crashed children are restarted with exponential backoff. On SIGINT or
+    SIGTERM every child receives SIGTERM so it can finish in-flight jobs and
+    write its stopped heartbeat; children still running after
+    ``drain_timeout_seconds`` are killed.
+    """
+    if stop_event is None:
+        stop_event = threading.Event()
+        _install_stop_handlers(stop_event)
+    children: dict[int, BaseProcess] = {}
+    started_at: dict[int, float] = {}
+    crashes: dict[int, int] = {}
+    restart_at: dict[int, float] = {}
+    for index in range(max(1, processes)):
+        children[index] = start_process(index)
+        started_at[index] = time.monotonic()
+    logger.info(
+        "worker_supervisor_started",
+        extra={
+            "processes": len(children),
+            "pids": [process.pid for process in children.values()],
+        },
+    )
+
+    while not stop_event.is_set():
+        now = time.monotonic()
+        for index, process in list(children.items()):
+            if process.is_alive():
+                continue
+            if index not in restart_at:
+                if now - started_at[index] > MAX_RESTART_BACKOFF_SECONDS:
+                    crashes[index] = 0
+                crashes[index] = crashes.get(index, 0) + 1
+                restart_at[index] = now + restart_backoff_seconds(crashes[index])
+                logger.warning(
+                    "worker_supervisor_child_exited",
+                    extra={
+                        "child_index": index,
+                        "pid": process.pid,
+                        "exit_code": process.exitcode,
+                    },
+                )
+            if now >= restart_at[index]:
+                restart_at.pop(index)
+                children[index] = start_process(index)
+                started_at[index] = time.monotonic()
+                logger.info(
+                    "worker_supervisor_child_restarted",
+                    extra={"child_index": index, "pid": children[index].pid},
+                )
+        stop_event.wait(poll_interval_seconds)
+
+    logger.info("worker_supervisor_draining", extra={"processes": len(children)})
+    _drain_children(children, drain_timeout_seconds=drain_timeout_seconds)
+    logger.info("worker_supervisor_stopped")
+
+
+__all__ = [
+    "DEFAULT_DRAIN_TIMEOUT_SECONDS",
+    "DEFAULT_SUPERVISOR_POLL_SECONDS",
+    "child_instance_id",
+    "fork_process_factory",
+    "restart_backoff_seconds",
+    "run_supervisor",
+]
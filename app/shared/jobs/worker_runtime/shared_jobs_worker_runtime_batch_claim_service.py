@@ -0,0 +1,87 @@
+"""Application module for jobs worker runtime batch claim service workflows."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Mapping
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.shared.jobs.repositories import repository as jobs_repo
+from app.shared.jobs.repositories.shared_jobs_repositories_models_repository import (
+    Job,
+)
+
+
+class JobBatchClaimer:
+    """Claim jobs for every idle slot of a worker process in one round trip.
+
+    Slots ask for work through :meth:`claim`. Only one claim query runs at a
+    time; it asks for as many jobs as there are slots waiting, keeps the first
+    and hands the rest to the waiting slots instead of letting each of them
+    issue its own claim. A job keeps the ``locked_by`` of the slot that
+    claimed it, which is what lease renewal and the state writes check.
+    """
+
+    def __init__(self) -> None:
+        self._pending: deque[Job] = deque()
+        self._waiting = 0
+        self._claims = 0
+        self._drained = False
+        self._lock = asyncio.Lock()
+
+    async def claim(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        *,
+        worker_id: str,
+        now: datetime,
+        lease_seconds: int,
+        max_in_flight: Mapping[str, int] | None = None,
+    ) -> Job | None:
+        """Return a claimed job for the calling slot, or ``None`` when idle."""
+        if self._pending:
+            return self._pending.popleft()
+        self._waiting += 1
+        try:
+            claims_seen = self._claims
+            async with self._lock:
+                if self._pending:
+                    return self._pending.popleft()
+                if self._claims != claims_seen and self._drained:
+                    # A claim that found fewer jobs than it asked for finished
+                    # while this slot queued behind it; nothing is runnable.
+                    return None
+                await self._gather_waiting_slots()
+                limit = self._waiting
+                async with session_maker() as db:
+                    jobs = await jobs_repo.claim_runnable_batch(
+                        db,
+                        worker_id=worker_id,
+                        now=now,
+                        lease_seconds=lease_seconds,
+                        limit=limit,
+                        max_in_flight=max_in_flight,
+                    )
+                self._claims += 1
+                self._drained = len(jobs) < limit
+                if not jobs:
+                    return None
+                self._pending.extend(jobs[1:])
+                return jobs[0]
+        finally:
+            self._waiting -= 1
+
+    async def _gather_waiting_slots(self) -> None:
+        # Slots woken by the same notification reach ``claim`` a scheduler
+        # tick apart; let them register so one query covers all of them.
+        while True:
+            waiting = self._waiting
+            await asyncio.sleep(0)
+            if self._waiting == waiting:
+                return
+
+
+__all__ = ["JobBatchClaimer"]
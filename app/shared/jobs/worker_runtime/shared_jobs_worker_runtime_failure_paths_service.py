@@ -83,6 +83,7 @@ async def retry_or_dead_letter(
             error_str=error_str,
             next_run_at=next_run_at,
             claim_time=claim_time,
+            worker_id=getattr(job, "locked_by", None),
         )
         log_fn = logger.warning if log_as_warning else logger.info
         log_fn(
@@ -99,6 +100,7 @@ async def retry_or_dead_letter(
         job_id=job.id,
         error_str=error_str,
         claim_time=claim_time,
+        worker_id=getattr(job, "locked_by", None),
     )
     logger.warning("job_dead_letter", extra=log_extra)
 
@@ -121,6 +123,7 @@ async def handle_handler_exception(
             job_id=job.id,
             error_str=format_error(error),
             claim_time=claim_time,
+            worker_id=getattr(job, "locked_by", None),
         )
         logger.warning("job_dead_letter", extra=log_extra)
         return
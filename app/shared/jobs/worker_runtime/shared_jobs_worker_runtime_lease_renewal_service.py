@@ -0,0 +1,114 @@
+"""Application module for jobs worker runtime lease renewal service workflows."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager, suppress
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.shared.jobs.repositories import repository as jobs_repo
+from app.shared.jobs.worker_runtime.shared_jobs_worker_runtime_types_model import (
+    JobLeaseLostError,
+)
+
+logger = logging.getLogger(__name__)
+
+MIN_LEASE_RENEWAL_INTERVAL_SECONDS = 1.0
+
+
+def lease_renewal_interval_seconds(lease_seconds: int) -> float:
+    """Return how often an in-flight lease is renewed (a third of the lease)."""
+    return max(MIN_LEASE_RENEWAL_INTERVAL_SECONDS, lease_seconds / 3)
+
+
+async def _renew_lease_forever(
+    session_maker: async_sessionmaker[AsyncSession],
+    *,
+    job_id: str,
+    worker_id: str,
+    interval_seconds: float,
+    log_extra: dict[str, Any],
+    on_lost: Callable[[], None],
+) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with session_maker() as db:
+                renewed = await jobs_repo.renew_lease(
+                    db, job_id=job_id, worker_id=worker_id, now=datetime.now(UTC)
+                )
+        except Exception:
+            logger.exception("job_lease_renewal_failed", extra=log_extra)
+            continue
+        if not renewed:
+            logger.warning("job_lease_lost", extra=log_extra)
+            on_lost()
+            return
+
+
+@asynccontextmanager
+async def hold_job_lease(
+    session_maker: async_sessionmaker[AsyncSession],
+    *,
+    job: Any,
+    lease_seconds: int,
+    log_extra: dict[str, Any],
+) -> AsyncIterator[None]:
+    """Renew ``job``'s lease in the background while the handler runs.
+
+    The claim holds the lease for ``lease_seconds``; renewing it every third
+    of that keeps long handlers from being reclaimed as stale. Renewal runs
+    on the event loop, so a handler that blocks the loop for longer than the
+    lease can still be reclaimed; the lease must outlast the longest
+    blocking stretch of any handler.
+
+    When a renewal finds the job claimed by another worker, the handler's
+    task is cancelled and :class:`JobLeaseLostError` is raised from the
+    context, so the handler stops instead of running alongside the new owner.
+    """
+    worker_id = getattr(job, "locked_by", None)
+    if not worker_id:
+        yield
+        return
+    owner = asyncio.current_task()
+    lost = False
+
+    def _cancel_owner() -> None:
+        nonlocal lost
+        lost = True
+        if owner is not None:
+            owner.cancel()
+
+    renewal = asyncio.create_task(
+        _renew_lease_forever(
+            session_maker,
+            job_id=job.id,
+            worker_id=worker_id,
+            interval_seconds=lease_renewal_interval_seconds(lease_seconds),
+            log_extra=log_extra,
+            on_lost=_cancel_owner,
+        )
+    )
+    try:
+        yield
+    except asyncio.CancelledError:
+        if not lost or owner is None:
+            raise
+        owner.uncancel()
+        raise JobLeaseLostError(job.id) from None
+    finally:
+        renewal.cancel()
+        with suppress(asyncio.CancelledError):
+            await renewal
+
+
+__all__ = [
+    "MIN_LEASE_RENEWAL_INTERVAL_SECONDS",
+    "hold_job_lease",
+    "lease_renewal_interval_seconds",
+]
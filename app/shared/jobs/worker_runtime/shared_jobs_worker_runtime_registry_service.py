@@ -6,7 +6,29 @@ from app.shared.jobs.worker_runtime.shared_jobs_worker_runtime_types_model impor
     JobHandler,
 )
 
+JOB_PRIORITY_HIGH = 100
+JOB_PRIORITY_NORMAL = 0
+JOB_PRIORITY_LOW = -100
+
 _HANDLERS: dict[str, JobHandler] = {}
+# Higher priorities are claimed first. Defaults live here rather than on the
+# handler registration because API processes enqueue jobs without loading
+# handlers.
+_JOB_PRIORITIES: dict[str, int] = {
+    "candidate_completed_notification": JOB_PRIORITY_HIGH,
+    "winoe_report_ready_notification": JOB_PRIORITY_HIGH,
+    "day_close_finalize_text": JOB_PRIORITY_HIGH,
+    "day_close_enforcement": JOB_PRIORITY_HIGH,
+    "media_retention_purge": JOB_PRIORITY_LOW,
+    "workspace_cleanup": JOB_PRIORITY_LOW,
+    "trial_cleanup": JOB_PRIORITY_LOW,
+    "trial_candidate_counters_reconcile": JOB_PRIORITY_LOW,
+}
+_JOB_MAX_IN_FLIGHT: dict[str, int] = {
+    "evaluation_run": 2,
+    "scenario_generation": 2,
+    "transcribe_recording": 2,
+}
 
 
 def _normalize_job_type(job_type: str) -> str:
@@ -37,6 +59,34 @@ def get_handler(job_type: str) -> JobHandler | None:
     return _HANDLERS.get(job_type)
 
 
+def register_job_type_policy(
+    job_type: str,
+    *,
+    priority: int | None = None,
+    max_in_flight: int | None = None,
+) -> None:
+    """Set the default priority and/or max in-flight cap for a job type."""
+    normalized = _normalize_job_type(job_type)
+    if not normalized:
+        raise ValueError("job_type is required")
+    if priority is not None:
+        _JOB_PRIORITIES[normalized] = int(priority)
+    if max_in_flight is not None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        _JOB_MAX_IN_FLIGHT[normalized] = int(max_in_flight)
+
+
+def get_job_priority(job_type: str) -> int:
+    """Return the default priority for a job type."""
+    return _JOB_PRIORITIES.get(_normalize_job_type(job_type), JOB_PRIORITY_NORMAL)
+
+
+def get_job_type_max_in_flight() -> dict[str, int]:
+    """Return per-type max in-flight caps enforced at claim time."""
+    return dict(_JOB_MAX_IN_FLIGHT)
+
+
 def register_builtin_handlers() -> None:
     """Execute register builtin handlers."""
     from app.shared.jobs.handlers import (
@@ -48,6 +98,7 @@ def register_builtin_handlers() -> None:
         MEDIA_RETENTION_PURGE_JOB_TYPE,
         SCENARIO_GENERATION_JOB_TYPE,
         TRANSCRIBE_RECORDING_JOB_TYPE,
+        TRIAL_CANDIDATE_COUNTERS_RECONCILE_JOB_TYPE,
         TRIAL_CLEANUP_JOB_TYPE,
         WINOE_REPORT_READY_NOTIFICATION_JOB_TYPE,
         WORKSPACE_CLEANUP_JOB_TYPE,
@@ -59,6 +110,7 @@ def register_builtin_handlers() -> None:
         handle_media_retention_purge,
         handle_scenario_generation,
         handle_transcribe_recording,
+        handle_trial_candidate_counters_reconcile,
         handle_trial_cleanup,
         handle_winoe_report_ready_notification,
         handle_workspace_cleanup,
@@ -84,12 +136,22 @@ def register_builtin_handlers() -> None:
     register_handler(SCENARIO_GENERATION_JOB_TYPE, handle_scenario_generation)
     register_handler(TRANSCRIBE_RECORDING_JOB_TYPE, handle_transcribe_recording)
     register_handler(MEDIA_RETENTION_PURGE_JOB_TYPE, handle_media_retention_purge)
+    register_handler(
+        TRIAL_CANDIDATE_COUNTERS_RECONCILE_JOB_TYPE,
+        handle_trial_candidate_counters_reconcile,
+    )
 
 
 __all__ = [
+    "JOB_PRIORITY_HIGH",
+    "JOB_PRIORITY_LOW",
+    "JOB_PRIORITY_NORMAL",
     "clear_handlers",
     "get_handler",
+    "get_job_priority",
+    "get_job_type_max_in_flight",
     "has_handler",
     "register_builtin_handlers",
     "register_handler",
+    "register_job_type_policy",
 ]
@@ -3,18 +3,34 @@
 from __future__ import annotations
 
 import logging
+import time
 from datetime import UTC, datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.shared import perf
 from app.shared.database import async_session_maker
 from app.shared.jobs.repositories import repository as jobs_repo
+from app.shared.jobs.shared_jobs_metrics_service import (
+    JOB_OUTCOME_DEAD_LETTER,
+    JOB_OUTCOME_LEASE_LOST,
+    JOB_OUTCOME_RESCHEDULED,
+    JOB_OUTCOME_RETRIED,
+    JOB_OUTCOME_SUCCEEDED,
+    job_runtime_metrics,
+)
+from app.shared.jobs.worker_runtime.shared_jobs_worker_runtime_batch_claim_service import (
+    JobBatchClaimer,
+)
 from app.shared.jobs.worker_runtime.shared_jobs_worker_runtime_failure_paths_service import (
     handle_handler_exception,
 )
 from app.shared.jobs.worker_runtime.shared_jobs_worker_runtime_invocation_service import (
     invoke_handler,
 )
+from app.shared.jobs.worker_runtime.shared_jobs_worker_runtime_lease_renewal_service import (
+    hold_job_lease,
+)
 from app.shared.jobs.worker_runtime.shared_jobs_worker_runtime_log_context_service import (
     build_log_extra,
 )
@@ -23,6 +39,7 @@ from app.shared.jobs.worker_runtime.shared_jobs_worker_runtime_missing_handler i
 )
 from app.shared.jobs.worker_runtime.shared_jobs_worker_runtime_registry_service import (
     get_handler,
+    get_job_type_max_in_flight,
 )
 from app.shared.jobs.worker_runtime.shared_jobs_worker_runtime_reschedule_paths_service import (
     handle_handler_reschedule,
@@ -34,11 +51,19 @@ from app.shared.jobs.worker_runtime.shared_jobs_worker_runtime_types_model impor
     DEFAULT_BASE_BACKOFF_SECONDS,
     DEFAULT_LEASE_SECONDS,
     DEFAULT_MAX_BACKOFF_SECONDS,
+    JobLeaseLostError,
+    PermanentJobError,
 )
 
 logger = logging.getLogger(__name__)
 
 
+def _failure_outcome(job, error: Exception) -> str:
+    if isinstance(error, PermanentJobError) or job.attempt >= job.max_attempts:
+        return JOB_OUTCOME_DEAD_LETTER
+    return JOB_OUTCOME_RETRIED
+
+
 async def run_once(
     *,
     session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
@@ -47,19 +72,63 @@ async def run_once(
     lease_seconds: int = DEFAULT_LEASE_SECONDS,
     base_backoff_seconds: int = DEFAULT_BASE_BACKOFF_SECONDS,
     max_backoff_seconds: int = DEFAULT_MAX_BACKOFF_SECONDS,
+    claimer: JobBatchClaimer | None = None,
 ) -> bool:
-    """Run once."""
+    """Run once.
+
+    Slots sharing a ``claimer`` take their job from its batch claims instead
+    of claiming one job each.
+    """
     claim_time = now or datetime.now(UTC)
-    async with session_maker() as db:
-        job = await jobs_repo.claim_next_runnable(
-            db,
+    if claimer is not None:
+        job = await claimer.claim(
+            session_maker,
             worker_id=worker_id,
             now=claim_time,
             lease_seconds=lease_seconds,
+            max_in_flight=get_job_type_max_in_flight(),
         )
+    else:
+        async with session_maker() as db:
+            job = await jobs_repo.claim_next_runnable(
+                db,
+                worker_id=worker_id,
+                now=claim_time,
+                lease_seconds=lease_seconds,
+                max_in_flight=get_job_type_max_in_flight(),
+            )
     if job is None:
         return False
 
+    with perf.track_job_perf(
+        job_id=job.id,
+        job_type=job.job_type,
+        attempt=job.attempt,
+        worker_id=worker_id,
+        correlation_id=getattr(job, "correlation_id", None),
+        traceparent=getattr(job, "traceparent", None),
+    ) as job_perf:
+        async with perf.profile_job(job.job_type):
+            job_perf[perf.JOB_PERF_OUTCOME_KEY] = await _run_claimed_job(
+                session_maker,
+                job=job,
+                claim_time=claim_time,
+                lease_seconds=lease_seconds,
+                base_backoff_seconds=base_backoff_seconds,
+                max_backoff_seconds=max_backoff_seconds,
+            )
+    return True
+
+
+async def _run_claimed_job(
+    session_maker: async_sessionmaker[AsyncSession],
+    *,
+    job,
+    claim_time: datetime,
+    lease_seconds: int,
+    base_backoff_seconds: int,
+    max_backoff_seconds: int,
+) -> str:
     log_extra = build_log_extra(job)
     logger.info("job_claimed", extra=log_extra)
     handler = get_handler(job.job_type)
@@ -71,13 +140,29 @@ async def run_once(
             claim_time=claim_time,
         )
         logger.warning("job_dead_letter", extra=log_extra)
-        return True
+        job_runtime_metrics.record(
+            job.job_type, outcome=JOB_OUTCOME_DEAD_LETTER, duration_seconds=0.0
+        )
+        return JOB_OUTCOME_DEAD_LETTER
 
+    started = time.perf_counter()
     try:
         handler_payload = dict(job.payload_json or {})
         handler_payload.setdefault("jobId", job.id)
-        result = await invoke_handler(handler, handler_payload)
+        async with hold_job_lease(
+            session_maker, job=job, lease_seconds=lease_seconds, log_extra=log_extra
+        ):
+            result = await invoke_handler(handler, handler_payload)
+    except JobLeaseLostError:
+        logger.warning("job_abandoned_lease_lost", extra=log_extra)
+        job_runtime_metrics.record(
+            job.job_type,
+            outcome=JOB_OUTCOME_LEASE_LOST,
+            duration_seconds=time.perf_counter() - started,
+        )
+        return JOB_OUTCOME_LEASE_LOST
     except Exception as exc:  # pragma: no cover
+        duration_seconds = time.perf_counter() - started
         await handle_handler_exception(
             session_maker,
             job=job,
@@ -88,8 +173,13 @@ async def run_once(
             max_backoff_seconds=max_backoff_seconds,
             logger=logger,
         )
-        return True
+        outcome = _failure_outcome(job, exc)
+        job_runtime_metrics.record(
+            job.job_type, outcome=outcome, duration_seconds=duration_seconds
+        )
+        return outcome
 
+    duration_seconds = time.perf_counter() - started
     if await handle_handler_reschedule(
         session_maker,
         job=job,
@@ -100,10 +190,31 @@ async def run_once(
         max_backoff_seconds=max_backoff_seconds,
         logger=logger,
     ):
-        return True
+        job_runtime_metrics.record(
+            job.job_type,
+            outcome=JOB_OUTCOME_RESCHEDULED,
+            duration_seconds=duration_seconds,
+        )
+        return JOB_OUTCOME_RESCHEDULED
 
-    await mark_succeeded(
-        session_maker, job_id=job.id, result=result, claim_time=claim_time
-    )
+    if not await mark_succeeded(
+        session_maker,
+        job_id=job.id,
+        result=result,
+        claim_time=claim_time,
+        worker_id=getattr(job, "locked_by", None),
+    ):
+        # The lease lapsed (e.g. the handler blocked the event loop) and the
+        # job now belongs to another worker; its outcome wins.
+        logger.warning("job_result_discarded_lease_lost", extra=log_extra)
+        job_runtime_metrics.record(
+            job.job_type,
+            outcome=JOB_OUTCOME_LEASE_LOST,
+            duration_seconds=duration_seconds,
+        )
+        return JOB_OUTCOME_LEASE_LOST
     logger.info("job_succeeded", extra=log_extra)
-    return True
+    job_runtime_metrics.record(
+        job.job_type, outcome=JOB_OUTCOME_SUCCEEDED, duration_seconds=duration_seconds
+    )
+    return JOB_OUTCOME_SUCCEEDED
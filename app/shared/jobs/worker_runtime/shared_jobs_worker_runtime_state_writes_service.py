@@ -16,11 +16,12 @@ async def mark_dead_letter(
     job_id: str,
     error_str: str,
     claim_time: datetime,
-) -> None:
+    worker_id: str | None = None,
+) -> bool:
     """Mark dead letter."""
     async with session_maker() as db:
-        await jobs_repo.mark_dead_letter(
-            db, job_id=job_id, error_str=error_str, now=claim_time
+        return await jobs_repo.mark_dead_letter(
+            db, job_id=job_id, error_str=error_str, now=claim_time, worker_id=worker_id
         )
 
 
@@ -31,15 +32,17 @@ async def mark_failed_and_reschedule(
     error_str: str,
     next_run_at: datetime,
     claim_time: datetime,
-) -> None:
+    worker_id: str | None = None,
+) -> bool:
     """Mark failed and reschedule."""
     async with session_maker() as db:
-        await jobs_repo.mark_failed_and_reschedule(
+        return await jobs_repo.mark_failed_and_reschedule(
             db,
             job_id=job_id,
             error_str=error_str,
             next_run_at=next_run_at,
             now=claim_time,
+            worker_id=worker_id,
         )
 
 
@@ -59,11 +62,12 @@ async def mark_succeeded(
     job_id: str,
     result: dict[str, Any] | None,
     claim_time: datetime,
-) -> None:
+    worker_id: str | None = None,
+) -> bool:
     """Mark succeeded."""
     async with session_maker() as db:
-        await jobs_repo.mark_succeeded(
-            db, job_id=job_id, result_json=result, now=claim_time
+        return await jobs_repo.mark_succeeded(
+            db, job_id=job_id, result_json=result, now=claim_time, worker_id=worker_id
         )
 
 
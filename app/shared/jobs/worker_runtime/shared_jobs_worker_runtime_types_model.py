@@ -20,6 +20,10 @@ class PermanentJobError(Exception):
     """Signals an unrecoverable handler failure."""
 
 
+class JobLeaseLostError(Exception):
+    """Signals that another worker reclaimed the job while its handler ran."""
+
+
 def compute_backoff_seconds(
     attempt: int,
     *,
@@ -38,6 +42,7 @@ __all__ = [
     "DEFAULT_LEASE_SECONDS",
     "DEFAULT_MAX_BACKOFF_SECONDS",
     "JobHandler",
+    "JobLeaseLostError",
     "PermanentJobError",
     "compute_backoff_seconds",
 ]
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
 from contextvars import ContextVar, Token
 
 from sqlalchemy import event as sa_event
@@ -11,9 +13,17 @@ from app.config import settings
 
 from .shared_perf_config import (
     perf_logging_enabled,
+    perf_loop_lag_monitor_enabled,
+    perf_loop_lag_threshold_ms,
+    perf_n_plus_one_strict,
+    perf_n_plus_one_threshold,
+    perf_profiler_enabled,
+    perf_request_logs_enabled,
+    perf_route_histograms_enabled,
     perf_span_sample_rate,
     perf_spans_enabled,
     perf_sql_fingerprints_enabled,
+    perf_tracing_enabled,
 )
 from .shared_perf_context_utils import (
     PerfStats,
@@ -21,13 +31,60 @@ from .shared_perf_context_utils import (
     get_request_stats,
     start_request_stats,
 )
+from .shared_perf_job_utils import JOB_PERF_OUTCOME_KEY, job_perf_scope
+from .shared_perf_loop_lag_utils import (
+    LOOP_BLOCKED_EVENT,
+    LoopLagSnapshot,
+    loop_lag_monitor,
+    monitor_event_loop_lag,
+    render_loop_lag_prometheus,
+)
 from .shared_perf_middleware import (
     _request_id_from_scope,
     create_request_perf_middleware,
 )
+from .shared_perf_n_plus_one_utils import (
+    N_PLUS_ONE_EVENT,
+    NPlusOneQueryError,
+    find_n_plus_one,
+)
+from .shared_perf_pool_utils import (
+    PoolCheckoutSnapshot,
+    pool_checkout_stats,
+    render_pool_checkout_prometheus,
+)
+from .shared_perf_profiler_utils import (
+    PROFILE_CAPTURED_EVENT,
+    ProfileSessionCreateRequest,
+    ProfileSessionSummary,
+    profile_job,
+    profile_request,
+    profile_session_summary,
+    profiler,
+)
+from .shared_perf_route_histograms_utils import (
+    RouteLatencyWindow,
+    render_route_histograms_prometheus,
+    route_latency_histograms,
+)
 from .shared_perf_sqlalchemy_hooks_utils import (
+    clear_sql_fingerprint_cache,
     normalize_sql_statement,
     register_listeners,
+    sql_fingerprint_cache_info,
+)
+from .shared_perf_tracing_utils import (
+    SPAN_KIND_CLIENT,
+    InMemorySpanExporter,
+    JsonLinesSpanExporter,
+    Span,
+    SpanExporter,
+    current_traceparent,
+    get_span_exporter,
+    parse_traceparent,
+    record_trace_span,
+    set_span_exporter,
+    start_trace_span,
 )
 
 _perf_ctx: ContextVar[PerfStats | None] = ContextVar("perf_ctx", default=None)
@@ -53,12 +110,50 @@ def _get_perf_ctx():
 
 def record_external_wait(provider: str, elapsed_ms: float) -> None:
     """Record external wait."""
+    record_trace_span(
+        f"external {provider}",
+        kind=SPAN_KIND_CLIENT,
+        elapsed_ms=elapsed_ms,
+        attributes={"peer.service": provider},
+    )
     stats = _perf_ctx.get()
     if stats is None:
         return
     stats.record_external_wait(provider, elapsed_ms)
 
 
+def record_pool_checkout_wait(elapsed_ms: float, *, timed_out: bool = False) -> None:
+    """Record how long a DB connection checkout waited on the pool."""
+    pool_checkout_stats.record(elapsed_ms, timed_out=timed_out)
+    stats = _perf_ctx.get()
+    if stats is None:
+        return
+    stats.db_pool_wait_ms += float(elapsed_ms)
+
+
+@contextmanager
+def track_job_perf(
+    *,
+    job_id: str,
+    job_type: str,
+    attempt: int,
+    worker_id: str | None = None,
+    correlation_id: str | None = None,
+    traceparent: str | None = None,
+) -> Iterator[dict[str, object]]:
+    """Collect per-job perf stats and emit a ``perf_job`` record."""
+    with job_perf_scope(
+        _perf_ctx,
+        job_id=job_id,
+        job_type=job_type,
+        attempt=attempt,
+        worker_id=worker_id,
+        correlation_id=correlation_id,
+        traceparent=traceparent,
+    ) as scope:
+        yield scope
+
+
 RequestPerfMiddleware = create_request_perf_middleware(_get_perf_ctx)
 
 
@@ -74,14 +169,57 @@ def attach_sqlalchemy_listeners(engine) -> None:
 
 
 __all__ = [
+    "InMemorySpanExporter",
+    "JOB_PERF_OUTCOME_KEY",
+    "JsonLinesSpanExporter",
+    "LOOP_BLOCKED_EVENT",
+    "LoopLagSnapshot",
+    "N_PLUS_ONE_EVENT",
+    "NPlusOneQueryError",
+    "PROFILE_CAPTURED_EVENT",
     "PerfStats",
+    "PoolCheckoutSnapshot",
+    "ProfileSessionCreateRequest",
+    "ProfileSessionSummary",
     "RequestPerfMiddleware",
+    "RouteLatencyWindow",
+    "Span",
+    "SpanExporter",
     "attach_sqlalchemy_listeners",
+    "clear_sql_fingerprint_cache",
+    "current_traceparent",
+    "find_n_plus_one",
+    "get_span_exporter",
+    "loop_lag_monitor",
+    "monitor_event_loop_lag",
     "perf_logging_enabled",
+    "perf_loop_lag_monitor_enabled",
+    "perf_loop_lag_threshold_ms",
+    "perf_n_plus_one_strict",
+    "perf_n_plus_one_threshold",
+    "perf_profiler_enabled",
+    "perf_request_logs_enabled",
+    "perf_route_histograms_enabled",
     "perf_spans_enabled",
     "perf_sql_fingerprints_enabled",
+    "parse_traceparent",
     "perf_span_sample_rate",
+    "perf_tracing_enabled",
+    "pool_checkout_stats",
+    "profile_job",
+    "profile_request",
+    "profile_session_summary",
+    "profiler",
     "record_external_wait",
+    "record_pool_checkout_wait",
+    "render_loop_lag_prometheus",
+    "render_pool_checkout_prometheus",
+    "set_span_exporter",
+    "start_trace_span",
+    "render_route_histograms_prometheus",
+    "route_latency_histograms",
+    "sql_fingerprint_cache_info",
+    "track_job_perf",
     "normalize_sql_statement",
     "_perf_ctx",
     "_start_request_stats",
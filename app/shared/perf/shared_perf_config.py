@@ -5,12 +5,28 @@ from app.config import settings
 
 def perf_logging_enabled() -> bool:
     """Return True when request perf instrumentation is enabled."""
+    return bool(
+        perf_request_logs_enabled()
+        or perf_n_plus_one_threshold() > 0
+        or perf_route_histograms_enabled()
+        or perf_tracing_enabled()
+        or perf_profiler_enabled()
+    )
+
+
+def perf_request_logs_enabled() -> bool:
+    """Return True when per-request/per-job ``perf_*`` lines should be logged."""
     return bool(
         getattr(settings, "DEBUG_PERF", False)
         or getattr(settings, "PERF_SPANS_ENABLED", False)
     )
 
 
+def perf_route_histograms_enabled() -> bool:
+    """Return True when per-route latency histograms should be recorded."""
+    return bool(getattr(settings, "PERF_ROUTE_HISTOGRAMS_ENABLED", False))
+
+
 def perf_spans_enabled() -> bool:
     """Execute perf spans enabled."""
     return bool(getattr(settings, "PERF_SPANS_ENABLED", False))
@@ -18,7 +34,69 @@ def perf_spans_enabled() -> bool:
 
 def perf_sql_fingerprints_enabled() -> bool:
     """Execute perf sql fingerprints enabled."""
-    return bool(getattr(settings, "PERF_SQL_FINGERPRINTS_ENABLED", False))
+    return bool(
+        getattr(settings, "PERF_SQL_FINGERPRINTS_ENABLED", False)
+        or perf_n_plus_one_threshold() > 0
+        or perf_tracing_enabled()
+    )
+
+
+def perf_n_plus_one_threshold() -> int:
+    """Return the per-scope repeat count above which a fingerprint is flagged.
+
+    Zero (the default) disables N+1 detection.
+    """
+    threshold = getattr(settings, "PERF_N_PLUS_ONE_THRESHOLD", 0)
+    try:
+        value = int(threshold)
+    except (TypeError, ValueError):
+        return 0
+    return max(value, 0)
+
+
+def perf_n_plus_one_strict() -> bool:
+    """Return True when detected N+1 patterns should raise."""
+    return bool(getattr(settings, "PERF_N_PLUS_ONE_STRICT", False))
+
+
+def perf_loop_lag_monitor_enabled() -> bool:
+    """Return True when the event-loop lag monitor should run."""
+    return bool(getattr(settings, "PERF_LOOP_LAG_MONITOR_ENABLED", False))
+
+
+def perf_loop_lag_threshold_ms() -> float:
+    """Return the loop stall (ms) that triggers a ``perf_loop_blocked`` report."""
+    threshold = getattr(settings, "PERF_LOOP_LAG_THRESHOLD_MS", 100.0)
+    try:
+        value = float(threshold)
+    except (TypeError, ValueError):
+        return 100.0
+    return value if value > 0 else 100.0
+
+
+def perf_profiler_enabled() -> bool:
+    """Return True when this process should honour admin-armed profile sessions."""
+    return bool(getattr(settings, "PERF_PROFILER_ENABLED", False))
+
+
+def perf_trace_exporter_name() -> str:
+    """Return the configured span exporter (``memory``, ``file``, ``module:attr``)."""
+    return str(getattr(settings, "PERF_TRACE_EXPORTER", "") or "").strip()
+
+
+def perf_tracing_enabled() -> bool:
+    """Return True when spans should be recorded and exported."""
+    return bool(perf_trace_exporter_name())
+
+
+def perf_trace_file_path() -> str:
+    """Return the OTLP/JSON lines file used by the ``file`` exporter."""
+    return str(getattr(settings, "PERF_TRACE_FILE_PATH", "") or "perf-traces.jsonl")
+
+
+def perf_trace_service_name() -> str:
+    """Return the ``service.name`` resource attribute for exported spans."""
+    return str(getattr(settings, "PERF_TRACE_SERVICE_NAME", "") or "winoe-backend")
 
 
 def perf_span_sample_rate() -> float:
@@ -37,8 +115,19 @@ def perf_span_sample_rate() -> float:
 
 __all__ = [
     "perf_logging_enabled",
+    "perf_loop_lag_monitor_enabled",
+    "perf_loop_lag_threshold_ms",
+    "perf_n_plus_one_strict",
+    "perf_n_plus_one_threshold",
+    "perf_profiler_enabled",
+    "perf_request_logs_enabled",
+    "perf_route_histograms_enabled",
     "perf_spans_enabled",
     "perf_sql_fingerprints_enabled",
     "perf_span_sample_rate",
+    "perf_trace_exporter_name",
+    "perf_trace_file_path",
+    "perf_trace_service_name",
+    "perf_tracing_enabled",
     "settings",
 ]
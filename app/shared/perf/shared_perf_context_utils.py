@@ -12,8 +12,10 @@ class PerfStats:
 
     db_count: int = 0
     db_time_ms: float = 0.0
+    db_pool_wait_ms: float = 0.0
     sql_fingerprint_counts: dict[str, int] = field(default_factory=dict)
     sql_fingerprint_time_ms: dict[str, float] = field(default_factory=dict)
+    sql_fingerprint_locations: dict[str, str] = field(default_factory=dict)
     external_call_counts: dict[str, int] = field(default_factory=dict)
     external_wait_ms: dict[str, float] = field(default_factory=dict)
 
@@ -0,0 +1,113 @@
+"""Application module for perf job utils workflows."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from .shared_perf_config import perf_logging_enabled, perf_request_logs_enabled
+from .shared_perf_context_utils import (
+    clear_request_stats,
+    get_request_stats,
+    start_request_stats,
+)
+from .shared_perf_middleware_spans_middleware import (
+    external_span_payload,
+    job_span_payload,
+    sample_perf_span,
+    sql_span_payload,
+)
+from .shared_perf_n_plus_one_utils import report_n_plus_one
+from .shared_perf_tracing_utils import (
+    SPAN_KIND_CONSUMER,
+    start_trace_span,
+)
+
+logger = logging.getLogger(__name__)
+
+JOB_PERF_OUTCOME_KEY = "outcome"
+
+
+@contextmanager
+def job_perf_scope(
+    perf_ctx: ContextVar,
+    *,
+    job_id: str,
+    job_type: str,
+    attempt: int,
+    worker_id: str | None,
+    correlation_id: str | None = None,
+    traceparent: str | None = None,
+) -> Iterator[dict[str, object]]:
+    """Collect PerfStats for one job and log a ``perf_job`` record on exit.
+
+    Callers set ``scope["outcome"]`` on the yielded dict before leaving. N+1
+    findings are logged but never raised, even in strict mode. A job enqueued
+    inside a traced request passes that span's ``traceparent`` so the job
+    span joins the enqueuing request's trace.
+    """
+    scope: dict[str, object] = {JOB_PERF_OUTCOME_KEY: "unknown"}
+    if not perf_logging_enabled():
+        yield scope
+        return
+    token = start_request_stats(perf_ctx)
+    started = time.perf_counter()
+    with start_trace_span(
+        f"job {job_type}",
+        kind=SPAN_KIND_CONSUMER,
+        traceparent=traceparent,
+        attributes={
+            "winoe.job_id": job_id,
+            "winoe.job_type": job_type,
+            "winoe.job_attempt": attempt,
+            "winoe.worker_id": worker_id,
+            "winoe.correlation_id": correlation_id,
+        },
+    ) as trace_span:
+        try:
+            yield scope
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            stats = get_request_stats(perf_ctx)
+            outcome = str(scope.get(JOB_PERF_OUTCOME_KEY) or "unknown")
+            if trace_span is not None:
+                trace_span.attributes["winoe.job_outcome"] = outcome
+            extra = {
+                "job_id": job_id,
+                "job_type": job_type,
+                "attempt": attempt,
+                "worker_id": worker_id,
+                "outcome": outcome,
+                "duration_ms": round(duration_ms, 3),
+                "db_count": stats.db_count,
+                "db_time_ms": round(stats.db_time_ms, 3),
+                "db_pool_wait_ms": round(stats.db_pool_wait_ms, 3),
+            }
+            if sample_perf_span():
+                extra["job_span"] = job_span_payload(
+                    job_id=job_id,
+                    job_type=job_type,
+                    attempt=attempt,
+                    outcome=outcome,
+                    duration_ms=duration_ms,
+                )
+                extra["sql_span"] = sql_span_payload(stats)
+                extra["external_span"] = external_span_payload(stats)
+            if perf_request_logs_enabled():
+                logger.info("perf_job", extra=extra)
+            clear_request_stats(perf_ctx, token)
+            # The job is already marked by now; raising would only crash the
+            # worker slot, so strict mode logs for jobs.
+            report_n_plus_one(
+                stats,
+                raise_strict=False,
+                job_id=job_id,
+                job_type=job_type,
+                attempt=attempt,
+            )
+
+
+__all__ = ["JOB_PERF_OUTCOME_KEY", "job_perf_scope"]
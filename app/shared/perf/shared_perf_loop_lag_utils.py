@@ -0,0 +1,214 @@
+"""Application module for perf event-loop lag monitor workflows."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from pathlib import Path
+from types import FrameType
+
+from app.shared.types.shared_types_base_model import APIModel
+
+from .shared_perf_config import (
+    perf_loop_lag_monitor_enabled,
+    perf_loop_lag_threshold_ms,
+)
+from .shared_perf_route_histograms_utils import LATENCY_BUCKETS_MS, _Histogram
+
+logger = logging.getLogger(__name__)
+
+LOOP_BLOCKED_EVENT = "perf_loop_blocked"
+_APP_ROOT = Path(__file__).resolve().parents[2]
+_STACK_DEPTH = 12
+
+
+class LoopLagSnapshot(APIModel):
+    """Event-loop scheduling lag observed by this process."""
+
+    thresholdMs: float
+    samples: int
+    maxMs: float
+    p50Ms: float | None = None
+    p95Ms: float | None = None
+    p99Ms: float | None = None
+    blockedCount: int
+
+
+def loop_lag_interval_seconds(threshold_ms: float) -> float:
+    """Return the sampler tick for a threshold (a quarter, 10ms..250ms)."""
+    return min(0.25, max(0.01, threshold_ms / 4000.0))
+
+
+def _frame_label(frame: FrameType) -> str:
+    return f"{frame.f_code.co_filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+
+
+def _blocking_frame_details(frame: FrameType | None) -> dict[str, object]:
+    stack: list[str] = []
+    offending: FrameType | None = None
+    current = frame
+    while current is not None:
+        if len(stack) < _STACK_DEPTH:
+            stack.append(_frame_label(current))
+        if offending is None and Path(current.f_code.co_filename).is_relative_to(
+            _APP_ROOT
+        ):
+            offending = current
+        current = current.f_back
+    # Prefer the innermost application frame: the stdlib/SDK frame that is
+    # actually blocking (socket.recv, ssl.read...) says little on its own.
+    culprit = offending or frame
+    return {
+        "offending_module": culprit.f_globals.get("__name__") if culprit else None,
+        "offending_function": culprit.f_code.co_name if culprit else None,
+        "location": _frame_label(culprit) if culprit else None,
+        "blocking_frame": _frame_label(frame) if frame else None,
+        "stack": stack,
+    }
+
+
+class LoopLagMonitor:
+    """Samples event-loop lag and reports stalls with the blocking stack.
+
+    An asyncio task measures how late each ``sleep(interval)`` wakes up. A
+    daemon watchdog thread notices when that task stops ticking for longer
+    than the threshold and snapshots the loop thread's current frame, which
+    is the code holding the loop.
+    """
+
+    def __init__(self) -> None:
+        self._histogram = _Histogram(LATENCY_BUCKETS_MS)
+        self._blocked_count = 0
+        self._threshold_ms = 0.0
+        self._last_tick = time.perf_counter()
+        self._stall_reported = False
+        self._loop_thread_id: int | None = None
+        self._stop = threading.Event()
+
+    def record_lag(self, lag_ms: float) -> None:
+        """Record one sampler tick's lag."""
+        self._histogram.record(lag_ms)
+
+    def snapshot(self) -> LoopLagSnapshot:
+        """Return lag percentiles, max and stall count since the last reset."""
+        return LoopLagSnapshot(
+            thresholdMs=self._threshold_ms or perf_loop_lag_threshold_ms(),
+            samples=self._histogram.count,
+            maxMs=round(self._histogram.max_value, 3),
+            p50Ms=self._histogram.quantile(0.50),
+            p95Ms=self._histogram.quantile(0.95),
+            p99Ms=self._histogram.quantile(0.99),
+            blockedCount=self._blocked_count,
+        )
+
+    def reset(self) -> None:
+        """Drop recorded lag samples."""
+        self._histogram = _Histogram(LATENCY_BUCKETS_MS)
+        self._blocked_count = 0
+
+    async def _sample(self, interval_seconds: float) -> None:
+        while True:
+            expected = time.perf_counter() + interval_seconds
+            await asyncio.sleep(interval_seconds)
+            now = time.perf_counter()
+            self.record_lag(max(0.0, (now - expected) * 1000))
+            self._last_tick = now
+            self._stall_reported = False
+
+    def _watch(self, interval_seconds: float) -> None:
+        while not self._stop.wait(interval_seconds):
+            stalled_ms = (time.perf_counter() - self._last_tick) * 1000
+            stalled_ms -= interval_seconds * 1000
+            if stalled_ms < self._threshold_ms or self._stall_reported:
+                continue
+            self._stall_reported = True
+            self._blocked_count += 1
+            frame = sys._current_frames().get(self._loop_thread_id or 0)
+            logger.warning(
+                LOOP_BLOCKED_EVENT,
+                extra={
+                    "blocked_ms": round(stalled_ms, 3),
+                    "threshold_ms": self._threshold_ms,
+                    **_blocking_frame_details(frame),
+                },
+            )
+
+    @asynccontextmanager
+    async def running(self, *, threshold_ms: float) -> AsyncIterator[LoopLagMonitor]:
+        """Run the sampler task and watchdog thread for the context lifetime."""
+        interval_seconds = loop_lag_interval_seconds(threshold_ms)
+        self._threshold_ms = float(threshold_ms)
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.perf_counter()
+        self._stall_reported = False
+        self._stop.clear()
+        sampler = asyncio.create_task(self._sample(interval_seconds))
+        watchdog = threading.Thread(
+            target=self._watch,
+            args=(interval_seconds,),
+            name="winoe-loop-lag-watchdog",
+            daemon=True,
+        )
+        watchdog.start()
+        try:
+            yield self
+        finally:
+            self._stop.set()
+            sampler.cancel()
+            with suppress(asyncio.CancelledError):
+                await sampler
+            watchdog.join(timeout=1.0)
+
+
+loop_lag_monitor = LoopLagMonitor()
+
+
+@asynccontextmanager
+async def monitor_event_loop_lag() -> AsyncIterator[LoopLagMonitor | None]:
+    """Run :data:`loop_lag_monitor` when ``PERF_LOOP_LAG_MONITOR_ENABLED`` is set."""
+    if not perf_loop_lag_monitor_enabled():
+        yield None
+        return
+    async with loop_lag_monitor.running(
+        threshold_ms=perf_loop_lag_threshold_ms()
+    ) as monitor:
+        yield monitor
+
+
+def render_loop_lag_prometheus(snapshot: LoopLagSnapshot) -> str:
+    """Render loop lag gauges in Prometheus text format."""
+    lines = [
+        "# HELP winoe_event_loop_lag_ms Event-loop scheduling lag (this process).",
+        "# TYPE winoe_event_loop_lag_ms gauge",
+    ]
+    for quantile, value in (
+        ("0.5", snapshot.p50Ms),
+        ("0.95", snapshot.p95Ms),
+        ("0.99", snapshot.p99Ms),
+    ):
+        lines.append(f'winoe_event_loop_lag_ms{{quantile="{quantile}"}} {value or 0:g}')
+    lines += [
+        "# HELP winoe_event_loop_lag_max_ms Worst event-loop lag (this process).",
+        "# TYPE winoe_event_loop_lag_max_ms gauge",
+        f"winoe_event_loop_lag_max_ms {snapshot.maxMs:g}",
+        "# HELP winoe_event_loop_blocked_total Stalls over the lag threshold.",
+        "# TYPE winoe_event_loop_blocked_total counter",
+        f"winoe_event_loop_blocked_total {snapshot.blockedCount}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+__all__ = [
+    "LOOP_BLOCKED_EVENT",
+    "LoopLagMonitor",
+    "LoopLagSnapshot",
+    "loop_lag_interval_seconds",
+    "loop_lag_monitor",
+    "monitor_event_loop_lag",
+    "render_loop_lag_prometheus",
+]
@@ -8,7 +8,11 @@ from collections.abc import Callable
 
 from starlette.types import ASGIApp, Receive, Scope, Send
 
-from .shared_perf_config import perf_logging_enabled
+from .shared_perf_config import (
+    perf_logging_enabled,
+    perf_request_logs_enabled,
+    perf_route_histograms_enabled,
+)
 from .shared_perf_context_utils import (
     clear_request_stats,
     get_request_stats,
@@ -20,7 +24,16 @@ from .shared_perf_middleware_spans_middleware import (
     sample_perf_span,
     sql_span_payload,
 )
+from .shared_perf_n_plus_one_utils import report_n_plus_one
+from .shared_perf_profiler_utils import profile_request
 from .shared_perf_request_id_utils import request_id_from_scope
+from .shared_perf_route_histograms_utils import route_latency_histograms
+from .shared_perf_tracing_utils import (
+    SPAN_KIND_SERVER,
+    SPAN_STATUS_ERROR,
+    start_trace_span,
+    traceparent_from_scope,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -58,40 +71,82 @@ def create_request_perf_middleware(get_perf_ctx: Callable[[], object]):
                     response_bytes += len(message.get("body") or b"")
                 await send(message)
 
-            try:
-                await self.app(scope, receive, send_wrapper)
-            finally:
-                duration_ms = (time.perf_counter() - started) * 1000
-                stats = get_request_stats(perf_ctx)
-                route = scope.get("route")
-                path_template = (
-                    getattr(route, "path", None)
-                    or getattr(route, "path_format", None)
-                    or scope.get("path")
-                )
-                extra = {
-                    "method": scope.get("method"),
-                    "path_template": path_template,
-                    "status_code": status_code,
-                    "duration_ms": round(duration_ms, 3),
-                    "db_count": stats.db_count,
-                    "db_time_ms": round(stats.db_time_ms, 3),
-                    "response_bytes": response_bytes,
-                    "request_id": request_id,
-                }
-                if sample_perf_span():
-                    extra["request_span"] = request_span_payload(
-                        request_id=request_id,
+            with start_trace_span(
+                f"{scope.get('method')} request",
+                kind=SPAN_KIND_SERVER,
+                traceparent=traceparent_from_scope(scope),
+            ) as trace_span:
+                app_failed = False
+                try:
+                    async with profile_request(scope):
+                        await self.app(scope, receive, send_wrapper)
+                except BaseException:
+                    app_failed = True
+                    raise
+                finally:
+                    duration_ms = (time.perf_counter() - started) * 1000
+                    stats = get_request_stats(perf_ctx)
+                    route = scope.get("route")
+                    path_template = (
+                        getattr(route, "path", None)
+                        or getattr(route, "path_format", None)
+                        or scope.get("path")
+                    )
+                    if trace_span is not None:
+                        trace_span.name = f"{scope.get('method')} {path_template}"
+                        trace_span.attributes.update(
+                            {
+                                "http.request.method": scope.get("method"),
+                                "http.route": path_template,
+                                "http.response.status_code": status_code,
+                                "winoe.request_id": request_id,
+                            }
+                        )
+                        if status_code >= 500:
+                            trace_span.status = SPAN_STATUS_ERROR
+                    if perf_route_histograms_enabled():
+                        route_latency_histograms.record(
+                            method=scope.get("method"),
+                            path_template=path_template,
+                            status_code=status_code,
+                            duration_ms=duration_ms,
+                            db_count=stats.db_count,
+                            db_time_ms=stats.db_time_ms,
+                        )
+                    extra = {
+                        "method": scope.get("method"),
+                        "path_template": path_template,
+                        "status_code": status_code,
+                        "duration_ms": round(duration_ms, 3),
+                        "db_count": stats.db_count,
+                        "db_time_ms": round(stats.db_time_ms, 3),
+                        "db_pool_wait_ms": round(stats.db_pool_wait_ms, 3),
+                        "response_bytes": response_bytes,
+                        "request_id": request_id,
+                    }
+                    if sample_perf_span():
+                        extra["request_span"] = request_span_payload(
+                            request_id=request_id,
+                            method=scope.get("method"),
+                            path_template=path_template,
+                            status_code=status_code,
+                            duration_ms=duration_ms,
+                            response_bytes=response_bytes,
+                        )
+                        extra["sql_span"] = sql_span_payload(stats)
+                        extra["external_span"] = external_span_payload(stats)
+                    if perf_request_logs_enabled():
+                        logger.info("perf_request", extra=extra)
+                    clear_request_stats(perf_ctx, token)
+                    # Strict mode must not replace the exception that
+                    # failed the request.
+                    report_n_plus_one(
+                        stats,
+                        raise_strict=not app_failed,
                         method=scope.get("method"),
                         path_template=path_template,
-                        status_code=status_code,
-                        duration_ms=duration_ms,
-                        response_bytes=response_bytes,
+                        request_id=request_id,
                     )
-                    extra["sql_span"] = sql_span_payload(stats)
-                    extra["external_span"] = external_span_payload(stats)
-                logger.info("perf_request", extra=extra)
-                clear_request_stats(perf_ctx, token)
 
     return RequestPerfMiddleware
 
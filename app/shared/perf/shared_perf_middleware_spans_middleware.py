@@ -35,6 +35,25 @@ def request_span_payload(
     }
 
 
+def job_span_payload(
+    *,
+    job_id: str,
+    job_type: str,
+    attempt: int,
+    outcome: str,
+    duration_ms: float,
+) -> dict[str, object]:
+    """Execute job span payload."""
+    return {
+        "kind": "job",
+        "jobId": job_id,
+        "jobType": job_type,
+        "attempt": int(attempt),
+        "outcome": outcome,
+        "durationMs": round(duration_ms, 3),
+    }
+
+
 def sql_span_payload(stats) -> dict[str, object]:
     """Execute sql span payload."""
     ranked = sorted(
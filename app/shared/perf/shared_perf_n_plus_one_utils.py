@@ -0,0 +1,136 @@
+"""Application module for perf N+1 query detection workflows."""
+
+from __future__ import annotations
+
+import logging
+import sys
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+from .shared_perf_config import perf_n_plus_one_strict, perf_n_plus_one_threshold
+
+try:  # pragma: no cover - greenlet ships with the SQLAlchemy asyncio extra
+    import greenlet as _greenlet
+except ImportError:  # pragma: no cover
+    _greenlet = None
+
+logger = logging.getLogger(__name__)
+
+N_PLUS_ONE_EVENT = "perf_n_plus_one"
+_APP_ROOT = Path(__file__).resolve().parents[2]
+_PERF_ROOT = Path(__file__).resolve().parent
+_MAX_LOCATION_FRAMES = 3
+
+
+class NPlusOneQueryError(AssertionError):
+    """Raised in strict mode when a scope repeats a SQL fingerprint too often."""
+
+
+def _iter_caller_frames() -> Any:
+    frame: FrameType | None = sys._getframe(1)
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
+    # AsyncSession work runs inside a greenlet; the awaiting coroutine frames
+    # live on the parent greenlet's suspended stack.
+    if _greenlet is None:
+        return
+    parent = _greenlet.getcurrent().parent
+    while parent is not None:
+        frame = parent.gr_frame
+        while frame is not None:
+            yield frame
+            frame = frame.f_back
+        parent = parent.parent
+
+
+def _app_frame_label(frame: FrameType) -> str | None:
+    path = Path(frame.f_code.co_filename)
+    if not path.is_relative_to(_APP_ROOT) or path.is_relative_to(_PERF_ROOT):
+        return None
+    relative = path.relative_to(_APP_ROOT.parent)
+    return f"{relative}:{frame.f_lineno} in {frame.f_code.co_name}"
+
+
+def caller_stack_location() -> str | None:
+    """Return the innermost application frames that issued the current query."""
+    labels: list[str] = []
+    for frame in _iter_caller_frames():
+        label = _app_frame_label(frame)
+        if label is None:
+            continue
+        labels.append(label)
+        if len(labels) >= _MAX_LOCATION_FRAMES:
+            break
+    return " <- ".join(labels) or None
+
+
+def sample_n_plus_one_location(stats: Any, fingerprint: str) -> None:
+    """Capture a stack location the first time a fingerprint crosses the threshold."""
+    threshold = perf_n_plus_one_threshold()
+    if threshold <= 0 or not fingerprint:
+        return
+    counts = getattr(stats, "sql_fingerprint_counts", None)
+    locations = getattr(stats, "sql_fingerprint_locations", None)
+    if counts is None or locations is None or fingerprint in locations:
+        return
+    if counts.get(fingerprint, 0) != threshold + 1:
+        return
+    location = caller_stack_location()
+    if location is not None:
+        locations[fingerprint] = location
+
+
+def find_n_plus_one(stats: Any) -> list[dict[str, object]]:
+    """Return fingerprints repeated more than the configured threshold."""
+    threshold = perf_n_plus_one_threshold()
+    if threshold <= 0:
+        return []
+    counts = getattr(stats, "sql_fingerprint_counts", None) or {}
+    time_ms = getattr(stats, "sql_fingerprint_time_ms", None) or {}
+    locations = getattr(stats, "sql_fingerprint_locations", None) or {}
+    findings = [
+        {
+            "fingerprint": fingerprint,
+            "count": count,
+            "threshold": threshold,
+            "db_time_ms": round(float(time_ms.get(fingerprint, 0.0)), 3),
+            "location": locations.get(fingerprint),
+        }
+        for fingerprint, count in counts.items()
+        if count > threshold
+    ]
+    findings.sort(key=lambda item: (-int(item["count"]), str(item["fingerprint"])))
+    return findings
+
+
+def report_n_plus_one(
+    stats: Any, *, raise_strict: bool = True, **scope: object
+) -> list[dict[str, object]]:
+    """Log a ``perf_n_plus_one`` record per finding; raise in strict mode.
+
+    ``scope`` identifies the request or job (``path_template``, ``job_type``...).
+    Callers pass ``raise_strict=False`` where raising would mask another
+    exception or escape after the unit of work was already settled.
+    """
+    findings = find_n_plus_one(stats)
+    for finding in findings:
+        logger.warning(N_PLUS_ONE_EVENT, extra={**scope, **finding})
+    if findings and raise_strict and perf_n_plus_one_strict():
+        worst = findings[0]
+        raise NPlusOneQueryError(
+            f"N+1 query pattern in {scope}: {worst['count']}x "
+            f"{worst['fingerprint']!r} at {worst['location']}"
+        )
+    return findings
+
+
+__all__ = [
+    "N_PLUS_ONE_EVENT",
+    "NPlusOneQueryError",
+    "caller_stack_location",
+    "find_n_plus_one",
+    "report_n_plus_one",
+    "sample_n_plus_one_location",
+]
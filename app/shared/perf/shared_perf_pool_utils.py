@@ -0,0 +1,130 @@
+"""Application module for perf connection-pool checkout workflows."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.shared.types.shared_types_base_model import APIModel
+
+from .shared_perf_route_histograms_utils import (
+    RouteHistogram,
+    _Histogram,
+    _histogram_lines,
+    _histogram_payload,
+)
+
+# Checkouts from a warm pool take microseconds; waits only show up when the
+# pool is exhausted, so the low end is finer than the request buckets.
+POOL_WAIT_BUCKETS_MS: tuple[float, ...] = (
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+    30000.0,
+)
+
+
+class PoolCheckoutSnapshot(APIModel):
+    """Connection-pool occupancy and checkout waits for this process."""
+
+    role: str
+    poolSize: int | None = None
+    checkedOut: int | None = None
+    overflow: int | None = None
+    timeouts: int
+    waitMs: RouteHistogram
+
+
+class PoolCheckoutStats:
+    """Checkout wait histogram for this process's engine pool.
+
+    Written from the pool's checkout path on the event-loop thread, so no lock
+    is taken (same reasoning as the route histograms).
+    """
+
+    def __init__(self) -> None:
+        self.role = "api"
+        self._wait_ms = _Histogram(POOL_WAIT_BUCKETS_MS)
+        self._timeouts = 0
+
+    def record(self, wait_ms: float, *, timed_out: bool = False) -> None:
+        """Record one checkout (``timed_out`` when the pool gave up)."""
+        self._wait_ms.record(wait_ms)
+        if timed_out:
+            self._timeouts += 1
+
+    def reset(self) -> None:
+        """Drop recorded waits."""
+        self._wait_ms = _Histogram(POOL_WAIT_BUCKETS_MS)
+        self._timeouts = 0
+
+    def snapshot(self, pool: Any | None = None) -> PoolCheckoutSnapshot:
+        """Return waits so far plus live occupancy of ``pool`` when given."""
+
+        def _gauge(name: str) -> int | None:
+            method = getattr(pool, name, None)
+            return int(method()) if callable(method) else None
+
+        # QueuePool reports overflow relative to pool_size (negative until
+        # the pool is full).
+        overflow = _gauge("overflow")
+        return PoolCheckoutSnapshot(
+            role=self.role,
+            poolSize=_gauge("size"),
+            checkedOut=_gauge("checkedout"),
+            overflow=None if overflow is None else max(0, overflow),
+            timeouts=self._timeouts,
+            waitMs=_histogram_payload(self._wait_ms),
+        )
+
+
+pool_checkout_stats = PoolCheckoutStats()
+
+
+def render_pool_checkout_prometheus(snapshot: PoolCheckoutSnapshot) -> str:
+    """Render pool occupancy and checkout waits in Prometheus text format."""
+    role = f'role="{snapshot.role}"'
+    lines = [
+        "# HELP winoe_db_pool_checkout_wait_ms Connection checkout wait in ms "
+        "(this process, since start).",
+        "# TYPE winoe_db_pool_checkout_wait_ms histogram",
+        *_histogram_lines("winoe_db_pool_checkout_wait_ms", role, snapshot.waitMs),
+        "# HELP winoe_db_pool_checkout_timeouts_total Checkouts that hit the "
+        "pool timeout.",
+        "# TYPE winoe_db_pool_checkout_timeouts_total counter",
+        f"winoe_db_pool_checkout_timeouts_total{{{role}}} {snapshot.timeouts}",
+    ]
+    for name, value, description in (
+        ("winoe_db_pool_size", snapshot.poolSize, "Configured pool size."),
+        ("winoe_db_pool_checked_out", snapshot.checkedOut, "Connections in use."),
+        ("winoe_db_pool_overflow", snapshot.overflow, "Overflow connections."),
+    ):
+        if value is None:
+            continue
+        lines += [
+            f"# HELP {name} {description}",
+            f"# TYPE {name} gauge",
+            f"{name}{{{role}}} {value}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+__all__ = [
+    "POOL_WAIT_BUCKETS_MS",
+    "PoolCheckoutSnapshot",
+    "PoolCheckoutStats",
+    "pool_checkout_stats",
+    "render_pool_checkout_prometheus",
+]
@@ -0,0 +1,63 @@
+"""Application module for perf profile session models workflows."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.shared.database.shared_database_base_model import Base
+
+PROFILE_STATUS_ARMED = "armed"
+PROFILE_STATUS_COMPLETED = "completed"
+PROFILE_STATUS_CANCELLED = "cancelled"
+
+
+class PerfProfileSession(Base):
+    """Admin-armed sampling profile for the next N matching requests or jobs."""
+
+    __tablename__ = "perf_profile_sessions"
+    __table_args__ = (
+        Index("ix_perf_profile_sessions_status_expires", "status", "expires_at"),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    target_kind: Mapped[str] = mapped_column(String(16), nullable=False)
+    target: Mapped[str] = mapped_column(String(255), nullable=False)
+    method: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    requested_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    claimed_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0", default=0
+    )
+    captured_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0", default=0
+    )
+    interval_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(16), nullable=False, server_default=PROFILE_STATUS_ARMED
+    )
+    sample_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0", default=0
+    )
+    collapsed_stacks: Mapped[str] = mapped_column(
+        Text, nullable=False, server_default="", default=""
+    )
+    created_by: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+
+__all__ = [
+    "PROFILE_STATUS_ARMED",
+    "PROFILE_STATUS_CANCELLED",
+    "PROFILE_STATUS_COMPLETED",
+    "PerfProfileSession",
+]
@@ -0,0 +1,164 @@
+"""Application module for perf profile session repository workflows."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .shared_perf_profile_sessions_model import (
+    PROFILE_STATUS_ARMED,
+    PROFILE_STATUS_CANCELLED,
+    PROFILE_STATUS_COMPLETED,
+    PerfProfileSession,
+)
+from .shared_perf_profiler_utils import merge_collapsed_stacks
+
+
+async def create_profile_session(
+    db: AsyncSession,
+    *,
+    target_kind: str,
+    target: str,
+    method: str | None,
+    requested_count: int,
+    interval_ms: int,
+    ttl_seconds: int,
+    created_by: str | None,
+    now: datetime,
+    commit: bool = True,
+) -> PerfProfileSession:
+    """Arm a profile session for the next ``requested_count`` matches."""
+    session = PerfProfileSession(
+        id=str(uuid4()),
+        target_kind=target_kind,
+        target=target,
+        method=method.upper() if method else None,
+        requested_count=requested_count,
+        claimed_count=0,
+        captured_count=0,
+        interval_ms=interval_ms,
+        status=PROFILE_STATUS_ARMED,
+        sample_count=0,
+        collapsed_stacks="",
+        created_by=created_by,
+        created_at=now,
+        expires_at=now + timedelta(seconds=ttl_seconds),
+    )
+    db.add(session)
+    await db.flush()
+    if commit:
+        await db.commit()
+    return session
+
+
+async def get_profile_session(
+    db: AsyncSession, session_id: str
+) -> PerfProfileSession | None:
+    """Return one profile session."""
+    return await db.get(PerfProfileSession, session_id)
+
+
+async def list_profile_sessions(
+    db: AsyncSession, *, limit: int = 50
+) -> list[PerfProfileSession]:
+    """Return the most recent profile sessions, newest first."""
+    rows = await db.execute(
+        select(PerfProfileSession)
+        .order_by(PerfProfileSession.created_at.desc(), PerfProfileSession.id)
+        .limit(limit)
+    )
+    return list(rows.scalars().all())
+
+
+async def list_armed_profile_sessions(
+    db: AsyncSession, *, now: datetime
+) -> list[PerfProfileSession]:
+    """Return unexpired armed sessions that still have unclaimed slots."""
+    rows = await db.execute(
+        select(PerfProfileSession).where(
+            PerfProfileSession.status == PROFILE_STATUS_ARMED,
+            PerfProfileSession.expires_at > now,
+            PerfProfileSession.claimed_count < PerfProfileSession.requested_count,
+        )
+    )
+    return list(rows.scalars().all())
+
+
+async def claim_profile_slot(
+    db: AsyncSession, session_id: str, *, now: datetime
+) -> bool:
+    """Atomically reserve one capture slot; False when none are left."""
+    result = await db.execute(
+        update(PerfProfileSession)
+        .where(
+            PerfProfileSession.id == session_id,
+            PerfProfileSession.status == PROFILE_STATUS_ARMED,
+            PerfProfileSession.expires_at > now,
+            PerfProfileSession.claimed_count < PerfProfileSession.requested_count,
+        )
+        .values(claimed_count=PerfProfileSession.claimed_count + 1)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount == 1
+
+
+async def record_profile_capture(
+    db: AsyncSession,
+    session_id: str,
+    *,
+    stacks: dict[str, int],
+    sample_count: int,
+    now: datetime,
+) -> PerfProfileSession | None:
+    """Merge one capture's collapsed stacks into its session."""
+    session = (
+        await db.execute(
+            select(PerfProfileSession)
+            .where(PerfProfileSession.id == session_id)
+            .with_for_update()
+        )
+    ).scalar_one_or_none()
+    if session is None:
+        return None
+    session.collapsed_stacks = merge_collapsed_stacks(session.collapsed_stacks, stacks)
+    session.sample_count += sample_count
+    session.captured_count += 1
+    if (
+        session.status == PROFILE_STATUS_ARMED
+        and session.captured_count >= session.requested_count
+    ):
+        session.status = PROFILE_STATUS_COMPLETED
+        session.completed_at = now
+    await db.commit()
+    return session
+
+
+async def cancel_profile_session(
+    db: AsyncSession, session_id: str, *, now: datetime, commit: bool = True
+) -> PerfProfileSession | None:
+    """Stop handing out slots for an armed session (captures in flight still land)."""
+    session = await db.get(PerfProfileSession, session_id)
+    if session is None:
+        return None
+    if session.status == PROFILE_STATUS_ARMED:
+        session.status = PROFILE_STATUS_CANCELLED
+        session.completed_at = now
+        await db.flush()
+    if commit:
+        await db.commit()
+    return session
+
+
+__all__ = [
+    "cancel_profile_session",
+    "claim_profile_slot",
+    "create_profile_session",
+    "get_profile_session",
+    "list_armed_profile_sessions",
+    "list_profile_sessions",
+    "record_profile_capture",
+]
@@ -0,0 +1,382 @@
+"""Application module for perf sampling profiler workflows."""
+
+from __future__ import annotations
+
+import logging
+import math
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from types import FrameType
+from typing import Any, Literal
+
+from pydantic import Field
+
+from app.shared.types.shared_types_base_model import APIModel
+
+from .shared_perf_config import perf_profiler_enabled
+
+logger = logging.getLogger(__name__)
+
+PROFILE_CAPTURED_EVENT = "perf_profile_captured"
+PROFILE_TARGET_ROUTE = "route"
+PROFILE_TARGET_JOB = "job"
+_MAX_STACK_DEPTH = 128
+_MAX_CAPTURE_SECONDS = 120.0
+_REFRESH_SECONDS = 5.0
+
+
+class ProfileSessionCreateRequest(APIModel):
+    """Arm the profiler for the next ``count`` matching requests or jobs."""
+
+    targetKind: Literal["route", "job"]
+    target: str = Field(..., min_length=1, max_length=255)
+    method: str | None = Field(default=None, max_length=16)
+    count: int = Field(default=1, ge=1, le=50)
+    intervalMs: int = Field(default=5, ge=1, le=100)
+    ttlSeconds: int = Field(default=3600, ge=60, le=86400)
+
+
+class ProfileSessionSummary(APIModel):
+    """Profile session state (collapsed stacks are downloaded separately)."""
+
+    id: str
+    targetKind: str
+    target: str
+    method: str | None = None
+    requestedCount: int
+    claimedCount: int
+    capturedCount: int
+    intervalMs: int
+    status: str
+    sampleCount: int
+    createdBy: str | None = None
+    createdAt: datetime
+    expiresAt: datetime
+    completedAt: datetime | None = None
+
+
+def profile_session_summary(session: Any) -> ProfileSessionSummary:
+    """Build the API summary for a ``PerfProfileSession`` row."""
+    return ProfileSessionSummary(
+        id=session.id,
+        targetKind=session.target_kind,
+        target=session.target,
+        method=session.method,
+        requestedCount=session.requested_count,
+        claimedCount=session.claimed_count,
+        capturedCount=session.captured_count,
+        intervalMs=session.interval_ms,
+        status=session.status,
+        sampleCount=session.sample_count,
+        createdBy=session.created_by,
+        createdAt=session.created_at,
+        expiresAt=session.expires_at,
+        completedAt=session.completed_at,
+    )
+
+
+def frame_stack_key(frame: FrameType | None) -> str:
+    """Return ``module:function`` labels root-first, joined by ``;``."""
+    labels: list[str] = []
+    current = frame
+    while current is not None and len(labels) < _MAX_STACK_DEPTH:
+        module = current.f_globals.get("__name__") or current.f_code.co_filename
+        labels.append(f"{module}:{current.f_code.co_name}")
+        current = current.f_back
+    labels.reverse()
+    return ";".join(label.replace(" ", "_") for label in labels)
+
+
+def render_collapsed_stacks(stacks: Mapping[str, int]) -> str:
+    """Render stacks in Brendan Gregg's collapsed format (``a;b;c 12``)."""
+    return "".join(
+        f"{stack} {count}\n" for stack, count in sorted(stacks.items()) if count > 0
+    )
+
+
+def parse_collapsed_stacks(text: str | None) -> Counter[str]:
+    """Parse collapsed-format text back into stack counts."""
+    stacks: Counter[str] = Counter()
+    for line in (text or "").splitlines():
+        stack, _, count = line.rpartition(" ")
+        if stack and count.isdigit():
+            stacks[stack] += int(count)
+    return stacks
+
+
+def merge_collapsed_stacks(existing: str | None, stacks: Mapping[str, int]) -> str:
+    """Add ``stacks`` to collapsed-format text."""
+    merged = parse_collapsed_stacks(existing)
+    merged.update(stacks)
+    return render_collapsed_stacks(merged)
+
+
+class StackSampler:
+    """Samples one thread's Python stack from a daemon thread.
+
+    ``sys._current_frames()`` reads the target's frame without stopping it,
+    so the cost on the profiled thread is only the GIL hand-off per tick.
+    Samples are wall-clock: on the event-loop thread they include time spent
+    in the selector and in other tasks sharing the loop.
+    """
+
+    def __init__(self, *, thread_id: int, interval_seconds: float) -> None:
+        self.thread_id = thread_id
+        self.interval_seconds = interval_seconds
+        self.stacks: Counter[str] = Counter()
+        self.sample_count = 0
+        self.started = 0.0
+        self.duration_ms = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def sample(self) -> None:
+        """Take one sample of the target thread."""
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+        self.stacks[frame_stack_key(frame)] += 1
+        self.sample_count += 1
+
+    def _run(self) -> None:
+        deadline = self.started + _MAX_CAPTURE_SECONDS
+        while not self._stop.wait(self.interval_seconds):
+            if time.perf_counter() > deadline:
+                return
+            self.sample()
+
+    def start(self) -> StackSampler:
+        """Start the sampling thread."""
+        self.started = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name="winoe-perf-profiler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self.duration_ms = (time.perf_counter() - self.started) * 1000
+
+
+@dataclass(frozen=True, slots=True)
+class ArmedProfile:
+    """Cached view of one armed profile session."""
+
+    id: str
+    target_kind: str
+    target: str
+    method: str | None
+    interval_ms: int
+
+
+class ProfilerRegistry:
+    """Per-process cache of armed profile sessions plus slot claiming.
+
+    Sessions live in ``perf_profile_sessions`` so an admin request on any API
+    pod can arm capture on every API pod and worker. Each process re-reads
+    the armed set at most every few seconds; the hot path is a tuple scan.
+    """
+
+    def __init__(self) -> None:
+        self.session_maker: Any = None
+        self._armed: tuple[ArmedProfile, ...] = ()
+        self._refreshed_at = -math.inf
+
+    def _get_session_maker(self) -> Any:
+        if self.session_maker is not None:
+            return self.session_maker
+        from app.shared.database import async_session_maker
+
+        return async_session_maker
+
+    def reset(self) -> None:
+        """Forget cached sessions (the next call re-reads them)."""
+        self._armed = ()
+        self._refreshed_at = -math.inf
+
+    async def refresh_if_stale(self) -> None:
+        """Reload armed sessions when the cache is older than the refresh tick."""
+        now = time.monotonic()
+        if now - self._refreshed_at < _REFRESH_SECONDS:
+            return
+        # Claim the refresh before awaiting so concurrent requests skip it.
+        self._refreshed_at = now
+        from .shared_perf_profile_sessions_repository import (
+            list_armed_profile_sessions,
+        )
+
+        try:
+            async with self._get_session_maker()() as db:
+                rows = await list_armed_profile_sessions(db, now=datetime.now(UTC))
+        except Exception:
+            logger.exception("perf_profile_refresh_failed")
+            return
+        self._armed = tuple(
+            ArmedProfile(
+                id=row.id,
+                target_kind=row.target_kind,
+                target=row.target,
+                method=row.method,
+                interval_ms=row.interval_ms,
+            )
+            for row in rows
+        )
+
+    def has_targets(self, target_kind: str) -> bool:
+        """Return True when any cached session targets ``target_kind``."""
+        return any(profile.target_kind == target_kind for profile in self._armed)
+
+    def match(
+        self, target_kind: str, target: str | None, method: str | None = None
+    ) -> ArmedProfile | None:
+        """Return the first cached session matching this request or job."""
+        for profile in self._armed:
+            if profile.target_kind != target_kind or profile.target != target:
+                continue
+            if profile.method and profile.method != (method or "").upper():
+                continue
+            return profile
+        return None
+
+    async def _claim(self, profile: ArmedProfile) -> bool:
+        from .shared_perf_profile_sessions_repository import claim_profile_slot
+
+        try:
+            async with self._get_session_maker()() as db:
+                claimed = await claim_profile_slot(
+                    db, profile.id, now=datetime.now(UTC)
+                )
+        except Exception:
+            logger.exception(
+                "perf_profile_claim_failed", extra={"profile_id": profile.id}
+            )
+            return False
+        if not claimed:
+            self._armed = tuple(p for p in self._armed if p.id != profile.id)
+        return claimed
+
+    async def _save(self, profile: ArmedProfile, sampler: StackSampler) -> None:
+        from .shared_perf_profile_sessions_repository import record_profile_capture
+
+        try:
+            async with self._get_session_maker()() as db:
+                await record_profile_capture(
+                    db,
+                    profile.id,
+                    stacks=sampler.stacks,
+                    sample_count=sampler.sample_count,
+                    now=datetime.now(UTC),
+                )
+        except Exception:
+            logger.exception(
+                "perf_profile_save_failed", extra={"profile_id": profile.id}
+            )
+            return
+        logger.info(
+            PROFILE_CAPTURED_EVENT,
+            extra={
+                "profile_id": profile.id,
+                "target_kind": profile.target_kind,
+                "target": profile.target,
+                "samples": sampler.sample_count,
+                "duration_ms": round(sampler.duration_ms, 3),
+            },
+        )
+
+    @asynccontextmanager
+    async def capture(
+        self, profile: ArmedProfile
+    ) -> AsyncIterator[StackSampler | None]:
+        """Sample the current thread for the block if a slot can be claimed."""
+        if not await self._claim(profile):
+            yield None
+            return
+        sampler = StackSampler(
+            thread_id=threading.get_ident(),
+            interval_seconds=profile.interval_ms / 1000,
+        ).start()
+        try:
+            yield sampler
+        finally:
+            sampler.stop()
+            await self._save(profile, sampler)
+
+
+profiler = ProfilerRegistry()
+
+
+def route_template_for_scope(scope: Any) -> str | None:
+    """Resolve the route template an ASGI scope will dispatch to."""
+    from starlette.routing import Match
+
+    app = scope.get("app")
+    for route in getattr(getattr(app, "router", None), "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", None)
+    return None
+
+
+@asynccontextmanager
+async def profile_request(scope: Any) -> AsyncIterator[StackSampler | None]:
+    """Profile this request when an armed session targets its route template."""
+    if not perf_profiler_enabled():
+        yield None
+        return
+    await profiler.refresh_if_stale()
+    profile = None
+    if profiler.has_targets(PROFILE_TARGET_ROUTE):
+        profile = profiler.match(
+            PROFILE_TARGET_ROUTE, route_template_for_scope(scope), scope.get("method")
+        )
+    if profile is None:
+        yield None
+        return
+    async with profiler.capture(profile) as sampler:
+        yield sampler
+
+
+@asynccontextmanager
+async def profile_job(job_type: str) -> AsyncIterator[StackSampler | None]:
+    """Profile this job run when an armed session targets its job type."""
+    if not perf_profiler_enabled():
+        yield None
+        return
+    await profiler.refresh_if_stale()
+    profile = profiler.match(PROFILE_TARGET_JOB, job_type)
+    if profile is None:
+        yield None
+        return
+    async with profiler.capture(profile) as sampler:
+        yield sampler
+
+
+__all__ = [
+    "PROFILE_CAPTURED_EVENT",
+    "PROFILE_TARGET_JOB",
+    "PROFILE_TARGET_ROUTE",
+    "ArmedProfile",
+    "ProfileSessionCreateRequest",
+    "ProfileSessionSummary",
+    "ProfilerRegistry",
+    "StackSampler",
+    "frame_stack_key",
+    "merge_collapsed_stacks",
+    "parse_collapsed_stacks",
+    "profile_job",
+    "profile_request",
+    "profile_session_summary",
+    "profiler",
+    "render_collapsed_stacks",
+    "route_template_for_scope",
+]
@@ -0,0 +1,285 @@
+"""Application module for perf per-route latency histogram workflows."""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from app.shared.types.shared_types_base_model import APIModel
+
+# Fixed 1-2.5-5 log-scale bounds; the implicit last bucket is +Inf.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+    30000.0,
+)
+DB_COUNT_BUCKETS: tuple[float, ...] = (
+    0.0,
+    1.0,
+    2.0,
+    5.0,
+    10.0,
+    20.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+)
+DB_TIME_BUCKETS_MS: tuple[float, ...] = LATENCY_BUCKETS_MS
+
+RouteKey = tuple[str, str, str]
+
+
+@dataclass(slots=True)
+class _Histogram:
+    bounds: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+    max_value: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def record(self, value: float) -> None:
+        value = max(0.0, float(value))
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+        if value > self.max_value:
+            self.max_value = value
+
+    def quantile(self, q: float) -> float | None:
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count == 0:
+                continue
+            if cumulative + bucket_count >= rank:
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                upper = (
+                    self.bounds[index] if index < len(self.bounds) else self.max_value
+                )
+                upper = min(upper, self.max_value)
+                fraction = (rank - cumulative) / bucket_count
+                return round(lower + (max(upper, lower) - lower) * fraction, 3)
+            cumulative += bucket_count
+        return round(self.max_value, 3)
+
+
+@dataclass(slots=True)
+class _RouteSeries:
+    latency_ms: _Histogram = field(
+        default_factory=lambda: _Histogram(LATENCY_BUCKETS_MS)
+    )
+    db_count: _Histogram = field(default_factory=lambda: _Histogram(DB_COUNT_BUCKETS))
+    db_time_ms: _Histogram = field(
+        default_factory=lambda: _Histogram(DB_TIME_BUCKETS_MS)
+    )
+
+
+class RouteHistogram(APIModel):
+    """Bucketed distribution with interpolated percentiles."""
+
+    buckets: list[float]
+    bucketCounts: list[int]
+    sum: float
+    count: int
+    p50: float | None = None
+    p95: float | None = None
+    p99: float | None = None
+
+
+class RouteLatencyStats(APIModel):
+    """Latency and DB distributions for one route/status class."""
+
+    method: str
+    pathTemplate: str
+    statusClass: str
+    latencyMs: RouteHistogram
+    dbCount: RouteHistogram
+    dbTimeMs: RouteHistogram
+
+
+class RouteLatencyWindow(APIModel):
+    """Per-route distributions recorded by this process during one window."""
+
+    windowStartedAt: datetime
+    windowEndedAt: datetime
+    routes: list[RouteLatencyStats]
+
+
+def status_class(status_code: int | None) -> str:
+    """Collapse an HTTP status code to ``2xx``/``4xx``/... ."""
+    try:
+        code = int(status_code or 0)
+    except (TypeError, ValueError):
+        code = 0
+    return f"{code // 100}xx" if 100 <= code <= 599 else "unknown"
+
+
+def _histogram_payload(histogram: _Histogram) -> RouteHistogram:
+    return RouteHistogram(
+        buckets=list(histogram.bounds),
+        bucketCounts=list(histogram.counts),
+        sum=round(histogram.total, 3),
+        count=histogram.count,
+        p50=histogram.quantile(0.50),
+        p95=histogram.quantile(0.95),
+        p99=histogram.quantile(0.99),
+    )
+
+
+class RouteLatencyHistograms:
+    """Per-(method, path_template, status_class) histograms for this process.
+
+    Recording happens on the event loop thread from the perf middleware, so no
+    lock is taken: each window is a plain dict that :meth:`drain` swaps out in
+    a single reference assignment.
+    """
+
+    def __init__(self) -> None:
+        self._series: dict[RouteKey, _RouteSeries] = {}
+        self._window_started_at = datetime.now(UTC)
+
+    def record(
+        self,
+        *,
+        method: str | None,
+        path_template: str | None,
+        status_code: int | None,
+        duration_ms: float,
+        db_count: int,
+        db_time_ms: float,
+    ) -> None:
+        """Record one finished request."""
+        key = (
+            str(method or "UNKNOWN").upper(),
+            str(path_template or "unknown"),
+            status_class(status_code),
+        )
+        series = self._series.get(key)
+        if series is None:
+            series = self._series.setdefault(key, _RouteSeries())
+        series.latency_ms.record(duration_ms)
+        series.db_count.record(db_count)
+        series.db_time_ms.record(db_time_ms)
+
+    def snapshot(self) -> RouteLatencyWindow:
+        """Return the current window without resetting it."""
+        return self._build_window(
+            self._series, self._window_started_at, datetime.now(UTC)
+        )
+
+    def drain(self) -> RouteLatencyWindow:
+        """Return the current window and start a new empty one."""
+        ended_at = datetime.now(UTC)
+        series, self._series = self._series, {}
+        started_at, self._window_started_at = self._window_started_at, ended_at
+        return self._build_window(series, started_at, ended_at)
+
+    def reset(self) -> None:
+        """Drop all recorded series."""
+        self._series = {}
+        self._window_started_at = datetime.now(UTC)
+
+    @staticmethod
+    def _build_window(
+        series: dict[RouteKey, _RouteSeries],
+        started_at: datetime,
+        ended_at: datetime,
+    ) -> RouteLatencyWindow:
+        return RouteLatencyWindow(
+            windowStartedAt=started_at,
+            windowEndedAt=ended_at,
+            routes=[
+                RouteLatencyStats(
+                    method=method,
+                    pathTemplate=path_template,
+                    statusClass=status,
+                    latencyMs=_histogram_payload(entry.latency_ms),
+                    dbCount=_histogram_payload(entry.db_count),
+                    dbTimeMs=_histogram_payload(entry.db_time_ms),
+                )
+                for (method, path_template, status), entry in sorted(
+                    list(series.items()), key=lambda item: (item[0][1], item[0])
+                )
+            ],
+        )
+
+
+route_latency_histograms = RouteLatencyHistograms()
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(
+    name: str, labels: str, histogram: RouteHistogram
+) -> Iterable[str]:
+    cumulative = 0
+    for bound, count in zip(histogram.buckets, histogram.bucketCounts, strict=False):
+        cumulative += count
+        yield f'{name}_bucket{{{labels},le="{bound:g}"}} {cumulative}'
+    yield f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}'
+    yield f"{name}_sum{{{labels}}} {histogram.sum:g}"
+    yield f"{name}_count{{{labels}}} {histogram.count}"
+
+
+_PROMETHEUS_FAMILIES = (
+    ("winoe_http_request_duration_ms", "latencyMs", "Request latency in ms"),
+    ("winoe_http_request_db_queries", "dbCount", "DB statements per request"),
+    ("winoe_http_request_db_time_ms", "dbTimeMs", "DB time per request in ms"),
+)
+
+
+def render_route_histograms_prometheus(window: RouteLatencyWindow) -> str:
+    """Render one window in Prometheus text format.
+
+    Buckets cover only the scrape window (they restart after each drain).
+    """
+    lines: list[str] = []
+    for name, attribute, description in _PROMETHEUS_FAMILIES:
+        lines += [
+            f"# HELP {name} {description} (this process, current scrape window).",
+            f"# TYPE {name} histogram",
+        ]
+        for route in window.routes:
+            labels = (
+                f'method="{_escape_label(route.method)}",'
+                f'route="{_escape_label(route.pathTemplate)}",'
+                f'status_class="{route.statusClass}"'
+            )
+            lines += _histogram_lines(name, labels, getattr(route, attribute))
+    return "\n".join(lines) + "\n"
+
+
+__all__ = [
+    "DB_COUNT_BUCKETS",
+    "DB_TIME_BUCKETS_MS",
+    "LATENCY_BUCKETS_MS",
+    "RouteHistogram",
+    "RouteLatencyHistograms",
+    "RouteLatencyStats",
+    "RouteLatencyWindow",
+    "render_route_histograms_prometheus",
+    "route_latency_histograms",
+    "status_class",
+]
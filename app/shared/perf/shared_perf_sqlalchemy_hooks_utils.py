@@ -4,9 +4,13 @@ from __future__ import annotations
 
 import re
 import time
+from functools import lru_cache
 
 from sqlalchemy import event as sa_event
 
+from .shared_perf_n_plus_one_utils import sample_n_plus_one_location
+from .shared_perf_tracing_utils import SPAN_KIND_CLIENT, record_trace_span
+
 _WS_RE = re.compile(r"\s+")
 _SQ_STRING_RE = re.compile(r"'(?:''|[^'])*'")
 _NUMERIC_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
@@ -15,11 +19,23 @@ _IN_PARAMETER_RE = re.compile(
     r"\(\s*(?:\?|\$\d+|:[a-z_][a-z0-9_]*)\s*(?:,\s*(?:\?|\$\d+|:[a-z_][a-z0-9_]*)\s*)+\)",
     flags=re.IGNORECASE,
 )
+_FINGERPRINT_CACHE_SIZE = 2048
 
 
 def normalize_sql_statement(statement: str | None) -> str:
-    """Normalize sql statement."""
-    normalized = (statement or "").strip().lower()
+    """Normalize sql statement.
+
+    Bound-parameter statements repeat verbatim, so results are memoized per raw
+    statement text in a bounded LRU cache.
+    """
+    if not statement:
+        return ""
+    return _normalize_sql_statement_cached(statement)
+
+
+@lru_cache(maxsize=_FINGERPRINT_CACHE_SIZE)
+def _normalize_sql_statement_cached(statement: str) -> str:
+    normalized = statement.strip().lower()
     if not normalized:
         return ""
     normalized = _SQ_STRING_RE.sub("?", normalized)
@@ -30,6 +46,22 @@ def normalize_sql_statement(statement: str | None) -> str:
     return normalized[:512]
 
 
+def sql_fingerprint_cache_info() -> dict[str, int]:
+    """Return hit/miss counters and occupancy of the fingerprint cache."""
+    info = _normalize_sql_statement_cached.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize or 0,
+    }
+
+
+def clear_sql_fingerprint_cache() -> None:
+    """Drop memoized fingerprints and reset the cache counters."""
+    _normalize_sql_statement_cached.cache_clear()
+
+
 def register_listeners(engine, *, event_impl=sa_event, perf_ctx, perf_module):
     """Attach lightweight timing hooks for DB statements."""
     sync_engine = engine.sync_engine
@@ -64,6 +96,22 @@ def register_listeners(engine, *, event_impl=sa_event, perf_ctx, perf_module):
         statement = getattr(context, "_winoe_perf_statement", None)
         fingerprint = normalize_sql_statement(statement)
         stats.record_sql(fingerprint, elapsed_ms)
+        sample_n_plus_one_location(stats, fingerprint)
+        record_trace_span(
+            "db.query",
+            kind=SPAN_KIND_CLIENT,
+            elapsed_ms=elapsed_ms,
+            attributes={
+                "db.system": getattr(getattr(_conn, "dialect", None), "name", None),
+                "db.statement": fingerprint,
+            },
+        )
 
 
-__all__ = ["normalize_sql_statement", "register_listeners", "sa_event"]
+__all__ = [
+    "clear_sql_fingerprint_cache",
+    "normalize_sql_statement",
+    "register_listeners",
+    "sa_event",
+    "sql_fingerprint_cache_info",
+]
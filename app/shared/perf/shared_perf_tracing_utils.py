@@ -0,0 +1,488 @@
+"""Application module for perf tracing (OpenTelemetry-compatible spans) workflows."""
+
+from __future__ import annotations
+
+import atexit
+import importlib
+import json
+import logging
+import queue
+import random
+import re
+import secrets
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Protocol
+
+from .shared_perf_config import (
+    perf_span_sample_rate,
+    perf_trace_exporter_name,
+    perf_trace_file_path,
+    perf_trace_service_name,
+    perf_tracing_enabled,
+)
+
+logger = logging.getLogger(__name__)
+
+SPAN_KIND_INTERNAL = "internal"
+SPAN_KIND_SERVER = "server"
+SPAN_KIND_CLIENT = "client"
+SPAN_KIND_CONSUMER = "consumer"
+SPAN_STATUS_UNSET = "unset"
+SPAN_STATUS_OK = "ok"
+SPAN_STATUS_ERROR = "error"
+
+# OTLP enum values (opentelemetry/proto/trace/v1/trace.proto).
+_OTLP_SPAN_KINDS = {
+    SPAN_KIND_INTERNAL: 1,
+    SPAN_KIND_SERVER: 2,
+    SPAN_KIND_CLIENT: 3,
+    SPAN_KIND_CONSUMER: 5,
+}
+_OTLP_STATUS_CODES = {SPAN_STATUS_UNSET: 0, SPAN_STATUS_OK: 1, SPAN_STATUS_ERROR: 2}
+# Child spans kept per trace; later ones are counted in ``winoe.dropped_spans``
+# on the root span so a long job cannot grow its buffer without bound.
+MAX_SPANS_PER_TRACE = 1000
+EXPORT_QUEUE_MAX_SIZE = 1024
+EXPORT_SHUTDOWN_TIMEOUT_SECONDS = 5.0
+_TRACEPARENT_RE = re.compile(
+    r"^00-(?P<trace_id>[0-9a-f]{32})-(?P<span_id>[0-9a-f]{16})-(?P<flags>[0-9a-f]{2})$"
+)
+
+
+@dataclass(slots=True)
+class Span:
+    """One finished or in-flight span, shaped after the OTLP data model."""
+
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    name: str
+    kind: str
+    start_ns: int
+    end_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: str = SPAN_STATUS_UNSET
+
+    @property
+    def traceparent(self) -> str:
+        """Return the W3C ``traceparent`` header value for this span."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    @property
+    def duration_ms(self) -> float:
+        """Return the span duration in milliseconds (0 while in flight)."""
+        if self.end_ns is None:
+            return 0.0
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Return this span in OTLP/JSON encoding."""
+        payload: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": _OTLP_SPAN_KINDS.get(self.kind, 1),
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in sorted(self.attributes.items())
+                if value is not None
+            ],
+            "status": {"code": _OTLP_STATUS_CODES.get(self.status, 0)},
+        }
+        if self.parent_span_id:
+            payload["parentSpanId"] = self.parent_span_id
+        return payload
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class SpanExporter(Protocol):
+    """Receives each finished trace as one batch of spans."""
+
+    def export(self, spans: Sequence[Span]) -> None:
+        """Export finished spans."""
+        ...
+
+    def shutdown(self) -> None:
+        """Flush and release exporter resources."""
+        ...
+
+
+class InMemorySpanExporter:
+    """Keeps exported spans in memory (tests and local inspection)."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, spans: Sequence[Span]) -> None:
+        """Append spans to :attr:`spans`."""
+        self.spans.extend(spans)
+
+    def shutdown(self) -> None:
+        """Nothing to release."""
+
+    def clear(self) -> None:
+        """Drop collected spans."""
+        self.spans.clear()
+
+
+def otlp_resource_spans(spans: Sequence[Span], *, service_name: str) -> dict[str, Any]:
+    """Wrap spans in an OTLP/JSON ``ExportTraceServiceRequest`` document."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": service_name}}
+                    ]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "winoe.perf"},
+                        "spans": [span.to_otlp() for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class JsonLinesSpanExporter:
+    """Appends one OTLP/JSON document per trace to a local file.
+
+    The format matches the OpenTelemetry Collector file exporter, so the file
+    can be replayed into any OTLP backend. Encoding and file writes happen on
+    a daemon thread so ``export`` never blocks the event loop; traces are
+    dropped (and counted) once ``max_queue_size`` batches are pending.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        service_name: str,
+        max_queue_size: int = EXPORT_QUEUE_MAX_SIZE,
+    ) -> None:
+        self.path = Path(path)
+        self.service_name = service_name
+        self.dropped_traces = 0
+        self._queue: queue.Queue[list[Span] | None] = queue.Queue(max_queue_size)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def export(self, spans: Sequence[Span]) -> None:
+        """Queue spans to be appended as one JSON line."""
+        if not spans:
+            return
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(list(spans))
+        except queue.Full:
+            self.dropped_traces += 1
+            logger.warning(
+                "perf_trace_export_dropped",
+                extra={"droppedTraces": self.dropped_traces},
+            )
+
+    def flush(self) -> None:
+        """Block until every queued trace has been written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def shutdown(self) -> None:
+        """Write pending traces and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        atexit.unregister(self.shutdown)
+        self._queue.put(None)
+        thread.join(timeout=EXPORT_SHUTDOWN_TIMEOUT_SECONDS)
+
+    def _ensure_writer(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._write_forever,
+                    name="perf-trace-exporter",
+                    daemon=True,
+                )
+                self._thread.start()
+                # Daemon threads die at exit; drain pending traces first.
+                atexit.register(self.shutdown)
+
+    def _write_forever(self) -> None:
+        while True:
+            spans = self._queue.get()
+            try:
+                if spans is None:
+                    return
+                self._write(spans)
+            except Exception:
+                logger.exception("perf_trace_export_failed")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, spans: list[Span]) -> None:
+        line = json.dumps(
+            otlp_resource_spans(spans, service_name=self.service_name),
+            separators=(",", ":"),
+        )
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+
+
+_exporter: SpanExporter | None = None
+_exporter_key: str | None = None
+
+
+def _build_exporter(name: str) -> SpanExporter:
+    if name == "memory":
+        return InMemorySpanExporter()
+    if name == "file":
+        return JsonLinesSpanExporter(
+            perf_trace_file_path(), service_name=perf_trace_service_name()
+        )
+    module_name, _, attribute = name.partition(":")
+    factory = getattr(importlib.import_module(module_name), attribute or "exporter")
+    return factory() if callable(factory) else factory
+
+
+def set_span_exporter(exporter: SpanExporter | None) -> None:
+    """Install ``exporter`` (None rebuilds from ``PERF_TRACE_EXPORTER``)."""
+    global _exporter, _exporter_key
+    if _exporter is not None and _exporter is not exporter:
+        _exporter.shutdown()
+    _exporter = exporter
+    _exporter_key = None if exporter is None else "__explicit__"
+
+
+def get_span_exporter() -> SpanExporter | None:
+    """Return the active exporter, building it from settings on first use."""
+    global _exporter, _exporter_key
+    name = perf_trace_exporter_name()
+    if not name:
+        return None
+    if _exporter is not None and _exporter_key in {name, "__explicit__"}:
+        return _exporter
+    _exporter = _build_exporter(name)
+    _exporter_key = name
+    return _exporter
+
+
+@dataclass(slots=True)
+class _TraceBuffer:
+    spans: list[Span] = field(default_factory=list)
+    dropped: int = 0
+
+    def add(self, span: Span) -> None:
+        if len(self.spans) >= MAX_SPANS_PER_TRACE:
+            self.dropped += 1
+            return
+        self.spans.append(span)
+
+
+@dataclass(slots=True)
+class _ActiveSpan:
+    span: Span
+    trace: _TraceBuffer
+
+
+_current_span: ContextVar[_ActiveSpan | None] = ContextVar(
+    "perf_current_span", default=None
+)
+
+
+def parse_traceparent(value: str | None) -> tuple[str, str] | None:
+    """Return ``(trace_id, parent_span_id)`` from a W3C traceparent, if valid."""
+    match = _TRACEPARENT_RE.match((value or "").strip().lower())
+    if match is None or set(match.group("trace_id")) == {"0"}:
+        return None
+    return match.group("trace_id"), match.group("span_id")
+
+
+def traceparent_from_scope(scope: Any) -> str | None:
+    """Return the incoming ``traceparent`` header from an ASGI scope."""
+    for key, value in scope.get("headers") or []:
+        if key.lower() == b"traceparent":
+            try:
+                return value.decode("latin-1")
+            except Exception:
+                return None
+    return None
+
+
+def current_span() -> Span | None:
+    """Return the span active in this context, if any."""
+    active = _current_span.get()
+    return active.span if active is not None else None
+
+
+def current_traceparent() -> str | None:
+    """Return the W3C traceparent of the active span, if any."""
+    span = current_span()
+    return span.traceparent if span is not None else None
+
+
+def _new_span(
+    name: str,
+    *,
+    kind: str,
+    trace_id: str,
+    parent_span_id: str | None,
+    start_ns: int,
+    attributes: dict[str, Any] | None,
+) -> Span:
+    return Span(
+        trace_id=trace_id,
+        span_id=secrets.token_hex(8),
+        parent_span_id=parent_span_id,
+        name=name,
+        kind=kind,
+        start_ns=start_ns,
+        attributes=dict(attributes or {}),
+    )
+
+
+def _export(spans: list[Span]) -> None:
+    exporter = get_span_exporter()
+    if exporter is None or not spans:
+        return
+    try:
+        exporter.export(spans)
+    except Exception:
+        logger.exception("perf_trace_export_failed")
+
+
+@contextmanager
+def start_trace_span(
+    name: str,
+    *,
+    kind: str = SPAN_KIND_INTERNAL,
+    attributes: dict[str, Any] | None = None,
+    traceparent: str | None = None,
+) -> Iterator[Span | None]:
+    """Open a span under the active one, or start a sampled trace.
+
+    A new trace continues ``traceparent`` when given (remote parent). The
+    whole trace is exported in one batch when its local root span ends,
+    keeping at most :data:`MAX_SPANS_PER_TRACE` child spans.
+    """
+    if not perf_tracing_enabled():
+        yield None
+        return
+    parent = _current_span.get()
+    if parent is not None:
+        span = _new_span(
+            name,
+            kind=kind,
+            trace_id=parent.span.trace_id,
+            parent_span_id=parent.span.span_id,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+        )
+        trace = parent.trace
+    else:
+        remote = parse_traceparent(traceparent)
+        if remote is None and random.random() > perf_span_sample_rate():
+            yield None
+            return
+        trace_id, parent_span_id = remote or (secrets.token_hex(16), None)
+        span = _new_span(
+            name,
+            kind=kind,
+            trace_id=trace_id,
+            parent_span_id=parent_span_id,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+        )
+        trace = _TraceBuffer()
+    token = _current_span.set(_ActiveSpan(span=span, trace=trace))
+    try:
+        yield span
+    except BaseException:
+        span.status = SPAN_STATUS_ERROR
+        raise
+    finally:
+        span.end_ns = time.time_ns()
+        _current_span.reset(token)
+        if parent is not None:
+            trace.add(span)
+        else:
+            if trace.dropped:
+                span.attributes["winoe.dropped_spans"] = trace.dropped
+            _export([*trace.spans, span])
+
+
+def record_trace_span(
+    name: str,
+    *,
+    kind: str,
+    elapsed_ms: float,
+    attributes: dict[str, Any] | None = None,
+) -> Span | None:
+    """Record an already-finished child span of the active span.
+
+    Used by hooks that only learn a duration after the fact (SQL cursor
+    events, external waits); the span is back-dated by ``elapsed_ms``.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return None
+    end_ns = time.time_ns()
+    span = _new_span(
+        name,
+        kind=kind,
+        trace_id=parent.span.trace_id,
+        parent_span_id=parent.span.span_id,
+        start_ns=end_ns - int(max(0.0, elapsed_ms) * 1_000_000),
+        attributes=attributes,
+    )
+    span.end_ns = end_ns
+    parent.trace.add(span)
+    return span
+
+
+__all__ = [
+    "EXPORT_QUEUE_MAX_SIZE",
+    "EXPORT_SHUTDOWN_TIMEOUT_SECONDS",
+    "MAX_SPANS_PER_TRACE",
+    "SPAN_KIND_CLIENT",
+    "SPAN_KIND_CONSUMER",
+    "SPAN_KIND_INTERNAL",
+    "SPAN_KIND_SERVER",
+    "SPAN_STATUS_ERROR",
+    "SPAN_STATUS_OK",
+    "SPAN_STATUS_UNSET",
+    "InMemorySpanExporter",
+    "JsonLinesSpanExporter",
+    "Span",
+    "SpanExporter",
+    "current_span",
+    "current_traceparent",
+    "get_span_exporter",
+    "otlp_resource_spans",
+    "parse_traceparent",
+    "record_trace_span",
+    "set_span_exporter",
+    "start_trace_span",
+    "traceparent_from_scope",
+]
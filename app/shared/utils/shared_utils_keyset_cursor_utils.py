@@ -0,0 +1,34 @@
+"""Application module for shared utils keyset cursor utils workflows."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+
+def encode_keyset_cursor(values: dict[str, Any]) -> str:
+    """Encode the last row's sort key as an opaque URL-safe token."""
+    payload = {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in values.items()
+    }
+    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_keyset_cursor(token: str) -> dict[str, Any]:
+    """Decode a token from ``encode_keyset_cursor``; raise ``ValueError``."""
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError("malformed cursor") from exc
+    if not isinstance(payload, dict):
+        raise ValueError("malformed cursor")
+    return payload
+
+
+__all__ = ["decode_keyset_cursor", "encode_keyset_cursor"]
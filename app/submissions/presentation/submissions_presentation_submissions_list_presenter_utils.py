@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from sqlalchemy import inspect as sa_inspect
+
 from app.submissions.presentation.submissions_presentation_submissions_commit_basis_utils import (
     resolve_commit_basis,
 )
@@ -13,6 +15,9 @@ from app.submissions.presentation.submissions_presentation_submissions_output_ut
     max_output_chars,
     parse_diff_summary,
 )
+from app.submissions.presentation.submissions_presentation_submissions_test_results_preview_utils import (
+    load_test_results_preview,
+)
 from app.submissions.presentation.submissions_presentation_submissions_test_results_utils import (
     build_test_results,
 )
@@ -21,11 +26,23 @@ from app.submissions.services import (
 )
 
 
-def present_list_item(sub, task, *, day_audit=None):
-    """Present list item."""
-    parsed_output = talent_partner_sub_service.parse_test_output(
+def _list_parsed_output(sub):
+    # The list query loads only the stored preview; callers that loaded the
+    # full output (or pass plain objects) still render from it.
+    preview = getattr(sub, "test_results_preview", None)
+    if preview:
+        return load_test_results_preview(preview)
+    state = sa_inspect(sub, raiseerr=False)
+    if state is not None and "test_output" in state.unloaded:
+        return None
+    return talent_partner_sub_service.parse_test_output(
         getattr(sub, "test_output", None)
     )
+
+
+def present_list_item(sub, task, *, day_audit=None):
+    """Present list item."""
+    parsed_output = _list_parsed_output(sub)
     diff_summary = parse_diff_summary(sub.diff_summary_json)
     repo_full_name = sub.code_repo_path
     commit_sha, cutoff_commit_sha, cutoff_at, eval_basis_ref = resolve_commit_basis(
@@ -0,0 +1,64 @@
+"""Application module for submissions presentation submissions test results preview utils workflows."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from app.submissions.presentation.submissions_presentation_submissions_core_constants import (
+    MAX_OUTPUT_CHARS_LIST,
+)
+from app.submissions.presentation.submissions_presentation_submissions_redaction_utils import (
+    redact_text,
+)
+from app.submissions.services.service_talent_partner.submissions_services_service_talent_partner_submissions_talent_partner_parse_output_service import (
+    parse_test_output,
+)
+
+_STREAM_KEYS = ("stdout", "stderr")
+
+
+def _clip_stream(value: str) -> str:
+    # One character past the list limit keeps the presenter's truncation flag
+    # and marker identical to rendering from the full output.
+    redacted = redact_text(value) or ""
+    return redacted[: MAX_OUTPUT_CHARS_LIST + 1]
+
+
+def build_test_results_preview(test_output: str | None) -> str | None:
+    """Return the list-sized copy of ``test_output`` stored next to it.
+
+    The Talent Partner submissions list only shows counts, run metadata and
+    the first ``MAX_OUTPUT_CHARS_LIST`` characters of stdout/stderr, so it
+    reads this instead of the full (possibly multi-megabyte) output.
+    """
+    parsed = parse_test_output(test_output)
+    if parsed is None:
+        return None
+    if isinstance(parsed, dict):
+        clipped = dict(parsed)
+        for key in _STREAM_KEYS:
+            value = clipped.get(key)
+            if isinstance(value, str):
+                clipped[key] = _clip_stream(value)
+        return json.dumps({"json": clipped}, ensure_ascii=False)
+    return json.dumps({"text": _clip_stream(parsed)}, ensure_ascii=False)
+
+
+def load_test_results_preview(preview: str | None) -> dict[str, Any] | str | None:
+    """Return the parsed-output equivalent of a stored preview."""
+    if not preview:
+        return None
+    try:
+        payload = json.loads(preview)
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    if isinstance(payload.get("json"), dict):
+        return payload["json"]
+    text = payload.get("text")
+    return text if isinstance(text, str) else None
+
+
+__all__ = ["build_test_results_preview", "load_test_results_preview"]
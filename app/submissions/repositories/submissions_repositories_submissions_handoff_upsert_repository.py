@@ -11,6 +11,7 @@ from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.shared.database.shared_database_models_model import Submission
+from app.shared.database.shared_database_read_model_utils import note_rows_written
 
 from .submissions_repositories_submissions_handoff_write_repository import (
     create_handoff_submission,
@@ -63,7 +64,9 @@ async def upsert_handoff_submission(
             )
             .returning(Submission.id)
         )
-        return int((await db.execute(stmt)).scalar_one())
+        submission_id = int((await db.execute(stmt)).scalar_one())
+        note_rows_written(db, Submission.__tablename__, [values])
+        return submission_id
     if dialect_name == "postgresql":
         stmt = (
             pg_insert(Submission)
@@ -74,7 +77,9 @@ async def upsert_handoff_submission(
             )
             .returning(Submission.id)
         )
-        return int((await db.execute(stmt)).scalar_one())
+        submission_id = int((await db.execute(stmt)).scalar_one())
+        note_rows_written(db, Submission.__tablename__, [values])
+        return submission_id
 
     existing = await get_submission(
         db,
@@ -11,6 +11,7 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    event,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -29,6 +30,7 @@ class Submission(Base):
         ),
         Index("ix_submissions_candidate_session_id", "candidate_session_id"),
         Index("ix_submissions_recording_id", "recording_id"),
+        Index("ix_submissions_submitted_at_id", "submitted_at", "id"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -60,6 +62,8 @@ class Submission(Base):
     tests_passed: Mapped[int | None] = mapped_column(Integer, nullable=True)
     tests_failed: Mapped[int | None] = mapped_column(Integer, nullable=True)
     test_output: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # List-sized copy of ``test_output``; kept in sync by the listener below.
+    test_results_preview: Mapped[str | None] = mapped_column(Text, nullable=True)
     last_run_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
@@ -67,3 +71,12 @@ class Submission(Base):
     candidate_session = relationship("CandidateSession", back_populates="submissions")
     task = relationship("Task", back_populates="submissions")
     recording = relationship("RecordingAsset")
+
+
+@event.listens_for(Submission.test_output, "set", propagate=True)
+def _sync_test_results_preview(target, value, _oldvalue, _initiator):
+    from app.submissions.presentation.submissions_presentation_submissions_test_results_preview_utils import (
+        build_test_results_preview,
+    )
+
+    target.test_results_preview = build_test_results_preview(value)
@@ -3,13 +3,13 @@
 from contextlib import suppress
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.candidates.candidate_sessions.repositories import repository as cs_repo
 from app.shared.auth.shared_auth_current_user_utils import get_current_user
 from app.shared.auth.shared_auth_roles_utils import ensure_talent_partner
-from app.shared.database import get_session
+from app.shared.database import get_read_session
 from app.shared.database.shared_database_models_model import User
 from app.submissions.presentation import present_list_item
 from app.submissions.schemas.submissions_schemas_submissions_core_schema import (
@@ -23,24 +23,68 @@ from app.submissions.services import (
 router = APIRouter(prefix="/submissions", tags=["submissions"])
 
 
+def _next_cursor(row) -> str | None:
+    sub = row
+    with suppress(TypeError, ValueError):
+        sub, *_ = row
+    submitted_at = getattr(sub, "submitted_at", None)
+    submission_id = getattr(sub, "id", None)
+    if submitted_at is None or not isinstance(submission_id, int):
+        return None
+    return talent_partner_sub_service.encode_submissions_cursor(
+        submitted_at, submission_id
+    )
+
+
 @router.get(
     "",
     response_model=TalentPartnerSubmissionListOut,
     response_model_exclude={"items": {"__all__": {"testResults": {"output"}}}},
 )
 async def list_submissions_route(
-    db: Annotated[AsyncSession, Depends(get_session)],
+    db: Annotated[AsyncSession, Depends(get_read_session)],
     user: Annotated[User, Depends(get_current_user)],
-    candidateSessionId: int | None = Query(default=None),
-    taskId: int | None = Query(default=None),
-    limit: int | None = Query(default=None, ge=1, le=200),
-    offset: int = Query(default=0, ge=0),
+    candidateSessionId: Annotated[int | None, Query()] = None,
+    taskId: Annotated[int | None, Query()] = None,
+    limit: Annotated[
+        int | None,
+        Query(ge=1, le=talent_partner_sub_service.SUBMISSIONS_PAGE_SIZE_MAX),
+    ] = None,
+    offset: Annotated[int, Query(ge=0, deprecated=True)] = 0,
+    cursor: Annotated[
+        str | None, Query(description="nextCursor from the previous page.")
+    ] = None,
 ) -> TalentPartnerSubmissionListOut:
-    """List submissions visible to the Talent Partner with optional filters."""
+    """List submissions visible to the Talent Partner with optional filters.
+
+    Newest first, one page at a time: pass the returned ``nextCursor`` back
+    as ``cursor`` for the next page (``null`` on the last page).
+    """
     ensure_talent_partner(user)
-    rows = await talent_partner_sub_service.list_submissions(
-        db, user.id, candidateSessionId, taskId, limit, offset
+    after = None
+    if cursor:
+        try:
+            after = talent_partner_sub_service.decode_submissions_cursor(cursor)
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            ) from exc
+    page_size = limit or talent_partner_sub_service.SUBMISSIONS_PAGE_SIZE_DEFAULT
+    rows = list(
+        await talent_partner_sub_service.list_submissions(
+            db,
+            user.id,
+            candidateSessionId,
+            taskId,
+            page_size + 1,
+            0 if after is not None else offset,
+            after=after,
+        )
     )
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = _next_cursor(rows[-1])
     parsed_rows: list[tuple[object, object]] = []
     for row in rows:
         sub = row
@@ -81,4 +125,4 @@ async def list_submissions_route(
         except TypeError:
             payload = present_list_item(sub, task)
         items.append(TalentPartnerSubmissionListItemOut(**payload))
-    return TalentPartnerSubmissionListOut(items=items)
+    return TalentPartnerSubmissionListOut(items=items, nextCursor=next_cursor)
@@ -77,3 +77,4 @@ class TalentPartnerSubmissionListOut(APIModel):
     """Represent Talent Partner submission list out data and behavior."""
 
     items: list[TalentPartnerSubmissionListItemOut]
+    nextCursor: str | None = None
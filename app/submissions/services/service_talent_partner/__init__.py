@@ -5,6 +5,10 @@ from app.submissions.services.service_talent_partner.submissions_services_servic
     fetch_detail,
 )
 from app.submissions.services.service_talent_partner.submissions_services_service_talent_partner_submissions_talent_partner_list_submissions_service import (
+    SUBMISSIONS_PAGE_SIZE_DEFAULT,
+    SUBMISSIONS_PAGE_SIZE_MAX,
+    decode_submissions_cursor,
+    encode_submissions_cursor,
     list_submissions,
 )
 from app.submissions.services.service_talent_partner.submissions_services_service_talent_partner_submissions_talent_partner_parse_output_service import (
@@ -12,7 +16,11 @@ from app.submissions.services.service_talent_partner.submissions_services_servic
 )
 
 __all__ = [
+    "SUBMISSIONS_PAGE_SIZE_DEFAULT",
+    "SUBMISSIONS_PAGE_SIZE_MAX",
+    "decode_submissions_cursor",
     "derive_test_status",
+    "encode_submissions_cursor",
     "fetch_detail",
     "list_submissions",
     "parse_test_output",
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from sqlalchemy import select
+from datetime import UTC, datetime
+
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import load_only
 
@@ -12,6 +14,31 @@ from app.shared.database.shared_database_models_model import (
     Task,
     Trial,
 )
+from app.shared.utils.shared_utils_keyset_cursor_utils import (
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+)
+
+SUBMISSIONS_PAGE_SIZE_DEFAULT = 50
+SUBMISSIONS_PAGE_SIZE_MAX = 200
+
+
+def encode_submissions_cursor(submitted_at: datetime, submission_id: int) -> str:
+    """Return the cursor for the page after the given (last) row."""
+    return encode_keyset_cursor({"s": submitted_at, "i": submission_id})
+
+
+def decode_submissions_cursor(token: str) -> tuple[datetime, int]:
+    """Return ``(submitted_at, id)`` from a cursor; raise ``ValueError``."""
+    payload = decode_keyset_cursor(token)
+    try:
+        submitted_at = datetime.fromisoformat(str(payload["s"]))
+        submission_id = int(payload["i"])
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError("malformed cursor") from exc
+    if submitted_at.tzinfo is None:
+        submitted_at = submitted_at.replace(tzinfo=UTC)
+    return submitted_at, submission_id
 
 
 async def list_submissions(
@@ -21,15 +48,22 @@ async def list_submissions(
     task_id: int | None,
     limit: int | None = None,
     offset: int = 0,
+    *,
+    after: tuple[datetime, int] | None = None,
 ) -> list[tuple[Submission, Task]]:
-    """Return submissions."""
+    """Return submissions, newest first.
+
+    ``after`` is the ``(submitted_at, id)`` of the previous page's last row
+    (keyset pagination); ``offset`` is kept for older callers. Only the stored
+    test-results preview is loaded, never the full ``test_output``.
+    """
     stmt = (
         select(Submission, Task)
         .join(Task, Task.id == Submission.task_id)
         .join(CandidateSession, CandidateSession.id == Submission.candidate_session_id)
         .join(Trial, Trial.id == CandidateSession.trial_id)
         .where(Trial.created_by == talent_partner_id)
-        .order_by(Submission.submitted_at.desc())
+        .order_by(Submission.submitted_at.desc(), Submission.id.desc())
         .options(
             load_only(
                 Submission.id,
@@ -44,7 +78,7 @@ async def list_submissions(
                 Submission.diff_summary_json,
                 Submission.tests_passed,
                 Submission.tests_failed,
-                Submission.test_output,
+                Submission.test_results_preview,
                 Submission.last_run_at,
             ),
             load_only(Task.id, Task.day_index, Task.type),
@@ -54,7 +88,11 @@ async def list_submissions(
         stmt = stmt.where(Submission.candidate_session_id == candidate_session_id)
     if task_id is not None:
         stmt = stmt.where(Submission.task_id == task_id)
-    if offset:
+    if after is not None:
+        stmt = stmt.where(
+            tuple_(Submission.submitted_at, Submission.id) < tuple_(*after)
+        )
+    elif offset:
         stmt = stmt.offset(offset)
     if limit is not None:
         stmt = stmt.limit(limit)
@@ -11,9 +11,13 @@ from . import (
 from . import (
     talent_partners_routes_admin_routes_talent_partners_admin_routes_jobs_routes as jobs,
 )
+from . import (
+    talent_partners_routes_admin_routes_talent_partners_admin_routes_perf_routes as perf,
+)
 
 router = APIRouter()
 router.include_router(demo_ops.router)
 router.include_router(jobs.router)
+router.include_router(perf.router)
 
-__all__ = ["demo_ops", "dev_session_controls", "jobs", "router"]
+__all__ = ["demo_ops", "dev_session_controls", "jobs", "perf", "router"]
@@ -6,6 +6,7 @@ from datetime import UTC, datetime
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.shared.database import get_session
@@ -24,6 +25,12 @@ from app.shared.jobs.shared_jobs_failure_summaries_service import (
     list_failed_jobs,
     safe_failed_job_summary,
 )
+from app.shared.jobs.shared_jobs_metrics_service import (
+    DEFAULT_METRICS_WINDOW_SECONDS,
+    JobMetricsResponse,
+    build_job_metrics,
+    render_prometheus_text,
+)
 from app.shared.utils.shared_utils_errors_utils import ApiError
 from app.talent_partners.services.talent_partners_services_talent_partners_admin_ops_audit_service import (
     insert_audit,
@@ -55,6 +62,53 @@ async def list_failed_operator_jobs(
     return await list_failed_jobs(db, limit=limit, offset=offset)
 
 
+@router.get(
+    "/jobs/metrics",
+    response_model=JobMetricsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Job Queue Metrics",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Authentication required."},
+        status.HTTP_403_FORBIDDEN: {"description": "Admin access required."},
+    },
+)
+async def get_operator_job_metrics(
+    db: Annotated[AsyncSession, Depends(get_session)],
+    _actor: Annotated[DemoAdminActor, Depends(require_operator_admin)],
+    window_seconds: Annotated[
+        int, Query(alias="windowSeconds", ge=60, le=86_400)
+    ] = DEFAULT_METRICS_WINDOW_SECONDS,
+) -> JobMetricsResponse:
+    """Return per-type queue depth, lag, recent finishes and handler metrics."""
+    return await build_job_metrics(db, window_seconds=window_seconds)
+
+
+@router.get(
+    "/jobs/metrics/prometheus",
+    response_class=PlainTextResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Job Queue Metrics (Prometheus)",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Authentication required."},
+        status.HTTP_403_FORBIDDEN: {"description": "Admin access required."},
+    },
+)
+async def get_operator_job_metrics_prometheus(
+    db: Annotated[AsyncSession, Depends(get_session)],
+    _actor: Annotated[DemoAdminActor, Depends(require_operator_admin)],
+) -> PlainTextResponse:
+    """Return job queue metrics in Prometheus text exposition format."""
+    metrics = await build_job_metrics(db)
+    return PlainTextResponse(
+        render_prometheus_text(
+            queues=metrics.queues,
+            runtime=metrics.runtime,
+            window_seconds=metrics.windowSeconds,
+        ),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
 @router.post(
     "/jobs/{job_id}/retry",
     response_model=SafeFailedJobSummary,
@@ -129,6 +183,8 @@ async def retry_operator_job(
 
 __all__ = [
     "JOB_RETRY_ACTION",
+    "get_operator_job_metrics",
+    "get_operator_job_metrics_prometheus",
     "list_failed_operator_jobs",
     "retry_operator_job",
     "router",
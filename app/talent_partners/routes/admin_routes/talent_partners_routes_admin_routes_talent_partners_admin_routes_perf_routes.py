@@ -0,0 +1,307 @@
+"""Operator perf diagnostics."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.database import engine, get_session
+from app.shared.http.dependencies.shared_http_dependencies_admin_operator_utils import (
+    DemoAdminActor,
+    require_operator_admin,
+)
+from app.shared.perf import (
+    LoopLagSnapshot,
+    PoolCheckoutSnapshot,
+    ProfileSessionCreateRequest,
+    ProfileSessionSummary,
+    RouteLatencyWindow,
+    loop_lag_monitor,
+    pool_checkout_stats,
+    profile_session_summary,
+    render_pool_checkout_prometheus,
+    render_route_histograms_prometheus,
+    route_latency_histograms,
+)
+from app.shared.perf.shared_perf_profile_sessions_repository import (
+    cancel_profile_session,
+    create_profile_session,
+    get_profile_session,
+    list_profile_sessions,
+)
+from app.shared.utils.shared_utils_errors_utils import ApiError
+from app.talent_partners.services.talent_partners_services_talent_partners_admin_ops_audit_service import (
+    insert_audit,
+    log_admin_action,
+)
+
+router = APIRouter()
+
+PERF_PROFILE_ARM_ACTION = "perf_profile_arm"
+PERF_PROFILE_CANCEL_ACTION = "perf_profile_cancel"
+
+
+def _profile_audit_payload(session) -> dict[str, object]:
+    return {
+        "targetKind": session.target_kind,
+        "target": session.target,
+        "method": session.method,
+        "count": session.requested_count,
+    }
+
+
+def _route_latency_window(reset: bool) -> RouteLatencyWindow:
+    if reset:
+        return route_latency_histograms.drain()
+    return route_latency_histograms.snapshot()
+
+
+@router.get(
+    "/perf/routes",
+    response_model=RouteLatencyWindow,
+    status_code=status.HTTP_200_OK,
+    summary="Route Latency Histograms",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Authentication required."},
+        status.HTTP_403_FORBIDDEN: {"description": "Admin access required."},
+    },
+)
+async def get_operator_route_latency(
+    _actor: Annotated[DemoAdminActor, Depends(require_operator_admin)],
+    reset: Annotated[bool, Query()] = True,
+) -> RouteLatencyWindow:
+    """Return this process's per-route latency/DB histograms for the window."""
+    return _route_latency_window(reset)
+
+
+@router.get(
+    "/perf/routes/prometheus",
+    response_class=PlainTextResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Route Latency Histograms (Prometheus)",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Authentication required."},
+        status.HTTP_403_FORBIDDEN: {"description": "Admin access required."},
+    },
+)
+async def get_operator_route_latency_prometheus(
+    _actor: Annotated[DemoAdminActor, Depends(require_operator_admin)],
+    reset: Annotated[bool, Query()] = True,
+) -> PlainTextResponse:
+    """Return per-route histograms and pool checkout waits for Prometheus."""
+    return PlainTextResponse(
+        render_route_histograms_prometheus(_route_latency_window(reset))
+        + render_pool_checkout_prometheus(pool_checkout_stats.snapshot(engine.pool)),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+@router.get(
+    "/perf/pool",
+    response_model=PoolCheckoutSnapshot,
+    status_code=status.HTTP_200_OK,
+    summary="DB Connection Pool",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Authentication required."},
+        status.HTTP_403_FORBIDDEN: {"description": "Admin access required."},
+    },
+)
+async def get_operator_pool_checkout(
+    _actor: Annotated[DemoAdminActor, Depends(require_operator_admin)],
+    reset: Annotated[bool, Query()] = False,
+) -> PoolCheckoutSnapshot:
+    """Return this process's pool occupancy and checkout wait histogram."""
+    snapshot = pool_checkout_stats.snapshot(engine.pool)
+    if reset:
+        pool_checkout_stats.reset()
+    return snapshot
+
+
+@router.get(
+    "/perf/loop-lag",
+    response_model=LoopLagSnapshot,
+    status_code=status.HTTP_200_OK,
+    summary="Event Loop Lag",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Authentication required."},
+        status.HTTP_403_FORBIDDEN: {"description": "Admin access required."},
+    },
+)
+async def get_operator_loop_lag(
+    _actor: Annotated[DemoAdminActor, Depends(require_operator_admin)],
+    reset: Annotated[bool, Query()] = False,
+) -> LoopLagSnapshot:
+    """Return this process's event-loop lag percentiles and stall count."""
+    snapshot = loop_lag_monitor.snapshot()
+    if reset:
+        loop_lag_monitor.reset()
+    return snapshot
+
+
+async def _get_profile_session_or_404(db: AsyncSession, profile_id: str):
+    session = await get_profile_session(db, profile_id)
+    if session is None:
+        raise ApiError(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile session not found",
+            error_code="PERF_PROFILE_NOT_FOUND",
+            retryable=False,
+        )
+    return session
+
+
+@router.post(
+    "/perf/profiles",
+    response_model=ProfileSessionSummary,
+    status_code=status.HTTP_201_CREATED,
+    summary="Arm Sampling Profiler",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Authentication required."},
+        status.HTTP_403_FORBIDDEN: {"description": "Admin access required."},
+    },
+)
+async def arm_operator_profile(
+    payload: ProfileSessionCreateRequest,
+    db: Annotated[AsyncSession, Depends(get_session)],
+    actor: Annotated[DemoAdminActor, Depends(require_operator_admin)],
+) -> ProfileSessionSummary:
+    """Profile the next N requests to a route template or N jobs of a type.
+
+    Processes only capture when ``PERF_PROFILER_ENABLED`` is set, and pick up
+    newly armed sessions within a few seconds.
+    """
+    session = await create_profile_session(
+        db,
+        target_kind=payload.targetKind,
+        target=payload.target.strip(),
+        method=payload.method,
+        requested_count=payload.count,
+        interval_ms=payload.intervalMs,
+        ttl_seconds=payload.ttlSeconds,
+        created_by=actor.actor_id,
+        now=datetime.now(UTC),
+        commit=False,
+    )
+    audit_id = await insert_audit(
+        db,
+        actor=actor,
+        action=PERF_PROFILE_ARM_ACTION,
+        target_type="perf_profile",
+        target_id=session.id,
+        payload=_profile_audit_payload(session),
+    )
+    await db.commit()
+    log_admin_action(
+        audit_id=audit_id,
+        action=PERF_PROFILE_ARM_ACTION,
+        target_type="perf_profile",
+        target_id=session.id,
+        actor_id=actor.actor_id,
+    )
+    return profile_session_summary(session)
+
+
+@router.get(
+    "/perf/profiles",
+    response_model=list[ProfileSessionSummary],
+    status_code=status.HTTP_200_OK,
+    summary="List Sampling Profiles",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Authentication required."},
+        status.HTTP_403_FORBIDDEN: {"description": "Admin access required."},
+    },
+)
+async def list_operator_profiles(
+    db: Annotated[AsyncSession, Depends(get_session)],
+    _actor: Annotated[DemoAdminActor, Depends(require_operator_admin)],
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+) -> list[ProfileSessionSummary]:
+    """Return recent profile sessions, newest first."""
+    sessions = await list_profile_sessions(db, limit=limit)
+    return [profile_session_summary(session) for session in sessions]
+
+
+@router.get(
+    "/perf/profiles/{profile_id}/collapsed",
+    response_class=PlainTextResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Download Collapsed Stacks",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Authentication required."},
+        status.HTTP_403_FORBIDDEN: {"description": "Admin access required."},
+        status.HTTP_404_NOT_FOUND: {"description": "Profile session not found."},
+    },
+)
+async def download_operator_profile(
+    profile_id: Annotated[str, Path(..., min_length=1, max_length=36)],
+    db: Annotated[AsyncSession, Depends(get_session)],
+    _actor: Annotated[DemoAdminActor, Depends(require_operator_admin)],
+) -> PlainTextResponse:
+    """Return merged collapsed stacks (input for flamegraph.pl / speedscope)."""
+    session = await _get_profile_session_or_404(db, profile_id)
+    return PlainTextResponse(
+        session.collapsed_stacks,
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="profile-{session.id}.collapsed.txt"'
+            )
+        },
+    )
+
+
+@router.post(
+    "/perf/profiles/{profile_id}/cancel",
+    response_model=ProfileSessionSummary,
+    status_code=status.HTTP_200_OK,
+    summary="Cancel Sampling Profile",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Authentication required."},
+        status.HTTP_403_FORBIDDEN: {"description": "Admin access required."},
+        status.HTTP_404_NOT_FOUND: {"description": "Profile session not found."},
+    },
+)
+async def cancel_operator_profile(
+    profile_id: Annotated[str, Path(..., min_length=1, max_length=36)],
+    db: Annotated[AsyncSession, Depends(get_session)],
+    actor: Annotated[DemoAdminActor, Depends(require_operator_admin)],
+) -> ProfileSessionSummary:
+    """Stop an armed profile session from claiming further captures."""
+    await _get_profile_session_or_404(db, profile_id)
+    session = await cancel_profile_session(
+        db, profile_id, now=datetime.now(UTC), commit=False
+    )
+    audit_id = await insert_audit(
+        db,
+        actor=actor,
+        action=PERF_PROFILE_CANCEL_ACTION,
+        target_type="perf_profile",
+        target_id=session.id,
+        payload=_profile_audit_payload(session),
+    )
+    await db.commit()
+    log_admin_action(
+        audit_id=audit_id,
+        action=PERF_PROFILE_CANCEL_ACTION,
+        target_type="perf_profile",
+        target_id=session.id,
+        actor_id=actor.actor_id,
+    )
+    return profile_session_summary(session)
+
+
+__all__ = [
+    "PERF_PROFILE_ARM_ACTION",
+    "PERF_PROFILE_CANCEL_ACTION",
+    "arm_operator_profile",
+    "cancel_operator_profile",
+    "download_operator_profile",
+    "get_operator_loop_lag",
+    "get_operator_route_latency",
+    "get_operator_route_latency_prometheus",
+    "list_operator_profiles",
+    "router",
+]
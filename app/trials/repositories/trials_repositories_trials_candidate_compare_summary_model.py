@@ -0,0 +1,101 @@
+"""Application module for trials repositories trials candidate compare summary model workflows."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Float, ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.shared.database.shared_database_base_model import Base
+from app.shared.database.shared_database_read_model_utils import (
+    ReadModel,
+    register_read_model,
+    row_value,
+)
+
+COMPARE_SUMMARY_READ_MODEL = "candidate_compare_summaries"
+# Mirrors EVALUATION_RUN_JOB_TYPE; importing the evaluations services from a
+# model module would be circular.
+_EVALUATION_RUN_JOB_TYPE = "evaluation_run"
+
+
+class CandidateCompareSummary(Base):
+    """Denormalized candidate-compare row, one per candidate session.
+
+    Rebuilt in the writing transaction whenever the candidate session, its
+    submissions, evaluation runs, Winoe Report, evaluation jobs or the
+    trial's tasks change (see ``_compare_keys_for``).
+    """
+
+    __tablename__ = "candidate_compare_summaries"
+    __table_args__ = (
+        Index(
+            "ix_candidate_compare_summaries_trial_report_status",
+            "trial_id",
+            "winoe_report_status",
+            "candidate_session_id",
+        ),
+    )
+
+    candidate_session_id: Mapped[int] = mapped_column(
+        ForeignKey("candidate_sessions.id", ondelete="CASCADE"), primary_key=True
+    )
+    trial_id: Mapped[int] = mapped_column(
+        ForeignKey("trials.id", ondelete="CASCADE"), nullable=False
+    )
+    candidate_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    status: Mapped[str] = mapped_column(String(32), nullable=False)
+    winoe_report_status: Mapped[str] = mapped_column(String(32), nullable=False)
+    overall_winoe_score: Mapped[float | None] = mapped_column(Float, nullable=True)
+    recommendation: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    day_completion: Mapped[dict[str, bool]] = mapped_column(JSON, nullable=False)
+    activity_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+
+def _compare_keys_for(table_name: str, row: Any) -> tuple[Any, ...]:
+    # Keys are candidate session ids, or ("trial", id) when a task change
+    # moves day completion for every candidate of the trial.
+    if table_name == "candidate_sessions":
+        return (row_value(row, "id"),)
+    if table_name == "tasks":
+        trial_id = row_value(row, "trial_id")
+        return (("trial", trial_id),) if trial_id is not None else ()
+    if table_name == "jobs" and row_value(row, "job_type") != _EVALUATION_RUN_JOB_TYPE:
+        return ()
+    return (row_value(row, "candidate_session_id"),)
+
+
+def _refresh(connection: Any, keys: set[Any]) -> None:
+    from app.trials.services.trials_services_trials_candidates_compare_read_model_service import (
+        refresh_compare_summaries,
+    )
+
+    refresh_compare_summaries(connection, keys)
+
+
+register_read_model(
+    ReadModel(
+        name=COMPARE_SUMMARY_READ_MODEL,
+        tables=frozenset(
+            {
+                "candidate_sessions",
+                "evaluation_runs",
+                "jobs",
+                "submissions",
+                "tasks",
+                "winoe_reports",
+            }
+        ),
+        keys_for=_compare_keys_for,
+        refresh=_refresh,
+    )
+)
+
+__all__ = ["COMPARE_SUMMARY_READ_MODEL", "CandidateCompareSummary"]
@@ -0,0 +1,204 @@
+"""Application module for trials repositories trials candidate counters model workflows."""
+
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, ForeignKey, Integer, inspect
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.shared.database.shared_database_base_model import Base
+from app.shared.database.shared_database_read_model_utils import (
+    ReadModel,
+    register_read_model,
+    row_value,
+)
+
+CANDIDATE_COUNTERS_READ_MODEL = "trial_candidate_counters"
+_SESSION_COLUMNS = ("trial_id", "started_at", "completed_at")
+_UNKNOWN = object()
+_DELTA_SEQUENCE = itertools.count()
+
+
+class TrialCandidateCounters(Base):
+    """Per-trial candidate counters shown on the Talent Partner trial list.
+
+    Adjusted by +1/-1 deltas in the writing transaction whenever a candidate
+    session is invited, started, completed or removed, or a Winoe Report is
+    added or removed; the reconciliation job repairs any drift.
+    """
+
+    __tablename__ = "trial_candidate_counters"
+
+    trial_id: Mapped[int] = mapped_column(
+        ForeignKey("trials.id", ondelete="CASCADE"), primary_key=True
+    )
+    invited_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    started_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    completed_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    report_ready_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class CandidateCounterDelta:
+    """One row's change to a trial's candidate counters.
+
+    Winoe Reports only know their candidate session, so their ``trial_id`` is
+    resolved when the delta is applied. ``sequence`` keeps equal changes of
+    different rows apart in the pending key set.
+    """
+
+    trial_id: int | None
+    candidate_session_id: int | None = None
+    invited_count: int = 0
+    started_count: int = 0
+    completed_count: int = 0
+    report_ready_count: int = 0
+    sequence: int = field(default_factory=lambda: next(_DELTA_SEQUENCE))
+
+
+def _session_delta(values: dict[str, Any], *, sign: int) -> CandidateCounterDelta:
+    return CandidateCounterDelta(
+        trial_id=values["trial_id"],
+        candidate_session_id=values.get("id"),
+        invited_count=sign,
+        started_count=sign if values["started_at"] is not None else 0,
+        completed_count=sign if values["completed_at"] is not None else 0,
+    )
+
+
+def _report_delta(candidate_session_id: Any, *, sign: int) -> tuple[Any, ...]:
+    if candidate_session_id in (None, _UNKNOWN):
+        return ()
+    return (
+        CandidateCounterDelta(
+            trial_id=None,
+            candidate_session_id=candidate_session_id,
+            report_ready_count=sign,
+        ),
+    )
+
+
+def _committed_value(state: Any, name: str) -> Any:
+    history = state.attrs[name].history
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    # Overwritten (or never read) since it was loaded: the old value is gone.
+    return _UNKNOWN
+
+
+def _current_value(state: Any, name: str) -> Any:
+    history = state.attrs[name].history
+    if history.added:
+        return history.added[0]
+    return _committed_value(state, name)
+
+
+def _orm_change(row: Any, names: tuple[str, ...]) -> tuple[Any, Any] | None:
+    """Return the ``(before, after)`` values of ``names`` for a flushed object.
+
+    ``before`` is ``None`` for inserts and ``after`` for deletes; returns
+    ``None`` when an update left every column in ``names`` untouched.
+    """
+    state = inspect(row)
+    if state.key is None:
+        return None, {name: state.dict.get(name) for name in ("id", *names)}
+    row_id = state.identity[0] if state.identity else None
+    before = {"id": row_id} | {name: _committed_value(state, name) for name in names}
+    if state.session is not None and row in state.session.deleted:
+        return before, None
+    if not any(state.attrs[name].history.has_changes() for name in names):
+        return None
+    return before, {"id": row_id} | {
+        name: _current_value(state, name) for name in names
+    }
+
+
+def _session_keys(row: Any) -> tuple[Any, ...]:
+    if isinstance(row, Base):
+        change = _orm_change(row, _SESSION_COLUMNS)
+        if change is None:
+            return ()
+        before, after = change
+    else:
+        # Core rows are reported by bulk inserts.
+        before = None
+        after = {name: row_value(row, name) for name in ("id", *_SESSION_COLUMNS)}
+    changes = [
+        (values, sign)
+        for values, sign in ((before, -1), (after, 1))
+        if values is not None
+    ]
+    if any(value is _UNKNOWN for values, _ in changes for value in values.values()):
+        # An old value was never loaded; recount the trial instead.
+        return tuple(
+            values["trial_id"]
+            for values, _ in changes
+            if values["trial_id"] not in (None, _UNKNOWN)
+        )
+    return tuple(
+        _session_delta(values, sign=sign)
+        for values, sign in changes
+        if values["trial_id"] is not None
+    )
+
+
+def _report_keys(row: Any) -> tuple[Any, ...]:
+    if not isinstance(row, Base):
+        return _report_delta(row_value(row, "candidate_session_id"), sign=1)
+    change = _orm_change(row, ("candidate_session_id",))
+    if change is None:
+        return ()
+    before, after = change
+    return (
+        *(_report_delta(before["candidate_session_id"], sign=-1) if before else ()),
+        *(_report_delta(after["candidate_session_id"], sign=1) if after else ()),
+    )
+
+
+def _counter_keys_for(table_name: str, row: Any) -> tuple[Any, ...]:
+    # Keys are CandidateCounterDelta changes, or a trial id to recount when a
+    # change cannot be expressed as a delta.
+    if table_name == "candidate_sessions":
+        return _session_keys(row)
+    return _report_keys(row)
+
+
+def _refresh(connection: Any, keys: set[Any]) -> None:
+    from app.trials.services.trials_services_trials_candidate_counters_service import (
+        apply_trial_candidate_counter_changes,
+    )
+
+    apply_trial_candidate_counter_changes(connection, keys)
+
+
+register_read_model(
+    ReadModel(
+        name=CANDIDATE_COUNTERS_READ_MODEL,
+        tables=frozenset({"candidate_sessions", "winoe_reports"}),
+        keys_for=_counter_keys_for,
+        refresh=_refresh,
+    )
+)
+
+__all__ = [
+    "CANDIDATE_COUNTERS_READ_MODEL",
+    "CandidateCounterDelta",
+    "TrialCandidateCounters",
+]
@@ -6,8 +6,8 @@ from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.shared.database.shared_database_models_model import (
-    CandidateSession,
     Trial,
+    TrialCandidateCounters,
 )
 from app.trials.repositories.trials_repositories_trials_trial_model import (
     TRIAL_STATUS_TERMINATED,
@@ -17,31 +17,27 @@ from app.trials.repositories.trials_repositories_trials_trial_model import (
 async def list_with_candidate_counts(
     db: AsyncSession, user_id: int, *, include_terminated: bool = False
 ):
-    """List trials owned by user with candidate counts."""
-    counts_subq = (
-        select(
-            CandidateSession.trial_id.label("trial_id"),
-            func.count(func.distinct(CandidateSession.id)).label("num_candidates"),
-        )
-        .join(Trial, Trial.id == CandidateSession.trial_id)
-        .where(Trial.created_by == user_id)
-        .group_by(CandidateSession.trial_id)
-    )
-    if not include_terminated:
-        counts_subq = counts_subq.where(
-            or_(
-                Trial.status.is_(None),
-                Trial.status != TRIAL_STATUS_TERMINATED,
-            )
-        )
-    counts_subq = counts_subq.subquery()
+    """List trials owned by user with candidate counts.
 
+    Counts come from ``trial_candidate_counters`` (one row per trial, joined
+    on its primary key), so the list is a single scan of the owner's trials.
+    Rows are ``(trial, invited, started, completed, report_ready)``.
+    """
     stmt = (
         select(
             Trial,
-            func.coalesce(counts_subq.c.num_candidates, 0).label("num_candidates"),
+            func.coalesce(TrialCandidateCounters.invited_count, 0).label(
+                "num_candidates"
+            ),
+            func.coalesce(TrialCandidateCounters.started_count, 0).label("num_started"),
+            func.coalesce(TrialCandidateCounters.completed_count, 0).label(
+                "num_completed"
+            ),
+            func.coalesce(TrialCandidateCounters.report_ready_count, 0).label(
+                "num_report_ready"
+            ),
         )
-        .outerjoin(counts_subq, counts_subq.c.trial_id == Trial.id)
+        .outerjoin(TrialCandidateCounters, TrialCandidateCounters.trial_id == Trial.id)
         .where(Trial.created_by == user_id)
         .order_by(Trial.created_at.desc())
     )
@@ -8,6 +8,7 @@ from sqlalchemy import (
     CheckConstraint,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -53,6 +54,7 @@ class Trial(Base, TimestampMixin):
             _active_scenario_required_expr(),
             name=TRIAL_ACTIVE_SCENARIO_REQUIRED_CHECK_NAME,
         ),
+        Index("ix_trials_created_by_created_at", "created_by", "created_at"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
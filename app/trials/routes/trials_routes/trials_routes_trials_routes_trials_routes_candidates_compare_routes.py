@@ -11,7 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.shared.auth.shared_auth_current_user_utils import get_current_user
 from app.shared.auth.shared_auth_roles_utils import ensure_talent_partner
-from app.shared.database import get_session
+from app.shared.database import get_read_session
 from app.shared.database.shared_database_models_model import User
 from app.trials import services as trial_service
 from app.trials.schemas.trials_schemas_trials_compare_schema import (
@@ -39,7 +39,7 @@ logger = logging.getLogger(__name__)
 )
 async def list_trial_candidates_compare(
     trial_id: Annotated[int, Path(..., ge=1)],
-    db: Annotated[AsyncSession, Depends(get_session)],
+    db: Annotated[AsyncSession, Depends(get_read_session)],
     user: Annotated[User, Depends(get_current_user)],
 ) -> TrialCandidatesCompareResponse:
     """Return trial candidates compare."""
@@ -2,41 +2,141 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Any
+from collections.abc import AsyncIterator
+from typing import Annotated, Any, Literal
 
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.candidates.schemas.candidates_schemas_candidates_candidate_sessions_core_schema import (
     CandidateSessionListItem,
 )
 from app.shared.auth.shared_auth_current_user_utils import get_current_user
 from app.shared.auth.shared_auth_roles_utils import ensure_talent_partner_or_none
-from app.shared.database import get_session
+from app.shared.database import get_read_session
 from app.shared.types.shared_types_progress_model import ProgressSummary
 from app.trials import services as trial_service
 from app.trials.services.trials_services_trials_candidates_compare_day_completion_service import (
     load_day_completion,
 )
+from app.trials.services.trials_services_trials_listing_service import (
+    CANDIDATES_PAGE_SIZE_DEFAULT,
+    CANDIDATES_PAGE_SIZE_MAX,
+)
 from app.trials.services.trials_services_trials_urls_service import (
     invite_url,
 )
 
 router = APIRouter()
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def _load_day_completion(db, trial_id: int, rows) -> dict[int, dict[str, bool]]:
+    session_ids = [cs.id for cs, _ in rows]
+    if not session_ids or not hasattr(db, "execute"):
+        return {}
+    day_completion_by_session, _ = await load_day_completion(
+        db,
+        trial_id=trial_id,
+        candidate_session_ids=session_ids,
+    )
+    return day_completion_by_session
+
+
+def _candidate_list_item(
+    cs, profile_id: int | None, day_completion: dict[str, bool]
+) -> CandidateSessionListItem:
+    return CandidateSessionListItem(
+        candidateSessionId=cs.id,
+        inviteEmail=cs.invite_email,
+        candidateName=cs.candidate_name,
+        githubUsername=getattr(cs, "github_username", None),
+        status=cs.status,
+        startedAt=cs.started_at,
+        completedAt=cs.completed_at,
+        hasWinoeReport=(profile_id is not None),
+        hasReport=(profile_id is not None),
+        reportReady=(profile_id is not None),
+        reportId=str(profile_id) if profile_id is not None else None,
+        dayProgress=ProgressSummary(
+            completed=sum(1 for completed in day_completion.values() if completed),
+            total=len(day_completion) or 5,
+        ),
+        inviteToken=(token := getattr(cs, "token", None)),
+        inviteUrl=invite_url(token) if token else None,
+        inviteEmailStatus=getattr(cs, "invite_email_status", None),
+        inviteEmailSentAt=getattr(cs, "invite_email_sent_at", None),
+        inviteEmailError=getattr(cs, "invite_email_error", None),
+    )
+
+
+def _stream_session_maker(db: AsyncSession) -> async_sessionmaker:
+    # Dependencies with ``yield`` are closed before a streaming body is sent,
+    # so the stream opens its own session on the request session's engine.
+    return async_sessionmaker(
+        bind=db.bind,
+        class_=type(db),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+async def _stream_candidates(
+    session_maker: async_sessionmaker, trial_id: int, filters: dict[str, Any]
+) -> AsyncIterator[str]:
+    async with session_maker() as stream_db:
+        async for rows in trial_service.stream_candidates_with_profile(
+            stream_db, trial_id, **filters
+        ):
+            day_completion = await _load_day_completion(stream_db, trial_id, rows)
+            yield "".join(
+                _candidate_list_item(
+                    cs, profile_id, day_completion.get(cs.id, {})
+                ).model_dump_json(by_alias=True)
+                + "\n"
+                for cs, profile_id in rows
+            )
+
 
 @router.get(
     "/{trial_id}/candidates",
     response_model=list[CandidateSessionListItem],
     status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {NDJSON_MEDIA_TYPE: {}},
+            "description": (
+                "Every matching candidate, or one page when limit or cursor "
+                f"is sent; the next page's cursor is then in the "
+                f"{NEXT_CURSOR_HEADER} header. With format=ndjson, every "
+                "matching candidate as one JSON object per line."
+            ),
+        }
+    },
 )
 async def list_trial_candidates(
     trial_id: int,
-    db: Annotated[AsyncSession, Depends(get_session)],
+    db: Annotated[AsyncSession, Depends(get_read_session)],
     user: Annotated[Any, Depends(get_current_user)],
+    response: Response = None,
     includeTerminated: bool = False,
+    status_filter: Annotated[str | None, Query(alias="status")] = None,
+    inviteEmailStatus: Annotated[str | None, Query()] = None,
+    hasReport: Annotated[bool | None, Query()] = None,
+    limit: Annotated[int | None, Query(ge=1, le=CANDIDATES_PAGE_SIZE_MAX)] = None,
+    cursor: Annotated[
+        str | None, Query(description=f"{NEXT_CURSOR_HEADER} from the previous page.")
+    ] = None,
+    output_format: Annotated[Literal["json", "ndjson"], Query(alias="format")] = "json",
 ):
-    """List Candidate Trials for a trial (Talent Partner-only)."""
+    """List Candidate Trials for a trial (Talent Partner-only).
+
+    Newest first. Without ``limit`` or ``cursor`` every match is returned;
+    with either, one page at a time. ``format=ndjson`` streams every match.
+    """
     ensure_talent_partner_or_none(user)
     await trial_service.require_owned_trial(
         db,
@@ -44,41 +144,48 @@ async def list_trial_candidates(
         user.id,
         include_terminated=includeTerminated,
     )
-    rows = await trial_service.list_candidates_with_profile(db, trial_id)
-    session_ids = [cs.id for cs, _ in rows]
-    day_completion_by_session: dict[int, dict[str, bool]] = {}
-    if session_ids and hasattr(db, "execute"):
-        day_completion_by_session, _ = await load_day_completion(
-            db,
-            trial_id=trial_id,
-            candidate_session_ids=session_ids,
+    filters = {
+        "status": status_filter,
+        "invite_email_status": inviteEmailStatus,
+        "has_report": hasReport,
+    }
+    if output_format == "ndjson":
+        return StreamingResponse(
+            _stream_candidates(_stream_session_maker(db), trial_id, filters),
+            media_type=NDJSON_MEDIA_TYPE,
         )
-    return [
-        CandidateSessionListItem(
-            candidateSessionId=cs.id,
-            inviteEmail=cs.invite_email,
-            candidateName=cs.candidate_name,
-            githubUsername=getattr(cs, "github_username", None),
-            status=cs.status,
-            startedAt=cs.started_at,
-            completedAt=cs.completed_at,
-            hasWinoeReport=(profile_id is not None),
-            hasReport=(profile_id is not None),
-            reportReady=(profile_id is not None),
-            reportId=str(profile_id) if profile_id is not None else None,
-            dayProgress=ProgressSummary(
-                completed=sum(
-                    1
-                    for completed in day_completion_by_session.get(cs.id, {}).values()
-                    if completed
-                ),
-                total=len(day_completion_by_session.get(cs.id, {})) or 5,
-            ),
-            inviteToken=(token := getattr(cs, "token", None)),
-            inviteUrl=invite_url(token) if token else None,
-            inviteEmailStatus=getattr(cs, "invite_email_status", None),
-            inviteEmailSentAt=getattr(cs, "invite_email_sent_at", None),
-            inviteEmailError=getattr(cs, "invite_email_error", None),
+    if limit is None and cursor is None:
+        # Callers that never opted into paging keep the full list.
+        rows = await trial_service.list_candidates_with_profile(db, trial_id, **filters)
+        day_completion_by_session = await _load_day_completion(db, trial_id, rows)
+        return [
+            _candidate_list_item(
+                cs, profile_id, day_completion_by_session.get(cs.id, {})
+            )
+            for cs, profile_id in rows
+        ]
+    after_id = None
+    if cursor:
+        try:
+            after_id = trial_service.decode_candidates_cursor(cursor)
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            ) from exc
+    page_size = limit or CANDIDATES_PAGE_SIZE_DEFAULT
+    rows = list(
+        await trial_service.list_candidates_with_profile(
+            db, trial_id, **filters, after_id=after_id, limit=page_size + 1
         )
+    )
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        if response is not None:
+            response.headers[NEXT_CURSOR_HEADER] = (
+                trial_service.encode_candidates_cursor(rows[-1][0].id)
+            )
+    day_completion_by_session = await _load_day_completion(db, trial_id, rows)
+    return [
+        _candidate_list_item(cs, profile_id, day_completion_by_session.get(cs.id, {}))
         for cs, profile_id in rows
     ]
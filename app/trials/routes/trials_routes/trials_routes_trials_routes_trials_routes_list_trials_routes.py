@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.shared.auth.shared_auth_current_user_utils import get_current_user
 from app.shared.auth.shared_auth_roles_utils import ensure_talent_partner_or_none
-from app.shared.database import get_session
+from app.shared.database import get_read_session
 from app.trials import services as trial_service
 from app.trials.schemas.trials_schemas_trials_core_schema import (
     TrialListItem,
@@ -21,9 +21,18 @@ from app.trials.schemas.trials_schemas_trials_core_schema import (
 router = APIRouter(prefix="/trials")
 
 
+def _progress_counts(progress: list[int]) -> dict[str, int]:
+    started, completed, report_ready = [*progress, 0, 0, 0][:3]
+    return {
+        "numStarted": int(started),
+        "numCompleted": int(completed),
+        "numReportReady": int(report_ready),
+    }
+
+
 @router.get("", response_model=list[TrialListItem], status_code=status.HTTP_200_OK)
 async def list_trials(
-    db: Annotated[AsyncSession, Depends(get_session)],
+    db: Annotated[AsyncSession, Depends(get_read_session)],
     user: Annotated[Any, Depends(get_current_user)],
     includeTerminated: bool = False,
 ):
@@ -55,6 +64,7 @@ async def list_trials(
             terminatedAt=getattr(sim, "terminated_at", None),
             createdAt=sim.created_at,
             numCandidates=int(num_candidates),
+            **_progress_counts(progress),
         )
-        for sim, num_candidates in rows
+        for sim, num_candidates, *progress in rows
     ]
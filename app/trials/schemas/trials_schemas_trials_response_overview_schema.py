@@ -53,6 +53,9 @@ class TrialListItem(BaseModel):
     terminatedAt: datetime | None = None
     createdAt: datetime
     numCandidates: int
+    numStarted: int = 0
+    numCompleted: int = 0
+    numReportReady: int = 0
 
 
 __all__ = ["TrialCreateResponse", "TrialListItem"]
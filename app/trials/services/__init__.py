@@ -143,6 +143,18 @@ _SYMBOL_ALIASES: dict[str, tuple[str, str]] = {
         "app.trials.services.trials_services_trials_listing_service",
         "list_candidates_with_profile",
     ),
+    "stream_candidates_with_profile": (
+        "app.trials.services.trials_services_trials_listing_service",
+        "stream_candidates_with_profile",
+    ),
+    "encode_candidates_cursor": (
+        "app.trials.services.trials_services_trials_listing_service",
+        "encode_candidates_cursor",
+    ),
+    "decode_candidates_cursor": (
+        "app.trials.services.trials_services_trials_listing_service",
+        "decode_candidates_cursor",
+    ),
     "list_candidates_compare_summary": (
         "app.trials.services.trials_services_trials_candidates_compare_service",
         "list_candidates_compare_summary",
@@ -0,0 +1,63 @@
+"""Application module for trials services trials candidate counters jobs service workflows."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.database.shared_database_models_model import Job
+from app.shared.jobs.repositories import repository as jobs_repo
+from app.trials.services.trials_services_trials_candidate_counters_service import (
+    RECONCILE_BATCH_SIZE,
+)
+
+TRIAL_CANDIDATE_COUNTERS_RECONCILE_JOB_TYPE = "trial_candidate_counters_reconcile"
+TRIAL_CANDIDATE_COUNTERS_RECONCILE_MAX_ATTEMPTS = 3
+
+
+def trial_candidate_counters_reconcile_idempotency_key(
+    company_id: int, *, now: datetime | None = None
+) -> str:
+    """Return the once-a-day idempotency key for a company's reconciliation."""
+    day = (now or datetime.now(UTC)).date().isoformat()
+    return f"trial_candidate_counters_reconcile:{company_id}:{day}"
+
+
+def build_trial_candidate_counters_reconcile_payload(
+    company_id: int, *, batch_size: int = RECONCILE_BATCH_SIZE
+) -> dict[str, Any]:
+    """Build trial candidate counters reconcile payload."""
+    return {"companyId": company_id, "batchSize": max(1, int(batch_size))}
+
+
+async def enqueue_trial_candidate_counters_reconcile_job(
+    db: AsyncSession,
+    *,
+    company_id: int,
+    now: datetime | None = None,
+    commit: bool = False,
+) -> Job:
+    """Enqueue (at most daily) counter reconciliation for a company's trials."""
+    return await jobs_repo.create_or_get_idempotent(
+        db,
+        job_type=TRIAL_CANDIDATE_COUNTERS_RECONCILE_JOB_TYPE,
+        idempotency_key=trial_candidate_counters_reconcile_idempotency_key(
+            company_id, now=now
+        ),
+        payload_json=build_trial_candidate_counters_reconcile_payload(company_id),
+        company_id=company_id,
+        max_attempts=TRIAL_CANDIDATE_COUNTERS_RECONCILE_MAX_ATTEMPTS,
+        correlation_id=f"company:{company_id}:trial_candidate_counters",
+        commit=commit,
+    )
+
+
+__all__ = [
+    "TRIAL_CANDIDATE_COUNTERS_RECONCILE_JOB_TYPE",
+    "TRIAL_CANDIDATE_COUNTERS_RECONCILE_MAX_ATTEMPTS",
+    "build_trial_candidate_counters_reconcile_payload",
+    "enqueue_trial_candidate_counters_reconcile_job",
+    "trial_candidate_counters_reconcile_idempotency_key",
+]
@@ -0,0 +1,291 @@
+"""Application module for trials services trials candidate counters service workflows."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.database.shared_database_models_model import (
+    CandidateSession,
+    Trial,
+    TrialCandidateCounters,
+    WinoeReport,
+)
+from app.shared.database.shared_database_read_model_utils import upsert_read_rows
+from app.trials.repositories.trials_repositories_trials_candidate_counters_model import (
+    CandidateCounterDelta,
+)
+
+RECONCILE_BATCH_SIZE = 500
+_COUNTER_COLUMNS = (
+    "invited_count",
+    "started_count",
+    "completed_count",
+    "report_ready_count",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CandidateCountersReconcileResult:
+    """Represent candidate counters reconciliation result data."""
+
+    scanned_count: int
+    repaired_count: int
+    repaired_trial_ids: list[int]
+
+
+def _count_candidates(
+    connection: Connection, trial_ids: list[int]
+) -> dict[int, dict[str, int]]:
+    existing = connection.execute(select(Trial.id).where(Trial.id.in_(trial_ids)))
+    counts = {
+        trial_id: dict.fromkeys(_COUNTER_COLUMNS, 0) for trial_id in existing.scalars()
+    }
+    rows = connection.execute(
+        select(
+            CandidateSession.trial_id,
+            func.count(CandidateSession.id),
+            func.count(CandidateSession.started_at),
+            func.count(CandidateSession.completed_at),
+            func.count(WinoeReport.id),
+        )
+        .outerjoin(WinoeReport, WinoeReport.candidate_session_id == CandidateSession.id)
+        .where(CandidateSession.trial_id.in_(trial_ids))
+        .group_by(CandidateSession.trial_id)
+    )
+    for trial_id, *values in rows:
+        if trial_id in counts:
+            counts[trial_id] = dict(zip(_COUNTER_COLUMNS, values, strict=True))
+    return counts
+
+
+def _write_counters(connection: Connection, counts: dict[int, dict[str, int]]) -> None:
+    refreshed_at = datetime.now(UTC)
+    upsert_read_rows(
+        connection,
+        TrialCandidateCounters.__table__,
+        [
+            {"trial_id": trial_id, **values, "refreshed_at": refreshed_at}
+            for trial_id, values in counts.items()
+        ],
+        key_columns=("trial_id",),
+    )
+
+
+def refresh_trial_candidate_counters(
+    connection: Connection, trial_ids: Iterable[int]
+) -> int:
+    """Recount the candidate counters of ``trial_ids``; returns how many."""
+    ordered = sorted({int(trial_id) for trial_id in trial_ids})
+    for start in range(0, len(ordered), RECONCILE_BATCH_SIZE):
+        batch = ordered[start : start + RECONCILE_BATCH_SIZE]
+        _write_counters(connection, _count_candidates(connection, batch))
+    return len(ordered)
+
+
+def _sum_deltas(
+    connection: Connection, deltas: list[CandidateCounterDelta]
+) -> dict[int, Counter[str]]:
+    session_trials = {
+        delta.candidate_session_id: delta.trial_id
+        for delta in deltas
+        if delta.trial_id is not None and delta.candidate_session_id is not None
+    }
+    unresolved = {
+        delta.candidate_session_id
+        for delta in deltas
+        if delta.trial_id is None and delta.candidate_session_id not in session_trials
+    }
+    if unresolved:
+        session_trials.update(
+            connection.execute(
+                select(CandidateSession.id, CandidateSession.trial_id).where(
+                    CandidateSession.id.in_(sorted(unresolved))
+                )
+            ).all()
+        )
+    totals: dict[int, Counter[str]] = {}
+    for delta in deltas:
+        trial_id = delta.trial_id or session_trials.get(delta.candidate_session_id)
+        if trial_id is None:
+            continue
+        total = totals.setdefault(trial_id, Counter())
+        for name in _COUNTER_COLUMNS:
+            total[name] += getattr(delta, name)
+    return {
+        trial_id: total
+        for trial_id, total in totals.items()
+        if any(total[name] for name in _COUNTER_COLUMNS)
+    }
+
+
+def _insert_missing_counters(
+    connection: Connection, counts: dict[int, dict[str, int]]
+) -> set[int]:
+    if not counts:
+        return set()
+    table = TrialCandidateCounters.__table__
+    refreshed_at = datetime.now(UTC)
+    rows = [
+        {"trial_id": trial_id, **values, "refreshed_at": refreshed_at}
+        for trial_id, values in counts.items()
+    ]
+    if connection.dialect.name not in {"postgresql", "sqlite"}:
+        connection.execute(table.insert(), rows)
+        return set(counts)
+    insert = pg_insert if connection.dialect.name == "postgresql" else sqlite_insert
+    inserted = connection.execute(
+        insert(table)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["trial_id"])
+        .returning(table.c.trial_id)
+    )
+    return set(inserted.scalars())
+
+
+def _increment_counters(
+    connection: Connection, totals: dict[int, Counter[str]]
+) -> None:
+    if not totals:
+        return
+    table = TrialCandidateCounters.__table__
+    stmt = (
+        update(table)
+        .where(table.c.trial_id == bindparam("b_trial_id"))
+        .values(
+            {name: table.c[name] + bindparam(f"b_{name}") for name in _COUNTER_COLUMNS}
+            | {"refreshed_at": bindparam("b_refreshed_at")}
+        )
+    )
+    refreshed_at = datetime.now(UTC)
+    connection.execute(
+        stmt,
+        [
+            {"b_trial_id": trial_id, "b_refreshed_at": refreshed_at}
+            | {f"b_{name}": total[name] for name in _COUNTER_COLUMNS}
+            for trial_id, total in sorted(totals.items())
+        ],
+    )
+
+
+def apply_trial_candidate_counter_changes(
+    connection: Connection, keys: Iterable[Any]
+) -> None:
+    """Apply pending counter changes in the writing transaction.
+
+    ``keys`` are :class:`CandidateCounterDelta` changes, added to the stored
+    counts with ``count = count + delta`` so concurrent writers never wait on
+    each other's recounts, or trial ids to recount outright. A trial without
+    a counters row yet is counted once to create it; if a concurrent
+    transaction creates it first, the deltas are added to that row instead.
+    """
+    recount: set[int] = set()
+    deltas: list[CandidateCounterDelta] = []
+    for key in keys:
+        if isinstance(key, CandidateCounterDelta):
+            deltas.append(key)
+        else:
+            recount.add(int(key))
+    if recount:
+        refresh_trial_candidate_counters(connection, recount)
+    totals = {
+        trial_id: total
+        for trial_id, total in _sum_deltas(connection, deltas).items()
+        if trial_id not in recount
+    }
+    if not totals:
+        return
+    stored = set(
+        connection.execute(
+            select(TrialCandidateCounters.trial_id).where(
+                TrialCandidateCounters.trial_id.in_(sorted(totals))
+            )
+        ).scalars()
+    )
+    missing = sorted(set(totals) - stored)
+    if missing:
+        created = _insert_missing_counters(
+            connection, _count_candidates(connection, missing)
+        )
+        for trial_id in created:
+            totals.pop(trial_id)
+    _increment_counters(connection, totals)
+
+
+def _reconcile_batch(connection: Connection, trial_ids: list[int]) -> list[int]:
+    counts = _count_candidates(connection, trial_ids)
+    stored = {
+        row.trial_id: {name: getattr(row, name) for name in _COUNTER_COLUMNS}
+        for row in connection.execute(
+            select(TrialCandidateCounters).where(
+                TrialCandidateCounters.trial_id.in_(trial_ids)
+            )
+        )
+    }
+    drifted = {
+        trial_id: values
+        for trial_id, values in counts.items()
+        if stored.get(trial_id) != values
+    }
+    if drifted:
+        _write_counters(connection, drifted)
+    return sorted(drifted)
+
+
+async def reconcile_trial_candidate_counters(
+    db: AsyncSession,
+    *,
+    company_id: int | None = None,
+    batch_size: int = RECONCILE_BATCH_SIZE,
+) -> CandidateCountersReconcileResult:
+    """Recount every trial (of one company, if given) and repair drift.
+
+    Commits after each batch so a large tenant does not hold one long
+    transaction.
+    """
+    scanned = 0
+    repaired: list[int] = []
+    last_id = 0
+    while True:
+        stmt = (
+            select(Trial.id)
+            .where(Trial.id > last_id)
+            .order_by(Trial.id)
+            .limit(max(1, batch_size))
+        )
+        if company_id is not None:
+            stmt = stmt.where(Trial.company_id == company_id)
+        trial_ids = list((await db.execute(stmt)).scalars())
+        if not trial_ids:
+            break
+
+        def _run(sync_session, batch: list[int] = trial_ids) -> list[int]:
+            return _reconcile_batch(sync_session.connection(), batch)
+
+        repaired.extend(await db.run_sync(_run))
+        await db.commit()
+        scanned += len(trial_ids)
+        last_id = trial_ids[-1]
+    return CandidateCountersReconcileResult(
+        scanned_count=scanned,
+        repaired_count=len(repaired),
+        repaired_trial_ids=repaired,
+    )
+
+
+__all__ = [
+    "RECONCILE_BATCH_SIZE",
+    "CandidateCountersReconcileResult",
+    "apply_trial_candidate_counter_changes",
+    "reconcile_trial_candidate_counters",
+    "refresh_trial_candidate_counters",
+]
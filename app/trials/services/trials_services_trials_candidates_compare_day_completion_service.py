@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any
 
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,21 +24,10 @@ from app.trials.services.trials_services_trials_candidates_compare_time_service
 )
 
 
-async def load_day_completion(
-    db: AsyncSession,
-    *,
-    trial_id: int,
-    candidate_session_ids: list[int],
-) -> tuple[dict[int, dict[str, bool]], dict[int, datetime | None]]:
-    """Load day completion."""
-    completion_by_session = {
-        session_id: default_day_completion() for session_id in candidate_session_ids
-    }
-    latest_submission_by_session: dict[int, datetime | None] = {
-        session_id: None for session_id in candidate_session_ids
-    }
-    if not candidate_session_ids:
-        return completion_by_session, latest_submission_by_session
+def day_completion_stmt(
+    *, candidate_session_ids: list[int], trial_id: int | None = None
+) -> Any:
+    """Return per-session, per-day task and submission counts."""
     stmt = (
         select(
             CandidateSession.id.label("candidate_session_id"),
@@ -56,13 +46,27 @@ async def load_day_completion(
             ),
         )
         .where(
-            Trial.id == trial_id,
             CandidateSession.id.in_(candidate_session_ids),
             Task.day_index.in_(COMPARE_DAYS),
         )
         .group_by(CandidateSession.id, Task.day_index)
     )
-    for row in (await db.execute(stmt)).all():
+    if trial_id is not None:
+        stmt = stmt.where(Trial.id == trial_id)
+    return stmt
+
+
+def fold_day_completion(
+    rows: Any, *, candidate_session_ids: list[int]
+) -> tuple[dict[int, dict[str, bool]], dict[int, datetime | None]]:
+    """Fold ``day_completion_stmt`` rows into per-session completion maps."""
+    completion_by_session = {
+        session_id: default_day_completion() for session_id in candidate_session_ids
+    }
+    latest_submission_by_session: dict[int, datetime | None] = {
+        session_id: None for session_id in candidate_session_ids
+    }
+    for row in rows:
         session_id = int(row.candidate_session_id)
         day_key = str(int(row.day_index))
         if day_key not in completion_by_session[session_id]:
@@ -82,4 +86,21 @@ async def load_day_completion(
     return completion_by_session, latest_submission_by_session
 
 
-__all__ = ["load_day_completion"]
+async def load_day_completion(
+    db: AsyncSession,
+    *,
+    trial_id: int,
+    candidate_session_ids: list[int],
+) -> tuple[dict[int, dict[str, bool]], dict[int, datetime | None]]:
+    """Load day completion."""
+    if not candidate_session_ids:
+        return fold_day_completion([], candidate_session_ids=candidate_session_ids)
+    stmt = day_completion_stmt(
+        candidate_session_ids=candidate_session_ids, trial_id=trial_id
+    )
+    return fold_day_completion(
+        (await db.execute(stmt)).all(), candidate_session_ids=candidate_session_ids
+    )
+
+
+__all__ = ["day_completion_stmt", "fold_day_completion", "load_day_completion"]
@@ -34,7 +34,9 @@ def _candidate_session_timestamp_columns() -> tuple[Any, Any]:
     return created_at, updated_at
 
 
-def candidate_compare_rows_stmt(*, trial_id: int) -> Any:
+def candidate_compare_rows_stmt(
+    *, trial_id: int | None = None, candidate_session_ids: list[int] | None = None
+) -> Any:
     """Execute candidate compare rows stmt."""
     latest_run_any = latest_run_subquery(completed_only=False)
     latest_run_success = latest_run_subquery(completed_only=True)
@@ -43,9 +45,10 @@ def candidate_compare_rows_stmt(*, trial_id: int) -> Any:
         candidate_session_updated_at,
     ) = _candidate_session_timestamp_columns()
     active_job = active_job_subquery()
-    return (
+    stmt = (
         select(
             CandidateSession.id.label("candidate_session_id"),
+            CandidateSession.trial_id.label("trial_id"),
             CandidateSession.candidate_name.label("candidate_name"),
             CandidateSession.status.label("candidate_session_status"),
             CandidateSession.claimed_at.label("claimed_at"),
@@ -83,9 +86,13 @@ def candidate_compare_rows_stmt(*, trial_id: int) -> Any:
             latest_run_success.c.candidate_session_id == CandidateSession.id,
         )
         .outerjoin(active_job, active_job.c.candidate_session_id == CandidateSession.id)
-        .where(CandidateSession.trial_id == trial_id)
         .order_by(CandidateSession.id.asc())
     )
+    if trial_id is not None:
+        stmt = stmt.where(CandidateSession.trial_id == trial_id)
+    if candidate_session_ids is not None:
+        stmt = stmt.where(CandidateSession.id.in_(candidate_session_ids))
+    return stmt
 
 
 async def fetch_candidate_compare_rows(db: AsyncSession, *, trial_id: int) -> list[Any]:
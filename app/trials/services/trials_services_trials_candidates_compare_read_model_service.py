@@ -0,0 +1,182 @@
+"""Application module for trials services trials candidates compare read model service workflows."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import delete, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.database.shared_database_models_model import (
+    CandidateCompareSummary,
+    CandidateSession,
+    User,
+)
+from app.shared.database.shared_database_read_model_utils import upsert_read_rows
+from app.trials.services.trials_services_trials_candidates_compare_access_service import (
+    require_trial_compare_access,
+)
+from app.trials.services.trials_services_trials_candidates_compare_day_completion_service import (
+    day_completion_stmt,
+    fold_day_completion,
+)
+from app.trials.services.trials_services_trials_candidates_compare_queries_service import (
+    candidate_compare_rows_stmt,
+)
+from app.trials.services.trials_services_trials_candidates_compare_summary_service import (
+    RequireAccess,
+    build_cohort_state,
+    compare_summary_values,
+    present_compare_candidate,
+)
+
+REFRESH_BATCH_SIZE = 500
+_UPSERT_COLUMNS = (
+    "trial_id",
+    "candidate_name",
+    "status",
+    "winoe_report_status",
+    "overall_winoe_score",
+    "recommendation",
+    "day_completion",
+    "activity_at",
+    "refreshed_at",
+)
+
+
+def _expand_keys(connection: Connection, keys: Iterable[Any]) -> list[int]:
+    session_ids: set[int] = set()
+    trial_ids: set[int] = set()
+    for key in keys:
+        if isinstance(key, tuple):
+            trial_ids.add(int(key[1]))
+        elif key is not None:
+            session_ids.add(int(key))
+    if trial_ids:
+        session_ids.update(
+            connection.execute(
+                select(CandidateSession.id).where(
+                    CandidateSession.trial_id.in_(sorted(trial_ids))
+                )
+            ).scalars()
+        )
+    return sorted(session_ids)
+
+
+def _refresh_batch(connection: Connection, session_ids: list[int]) -> None:
+    compare_rows = connection.execute(
+        candidate_compare_rows_stmt(candidate_session_ids=session_ids)
+    ).all()
+    completion, latest_submission = fold_day_completion(
+        connection.execute(
+            day_completion_stmt(candidate_session_ids=session_ids)
+        ).all(),
+        candidate_session_ids=session_ids,
+    )
+    refreshed_at = datetime.now(UTC)
+    table = CandidateCompareSummary.__table__
+    rows = []
+    for row in compare_rows:
+        session_id = int(row.candidate_session_id)
+        values = compare_summary_values(
+            row,
+            day_completion=completion[session_id],
+            latest_submission_at=latest_submission[session_id],
+        )
+        rows.append(
+            {
+                **{key: values[key] for key in _UPSERT_COLUMNS if key in values},
+                "candidate_session_id": session_id,
+                "trial_id": int(row.trial_id),
+                "refreshed_at": refreshed_at,
+            }
+        )
+    upsert_read_rows(connection, table, rows, key_columns=("candidate_session_id",))
+    found = {row["candidate_session_id"] for row in rows}
+    missing = [session_id for session_id in session_ids if session_id not in found]
+    if missing:
+        connection.execute(
+            delete(table).where(table.c.candidate_session_id.in_(missing))
+        )
+
+
+def refresh_compare_summaries(connection: Connection, keys: Iterable[Any]) -> int:
+    """Rebuild the compare summaries for candidate session ids.
+
+    ``keys`` may also hold ``("trial", trial_id)`` to rebuild a whole trial.
+    Runs Core statements on ``connection`` so it works from session events,
+    ``run_sync`` and migrations alike; returns the sessions considered.
+    """
+    session_ids = _expand_keys(connection, keys)
+    for start in range(0, len(session_ids), REFRESH_BATCH_SIZE):
+        _refresh_batch(connection, session_ids[start : start + REFRESH_BATCH_SIZE])
+    return len(session_ids)
+
+
+async def rebuild_trial_compare_summaries(
+    db: AsyncSession, trial_ids: list[int]
+) -> int:
+    """Rebuild every compare summary of the given trials."""
+
+    def _run(sync_session) -> int:
+        return refresh_compare_summaries(
+            sync_session.connection(), {("trial", trial_id) for trial_id in trial_ids}
+        )
+
+    return await db.run_sync(_run)
+
+
+async def list_candidates_compare_summary_from_read_model(
+    db: AsyncSession,
+    *,
+    trial_id: int,
+    user: User,
+    require_access: RequireAccess = require_trial_compare_access,
+) -> dict[str, Any]:
+    """Return the compare summary from ``candidate_compare_summaries``."""
+    access = await require_access(db, trial_id=trial_id, user=user)
+    summaries = (
+        await db.execute(
+            select(CandidateCompareSummary)
+            .where(
+                CandidateCompareSummary.trial_id == trial_id,
+                CandidateCompareSummary.winoe_report_status == "ready",
+            )
+            .order_by(CandidateCompareSummary.candidate_session_id.asc())
+        )
+    ).scalars()
+    candidates = [
+        present_compare_candidate(
+            {
+                "candidate_session_id": summary.candidate_session_id,
+                "candidate_name": summary.candidate_name,
+                "status": summary.status,
+                "winoe_report_status": summary.winoe_report_status,
+                "overall_winoe_score": summary.overall_winoe_score,
+                "recommendation": summary.recommendation,
+                "day_completion": dict(summary.day_completion or {}),
+                "activity_at": summary.activity_at,
+            },
+            index=index,
+        )
+        for index, summary in enumerate(summaries)
+    ]
+    state, message = build_cohort_state(len(candidates))
+    return {
+        "trialId": access.trial_id,
+        "cohortSize": len(candidates),
+        "state": state,
+        "message": message,
+        "candidates": candidates,
+    }
+
+
+__all__ = [
+    "REFRESH_BATCH_SIZE",
+    "list_candidates_compare_summary_from_read_model",
+    "rebuild_trial_compare_summaries",
+    "refresh_compare_summaries",
+]
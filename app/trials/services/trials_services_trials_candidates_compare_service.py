@@ -23,13 +23,13 @@ from app.trials.services.trials_services_trials_candidates_compare_formatting_se
 from app.trials.services.trials_services_trials_candidates_compare_model import (
     TrialCompareAccessContext,
 )
+from app.trials.services.trials_services_trials_candidates_compare_read_model_service import (
+    list_candidates_compare_summary_from_read_model,
+)
 from app.trials.services.trials_services_trials_candidates_compare_status_service import (
     derive_candidate_compare_status,
     derive_winoe_report_status,
 )
-from app.trials.services.trials_services_trials_candidates_compare_summary_service import (
-    list_candidates_compare_summary as _list_candidates_compare_summary_impl,
-)
 from app.trials.services.trials_services_trials_candidates_compare_time_service import (
     candidate_session_created_at as _candidate_session_created_at,
 )
@@ -63,13 +63,12 @@ async def list_candidates_compare_summary(
     trial_id: int,
     user: User,
 ):
-    """Return candidates compare summary."""
-    return await _list_candidates_compare_summary_impl(
+    """Return candidates compare summary from the incrementally kept read model."""
+    return await list_candidates_compare_summary_from_read_model(
         db,
         trial_id=trial_id,
         user=user,
         require_access=require_trial_compare_access,
-        load_day_completion_for_sessions=_load_day_completion,
     )
 
 
@@ -34,6 +34,7 @@ from app.trials.services.trials_services_trials_candidates_compare_time_service
     candidate_session_created_at,
     candidate_session_updated_at,
     default_day_completion,
+    normalize_datetime,
     winoe_report_updated_at,
 )
 
@@ -43,13 +44,13 @@ LoadDayCompletion = Callable[
 ]
 
 
-def _build_candidate_summary(
-    *,
+def compare_summary_values(
     row: Any,
-    index: int,
+    *,
     day_completion: dict[str, bool],
     latest_submission_at: datetime | None,
 ) -> dict[str, Any]:
+    """Derive the stored compare fields for one candidate compare row."""
     winoe_report_status = derive_winoe_report_status(
         has_ready_profile=(
             row.latest_success_candidate_session_id is not None
@@ -65,27 +66,59 @@ def _build_candidate_summary(
         started_at=row.started_at,
         completed_at=row.completed_at,
     )
-    resolved_name = display_name(row.candidate_name, position=index)
-    updated_at = (
-        winoe_report_updated_at(row)
-        or candidate_session_updated_at(row, latest_submission_at=latest_submission_at)
-        or candidate_session_created_at(row)
-        or datetime.now(UTC).replace(microsecond=0)
-    )
     return {
-        "candidateSessionId": int(row.candidate_session_id),
+        "candidate_session_id": int(row.candidate_session_id),
+        "candidate_name": row.candidate_name,
+        "status": candidate_status,
+        "winoe_report_status": winoe_report_status,
+        "overall_winoe_score": row.overall_winoe_score,
+        "recommendation": row.recommendation,
+        "day_completion": day_completion,
+        "activity_at": (
+            winoe_report_updated_at(row)
+            or candidate_session_updated_at(
+                row, latest_submission_at=latest_submission_at
+            )
+            or candidate_session_created_at(row)
+        ),
+    }
+
+
+def present_compare_candidate(values: Any, *, index: int) -> dict[str, Any]:
+    """Return the API payload for one stored or derived compare summary."""
+    resolved_name = display_name(values["candidate_name"], position=index)
+    return {
+        "candidateSessionId": int(values["candidate_session_id"]),
         "candidateName": resolved_name,
         "candidateDisplayName": resolved_name,
-        "status": candidate_status,
-        "winoeReportStatus": winoe_report_status,
-        "overallWinoeScore": normalize_score(row.overall_winoe_score),
-        "recommendation": normalize_recommendation(row.recommendation),
-        "dayCompletion": day_completion,
-        "updatedAt": updated_at,
+        "status": values["status"],
+        "winoeReportStatus": values["winoe_report_status"],
+        "overallWinoeScore": normalize_score(values["overall_winoe_score"]),
+        "recommendation": normalize_recommendation(values["recommendation"]),
+        "dayCompletion": values["day_completion"],
+        "updatedAt": normalize_datetime(values["activity_at"])
+        or datetime.now(UTC).replace(microsecond=0),
     }
 
 
-def _build_cohort_state(cohort_size: int) -> tuple[str, str | None]:
+def _build_candidate_summary(
+    *,
+    row: Any,
+    index: int,
+    day_completion: dict[str, bool],
+    latest_submission_at: datetime | None,
+) -> dict[str, Any]:
+    return present_compare_candidate(
+        compare_summary_values(
+            row,
+            day_completion=day_completion,
+            latest_submission_at=latest_submission_at,
+        ),
+        index=index,
+    )
+
+
+def build_cohort_state(cohort_size: int) -> tuple[str, str | None]:
     if cohort_size == 0:
         return "empty", "No completed Winoe Reports are available for this Trial yet."
     if cohort_size < 3:
@@ -143,7 +176,7 @@ async def list_candidates_compare_summary(
         )
         for index, row in enumerate(ready_rows)
     ]
-    state, message = _build_cohort_state(len(candidates))
+    state, message = build_cohort_state(len(candidates))
     return {
         "trialId": access.trial_id,
         "cohortSize": len(candidates),
@@ -153,4 +186,9 @@ async def list_candidates_compare_summary(
     }
 
 
-__all__ = ["list_candidates_compare_summary"]
+__all__ = [
+    "build_cohort_state",
+    "compare_summary_values",
+    "list_candidates_compare_summary",
+    "present_compare_candidate",
+]
@@ -29,6 +29,9 @@ TRIALS_EXPORTS = [
     "invite_url",
     "lock_active_scenario_for_invites",
     "list_candidates_with_profile",
+    "stream_candidates_with_profile",
+    "encode_candidates_cursor",
+    "decode_candidates_cursor",
     "list_candidates_compare_summary",
     "list_trials",
     "normalize_trial_status",
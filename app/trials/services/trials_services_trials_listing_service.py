@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import load_only
@@ -11,8 +13,16 @@ from app.shared.database.shared_database_models_model import (
     Trial,
     WinoeReport,
 )
+from app.shared.utils.shared_utils_keyset_cursor_utils import (
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+)
 from app.trials.repositories import repository as sim_repo
 
+CANDIDATES_PAGE_SIZE_DEFAULT = 100
+CANDIDATES_PAGE_SIZE_MAX = 500
+CANDIDATES_STREAM_BATCH_SIZE = 500
+
 
 async def list_trials(
     db: AsyncSession, user_id: int, *, include_terminated: bool = False
@@ -23,10 +33,28 @@ async def list_trials(
     )
 
 
-async def list_candidates_with_profile(
-    db: AsyncSession, trial_id: int
-) -> list[tuple[CandidateSession, int | None]]:
-    """Return candidates with profile."""
+def encode_candidates_cursor(candidate_session_id: int) -> str:
+    """Return the cursor for the page after the given (last) candidate."""
+    return encode_keyset_cursor({"i": candidate_session_id})
+
+
+def decode_candidates_cursor(token: str) -> int:
+    """Return the candidate session id from a cursor; raise ``ValueError``."""
+    payload = decode_keyset_cursor(token)
+    try:
+        return int(payload["i"])
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError("malformed cursor") from exc
+
+
+def _candidates_with_profile_stmt(
+    trial_id: int,
+    *,
+    status: str | None,
+    invite_email_status: str | None,
+    has_report: bool | None,
+    after_id: int | None,
+):
     stmt = (
         select(CandidateSession, WinoeReport.id)
         .join(Trial, Trial.id == CandidateSession.trial_id)
@@ -52,4 +80,70 @@ async def list_candidates_with_profile(
         .where(Trial.id == trial_id)
         .order_by(CandidateSession.id.desc())
     )
+    if status is not None:
+        stmt = stmt.where(CandidateSession.status == status)
+    if invite_email_status is not None:
+        stmt = stmt.where(CandidateSession.invite_email_status == invite_email_status)
+    if has_report is True:
+        stmt = stmt.where(WinoeReport.id.is_not(None))
+    elif has_report is False:
+        stmt = stmt.where(WinoeReport.id.is_(None))
+    if after_id is not None:
+        stmt = stmt.where(CandidateSession.id < after_id)
+    return stmt
+
+
+async def list_candidates_with_profile(
+    db: AsyncSession,
+    trial_id: int,
+    *,
+    status: str | None = None,
+    invite_email_status: str | None = None,
+    has_report: bool | None = None,
+    after_id: int | None = None,
+    limit: int | None = None,
+) -> list[tuple[CandidateSession, int | None]]:
+    """Return candidates with profile, newest first.
+
+    ``after_id`` is the last candidate session id of the previous page
+    (keyset pagination); without ``limit`` every matching row is returned.
+    """
+    stmt = _candidates_with_profile_stmt(
+        trial_id,
+        status=status,
+        invite_email_status=invite_email_status,
+        has_report=has_report,
+        after_id=after_id,
+    )
+    if limit is not None:
+        stmt = stmt.limit(limit)
     return (await db.execute(stmt)).all()
+
+
+async def stream_candidates_with_profile(
+    db: AsyncSession,
+    trial_id: int,
+    *,
+    status: str | None = None,
+    invite_email_status: str | None = None,
+    has_report: bool | None = None,
+    batch_size: int = CANDIDATES_STREAM_BATCH_SIZE,
+) -> AsyncIterator[list[tuple[CandidateSession, int | None]]]:
+    """Yield candidates with profile in batches from a server-side cursor.
+
+    The session's connection stays checked out until the iterator finishes,
+    so the caller should own a session dedicated to the stream.
+    """
+    stmt = _candidates_with_profile_stmt(
+        trial_id,
+        status=status,
+        invite_email_status=invite_email_status,
+        has_report=has_report,
+        after_id=None,
+    ).execution_options(yield_per=batch_size)
+    result = await db.stream(stmt)
+    try:
+        async for partition in result.partitions(batch_size):
+            yield [tuple(row) for row in partition]
+    finally:
+        await result.close()
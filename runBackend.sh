@@ -136,6 +136,7 @@ run_worker() {
   require_database_config
 
   log_info "Starting Winoe worker."
+  export WINOE_PROCESS_ROLE=worker
   exec "${RUN_PREFIX[@]}" python -m app.shared.jobs.shared_jobs_worker_cli_service worker
 }
 
@@ -165,6 +166,7 @@ run_dead_letter_retry() {
   require_database_config
 
   log_info "Retrying dead-letter Winoe jobs."
+  export WINOE_PROCESS_ROLE=worker
   exec "${RUN_PREFIX[@]}" python -m app.shared.jobs.shared_jobs_worker_cli_service retry-dead-jobs "$@"
 }
 
@@ -197,7 +199,7 @@ run_supervised_local_runtime() {
   fi
   api_pid="$!"
 
-  "${RUN_PREFIX[@]}" python -m app.shared.jobs.shared_jobs_worker_cli_service worker &
+  WINOE_PROCESS_ROLE=worker "${RUN_PREFIX[@]}" python -m app.shared.jobs.shared_jobs_worker_cli_service worker &
   worker_pid="$!"
 
   RUNNING_PIDS=("$api_pid" "$worker_pid")
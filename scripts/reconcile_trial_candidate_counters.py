@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from app.shared.database import async_session_maker
+from app.trials.services.trials_services_trials_candidate_counters_service import (
+    RECONCILE_BATCH_SIZE,
+    reconcile_trial_candidate_counters,
+)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Recount per-trial candidate counters and repair drift."
+    )
+    parser.add_argument(
+        "--company-id",
+        type=int,
+        default=None,
+        help="Only reconcile this company's trials (default: all).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=RECONCILE_BATCH_SIZE,
+        help=f"Trials recounted per transaction (default: {RECONCILE_BATCH_SIZE}).",
+    )
+    return parser
+
+
+async def _run(company_id: int | None, batch_size: int) -> int:
+    async with async_session_maker() as db:
+        result = await reconcile_trial_candidate_counters(
+            db, company_id=company_id, batch_size=batch_size
+        )
+    print(
+        "trial_candidate_counters_reconcile"
+        f" scanned={result.scanned_count}"
+        f" repaired={result.repaired_count}"
+    )
+    if result.repaired_trial_ids:
+        print(f"repaired_trial_ids={','.join(map(str, result.repaired_trial_ids))}")
+    return 0
+
+
+def main() -> int:
+    parser = _build_parser()
+    args = parser.parse_args()
+    return asyncio.run(_run(args.company_id, args.batch_size))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+
+from app.config import settings
+from app.demo.services.large_tenant_seed_service import (
+    LargeTenantSeedConfig,
+    seed_large_tenant_dataset,
+)
+from app.demo.services.yc_demo_seed_service import _reset_database
+from app.shared.database import async_session_maker, engine
+
+
+def _is_truthy(value: object) -> bool:
+    return str(value).strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Bulk-seed synthetic large tenants for load and query-plan work."
+    )
+    parser.add_argument("--companies", type=int, default=3)
+    parser.add_argument("--trials-per-company", type=int, default=4)
+    parser.add_argument("--candidates-per-trial", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=2000,
+        help="Candidate sessions written (and committed) per bulk batch.",
+    )
+    parser.add_argument(
+        "--no-copy",
+        action="store_true",
+        help="Use executemany inserts even on PostgreSQL.",
+    )
+    parser.add_argument(
+        "--reset-db",
+        action="store_true",
+        default=_is_truthy(os.getenv("DEMO_RESET_DB")),
+        help="Wipe the database before seeding.",
+    )
+    parser.add_argument(
+        "--allow-production-write",
+        action="store_true",
+        default=_is_truthy(os.getenv("DEMO_ALLOW_PRODUCTION_WRITE")),
+        help="Explicit override for non-local environments.",
+    )
+    return parser.parse_args(argv)
+
+
+def _ensure_safe_environment(
+    *, reset_requested: bool, allow_production_write: bool
+) -> None:
+    if settings.is_production_environment() and not allow_production_write:
+        raise RuntimeError(
+            "Refusing to seed synthetic tenants in a production-like environment."
+        )
+    if reset_requested and settings.is_production_environment():
+        raise RuntimeError(
+            "Refusing destructive reset in a production-like environment."
+        )
+
+
+async def _main_async(args: argparse.Namespace) -> None:
+    _ensure_safe_environment(
+        reset_requested=args.reset_db,
+        allow_production_write=args.allow_production_write,
+    )
+    if args.reset_db:
+        print("Synthetic tenant seed: full database reset requested")
+        await _reset_database(engine)
+    config = LargeTenantSeedConfig(
+        companies=args.companies,
+        trials_per_company=args.trials_per_company,
+        candidates_per_trial=args.candidates_per_trial,
+        seed=args.seed,
+        batch_size=args.batch_size,
+        use_copy=not args.no_copy,
+    )
+    async with async_session_maker() as db:
+        summary = await seed_large_tenant_dataset(db, config=config)
+    counts = ", ".join(
+        f"{table}={count}" for table, count in sorted(summary.row_counts.items())
+    )
+    print(
+        "Synthetic tenant seed ready: "
+        f"companies={summary.company_ids}, trials={len(summary.trial_ids)}, "
+        f"copy={summary.used_copy}, seconds={summary.elapsed_seconds:.1f}"
+    )
+    print(f"Rows: {counts}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    asyncio.run(_main_async(_parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+
+_MIGRATION_PATH = (
+    Path(__file__).resolve().parents[4]
+    / "alembic/versions/202604240004_add_job_finished_index.py"
+)
+_MIGRATION_SPEC = importlib.util.spec_from_file_location(
+    "job_finished_index_migration", _MIGRATION_PATH
+)
+assert _MIGRATION_SPEC and _MIGRATION_SPEC.loader
+job_finished_index_migration = importlib.util.module_from_spec(_MIGRATION_SPEC)
+_MIGRATION_SPEC.loader.exec_module(job_finished_index_migration)
+
+
+def test_job_finished_index_migration_creates_partial_index() -> None:
+    engine = sa.create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(
+            sa.text(
+                "CREATE TABLE jobs (id VARCHAR(36) PRIMARY KEY, job_type VARCHAR(100), "
+                "status VARCHAR(32), updated_at DATETIME)"
+            )
+        )
+        job_finished_index_migration.op = Operations(MigrationContext.configure(conn))
+        job_finished_index_migration.upgrade()
+        job_finished_index_migration.upgrade()
+
+        index_sql = conn.execute(
+            sa.text(
+                "SELECT sql FROM sqlite_master WHERE name = "
+                "'ix_jobs_finished_status_updated'"
+            )
+        ).scalar_one()
+        assert "status IN ('succeeded', 'dead_letter')" in index_sql
+        plan = " ".join(
+            str(row[-1])
+            for row in conn.execute(
+                sa.text(
+                    "EXPLAIN QUERY PLAN SELECT job_type, status, count(*) FROM jobs "
+                    "WHERE status IN ('succeeded', 'dead_letter') "
+                    "AND updated_at >= '2026-01-01' GROUP BY job_type, status"
+                )
+            )
+        )
+        assert "ix_jobs_finished_status_updated" in plan
+
+        job_finished_index_migration.downgrade()
+        assert not sa.inspect(conn).get_indexes("jobs")
+    engine.dispose()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+
+_MIGRATION_PATH = (
+    Path(__file__).resolve().parents[4]
+    / "alembic/versions/202604240005_add_job_traceparent.py"
+)
+_MIGRATION_SPEC = importlib.util.spec_from_file_location(
+    "job_traceparent_migration", _MIGRATION_PATH
+)
+assert _MIGRATION_SPEC and _MIGRATION_SPEC.loader
+job_traceparent_migration = importlib.util.module_from_spec(_MIGRATION_SPEC)
+_MIGRATION_SPEC.loader.exec_module(job_traceparent_migration)
+
+_TRACEPARENT = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+
+def test_job_traceparent_migration_moves_stored_traceparents() -> None:
+    engine = sa.create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(
+            sa.text(
+                "CREATE TABLE jobs (id VARCHAR(36) PRIMARY KEY, "
+                "correlation_id VARCHAR(255))"
+            )
+        )
+        conn.execute(
+            sa.text(
+                "INSERT INTO jobs (id, correlation_id) VALUES "
+                "('traced', :traceparent), ('domain', 'trial:9'), ('none', NULL)"
+            ),
+            {"traceparent": _TRACEPARENT},
+        )
+        job_traceparent_migration.op = Operations(MigrationContext.configure(conn))
+        job_traceparent_migration.upgrade()
+        job_traceparent_migration.upgrade()
+
+        rows = {
+            row.id: (row.correlation_id, row.traceparent)
+            for row in conn.execute(
+                sa.text("SELECT id, correlation_id, traceparent FROM jobs")
+            )
+        }
+        assert rows == {
+            "traced": (None, _TRACEPARENT),
+            "domain": ("trial:9", None),
+            "none": (None, None),
+        }
+
+        job_traceparent_migration.downgrade()
+        columns = {column["name"] for column in sa.inspect(conn).get_columns("jobs")}
+        assert "traceparent" not in columns
+    engine.dispose()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+
+_MIGRATION_PATH = (
+    Path(__file__).resolve().parents[4]
+    / "alembic/versions/202604240003_add_job_trial_id.py"
+)
+_MIGRATION_SPEC = importlib.util.spec_from_file_location(
+    "job_trial_id_migration", _MIGRATION_PATH
+)
+assert _MIGRATION_SPEC and _MIGRATION_SPEC.loader
+job_trial_id_migration = importlib.util.module_from_spec(_MIGRATION_SPEC)
+_MIGRATION_SPEC.loader.exec_module(job_trial_id_migration)
+
+
+def _operations(bind: sa.Connection) -> Operations:
+    return Operations(MigrationContext.configure(bind))
+
+
+def _create_legacy_tables(conn: sa.Connection) -> None:
+    conn.execute(
+        sa.text(
+            "CREATE TABLE candidate_sessions (id INTEGER PRIMARY KEY, trial_id INTEGER)"
+        )
+    )
+    conn.execute(
+        sa.text(
+            "CREATE TABLE jobs (id VARCHAR(36) PRIMARY KEY, status VARCHAR(32), "
+            "company_id INTEGER, candidate_session_id INTEGER, payload_json JSON, "
+            "correlation_id VARCHAR(255), created_at DATETIME, updated_at DATETIME)"
+        )
+    )
+    conn.execute(sa.text("INSERT INTO candidate_sessions VALUES (10, 7)"))
+    conn.execute(
+        sa.text(
+            "INSERT INTO jobs (id, status, company_id, candidate_session_id, "
+            "payload_json, correlation_id) VALUES "
+            "('a', 'dead_letter', 1, NULL, '{\"trialId\": 3}', NULL), "
+            "('b', 'dead_letter', 1, NULL, '{}', 'trial:4:winoe-report'), "
+            "('c', 'queued', 1, 10, '{}', NULL), "
+            "('d', 'dead_letter', 1, NULL, '{}', 'request:trial:x')"
+        )
+    )
+
+
+def test_job_trial_id_migration_backfills_and_indexes() -> None:
+    engine = sa.create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as conn:
+        _create_legacy_tables(conn)
+        job_trial_id_migration.op = _operations(conn)
+        job_trial_id_migration.upgrade()
+
+        scoped = dict(conn.execute(sa.text("SELECT id, trial_id FROM jobs")).all())
+        assert scoped == {"a": 3, "b": 4, "c": 7, "d": None}
+        index_names = {index["name"] for index in sa.inspect(conn).get_indexes("jobs")}
+        assert "ix_jobs_trial_dead_letter" in index_names
+
+        job_trial_id_migration.downgrade()
+        columns = {column["name"] for column in sa.inspect(conn).get_columns("jobs")}
+        assert "trial_id" not in columns
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import JSON, Column, DateTime, Integer, MetaData, Table, func, select
+
+from app.demo.services.large_tenant_seed_service import (
+    LargeTenantSeedConfig,
+    copy_records,
+    seed_large_tenant_dataset,
+)
+from app.demo.services.yc_demo_seed_service import _reset_database
+from app.shared.database.shared_database_models_model import (
+    CandidateSession,
+    EvaluationRun,
+    RecordingAsset,
+    Submission,
+    Transcript,
+    Trial,
+    WinoeReport,
+)
+from app.shared.jobs.repositories.shared_jobs_repositories_models_repository import (
+    Job,
+)
+from app.shared.jobs.shared_jobs_failure_summaries_service import (
+    trial_background_failures,
+)
+from scripts import seed_large_tenants as seed_script
+
+
+def _config(**overrides) -> LargeTenantSeedConfig:
+    values = {
+        "companies": 2,
+        "trials_per_company": 2,
+        "candidates_per_trial": 25,
+        "seed": 7,
+        "batch_size": 10,
+    }
+    values.update(overrides)
+    return LargeTenantSeedConfig(**values)
+
+
+async def _fingerprint(db) -> list[tuple]:
+    sessions = (
+        await db.execute(
+            select(
+                CandidateSession.invite_email,
+                CandidateSession.token,
+                CandidateSession.status,
+            ).order_by(CandidateSession.id)
+        )
+    ).all()
+    jobs = (await db.execute(select(Job.id, Job.status).order_by(Job.id))).all()
+    scores = (
+        await db.execute(
+            select(EvaluationRun.overall_winoe_score).order_by(EvaluationRun.id)
+        )
+    ).all()
+    return [tuple(row) for row in [*sessions, *jobs, *scores]]
+
+
+async def test_seed_writes_linked_rows_for_every_trial(db_session):
+    summary = await seed_large_tenant_dataset(db_session, config=_config())
+
+    assert len(summary.company_ids) == 2
+    assert len(summary.trial_ids) == 4
+    assert summary.used_copy is False
+    assert summary.row_counts["candidate_sessions"] == 100
+
+    trials = (await db_session.execute(select(Trial))).scalars().all()
+    assert {trial.status for trial in trials} == {"active_inviting"}
+    assert all(trial.active_scenario_version_id for trial in trials)
+
+    completed = await db_session.scalar(
+        select(func.count())
+        .select_from(CandidateSession)
+        .where(CandidateSession.status == "completed")
+    )
+    for model in (EvaluationRun, WinoeReport):
+        assert await db_session.scalar(select(func.count(model.id))) == completed
+    recordings = await db_session.scalar(select(func.count(RecordingAsset.id)))
+    assert await db_session.scalar(select(func.count(Transcript.id))) == recordings
+    linked = await db_session.scalar(
+        select(func.count(Submission.id)).where(Submission.recording_id.is_not(None))
+    )
+    assert linked == recordings
+    assert await db_session.scalar(select(func.count(Job.id))) == (
+        completed + recordings
+    )
+
+
+async def test_seeded_dead_letter_jobs_show_in_trial_failure_summaries(db_session):
+    summary = await seed_large_tenant_dataset(
+        db_session, config=_config(dead_letter_ratio=0.2)
+    )
+    dead_letters = await db_session.scalar(
+        select(func.count(Job.id)).where(Job.status == "dead_letter")
+    )
+    assert dead_letters
+
+    trials = (
+        await db_session.execute(
+            select(Trial.id, Trial.company_id).where(Trial.id.in_(summary.trial_ids))
+        )
+    ).all()
+    failures = [
+        await trial_background_failures(
+            db_session, trial_id=trial_id, company_id=company_id
+        )
+        for trial_id, company_id in trials
+    ]
+    assert sum(item.failedJobsCount for item in failures) == dead_letters
+    assert any(item.hasFailedJobs for item in failures)
+
+
+async def test_seed_is_deterministic_by_seed(db_engine, db_session):
+    await seed_large_tenant_dataset(db_session, config=_config())
+    first = await _fingerprint(db_session)
+    await db_session.close()
+
+    await _reset_database(db_engine)
+    await seed_large_tenant_dataset(db_session, config=_config())
+    assert await _fingerprint(db_session) == first
+
+    await _reset_database(db_engine)
+    await seed_large_tenant_dataset(db_session, config=_config(seed=8))
+    assert await _fingerprint(db_session) != first
+
+
+async def test_seed_refuses_to_duplicate_existing_tenants(db_session):
+    await seed_large_tenant_dataset(db_session, config=_config(companies=1))
+
+    with pytest.raises(ValueError, match="already exist"):
+        await seed_large_tenant_dataset(db_session, config=_config(companies=1))
+    summary = await seed_large_tenant_dataset(
+        db_session, config=_config(companies=1, seed=99)
+    )
+    assert summary.company_ids == [2]
+
+
+def test_copy_records_encodes_json_and_naive_timestamps():
+    table = Table(
+        "copy_probe",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("payload", JSON),
+        Column("naive_at", DateTime()),
+        Column("aware_at", DateTime(timezone=True)),
+    )
+    moment = datetime(2026, 1, 5, 12, tzinfo=UTC)
+
+    columns, records = copy_records(
+        table,
+        [
+            {"id": 1, "payload": {"a": [1]}, "naive_at": moment, "aware_at": moment},
+            {"id": 2, "payload": None, "naive_at": None, "aware_at": moment},
+        ],
+    )
+
+    assert columns == ["id", "payload", "naive_at", "aware_at"]
+    assert json.loads(records[0][1]) == {"a": [1]}
+    assert records[0][2].tzinfo is None
+    assert records[0][3] == moment
+    assert records[1][1:3] == (None, None)
+
+
+def test_script_parses_dataset_shape():
+    args = seed_script._parse_args(
+        ["--companies", "5", "--candidates-per-trial", "3000", "--no-copy"]
+    )
+
+    assert args.companies == 5
+    assert args.trials_per_company == 4
+    assert args.candidates_per_trial == 3000
+    assert args.no_copy is True
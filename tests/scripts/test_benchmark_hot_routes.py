@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+
+from scripts import benchmark_hot_routes as bench
+
+
+def _scenario(**overrides):
+    values = {
+        "p95_ms": 10.0,
+        "throughput_rps": 100.0,
+        "queries_per_request": 3.0,
+        "errors": 0,
+    }
+    values.update(overrides)
+    return values
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(value) for value in range(1, 101)]
+    assert bench.percentile(values, 0.50) == 50.0
+    assert bench.percentile(values, 0.95) == 95.0
+    assert bench.percentile(values, 0.99) == 99.0
+    assert bench.percentile([], 0.5) == 0.0
+    assert bench.percentile([7.0], 0.99) == 7.0
+
+
+def test_summarize_counts_errors_and_throughput():
+    result = bench.summarize(
+        name="trial_list",
+        path_template="/api/trials",
+        latencies_ms=[4.0, 2.0, 3.0, 1.0],
+        status_codes=[200, 200, 500, 404],
+        elapsed_seconds=0.5,
+        queries_per_request=2.0,
+    )
+
+    assert result.requests == 4
+    assert result.errors == 2
+    assert result.status_codes == {"200": 2, "404": 1, "500": 1}
+    assert result.throughput_rps == 8.0
+    assert result.p50_ms == 2.0
+    assert result.max_ms == 4.0
+
+
+def test_compare_to_baseline_flags_each_metric():
+    baseline = {"scenarios": {"compare": _scenario(), "gone": _scenario()}}
+    report = {
+        "scenarios": {
+            "compare": _scenario(
+                p95_ms=13.0, throughput_rps=70.0, queries_per_request=4.0, errors=1
+            ),
+            "new": _scenario(p95_ms=999.0),
+        }
+    }
+
+    regressions = bench.compare_to_baseline(report, baseline)
+
+    assert [(item.scenario, item.metric) for item in regressions] == [
+        ("compare", "p95_ms"),
+        ("compare", "throughput_rps"),
+        ("compare", "queries_per_request"),
+        ("compare", "errors"),
+    ]
+    assert "queries_per_request 4" in regressions[2].describe()
+
+
+def test_compare_to_baseline_allows_drift_within_tolerance():
+    baseline = {"scenarios": {"compare": _scenario()}}
+    report = {
+        "scenarios": {
+            "compare": _scenario(
+                p95_ms=12.4, throughput_rps=80.0, queries_per_request=2
+            )
+        }
+    }
+
+    assert bench.compare_to_baseline(report, baseline) == []
+
+
+def test_stored_baseline_covers_every_hot_route():
+    baseline = json.loads(bench.DEFAULT_BASELINE_PATH.read_text(encoding="utf-8"))
+
+    assert set(baseline["scenarios"]) == {
+        "trial_list",
+        "trial_detail",
+        "candidates_compare",
+        "submissions_list",
+        "run_poll",
+        "job_status",
+        "winoe_report",
+    }
+    assert all(
+        entry["errors"] == 0 and entry["queries_per_request"] is not None
+        for entry in baseline["scenarios"].values()
+    )
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import String
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from app.shared.database import shared_database_read_model_utils as read_models
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Gadget(_Base):
+    __tablename__ = "read_model_gadgets"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    owner: Mapped[str] = mapped_column(String(50))
+
+
+@pytest.fixture
+async def tracked(tmp_path, monkeypatch):
+    monkeypatch.setattr(read_models, "_READ_MODELS", {})
+    refreshed: list[set[str]] = []
+    read_models.register_read_model(
+        read_models.ReadModel(
+            name="gadget_owners",
+            tables=frozenset({"read_model_gadgets"}),
+            keys_for=lambda _table, row: (read_models.row_value(row, "owner"),),
+            refresh=lambda _connection, keys: refreshed.append(set(keys)),
+        )
+    )
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'rm.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(_Base.metadata.create_all)
+    maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with maker() as session:
+        yield session, refreshed
+    await engine.dispose()
+
+
+async def test_orm_flushes_refresh_touched_keys(tracked):
+    session, refreshed = tracked
+    session.add_all([_Gadget(id=1, owner="ada"), _Gadget(id=2, owner="bob")])
+    await session.flush()
+    assert refreshed == [{"ada", "bob"}]
+
+    await session.commit()
+    assert refreshed == [{"ada", "bob"}]
+
+
+async def test_core_writes_refresh_on_commit_and_rollback_forgets(tracked):
+    session, refreshed = tracked
+    await session.execute(_Gadget.__table__.insert(), [{"id": 3, "owner": "cy"}])
+    read_models.note_rows_written(session, "read_model_gadgets", [{"owner": "cy"}])
+    read_models.note_rows_written(session, "unrelated", [{"owner": "zed"}])
+    await session.commit()
+    assert refreshed == [{"cy"}]
+
+    await session.execute(_Gadget.__table__.insert(), [{"id": 4, "owner": "dee"}])
+    read_models.note_rows_written(session, "read_model_gadgets", [{"owner": "dee"}])
+    await session.rollback()
+    await session.commit()
+    assert refreshed == [{"cy"}]
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.shared import database as db
+from app.shared.database import shared_database_read_routing_utils as routing
+from app.shared.http.shared_http_middleware_read_routing_middleware import (
+    ReadYourWritesMiddleware,
+)
+
+
+class _Probe:
+    def __init__(self, *values) -> None:
+        self.values = list(values)
+        self.calls = 0
+
+    async def __call__(self, _engine):
+        self.calls += 1
+        value = self.values.pop(0)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+async def test_lag_monitor_caches_and_falls_back_on_lag_or_errors(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(routing.time, "monotonic", lambda: clock[0])
+    probe = _Probe(0.5, 12.0, RuntimeError("replica down"), None)
+    monitor = routing.ReplicaLagMonitor(
+        max_lag_seconds=5.0, check_interval_seconds=2.0, probe=probe
+    )
+
+    assert await monitor.replica_usable(object()) is True
+    assert await monitor.replica_usable(object()) is True
+    assert probe.calls == 1
+
+    clock[0] += 2.0
+    assert await monitor.replica_usable(object()) is False
+    assert monitor.lag_seconds == 12.0
+    clock[0] += 2.0
+    assert await monitor.replica_usable(object()) is False
+    clock[0] += 2.0
+    assert await monitor.replica_usable(object()) is False
+    assert probe.calls == 4
+
+
+async def test_probe_reports_zero_lag_off_postgres():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        assert await routing.probe_replica_lag(engine) == 0.0
+    finally:
+        await engine.dispose()
+
+
+def test_recent_write_tracker_window(monkeypatch):
+    clock = [10.0]
+    monkeypatch.setattr(routing.time, "monotonic", lambda: clock[0])
+    tracker = routing.RecentWriteTracker(window_seconds=5.0)
+    key = routing.principal_key({"authorization": "Bearer abc"})
+
+    assert tracker.wrote_recently(key) is False
+    tracker.mark(key)
+    assert tracker.wrote_recently(key) is True
+    assert tracker.wrote_recently(routing.principal_key({"cookie": "s=1"})) is False
+    clock[0] += 5.0
+    assert tracker.wrote_recently(key) is False
+    assert routing.principal_key({}) is None
+    assert "abc" not in key
+
+
+@pytest.fixture
+async def replica(monkeypatch):
+    read_engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    maker = async_sessionmaker(bind=read_engine, expire_on_commit=False)
+    probe = _Probe(*([0.0] * 10))
+    monkeypatch.setattr(db, "read_engine", read_engine)
+    monkeypatch.setattr(db, "read_session_maker", maker)
+    monkeypatch.setattr(
+        db,
+        "replica_lag_monitor",
+        routing.ReplicaLagMonitor(
+            max_lag_seconds=5.0, check_interval_seconds=60.0, probe=probe
+        ),
+    )
+    monkeypatch.setattr(
+        db, "recent_writes", routing.RecentWriteTracker(window_seconds=30.0)
+    )
+    yield read_engine
+    await read_engine.dispose()
+
+
+async def _resolve(headers: dict[str, str], primary):
+    request = SimpleNamespace(headers=headers)
+    gen = db.get_read_session(request, primary)
+    session = await gen.__anext__()
+    await gen.aclose()
+    return session
+
+
+async def test_get_read_session_uses_primary_without_replica(monkeypatch):
+    monkeypatch.setattr(db, "read_engine", None)
+    primary = object()
+
+    assert await _resolve({}, primary) is primary
+
+
+async def test_get_read_session_routes_to_replica_unless_caller_wrote(replica):
+    primary = object()
+    headers = {"authorization": "Bearer talent_partner:tp@example.com"}
+
+    session = await _resolve(headers, primary)
+    assert session is not primary
+    assert session.bind is replica
+
+    db.recent_writes.mark(routing.principal_key(headers))
+    assert await _resolve(headers, primary) is primary
+    other = await _resolve({"authorization": "Bearer other"}, primary)
+    assert other is not primary
+
+
+async def _run_middleware(tracker, *, method: str, status: int) -> None:
+    async def _app(_scope, _receive, send):
+        await send({"type": "http.response.start", "status": status})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def _send(_message):
+        return None
+
+    middleware = ReadYourWritesMiddleware(_app, tracker=tracker)
+    await middleware(
+        {
+            "type": "http",
+            "method": method,
+            "headers": [(b"authorization", b"Bearer writer")],
+        },
+        None,
+        _send,
+    )
+
+
+@pytest.mark.parametrize(
+    ("method", "status", "marked"),
+    [("POST", 201, True), ("PATCH", 422, False), ("GET", 200, False)],
+)
+async def test_middleware_marks_successful_writes(method, status, marked):
+    tracker = routing.RecentWriteTracker(window_seconds=30.0)
+
+    await _run_middleware(tracker, method=method, status=status)
+
+    key = routing.principal_key({"authorization": "Bearer writer"})
+    assert tracker.wrote_recently(key) is marked
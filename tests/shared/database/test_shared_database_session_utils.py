@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import String, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from app.shared.database import shared_database_engine_utils as engine_utils
+from app.shared.database.shared_database_session_utils import LazyReleaseAsyncSession
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Widget(_Base):
+    __tablename__ = "lazy_release_widgets"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(50))
+
+
+@pytest.fixture
+async def lazy_session(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'lazy.db'}",
+        poolclass=engine_utils.TimedAsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(_Base.metadata.create_all)
+        await conn.execute(_Widget.__table__.insert(), [{"id": 1, "name": "a"}])
+    maker = async_sessionmaker(
+        bind=engine,
+        class_=LazyReleaseAsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+    )
+    async with maker() as session:
+        yield session
+    await engine.dispose()
+
+
+def _checked_out(session) -> int:
+    return session.bind.pool.checkedout()
+
+
+async def test_plain_reads_return_the_connection(lazy_session):
+    widget = await lazy_session.get(_Widget, 1)
+    assert _checked_out(lazy_session) == 0
+    names = (await lazy_session.scalars(select(_Widget.name))).all()
+    assert _checked_out(lazy_session) == 0
+    assert await lazy_session.scalar(select(_Widget.id)) == 1
+
+    assert names == ["a"]
+    assert widget.name == "a"
+    assert _checked_out(lazy_session) == 0
+    assert not lazy_session.in_transaction()
+
+
+async def test_pending_changes_and_writes_keep_the_connection(lazy_session):
+    widget = await lazy_session.get(_Widget, 1)
+    widget.name = "b"
+    await lazy_session.execute(select(_Widget.id))
+    assert _checked_out(lazy_session) == 1
+    assert lazy_session.in_transaction()
+
+    await lazy_session.flush()
+    await lazy_session.execute(select(_Widget.id))
+    assert lazy_session.in_transaction()
+    assert _checked_out(lazy_session) == 1
+
+    await lazy_session.commit()
+    await lazy_session.execute(select(_Widget.id))
+    assert _checked_out(lazy_session) == 0
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        select(_Widget).where(_Widget.id == 1).with_for_update(),
+        text("SELECT 1"),
+    ],
+    ids=["for_update", "text"],
+)
+async def test_locking_and_opaque_statements_pin_the_transaction(
+    lazy_session, statement
+):
+    await lazy_session.execute(statement)
+    await lazy_session.execute(select(_Widget.id))
+
+    assert _checked_out(lazy_session) == 1
+    await lazy_session.rollback()
+    await lazy_session.execute(select(_Widget.id))
+    assert _checked_out(lazy_session) == 0
+
+
+async def test_explicit_transactions_are_left_alone(lazy_session):
+    async with lazy_session.begin():
+        await lazy_session.execute(select(_Widget.id))
+        assert _checked_out(lazy_session) == 1
+    assert _checked_out(lazy_session) == 0
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from sqlalchemy.pool import NullPool, StaticPool
 
 from app.config import settings
+from app.shared import perf
 from app.shared.database.shared_database_models_model import Base
 
 settings.ENV = "test"
@@ -32,6 +33,10 @@ def db_engine():
     else:
         engine_kwargs["poolclass"] = NullPool
     engine = create_async_engine(test_url, **engine_kwargs)
+    if perf.perf_n_plus_one_threshold() > 0:
+        # WINOE_PERF_N_PLUS_ONE_THRESHOLD=N (+ _STRICT=1) runs the suite under
+        # the N+1 detector for every route exercised through the test client.
+        perf.register_listeners(engine, perf_ctx=perf._perf_ctx, perf_module=perf)
 
     async def _create_schema() -> None:
         async with engine.begin() as conn:
@@ -124,3 +124,38 @@ def test_ready_openapi_uses_explicit_response_schema():
 
     assert "ReadinessPayload" in schema["$ref"]
     assert failure_schema["$ref"] == "#/components/schemas/ReadinessPayload"
+
+
+@pytest.mark.asyncio
+async def test_ready_light_returns_status_only(monkeypatch):
+    async def fake_connectivity():
+        return readiness_service._readiness_check(
+            status="ready", code="database_reachable", detail="ok"
+        )
+
+    monkeypatch.setattr(
+        readiness_service, "check_database_connectivity", fake_connectivity
+    )
+
+    async with _client_for(app) as ac:
+        res = await ac.get("/ready/light")
+        assert res.status_code == 200
+        assert set(res.json()) == {"status", "checkedAt"}
+        assert res.json()["status"] == "ready"
+
+
+@pytest.mark.asyncio
+async def test_ready_light_returns_503_when_database_unreachable(monkeypatch):
+    async def fake_connectivity():
+        return readiness_service._readiness_check(
+            status="not_ready", code="database_unavailable", detail="down"
+        )
+
+    monkeypatch.setattr(
+        readiness_service, "check_database_connectivity", fake_connectivity
+    )
+
+    async with _client_for(app) as ac:
+        res = await ac.get("/ready/light")
+        assert res.status_code == 503
+        assert res.json()["status"] == "not_ready"
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.shared.http import shared_http_readiness_refresher_service as refresher_module
+from app.shared.http import shared_http_readiness_service as readiness_service
+from app.shared.http.shared_http_readiness_refresher_service import (
+    ReadinessRefresher,
+)
+
+
+def _patch_builder(monkeypatch, *, status: str = "ready") -> list[int]:
+    calls: list[int] = []
+
+    async def fake_build_readiness_payload(**_kwargs):
+        calls.append(1)
+        return {
+            "status": status,
+            "checkedAt": f"2026-01-01T00:00:{len(calls):02d}Z",
+            "checks": {},
+        }
+
+    monkeypatch.setattr(
+        readiness_service, "build_readiness_payload", fake_build_readiness_payload
+    )
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_payload_builds_inline_when_refresher_not_running(monkeypatch):
+    calls = _patch_builder(monkeypatch)
+    refresher = ReadinessRefresher()
+
+    first = await refresher.payload()
+    second = await refresher.payload()
+
+    assert len(calls) == 2
+    assert first["checkedAt"] != second["checkedAt"]
+    assert refresher.snapshot() is None
+
+
+@pytest.mark.asyncio
+async def test_running_refresher_serves_snapshot(monkeypatch):
+    calls = _patch_builder(monkeypatch)
+    refresher = ReadinessRefresher()
+
+    async with refresher.running(interval_seconds=60):
+        await asyncio.sleep(0)
+        first = await refresher.payload()
+        second = await refresher.payload()
+        light = await refresher.light_payload()
+
+    assert len(calls) == 1
+    assert first is second
+    assert light == {"status": "ready", "checkedAt": first["checkedAt"]}
+    assert refresher.snapshot() is None
+
+
+@pytest.mark.asyncio
+async def test_stale_snapshot_is_rebuilt(monkeypatch):
+    calls = _patch_builder(monkeypatch)
+    refresher = ReadinessRefresher()
+    clock = [1000.0]
+    monkeypatch.setattr(
+        refresher_module, "time", SimpleNamespace(monotonic=lambda: clock[0])
+    )
+
+    async with refresher.running(interval_seconds=60):
+        await asyncio.sleep(0)
+        assert len(calls) == 1
+        clock[0] += 60 * 3 + 1
+        assert refresher.snapshot() is None
+        payload = await refresher.payload()
+
+    assert len(calls) == 2
+    assert payload["checkedAt"] == "2026-01-01T00:00:02Z"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_share_one_build(monkeypatch):
+    calls: list[int] = []
+
+    async def slow_build_readiness_payload(**_kwargs):
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"status": "ready", "checkedAt": "2026-01-01T00:00:00Z", "checks": {}}
+
+    monkeypatch.setattr(
+        readiness_service, "build_readiness_payload", slow_build_readiness_payload
+    )
+    refresher = ReadinessRefresher()
+
+    results = await asyncio.gather(*(refresher.refresh() for _ in range(5)))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_refresh_loop_survives_build_failures(monkeypatch, caplog):
+    attempts: list[int] = []
+
+    async def flaky_build_readiness_payload(**_kwargs):
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+        return {"status": "ready", "checkedAt": "2026-01-01T00:00:00Z", "checks": {}}
+
+    monkeypatch.setattr(
+        readiness_service, "build_readiness_payload", flaky_build_readiness_payload
+    )
+    refresher = ReadinessRefresher()
+
+    async with refresher.running(interval_seconds=0.01):
+        for _ in range(50):
+            if refresher.snapshot() is not None:
+                break
+            await asyncio.sleep(0.01)
+        assert refresher.snapshot() is not None
+
+    assert "readiness_refresh_failed" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_light_payload_falls_back_to_connectivity_check(monkeypatch):
+    async def fake_connectivity():
+        return readiness_service._readiness_check(
+            status="not_ready", code="database_unavailable", detail="down"
+        )
+
+    monkeypatch.setattr(
+        readiness_service, "check_database_connectivity", fake_connectivity
+    )
+
+    payload = await ReadinessRefresher().light_payload()
+
+    assert payload["status"] == "not_ready"
+    assert payload["checkedAt"].endswith("Z")
+
+
+@pytest.mark.asyncio
+async def test_zero_interval_disables_background_refresh(monkeypatch):
+    calls = _patch_builder(monkeypatch)
+    refresher = ReadinessRefresher()
+
+    async with refresher.running(interval_seconds=0):
+        await asyncio.sleep(0)
+        await refresher.payload()
+        await refresher.payload()
+
+    assert len(calls) == 2
+
+
+def test_refresh_interval_reads_settings(monkeypatch):
+    monkeypatch.setattr(
+        refresher_module,
+        "settings",
+        SimpleNamespace(READINESS_REFRESH_INTERVAL_SECONDS="2.5"),
+    )
+    assert refresher_module.readiness_refresh_interval_seconds() == 2.5
+
+    monkeypatch.setattr(
+        refresher_module,
+        "settings",
+        SimpleNamespace(READINESS_REFRESH_INTERVAL_SECONDS="bogus"),
+    )
+    assert refresher_module.readiness_refresh_interval_seconds() == 10.0
+
+    monkeypatch.setattr(refresher_module, "settings", SimpleNamespace())
+    assert refresher_module.readiness_refresh_interval_seconds() == 10.0
@@ -4,6 +4,7 @@ from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 
 import pytest
+from sqlalchemy import create_engine, text
 
 from app.shared.http import shared_http_readiness_service as readiness_service
 
@@ -222,6 +223,96 @@ async def test_check_database_readiness_returns_specific_schema_failure(monkeypa
     assert result.code == "database_unavailable"
 
 
+def test_inspect_schema_per_head_reflects_once_per_migration_head(monkeypatch):
+    heads = [("202604240002",), ("202604240002",), ("202604240003",)]
+    inspected: list[object] = []
+
+    def fake_inspect_schema(sync_connection):
+        inspected.append(sync_connection)
+        return readiness_service._readiness_check(
+            status="ready", code="schema_ok", detail="ok"
+        )
+
+    monkeypatch.setattr(readiness_service, "_SCHEMA_CHECKS_BY_HEAD", {})
+    monkeypatch.setattr(readiness_service, "_migration_heads", lambda _c: heads.pop(0))
+    monkeypatch.setattr(readiness_service, "_inspect_schema", fake_inspect_schema)
+
+    for _ in range(3):
+        assert readiness_service._inspect_schema_per_head(object()).code == "schema_ok"
+
+    assert len(inspected) == 2
+    assert list(readiness_service._SCHEMA_CHECKS_BY_HEAD) == [("202604240003",)]
+
+
+def test_inspect_schema_per_head_rechecks_failing_schema(monkeypatch):
+    calls = []
+
+    def fake_inspect_schema(_sync_connection):
+        calls.append(1)
+        return readiness_service._readiness_check(
+            status="not_ready", code="schema_mismatch", detail="missing"
+        )
+
+    monkeypatch.setattr(readiness_service, "_SCHEMA_CHECKS_BY_HEAD", {})
+    monkeypatch.setattr(readiness_service, "_migration_heads", lambda _c: None)
+    monkeypatch.setattr(readiness_service, "_inspect_schema", fake_inspect_schema)
+
+    readiness_service._inspect_schema_per_head(object())
+    readiness_service._inspect_schema_per_head(object())
+
+    assert len(calls) == 2
+    assert readiness_service._SCHEMA_CHECKS_BY_HEAD == {}
+
+
+def test_migration_heads_reads_alembic_version():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        assert readiness_service._migration_heads(conn) is None
+        conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32))"))
+        conn.execute(text("INSERT INTO alembic_version VALUES ('b_head'), ('a_head')"))
+        assert readiness_service._migration_heads(conn) == ("a_head", "b_head")
+    engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_check_database_connectivity_reports_reachable_and_unavailable(
+    monkeypatch,
+):
+    class _Connection:
+        def __init__(self, *, broken: bool):
+            self.broken = broken
+
+        async def execute(self, _stmt):
+            if self.broken:
+                raise RuntimeError("db down")
+
+    class _Context:
+        def __init__(self, *, broken: bool):
+            self.broken = broken
+
+        async def __aenter__(self):
+            return _Connection(broken=self.broken)
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+
+    monkeypatch.setattr(
+        readiness_service,
+        "engine",
+        SimpleNamespace(connect=lambda: _Context(broken=False)),
+    )
+    ok = await readiness_service.check_database_connectivity()
+    assert (ok.status, ok.code) == ("ready", "database_reachable")
+
+    monkeypatch.setattr(
+        readiness_service,
+        "engine",
+        SimpleNamespace(connect=lambda: _Context(broken=True)),
+    )
+    down = await readiness_service.check_database_connectivity()
+    assert (down.status, down.code) == ("not_ready", "database_unavailable")
+
+
 def test_check_ai_feature_skips_demo_mode_and_handles_provider_modes(monkeypatch):
     demo_config = SimpleNamespace(runtime_mode="demo", provider="openai")
     test_config = SimpleNamespace(runtime_mode="test", provider="anthropic")
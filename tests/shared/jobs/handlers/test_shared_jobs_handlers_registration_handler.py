@@ -8,6 +8,7 @@ from app.shared.jobs.handlers import (
     GITHUB_WORKFLOW_ARTIFACT_PARSE_JOB_TYPE,
     SCENARIO_GENERATION_JOB_TYPE,
     TRANSCRIBE_RECORDING_JOB_TYPE,
+    TRIAL_CANDIDATE_COUNTERS_RECONCILE_JOB_TYPE,
     TRIAL_CLEANUP_JOB_TYPE,
     WORKSPACE_CLEANUP_JOB_TYPE,
 )
@@ -24,6 +25,7 @@ def test_register_builtin_handlers_is_explicit():
         assert worker.has_handler(GITHUB_WORKFLOW_ARTIFACT_PARSE_JOB_TYPE) is False
         assert worker.has_handler(SCENARIO_GENERATION_JOB_TYPE) is False
         assert worker.has_handler(TRANSCRIBE_RECORDING_JOB_TYPE) is False
+        assert worker.has_handler(TRIAL_CANDIDATE_COUNTERS_RECONCILE_JOB_TYPE) is False
 
         worker.register_builtin_handlers()
 
@@ -35,6 +37,7 @@ def test_register_builtin_handlers_is_explicit():
         assert worker.has_handler(GITHUB_WORKFLOW_ARTIFACT_PARSE_JOB_TYPE) is True
         assert worker.has_handler(SCENARIO_GENERATION_JOB_TYPE) is True
         assert worker.has_handler(TRANSCRIBE_RECORDING_JOB_TYPE) is True
+        assert worker.has_handler(TRIAL_CANDIDATE_COUNTERS_RECONCILE_JOB_TYPE) is True
     finally:
         worker.clear_handlers()
 
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+
+from app.shared.jobs.handlers import trial_candidate_counters_reconcile as handler
+from app.trials.services.trials_services_trials_candidate_counters_service import (
+    CandidateCountersReconcileResult,
+)
+
+
+class _SessionMaker:
+    def __init__(self, db):
+        self.db = db
+
+    async def __aenter__(self):
+        return self.db
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+@pytest.mark.asyncio
+async def test_reconcile_handler_maps_payload(monkeypatch):
+    calls = {}
+
+    async def _reconcile(db, *, company_id, batch_size):
+        calls.update(db=db, company_id=company_id, batch_size=batch_size)
+        return CandidateCountersReconcileResult(
+            scanned_count=9, repaired_count=2, repaired_trial_ids=[3, 5]
+        )
+
+    monkeypatch.setattr(handler, "async_session_maker", lambda: _SessionMaker("db"))
+    monkeypatch.setattr(handler, "reconcile_trial_candidate_counters", _reconcile)
+
+    result = await handler.handle_trial_candidate_counters_reconcile(
+        {"companyId": 4, "batchSize": 50}
+    )
+
+    assert calls == {"db": "db", "company_id": 4, "batch_size": 50}
+    assert result == {"scannedCount": 9, "repairedCount": 2}
+
+
+@pytest.mark.asyncio
+async def test_reconcile_handler_defaults_to_all_trials(monkeypatch):
+    calls = {}
+
+    async def _reconcile(db, *, company_id, batch_size):
+        calls.update(company_id=company_id, batch_size=batch_size)
+        return CandidateCountersReconcileResult(0, 0, [])
+
+    monkeypatch.setattr(handler, "async_session_maker", lambda: _SessionMaker("db"))
+    monkeypatch.setattr(handler, "reconcile_trial_candidate_counters", _reconcile)
+
+    await handler.handle_trial_candidate_counters_reconcile({"batchSize": "bad"})
+
+    assert calls == {"company_id": None, "batch_size": handler.RECONCILE_BATCH_SIZE}
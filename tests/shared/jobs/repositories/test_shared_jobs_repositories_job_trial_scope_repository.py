@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+
+from tests.shared.jobs.repositories.shared_jobs_repository_utils import *
+
+
+@pytest.mark.asyncio
+async def test_enqueue_scopes_jobs_to_their_trial(async_session):
+    talent_partner = await create_talent_partner(
+        async_session, email="job-trial-scope@test.com"
+    )
+    trial, _ = await create_trial(async_session, created_by=talent_partner)
+    candidate_session = await create_candidate_session(async_session, trial=trial)
+    company_id = talent_partner.company_id
+
+    by_session = await jobs_repo.create_or_get_idempotent(
+        async_session,
+        job_type="transcribe_recording",
+        idempotency_key="scope-session",
+        payload_json={},
+        company_id=company_id,
+        candidate_session_id=candidate_session.id,
+    )
+    by_correlation = await jobs_repo.create_or_get_idempotent(
+        async_session,
+        job_type="scenario_generation",
+        idempotency_key="scope-correlation",
+        payload_json={},
+        company_id=company_id,
+        correlation_id=f"trial:{trial.id}:generate",
+    )
+    bulk = await jobs_repo.create_or_update_many_idempotent(
+        async_session,
+        company_id=company_id,
+        jobs=[
+            jobs_repo.IdempotentJobSpec(
+                job_type="day_close_enforcement",
+                idempotency_key="scope-bulk-session",
+                payload_json={},
+                candidate_session_id=candidate_session.id,
+            ),
+            jobs_repo.IdempotentJobSpec(
+                job_type="day_close_enforcement",
+                idempotency_key="scope-bulk-payload",
+                payload_json={"trialId": trial.id},
+            ),
+            jobs_repo.IdempotentJobSpec(
+                job_type="day_close_enforcement",
+                idempotency_key="scope-bulk-none",
+                payload_json={},
+            ),
+        ],
+    )
+
+    assert by_session.trial_id == trial.id
+    assert by_correlation.trial_id == trial.id
+    assert [job.trial_id for job in bulk] == [trial.id, trial.id, None]
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.shared.jobs.repositories import (
+    shared_jobs_repositories_repository_claim_repository as claim_repository,
+)
+from app.shared.jobs.repositories.shared_jobs_repositories_repository_claim_repository import (
+    build_skip_locked_claim_statement,
+)
+from tests.shared.jobs.repositories.shared_jobs_repository_utils import *
+
+
+def test_skip_locked_claim_statement_is_single_update_returning():
+    stmt = build_skip_locked_claim_statement(
+        worker_id="worker-pg",
+        now=datetime(2026, 4, 14, 12, 0, tzinfo=UTC),
+        lease_seconds=60,
+        limit=4,
+    )
+
+    sql = str(stmt.compile(dialect=postgresql.dialect())).upper()
+
+    assert sql.startswith("UPDATE JOBS SET")
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "LIMIT" in sql
+    assert "RETURNING" in sql
+
+
+@pytest.mark.asyncio
+async def test_claim_runnable_batch_falls_back_to_optimistic_claims(async_session):
+    company = await create_company(async_session, name="Jobs Co Batch")
+    now = datetime.now(UTC)
+    oldest = await create_job(
+        async_session,
+        company=company,
+        next_run_at=now - timedelta(minutes=3),
+    )
+    middle = await create_job(
+        async_session,
+        company=company,
+        next_run_at=now - timedelta(minutes=2),
+    )
+    await create_job(
+        async_session,
+        company=company,
+        next_run_at=now - timedelta(minutes=1),
+    )
+    await create_job(
+        async_session,
+        company=company,
+        status=JOB_STATUS_SUCCEEDED,
+        next_run_at=now - timedelta(minutes=5),
+    )
+    await async_session.commit()
+
+    claimed = await jobs_repo.claim_runnable_batch(
+        async_session,
+        worker_id="worker-batch",
+        now=now,
+        lease_seconds=300,
+        limit=2,
+    )
+
+    assert [job.id for job in claimed] == [oldest.id, middle.id]
+    assert all(job.status == JOB_STATUS_RUNNING for job in claimed)
+    assert all(job.attempt == 1 for job in claimed)
+    assert all(job.locked_by == "worker-batch" for job in claimed)
+
+    remaining = await jobs_repo.claim_runnable_batch(
+        async_session,
+        worker_id="worker-batch",
+        now=now,
+        lease_seconds=300,
+        limit=5,
+    )
+    assert len(remaining) == 1
+    assert (
+        await jobs_repo.claim_runnable_batch(
+            async_session,
+            worker_id="worker-batch",
+            now=now,
+            lease_seconds=300,
+            limit=0,
+        )
+        == []
+    )
+
+
+@pytest.mark.asyncio
+async def test_claim_prefers_priority_and_respects_max_in_flight(async_session):
+    company = await create_company(async_session, name="Jobs Co Lanes")
+    now = datetime.now(UTC)
+    purge = await jobs_repo.create_or_get_idempotent(
+        async_session,
+        job_type="media_retention_purge",
+        idempotency_key="purge-1",
+        payload_json={},
+        company_id=company.id,
+        next_run_at=now - timedelta(minutes=10),
+    )
+    notify = await jobs_repo.create_or_get_idempotent(
+        async_session,
+        job_type="candidate_completed_notification",
+        idempotency_key="notify-1",
+        payload_json={},
+        company_id=company.id,
+        next_run_at=now - timedelta(minutes=1),
+    )
+    running_eval = await create_job(
+        async_session,
+        company=company,
+        job_type="evaluation_run",
+        status=JOB_STATUS_RUNNING,
+        next_run_at=now - timedelta(minutes=20),
+    )
+    running_eval.locked_at = now
+    queued_eval = await create_job(
+        async_session,
+        company=company,
+        job_type="evaluation_run",
+        next_run_at=now - timedelta(minutes=20),
+    )
+    await async_session.commit()
+    assert notify.priority > purge.priority
+    async_session.expunge_all()
+
+    claimed = await jobs_repo.claim_runnable_batch(
+        async_session,
+        worker_id="worker-lanes",
+        now=now,
+        lease_seconds=300,
+        limit=5,
+        max_in_flight={"evaluation_run": 1},
+    )
+
+    assert [job.id for job in claimed] == [notify.id, purge.id]
+    assert queued_eval.id not in {job.id for job in claimed}
+
+
+def test_skip_locked_claim_statement_ranks_capped_types():
+    stmt = build_skip_locked_claim_statement(
+        worker_id="worker-pg",
+        now=datetime(2026, 4, 14, 12, 0, tzinfo=UTC),
+        lease_seconds=60,
+        limit=5,
+        type_headroom={"evaluation_run": 2, "transcribe_recording": 0},
+    )
+
+    sql = str(stmt.compile(dialect=postgresql.dialect())).upper()
+
+    assert "ROW_NUMBER() OVER (PARTITION BY JOBS.JOB_TYPE" in sql
+    assert "NOT IN" in sql
+    assert "FOR UPDATE SKIP LOCKED" in sql
+
+
+@pytest.mark.asyncio
+async def test_skip_locked_claim_statement_never_exceeds_type_headroom(
+    async_session,
+):
+    company = await create_company(async_session, name="Jobs Co Headroom")
+    now = datetime.now(UTC)
+    evals = [
+        await create_job(
+            async_session,
+            company=company,
+            job_type="evaluation_run",
+            next_run_at=now - timedelta(minutes=10 - index),
+        )
+        for index in range(5)
+    ]
+    other = await create_job(
+        async_session,
+        company=company,
+        job_type="other_job",
+        next_run_at=now - timedelta(minutes=1),
+    )
+    await async_session.commit()
+
+    stmt = build_skip_locked_claim_statement(
+        worker_id="worker-headroom",
+        now=now,
+        lease_seconds=300,
+        limit=5,
+        type_headroom={"evaluation_run": 2},
+    )
+    claimed = (await async_session.execute(stmt)).scalars().all()
+    await async_session.commit()
+
+    assert {job.id for job in claimed} == {evals[0].id, evals[1].id, other.id}
+
+
+@pytest.mark.asyncio
+async def test_claim_runnable_batch_counts_its_own_claims_against_cap(async_session):
+    company = await create_company(async_session, name="Jobs Co Batch Cap")
+    now = datetime.now(UTC)
+    running_eval = await create_job(
+        async_session,
+        company=company,
+        job_type="evaluation_run",
+        status=JOB_STATUS_RUNNING,
+        next_run_at=now - timedelta(minutes=20),
+    )
+    running_eval.locked_at = now
+    for index in range(3):
+        await create_job(
+            async_session,
+            company=company,
+            job_type="evaluation_run",
+            next_run_at=now - timedelta(minutes=10 - index),
+        )
+    await async_session.commit()
+
+    claimed = await jobs_repo.claim_runnable_batch(
+        async_session,
+        worker_id="worker-batch-cap",
+        now=now,
+        lease_seconds=300,
+        limit=5,
+        max_in_flight={"evaluation_run": 2},
+    )
+
+    assert len(claimed) == 1
+
+
+class _AdvisoryLockRecorder:
+    """Runs statements on SQLite, recording PostgreSQL advisory locks instead."""
+
+    def __init__(self, session) -> None:
+        self._session = session
+        self.locked_types: list[str] = []
+
+    async def execute(self, stmt, *args, **kwargs):
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        if "pg_advisory_xact_lock" in str(compiled):
+            self.locked_types.extend(
+                value for value in compiled.params.values() if isinstance(value, str)
+            )
+            return None
+        return await self._session.execute(stmt, *args, **kwargs)
+
+    async def commit(self) -> None:
+        await self._session.commit()
+
+
+@pytest.mark.asyncio
+async def test_skip_locked_claim_locks_only_runnable_capped_types(async_session):
+    company = await create_company(async_session, name="Jobs Co Type Locks")
+    now = datetime.now(UTC)
+    uncapped = await create_job(
+        async_session,
+        company=company,
+        job_type="other_job",
+        next_run_at=now - timedelta(minutes=1),
+    )
+    await async_session.commit()
+    caps = {"evaluation_run": 2, "transcribe_recording": 2}
+
+    recorder = _AdvisoryLockRecorder(async_session)
+    claimed = await claim_repository._claim_batch_skip_locked(
+        recorder,
+        worker_id="worker-uncapped",
+        now=now,
+        lease_seconds=300,
+        limit=2,
+        max_in_flight=caps,
+    )
+    assert [job.id for job in claimed] == [uncapped.id]
+    assert recorder.locked_types == []
+
+    evaluation = await create_job(
+        async_session,
+        company=company,
+        job_type="evaluation_run",
+        next_run_at=now - timedelta(minutes=1),
+    )
+    await async_session.commit()
+    recorder = _AdvisoryLockRecorder(async_session)
+    claimed = await claim_repository._claim_batch_skip_locked(
+        recorder,
+        worker_id="worker-capped",
+        now=now,
+        lease_seconds=300,
+        limit=2,
+        max_in_flight=caps,
+    )
+    assert [job.id for job in claimed] == [evaluation.id]
+    assert recorder.locked_types == ["evaluation_run"]
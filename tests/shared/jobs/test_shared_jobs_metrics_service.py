@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.shared.jobs import shared_jobs_metrics_service as metrics_service
+from app.shared.jobs.repositories.shared_jobs_repositories_models_repository import (
+    JOB_STATUS_DEAD_LETTER,
+    JOB_STATUS_QUEUED,
+    JOB_STATUS_RUNNING,
+    JOB_STATUS_SUCCEEDED,
+)
+from tests.shared.factories import create_company, create_job
+
+
+def test_runtime_metrics_histogram_and_prometheus_text():
+    runtime = metrics_service.JobRuntimeMetrics()
+    runtime.record("evaluation_run", outcome="succeeded", duration_seconds=0.2)
+    runtime.record("evaluation_run", outcome="succeeded", duration_seconds=45)
+    runtime.record("evaluation_run", outcome="dead_letter", duration_seconds=1000)
+
+    [snapshot] = runtime.snapshot()
+    assert snapshot.outcomes == {"succeeded": 2, "dead_letter": 1}
+    assert snapshot.durationCount == 3
+    assert sum(snapshot.durationBucketCounts) == 3
+    assert snapshot.durationBucketCounts[-1] == 1
+
+    text = metrics_service.render_prometheus_text(
+        queues=[
+            metrics_service.JobTypeQueueStats(
+                jobType="evaluation_run",
+                queued=4,
+                runnable=3,
+                running=1,
+                oldestRunnableAgeSeconds=12.5,
+            )
+        ],
+        runtime=[snapshot],
+        window_seconds=900,
+    )
+    assert 'winoe_jobs_queued{job_type="evaluation_run"} 4' in text
+    assert 'winoe_jobs_oldest_runnable_age_seconds{job_type="evaluation_run"} 12.5' in (
+        text
+    )
+    assert (
+        'winoe_job_outcomes_total{job_type="evaluation_run",outcome="succeeded"} 2'
+        in text
+    )
+    assert (
+        'winoe_job_duration_seconds_bucket{job_type="evaluation_run",le="0.25"} 1'
+        in (text)
+    )
+    assert (
+        'winoe_job_duration_seconds_bucket{job_type="evaluation_run",le="+Inf"} 3'
+        in (text)
+    )
+
+    runtime.reset()
+    assert runtime.snapshot() == []
+
+
+@pytest.mark.asyncio
+async def test_load_queue_stats_aggregates_per_job_type(async_session):
+    company = await create_company(async_session, name="metrics-company")
+    now = datetime.now(UTC)
+    await create_job(
+        async_session,
+        company=company,
+        job_type="alpha",
+        next_run_at=now - timedelta(seconds=30),
+    )
+    await create_job(
+        async_session,
+        company=company,
+        job_type="alpha",
+        status=JOB_STATUS_QUEUED,
+        next_run_at=now + timedelta(minutes=5),
+    )
+    await create_job(
+        async_session, company=company, job_type="alpha", status=JOB_STATUS_RUNNING
+    )
+    await create_job(
+        async_session, company=company, job_type="beta", status=JOB_STATUS_SUCCEEDED
+    )
+    await create_job(
+        async_session, company=company, job_type="beta", status=JOB_STATUS_DEAD_LETTER
+    )
+    await async_session.commit()
+
+    stats = await metrics_service.load_queue_stats(
+        async_session, now=now, window_seconds=900
+    )
+
+    by_type = {entry.jobType: entry for entry in stats}
+    assert by_type["alpha"].queued == 2
+    assert by_type["alpha"].runnable == 1
+    assert by_type["alpha"].running == 1
+    assert 29 <= by_type["alpha"].oldestRunnableAgeSeconds <= 60
+    assert by_type["beta"].succeededInWindow == 1
+    assert by_type["beta"].deadLetterInWindow == 1
+    assert by_type["beta"].oldestRunnableAgeSeconds is None
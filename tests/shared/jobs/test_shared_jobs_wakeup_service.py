@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.shared.jobs import shared_jobs_wakeup_service as job_wakeup
+from app.shared.jobs import shared_jobs_worker_heartbeat_service as heartbeat_service
+from app.shared.jobs.repositories import repository as jobs_repo
+from tests.shared.factories import create_company
+from tests.shared.jobs.shared_jobs_worker_utils import _session_maker
+
+
+@pytest.mark.asyncio
+async def test_create_job_wakes_listener_after_commit(async_session):
+    company = await create_company(async_session, name="wakeup-company")
+    session_maker = _session_maker(async_session)
+
+    async with job_wakeup.in_memory_job_wakeup.listen() as listener:
+        async with session_maker() as db:
+            await jobs_repo.create_or_get_idempotent(
+                db,
+                job_type="wakeup_job",
+                idempotency_key="wakeup-now",
+                payload_json={},
+                company_id=company.id,
+            )
+
+        assert await listener.wait(timeout=0.5) is True
+        assert await listener.wait(timeout=0.01) is False
+
+
+@pytest.mark.asyncio
+async def test_future_job_does_not_wake_listener(async_session):
+    company = await create_company(async_session, name="wakeup-future-company")
+    session_maker = _session_maker(async_session)
+
+    async with job_wakeup.in_memory_job_wakeup.listen() as listener:
+        async with session_maker() as db:
+            await jobs_repo.create_or_get_idempotent(
+                db,
+                job_type="wakeup_job",
+                idempotency_key="wakeup-later",
+                payload_json={},
+                company_id=company.id,
+                next_run_at=datetime.now(UTC) + timedelta(hours=1),
+            )
+
+        assert await listener.wait(timeout=0.01) is False
+
+
+@pytest.mark.asyncio
+async def test_idle_slot_returns_on_notify_before_safety_poll():
+    stop_event = asyncio.Event()
+
+    async with job_wakeup.in_memory_job_wakeup.listen() as listener:
+        waiter = asyncio.create_task(
+            heartbeat_service._wait_for_work(
+                stop_event=stop_event,
+                idle_sleep_seconds=0.01,
+                wakeup_listener=listener,
+                safety_poll_seconds=30,
+            )
+        )
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        job_wakeup.in_memory_job_wakeup.notify()
+        await asyncio.wait_for(waiter, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_idle_slot_returns_on_stop_while_listening():
+    stop_event = asyncio.Event()
+
+    async with job_wakeup.in_memory_job_wakeup.listen() as listener:
+        waiter = asyncio.create_task(
+            heartbeat_service._wait_for_work(
+                stop_event=stop_event,
+                idle_sleep_seconds=0.01,
+                wakeup_listener=listener,
+                safety_poll_seconds=30,
+            )
+        )
+        stop_event.set()
+        await asyncio.wait_for(waiter, timeout=1)
+
+
+class _FakeDriver:
+    def __init__(self) -> None:
+        self.closed = False
+        self.listeners: list[object] = []
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def add_listener(self, _channel, callback) -> None:
+        self.listeners.append(callback)
+
+    async def remove_listener(self, _channel, callback) -> None:
+        self.listeners.remove(callback)
+
+
+class _FakeConnection:
+    def __init__(self, driver: _FakeDriver) -> None:
+        self.driver = driver
+
+    async def get_raw_connection(self):
+        return SimpleNamespace(driver_connection=self.driver)
+
+    async def close(self) -> None:
+        self.driver.closed = True
+
+
+class _FakePostgresEngine:
+    dialect = SimpleNamespace(name="postgresql")
+
+    def __init__(self) -> None:
+        self.drivers: list[_FakeDriver] = []
+        self.fail_connects = 0
+
+    async def connect(self) -> _FakeConnection:
+        if self.fail_connects:
+            self.fail_connects -= 1
+            raise OSError("connection refused")
+        driver = _FakeDriver()
+        self.drivers.append(driver)
+        return _FakeConnection(driver)
+
+
+@pytest.mark.asyncio
+async def test_postgres_listener_reconnects_after_connection_loss(caplog):
+    caplog.set_level(logging.INFO, logger=job_wakeup.__name__)
+    engine = _FakePostgresEngine()
+
+    async with job_wakeup.open_job_wakeup_listener(engine) as listener:
+        assert listener is not None
+        engine.drivers[0].closed = True
+
+        assert await listener.wait(timeout=0.01) is True
+        assert len(engine.drivers) == 2
+        assert engine.drivers[1].listeners == [listener.on_notify]
+
+        listener.on_notify()
+        assert await listener.wait(timeout=0.5) is True
+
+    assert engine.drivers[1].closed is True
+    assert "jobs_wakeup_listener_lost" in caplog.text
+    assert "jobs_wakeup_listener_reconnected" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_postgres_listener_backs_off_between_reconnect_attempts(
+    monkeypatch, caplog
+):
+    engine = _FakePostgresEngine()
+    clock = [100.0]
+    monkeypatch.setattr(job_wakeup, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+
+    async with job_wakeup.open_job_wakeup_listener(engine) as listener:
+        engine.drivers[0].closed = True
+        engine.fail_connects = 2
+
+        assert await listener.wait(timeout=0.01) is False
+        assert engine.fail_connects == 1
+        assert await listener.wait(timeout=0.01) is False
+        assert engine.fail_connects == 1
+
+        clock[0] += job_wakeup.RECONNECT_BACKOFF_INITIAL_SECONDS
+        assert await listener.wait(timeout=0.01) is False
+        assert engine.fail_connects == 0
+
+        clock[0] += job_wakeup.RECONNECT_BACKOFF_INITIAL_SECONDS
+        assert await listener.wait(timeout=0.01) is False
+        assert len(engine.drivers) == 1
+
+        clock[0] += job_wakeup.RECONNECT_BACKOFF_INITIAL_SECONDS
+        assert await listener.wait(timeout=0.01) is True
+        assert len(engine.drivers) == 2
+
+    assert caplog.text.count("jobs_wakeup_listener_lost") == 1
+    assert caplog.text.count("jobs_wakeup_listener_reconnect_failed") == 2
+
+
+@pytest.mark.asyncio
+async def test_requeue_paths_wake_listener(async_session):
+    company = await create_company(async_session, name="wakeup-requeue-company")
+    session_maker = _session_maker(async_session)
+    async with session_maker() as db:
+        job = await jobs_repo.create_or_get_idempotent(
+            db,
+            job_type="wakeup_job",
+            idempotency_key="wakeup-requeue",
+            payload_json={},
+            company_id=company.id,
+            next_run_at=datetime.now(UTC) + timedelta(hours=1),
+        )
+        job_id = job.id
+
+    async with job_wakeup.in_memory_job_wakeup.listen() as listener:
+        async with session_maker() as db:
+            now = datetime.now(UTC)
+            await jobs_repo.requeue_nonterminal_idempotent_job(
+                db,
+                company_id=company.id,
+                job_type="wakeup_job",
+                idempotency_key="wakeup-requeue",
+                next_run_at=now,
+                now=now,
+            )
+        assert await listener.wait(timeout=0.5) is True
+
+        async with session_maker() as db:
+            await jobs_repo.mark_failed_and_reschedule(
+                db,
+                job_id=job_id,
+                error_str="later",
+                next_run_at=datetime.now(UTC) + timedelta(minutes=5),
+                now=datetime.now(UTC),
+            )
+        assert await listener.wait(timeout=0.01) is False
+
+        async with session_maker() as db:
+            await jobs_repo.mark_dead_letter(
+                db, job_id=job_id, error_str="boom", now=datetime.now(UTC)
+            )
+            await jobs_repo.requeue_dead_letter_job(
+                db, job_id=job_id, now=datetime.now(UTC)
+            )
+        assert await listener.wait(timeout=0.5) is True
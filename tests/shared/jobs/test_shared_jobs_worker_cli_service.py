@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from types import SimpleNamespace
 
@@ -23,6 +24,38 @@ def test_worker_cli_parser_exposes_worker_and_retry_commands() -> None:
     assert retry_args.job_ids == ["job-1", "job-2"]
 
 
+def test_worker_cli_parser_accepts_concurrency_and_rejects_zero() -> None:
+    parser = worker_cli._build_parser()
+
+    assert parser.parse_args(["worker"]).concurrency >= 1
+    assert parser.parse_args(["worker", "--concurrency", "4"]).concurrency == 4
+    with pytest.raises(SystemExit):
+        parser.parse_args(["worker", "--concurrency", "0"])
+
+
+def test_worker_cli_parser_accepts_processes() -> None:
+    parser = worker_cli._build_parser()
+
+    assert parser.parse_args(["worker"]).processes >= 1
+    assert parser.parse_args(["worker", "--processes", "4"]).processes == 4
+    with pytest.raises(SystemExit):
+        parser.parse_args(["worker", "--processes", "0"])
+
+
+def test_worker_cli_run_supervised_workers_forks_processes(monkeypatch) -> None:
+    forwarded: dict[str, object] = {}
+
+    def fake_run_supervisor(**kwargs):
+        forwarded.update(kwargs)
+
+    monkeypatch.setattr(worker_cli.supervisor, "run_supervisor", fake_run_supervisor)
+
+    worker_cli.run_supervised_workers(SimpleNamespace(processes=3, worker_id=None))
+
+    assert forwarded["processes"] == 3
+    assert callable(forwarded["start_process"])
+
+
 @pytest.mark.asyncio
 async def test_worker_cli_run_worker_registers_handlers_and_delegates(
     monkeypatch,
@@ -36,6 +69,22 @@ async def test_worker_cli_run_worker_registers_handlers_and_delegates(
     async def fake_run_worker_forever(**kwargs):
         forwarded.update(kwargs)
 
+    fake_listener = object()
+    sized_for: list[int] = []
+
+    monkeypatch.setattr(
+        worker_cli, "size_pools_for_worker_concurrency", sized_for.append
+    )
+
+    @asynccontextmanager
+    async def fake_open_job_wakeup_listener(_engine):
+        yield fake_listener
+
+    monkeypatch.setattr(
+        worker_cli.job_wakeup,
+        "open_job_wakeup_listener",
+        fake_open_job_wakeup_listener,
+    )
     monkeypatch.setattr(
         worker_cli.worker_service,
         "register_builtin_handlers",
@@ -52,16 +101,23 @@ async def test_worker_cli_run_worker_registers_handlers_and_delegates(
         worker_id="instance-a",
         idle_sleep_seconds=2.5,
         heartbeat_interval_seconds=17,
+        concurrency=3,
+        safety_poll_seconds=9.0,
+        metrics_port=0,
     )
 
     await worker_cli.run_worker(args)
 
     assert register_calls == ["register"]
+    assert sized_for == [3]
     assert forwarded["session_maker"] is async_session_maker
     assert forwarded["service_name"] == "worker-a"
     assert forwarded["instance_id"] == "instance-a"
     assert forwarded["idle_sleep_seconds"] == 2.5
     assert forwarded["heartbeat_interval_seconds"] == 17
+    assert forwarded["concurrency"] == 3
+    assert forwarded["wakeup_listener"] is fake_listener
+    assert forwarded["safety_poll_seconds"] == 9.0
 
 
 @pytest.mark.asyncio
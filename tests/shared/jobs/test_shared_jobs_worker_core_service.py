@@ -3,12 +3,15 @@ from __future__ import annotations
 from datetime import UTC, datetime
 
 import pytest
+from sqlalchemy import update
 
 from app.shared.jobs import shared_jobs_worker_service as worker_service
 from app.shared.jobs import worker
 from app.shared.jobs.repositories import repository as jobs_repo
 from app.shared.jobs.repositories.shared_jobs_repositories_models_repository import (
+    JOB_STATUS_RUNNING,
     JOB_STATUS_SUCCEEDED,
+    Job,
 )
 from tests.shared.jobs.shared_jobs_worker_utils import _session_maker, create_job
 
@@ -64,8 +67,69 @@ async def test_run_once_succeeds_and_marks_result(async_session):
         assert refreshed.last_error is None
 
 
+@pytest.mark.asyncio
+async def test_run_once_discards_result_when_job_was_reclaimed(async_session):
+    job = await create_job(
+        async_session,
+        job_type="worker_reclaimed",
+        idempotency_key="worker-reclaimed-1",
+        payload_json={},
+    )
+    session_maker = _session_maker(async_session)
+
+    async def _handler(_payload):
+        # Simulate a blocked loop: the lease lapsed and another worker took over.
+        async with session_maker() as db:
+            await db.execute(
+                update(Job).where(Job.id == job.id).values(locked_by="worker-other")
+            )
+            await db.commit()
+        return {"ok": True}
+
+    worker.register_handler("worker_reclaimed", _handler)
+    assert await worker.run_once(
+        session_maker=session_maker,
+        worker_id="worker-slow",
+        now=datetime.now(UTC),
+    )
+
+    async with session_maker() as check_session:
+        refreshed = await jobs_repo.get_by_id(check_session, job.id)
+        assert refreshed.status == JOB_STATUS_RUNNING
+        assert refreshed.locked_by == "worker-other"
+        assert refreshed.result_json is None
+
+
 def test_build_worker_id_uses_hostname_and_pid(monkeypatch):
     monkeypatch.setattr(worker_service.socket, "gethostname", lambda: "unit-host")
     monkeypatch.setattr(worker_service.os, "getpid", lambda: 4321)
 
     assert worker_service._build_worker_id() == "unit-host:4321"
+
+
+@pytest.mark.asyncio
+async def test_run_once_emits_perf_job_record(async_session, caplog, monkeypatch):
+    from app.shared import perf
+
+    monkeypatch.setattr(perf.settings, "DEBUG_PERF", True)
+    caplog.set_level("INFO", logger="app.shared.perf")
+    job = await create_job(
+        async_session,
+        job_type="worker_perf",
+        idempotency_key="worker-perf-1",
+        payload_json={},
+    )
+    worker.register_handler("worker_perf", lambda _payload: {"ok": True})
+
+    handled = await worker.run_once(
+        session_maker=_session_maker(async_session),
+        worker_id="worker-perf",
+        now=datetime.now(UTC),
+    )
+
+    assert handled is True
+    record = next(r for r in caplog.records if r.message == "perf_job")
+    assert record.job_id == job.id
+    assert record.job_type == "worker_perf"
+    assert record.worker_id == "worker-perf"
+    assert record.outcome == "succeeded"
@@ -137,7 +137,7 @@ async def test_run_worker_forever_stops_cleanly_on_cancellation(monkeypatch):
     run_once_calls: list[str] = []
     writes: list[bool] = []
 
-    async def fake_run_once(*, session_maker, worker_id):
+    async def fake_run_once(*, session_maker, worker_id, lease_seconds, claimer):
         run_once_calls.append(worker_id)
         return False
 
@@ -181,7 +181,7 @@ async def test_run_worker_forever_raises_when_heartbeat_task_fails(monkeypatch):
     run_once_calls: list[str] = []
     writes: list[bool] = []
 
-    async def fake_run_once(*, session_maker, worker_id):
+    async def fake_run_once(*, session_maker, worker_id, lease_seconds, claimer):
         run_once_calls.append(worker_id)
         return True
 
@@ -214,3 +214,92 @@ async def test_run_worker_forever_raises_when_heartbeat_task_fails(monkeypatch):
 
     assert run_once_calls == ["worker-error"]
     assert writes == [False]
+
+
+@pytest.mark.asyncio
+async def test_run_worker_forever_runs_concurrent_slots_and_drains(monkeypatch):
+    started: list[str] = []
+    finished: list[str] = []
+    writes: list[bool] = []
+    captured: dict[str, asyncio.Event] = {}
+    claimers: list[object] = []
+    release = asyncio.Event()
+
+    async def fake_run_once(*, session_maker, worker_id, lease_seconds, claimer):
+        started.append(worker_id)
+        claimers.append(claimer)
+        await release.wait()
+        finished.append(worker_id)
+        return True
+
+    async def fake_heartbeat_loop(*, stop_event, **kwargs):
+        captured["stop_event"] = stop_event
+        await stop_event.wait()
+
+    async def fake_write_heartbeat(*, running, **kwargs):
+        writes.append(running)
+
+    monkeypatch.setattr(heartbeat_service.worker_service, "run_once", fake_run_once)
+    monkeypatch.setattr(heartbeat_service, "_heartbeat_loop", fake_heartbeat_loop)
+    monkeypatch.setattr(heartbeat_service, "_write_heartbeat", fake_write_heartbeat)
+
+    task = asyncio.create_task(
+        heartbeat_service.run_worker_forever(
+            session_maker=_FakeSessionMaker(),
+            service_name="winoe-worker",
+            instance_id="worker-pool",
+            idle_sleep_seconds=0.01,
+            heartbeat_interval_seconds=1,
+            concurrency=3,
+        )
+    )
+    for _ in range(20):
+        if len(started) == 3 and "stop_event" in captured:
+            break
+        await asyncio.sleep(0)
+
+    captured["stop_event"].set()
+    release.set()
+    await task
+
+    assert sorted(started) == [
+        "worker-pool",
+        "worker-pool/slot-1",
+        "worker-pool/slot-2",
+    ]
+    assert sorted(finished) == sorted(started)
+    assert len({id(claimer) for claimer in claimers}) == 1
+    assert writes == [False]
+
+
+@pytest.mark.asyncio
+async def test_run_worker_forever_raises_when_extra_slot_fails(monkeypatch):
+    writes: list[bool] = []
+
+    async def fake_run_once(*, session_maker, worker_id, lease_seconds, claimer):
+        if worker_id.endswith("/slot-1"):
+            raise RuntimeError("slot exploded")
+        await asyncio.sleep(0)
+        return False
+
+    async def fake_heartbeat_loop(*, stop_event, **kwargs):
+        await stop_event.wait()
+
+    async def fake_write_heartbeat(*, running, **kwargs):
+        writes.append(running)
+
+    monkeypatch.setattr(heartbeat_service.worker_service, "run_once", fake_run_once)
+    monkeypatch.setattr(heartbeat_service, "_heartbeat_loop", fake_heartbeat_loop)
+    monkeypatch.setattr(heartbeat_service, "_write_heartbeat", fake_write_heartbeat)
+
+    with pytest.raises(RuntimeError, match="slot exploded"):
+        await heartbeat_service.run_worker_forever(
+            session_maker=_FakeSessionMaker(),
+            service_name="winoe-worker",
+            instance_id="worker-slot-error",
+            idle_sleep_seconds=0.01,
+            heartbeat_interval_seconds=1,
+            concurrency=2,
+        )
+
+    assert writes == [False]
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+
+from app.shared.jobs import shared_jobs_worker_supervisor_service as supervisor
+
+
+class _FakeProcess:
+    def __init__(self, pid: int, *, alive: bool = True, exitcode: int | None = None):
+        self.pid = pid
+        self.alive = alive
+        self.exitcode = exitcode
+        self.terminated = False
+        self.killed = False
+        self.ignore_terminate = False
+
+    def is_alive(self) -> bool:
+        return self.alive
+
+    def terminate(self) -> None:
+        self.terminated = True
+        if not self.ignore_terminate:
+            self.alive = False
+            self.exitcode = 0
+
+    def join(self, timeout: float | None = None) -> None:
+        del timeout
+
+    def kill(self) -> None:
+        self.killed = True
+        self.alive = False
+
+
+def test_child_instance_id_and_restart_backoff():
+    assert supervisor.child_instance_id(None, 2) is None
+    assert supervisor.child_instance_id("node-a", 2) == "node-a/p2"
+    assert supervisor.restart_backoff_seconds(0) == 0.0
+    assert supervisor.restart_backoff_seconds(1) == 1.0
+    assert supervisor.restart_backoff_seconds(3) == 4.0
+    assert (
+        supervisor.restart_backoff_seconds(50) == supervisor.MAX_RESTART_BACKOFF_SECONDS
+    )
+
+
+def test_run_supervisor_restarts_crashed_child_and_drains(monkeypatch):
+    monkeypatch.setattr(supervisor, "restart_backoff_seconds", lambda _crashes: 0.0)
+    stop_event = threading.Event()
+    started: list[tuple[int, _FakeProcess]] = []
+
+    def start_process(index: int) -> _FakeProcess:
+        crashed_on_start = index == 0 and not started
+        process = _FakeProcess(
+            pid=100 + len(started),
+            alive=not crashed_on_start,
+            exitcode=1 if crashed_on_start else None,
+        )
+        started.append((index, process))
+        if len(started) == 3:
+            stop_event.set()
+        return process
+
+    supervisor.run_supervisor(
+        processes=2,
+        start_process=start_process,
+        stop_event=stop_event,
+        poll_interval_seconds=0.01,
+        drain_timeout_seconds=0,
+    )
+
+    assert [index for index, _process in started] == [0, 1, 0]
+    assert not started[0][1].terminated
+    assert started[1][1].terminated
+    assert started[2][1].terminated
+
+
+def test_run_supervisor_kills_children_that_do_not_drain():
+    stop_event = threading.Event()
+    stop_event.set()
+    stubborn = _FakeProcess(pid=200)
+    stubborn.ignore_terminate = True
+
+    supervisor.run_supervisor(
+        processes=1,
+        start_process=lambda _index: stubborn,
+        stop_event=stop_event,
+        drain_timeout_seconds=0,
+    )
+
+    assert stubborn.terminated
+    assert stubborn.killed
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.shared.jobs.repositories import repository as jobs_repo
+from app.shared.jobs.worker_runtime.shared_jobs_worker_runtime_batch_claim_service import (
+    JobBatchClaimer,
+)
+from tests.shared.factories import create_company, create_job
+from tests.shared.jobs.shared_jobs_worker_utils import _session_maker
+
+
+def _spy_batch_claims(monkeypatch) -> list[int]:
+    limits: list[int] = []
+    original_claim_runnable_batch = jobs_repo.claim_runnable_batch
+
+    async def _spy(db, **kwargs):
+        limits.append(kwargs["limit"])
+        return await original_claim_runnable_batch(db, **kwargs)
+
+    monkeypatch.setattr(jobs_repo, "claim_runnable_batch", _spy)
+    return limits
+
+
+@pytest.mark.asyncio
+async def test_idle_slots_share_one_batch_claim(async_session, monkeypatch):
+    company = await create_company(async_session, name="batch-claimer-company")
+    due = datetime.now(UTC) - timedelta(seconds=5)
+    jobs = [
+        await create_job(async_session, company=company, next_run_at=due)
+        for _ in range(3)
+    ]
+    limits = _spy_batch_claims(monkeypatch)
+    claimer = JobBatchClaimer()
+    session_maker = _session_maker(async_session)
+
+    claimed = await asyncio.gather(
+        *(
+            claimer.claim(
+                session_maker,
+                worker_id=f"worker/slot-{slot}",
+                now=datetime.now(UTC),
+                lease_seconds=60,
+            )
+            for slot in range(3)
+        )
+    )
+
+    assert limits == [3]
+    assert sorted(job.id for job in claimed) == sorted(job.id for job in jobs)
+    assert len({job.locked_by for job in claimed}) == 1
+
+
+@pytest.mark.asyncio
+async def test_slots_queued_behind_a_drained_claim_stay_idle(
+    async_session, monkeypatch
+):
+    company = await create_company(async_session, name="batch-drained-company")
+    job = await create_job(
+        async_session,
+        company=company,
+        next_run_at=datetime.now(UTC) - timedelta(seconds=5),
+    )
+    limits = _spy_batch_claims(monkeypatch)
+    claimer = JobBatchClaimer()
+    session_maker = _session_maker(async_session)
+
+    claimed = await asyncio.gather(
+        *(
+            claimer.claim(
+                session_maker,
+                worker_id="worker",
+                now=datetime.now(UTC),
+                lease_seconds=60,
+            )
+            for _ in range(2)
+        )
+    )
+
+    assert limits == [2]
+    assert [c.id for c in claimed if c is not None] == [job.id]
+    assert (
+        await claimer.claim(
+            session_maker, worker_id="worker", now=datetime.now(UTC), lease_seconds=60
+        )
+        is None
+    )
+    assert limits == [2, 1]
@@ -24,8 +24,10 @@ async def test_retry_or_dead_letter_uses_provider_backoff_for_rate_limit_errors(
         error_str,
         next_run_at,
         claim_time,
+        worker_id,
     ):
         observed["job_id"] = job_id
+        observed["worker_id"] = worker_id
         observed["error_str"] = error_str
         observed["next_run_at"] = next_run_at
         observed["claim_time"] = claim_time
@@ -40,7 +42,7 @@ async def test_retry_or_dead_letter_uses_provider_backoff_for_rate_limit_errors(
         info=lambda *_args, **_kwargs: None,
         warning=lambda *_args, **_kwargs: None,
     )
-    job = SimpleNamespace(id="job-1", attempt=1, max_attempts=7)
+    job = SimpleNamespace(id="job-1", attempt=1, max_attempts=7, locked_by="w-1")
 
     await failure_paths.retry_or_dead_letter(
         object(),
@@ -55,6 +57,7 @@ async def test_retry_or_dead_letter_uses_provider_backoff_for_rate_limit_errors(
     )
 
     assert observed["job_id"] == "job-1"
+    assert observed["worker_id"] == "w-1"
     assert observed["next_run_at"] == claim_time + timedelta(seconds=15)
 
 
@@ -69,8 +72,11 @@ async def test_retry_or_dead_letter_dead_letters_when_attempt_budget_exhausted(
     observed: dict[str, object] = {}
     claim_time = datetime(2026, 4, 3, tzinfo=UTC)
 
-    async def _mark_dead_letter(_session_maker, *, job_id, error_str, claim_time):
+    async def _mark_dead_letter(
+        _session_maker, *, job_id, error_str, claim_time, worker_id
+    ):
         observed["job_id"] = job_id
+        observed["worker_id"] = worker_id
         observed["error_str"] = error_str
         observed["claim_time"] = claim_time
 
@@ -95,3 +101,4 @@ async def test_retry_or_dead_letter_dead_letters_when_attempt_budget_exhausted(
     )
 
     assert observed["job_id"] == "job-2"
+    assert observed["worker_id"] is None
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.shared.jobs.repositories import repository as jobs_repo
+from app.shared.jobs.repositories.shared_jobs_repositories_models_repository import (
+    JOB_STATUS_RUNNING,
+)
+from app.shared.jobs.worker_runtime import (
+    shared_jobs_worker_runtime_lease_renewal_service as lease_renewal,
+)
+from app.shared.jobs.worker_runtime.shared_jobs_worker_runtime_types_model import (
+    JobLeaseLostError,
+)
+from tests.shared.factories import create_company, create_job
+from tests.shared.jobs.shared_jobs_worker_utils import _session_maker
+
+
+def test_lease_renewal_interval_is_a_third_of_the_lease():
+    assert lease_renewal.lease_renewal_interval_seconds(60) == 20
+    assert lease_renewal.lease_renewal_interval_seconds(1) == (
+        lease_renewal.MIN_LEASE_RENEWAL_INTERVAL_SECONDS
+    )
+
+
+@pytest.mark.asyncio
+async def test_renew_lease_only_extends_lease_held_by_worker(async_session):
+    company = await create_company(async_session, name="lease-company")
+    job = await create_job(async_session, company=company, status=JOB_STATUS_RUNNING)
+    job.locked_by = "worker-a"
+    job.locked_at = datetime.now(UTC) - timedelta(minutes=5)
+    await async_session.commit()
+    now = datetime.now(UTC)
+
+    assert not await jobs_repo.renew_lease(
+        async_session, job_id=job.id, worker_id="worker-b", now=now
+    )
+    assert await jobs_repo.renew_lease(
+        async_session, job_id=job.id, worker_id="worker-a", now=now
+    )
+
+    refreshed = await jobs_repo.get_by_id(async_session, job.id)
+    await async_session.refresh(refreshed)
+    assert refreshed.locked_at.replace(tzinfo=UTC) == now
+
+
+@pytest.mark.asyncio
+async def test_hold_job_lease_renews_while_handler_runs(async_session, monkeypatch):
+    company = await create_company(async_session, name="lease-hold-company")
+    job = await create_job(async_session, company=company, status=JOB_STATUS_RUNNING)
+    job.locked_by = "worker-a"
+    job.locked_at = datetime.now(UTC) - timedelta(minutes=5)
+    await async_session.commit()
+    renewals: list[str] = []
+    original_renew_lease = jobs_repo.renew_lease
+
+    async def tracking_renew_lease(db, **kwargs):
+        renewals.append(kwargs["worker_id"])
+        return await original_renew_lease(db, **kwargs)
+
+    monkeypatch.setattr(
+        lease_renewal, "lease_renewal_interval_seconds", lambda _lease: 0.01
+    )
+    monkeypatch.setattr(lease_renewal.jobs_repo, "renew_lease", tracking_renew_lease)
+
+    async with lease_renewal.hold_job_lease(
+        _session_maker(async_session), job=job, lease_seconds=30, log_extra={}
+    ):
+        await asyncio.sleep(0.1)
+    renewed_count = len(renewals)
+    await asyncio.sleep(0.05)
+
+    assert renewed_count >= 1
+    assert len(renewals) == renewed_count
+    assert set(renewals) == {"worker-a"}
+
+
+@pytest.mark.asyncio
+async def test_hold_job_lease_cancels_handler_when_lease_is_lost(
+    async_session, monkeypatch
+):
+    company = await create_company(async_session, name="lease-lost-company")
+    job = await create_job(async_session, company=company, status=JOB_STATUS_RUNNING)
+    job.locked_by = "worker-a"
+    job.locked_at = datetime.now(UTC)
+    await async_session.commit()
+    monkeypatch.setattr(
+        lease_renewal, "lease_renewal_interval_seconds", lambda _lease: 0.01
+    )
+    # worker-b reclaims the job as stale before worker-a renews.
+    reclaimed = await jobs_repo.claim_next_runnable(
+        async_session,
+        worker_id="worker-b",
+        now=datetime.now(UTC) + timedelta(minutes=10),
+        lease_seconds=30,
+    )
+    assert reclaimed is not None and reclaimed.id == job.id
+    handler_finished = False
+
+    with pytest.raises(JobLeaseLostError):
+        async with lease_renewal.hold_job_lease(
+            _session_maker(async_session),
+            job=SimpleNamespace(id=job.id, locked_by="worker-a"),
+            lease_seconds=30,
+            log_extra={},
+        ):
+            await asyncio.sleep(5)
+            handler_finished = True
+
+    assert handler_finished is False
+    assert asyncio.current_task().cancelling() == 0
+
+
+@pytest.mark.asyncio
+async def test_status_writes_from_a_worker_that_lost_the_job_are_ignored(
+    async_session,
+):
+    company = await create_company(async_session, name="lease-guard-company")
+    job = await create_job(async_session, company=company, status=JOB_STATUS_RUNNING)
+    job.locked_by = "worker-b"
+    job.locked_at = datetime.now(UTC)
+    await async_session.commit()
+    now = datetime.now(UTC)
+
+    assert not await jobs_repo.mark_succeeded(
+        async_session, job_id=job.id, result_json={}, now=now, worker_id="worker-a"
+    )
+    assert not await jobs_repo.mark_failed_and_reschedule(
+        async_session,
+        job_id=job.id,
+        error_str="late",
+        next_run_at=now,
+        now=now,
+        worker_id="worker-a",
+    )
+    assert not await jobs_repo.mark_dead_letter(
+        async_session, job_id=job.id, error_str="late", now=now, worker_id="worker-a"
+    )
+    refreshed = await jobs_repo.get_by_id(async_session, job.id)
+    await async_session.refresh(refreshed)
+    assert refreshed.status == JOB_STATUS_RUNNING
+    assert refreshed.locked_by == "worker-b"
+
+    assert await jobs_repo.mark_succeeded(
+        async_session, job_id=job.id, result_json={}, now=now, worker_id="worker-b"
+    )
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import pytest
+
+from app.shared.jobs.worker_runtime import (
+    shared_jobs_worker_runtime_registry_service as registry,
+)
+
+
+def test_builtin_job_type_priorities_and_caps():
+    assert registry.get_job_priority("candidate_completed_notification") > (
+        registry.get_job_priority("media_retention_purge")
+    )
+    assert registry.get_job_priority("unknown_type") == registry.JOB_PRIORITY_NORMAL
+    assert registry.get_job_type_max_in_flight()["evaluation_run"] >= 1
+
+
+def test_register_job_type_policy_overrides_and_validates(monkeypatch):
+    monkeypatch.setattr(registry, "_JOB_PRIORITIES", {})
+    monkeypatch.setattr(registry, "_JOB_MAX_IN_FLIGHT", {})
+
+    registry.register_job_type_policy(" custom_job ", priority=7, max_in_flight=3)
+
+    assert registry.get_job_priority("custom_job") == 7
+    assert registry.get_job_type_max_in_flight() == {"custom_job": 3}
+    with pytest.raises(ValueError):
+        registry.register_job_type_policy("custom_job", max_in_flight=0)
+    with pytest.raises(ValueError):
+        registry.register_job_type_policy("  ", priority=1)
@@ -0,0 +1,51 @@
+import logging
+
+import pytest
+
+from app.shared.utils import shared_utils_perf_utils as perf
+
+
+def test_track_job_perf_is_noop_when_perf_disabled(caplog, monkeypatch):
+    monkeypatch.setattr(perf.settings, "DEBUG_PERF", False)
+    monkeypatch.setattr(perf.settings, "PERF_SPANS_ENABLED", False)
+    caplog.set_level(logging.INFO, logger="app.shared.perf")
+
+    with perf.track_job_perf(job_id="job-1", job_type="demo", attempt=1) as scope:
+        assert perf._perf_ctx.get() is None
+        scope[perf.JOB_PERF_OUTCOME_KEY] = "succeeded"
+
+    assert not [r for r in caplog.records if r.message == "perf_job"]
+
+
+@pytest.mark.asyncio
+async def test_track_job_perf_emits_perf_job_with_spans(caplog, monkeypatch):
+    monkeypatch.setattr(perf.settings, "DEBUG_PERF", False)
+    monkeypatch.setattr(perf.settings, "PERF_SPANS_ENABLED", True)
+    monkeypatch.setattr(perf.settings, "PERF_SPAN_SAMPLE_RATE", 1.0)
+    caplog.set_level(logging.INFO, logger="app.shared.perf")
+
+    with perf.track_job_perf(
+        job_id="job-2", job_type="evaluation_run", attempt=2, worker_id="w-1"
+    ) as scope:
+        stats = perf._perf_ctx.get()
+        stats.db_count += 3
+        stats.db_time_ms += 4.5
+        stats.record_sql("select ? from jobs", 1.5)
+        perf.record_external_wait("openai", 120.0)
+        scope[perf.JOB_PERF_OUTCOME_KEY] = "succeeded"
+
+    record = next(r for r in caplog.records if r.message == "perf_job")
+    assert record.job_id == "job-2"
+    assert record.job_type == "evaluation_run"
+    assert record.worker_id == "w-1"
+    assert record.outcome == "succeeded"
+    assert record.db_count == 3
+    assert record.job_span["kind"] == "job"
+    assert record.job_span["attempt"] == 2
+    assert record.sql_span["topFingerprints"][0]["fingerprint"] == (
+        "select ? from jobs"
+    )
+    assert record.external_span["providers"] == [
+        {"provider": "openai", "calls": 1, "waitMs": 120.0}
+    ]
+    assert perf._perf_ctx.get() is None
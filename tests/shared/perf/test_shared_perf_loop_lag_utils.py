@@ -0,0 +1,64 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from app.shared.perf import shared_perf_loop_lag_utils as loop_lag
+from app.shared.utils import shared_utils_perf_utils as perf
+
+
+def _block_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+def test_loop_lag_interval_is_clamped():
+    assert loop_lag.loop_lag_interval_seconds(1.0) == 0.01
+    assert loop_lag.loop_lag_interval_seconds(100.0) == 0.025
+    assert loop_lag.loop_lag_interval_seconds(10_000.0) == 0.25
+
+
+def test_loop_lag_threshold_setting_falls_back(monkeypatch):
+    monkeypatch.setattr(perf.settings, "PERF_LOOP_LAG_THRESHOLD_MS", "bogus")
+    assert perf.perf_loop_lag_threshold_ms() == 100.0
+    monkeypatch.setattr(perf.settings, "PERF_LOOP_LAG_THRESHOLD_MS", 0)
+    assert perf.perf_loop_lag_threshold_ms() == 100.0
+
+
+@pytest.mark.asyncio
+async def test_monitor_is_noop_when_disabled(monkeypatch):
+    monkeypatch.setattr(perf.settings, "PERF_LOOP_LAG_MONITOR_ENABLED", False)
+    async with perf.monitor_event_loop_lag() as monitor:
+        assert monitor is None
+
+
+@pytest.mark.asyncio
+async def test_monitor_reports_blocking_frame(caplog, monkeypatch):
+    monkeypatch.setattr(perf.settings, "PERF_LOOP_LAG_MONITOR_ENABLED", True)
+    monkeypatch.setattr(perf.settings, "PERF_LOOP_LAG_THRESHOLD_MS", 40.0)
+    monitor = loop_lag.LoopLagMonitor()
+    monkeypatch.setattr(loop_lag, "loop_lag_monitor", monitor)
+    caplog.set_level(logging.WARNING, logger="app.shared.perf")
+
+    async with perf.monitor_event_loop_lag() as running:
+        assert running is monitor
+        await asyncio.sleep(0.05)
+        _block_loop(0.3)
+        await asyncio.sleep(0.05)
+
+    record = next(r for r in caplog.records if r.message == perf.LOOP_BLOCKED_EVENT)
+    assert record.offending_function == "_block_loop"
+    assert record.offending_module == __name__
+    assert record.blocked_ms >= 40.0
+    assert "in _block_loop" in record.stack[0]
+    snapshot = monitor.snapshot()
+    assert snapshot.blockedCount == 1
+    assert snapshot.samples > 0
+    assert snapshot.maxMs >= 200.0
+    assert snapshot.thresholdMs == 40.0
+
+    text = perf.render_loop_lag_prometheus(snapshot)
+    assert 'winoe_event_loop_lag_ms{quantile="0.99"}' in text
+    assert "winoe_event_loop_blocked_total 1" in text
+    monitor.reset()
+    assert monitor.snapshot().samples == 0
@@ -21,6 +21,7 @@ async def test_request_perf_middleware_passes_through_non_body_send_messages(
         await send({"type": "http.response.body", "body": b""})
 
     monkeypatch.setattr(perf_middleware, "perf_logging_enabled", lambda: True)
+    monkeypatch.setattr(perf_middleware, "perf_request_logs_enabled", lambda: True)
     monkeypatch.setattr(perf_middleware, "sample_perf_span", lambda: False)
     monkeypatch.setattr(
         perf_middleware, "request_id_from_scope", lambda _scope: "req-1"
@@ -33,7 +34,7 @@ async def test_request_perf_middleware_passes_through_non_body_send_messages(
     monkeypatch.setattr(
         perf_middleware,
         "get_request_stats",
-        lambda _ctx: SimpleNamespace(db_count=0, db_time_ms=0.0),
+        lambda _ctx: SimpleNamespace(db_count=0, db_time_ms=0.0, db_pool_wait_ms=0.0),
     )
     monkeypatch.setattr(
         perf_middleware,
@@ -0,0 +1,159 @@
+import logging
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.shared.perf import shared_perf_n_plus_one_utils as n_plus_one
+from app.shared.utils import shared_utils_perf_utils as perf
+
+
+@pytest.fixture
+def detector(monkeypatch):
+    monkeypatch.setattr(perf.settings, "DEBUG_PERF", False)
+    monkeypatch.setattr(perf.settings, "PERF_SPANS_ENABLED", False)
+    monkeypatch.setattr(perf.settings, "PERF_SQL_FINGERPRINTS_ENABLED", False)
+    monkeypatch.setattr(perf.settings, "PERF_N_PLUS_ONE_THRESHOLD", 3)
+    monkeypatch.setattr(perf.settings, "PERF_N_PLUS_ONE_STRICT", False)
+
+
+async def _load_rows_one_by_one(conn, count: int) -> None:
+    for row_id in range(count):
+        await conn.execute(text(f"SELECT {row_id}"))
+
+
+def test_detector_threshold_enables_fingerprint_collection(monkeypatch, detector):
+    assert perf.perf_logging_enabled() is True
+    assert perf.perf_sql_fingerprints_enabled() is True
+    monkeypatch.setattr(perf.settings, "PERF_N_PLUS_ONE_THRESHOLD", "bogus")
+    assert perf.perf_n_plus_one_threshold() == 0
+    monkeypatch.setattr(perf.settings, "PERF_N_PLUS_ONE_THRESHOLD", -5)
+    assert perf.perf_n_plus_one_threshold() == 0
+    assert perf.perf_logging_enabled() is False
+
+
+def test_find_n_plus_one_only_flags_fingerprints_over_threshold(detector):
+    stats = perf.PerfStats()
+    for _ in range(4):
+        stats.record_sql("select ? from tasks where id = ?", 1.0)
+    for _ in range(3):
+        stats.record_sql("select ? from trials", 1.0)
+    stats.sql_fingerprint_locations["select ? from tasks where id = ?"] = "x.py:1"
+
+    findings = perf.find_n_plus_one(stats)
+
+    assert findings == [
+        {
+            "fingerprint": "select ? from tasks where id = ?",
+            "count": 4,
+            "threshold": 3,
+            "db_time_ms": 4.0,
+            "location": "x.py:1",
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_job_scope_logs_n_plus_one_with_sampled_location(
+    caplog, monkeypatch, detector
+):
+    tests_root = Path(__file__).resolve().parents[2]
+    monkeypatch.setattr(n_plus_one, "_APP_ROOT", tests_root)
+    caplog.set_level(logging.INFO, logger="app.shared.perf")
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    perf.register_listeners(engine, perf_ctx=perf._perf_ctx, perf_module=perf)
+    try:
+        with perf.track_job_perf(job_id="job-1", job_type="demo", attempt=1):
+            async with engine.connect() as conn:
+                await _load_rows_one_by_one(conn, 5)
+    finally:
+        await engine.dispose()
+
+    record = next(r for r in caplog.records if r.message == perf.N_PLUS_ONE_EVENT)
+    assert record.levelno == logging.WARNING
+    assert record.job_type == "demo"
+    assert record.fingerprint == "select ?"
+    assert record.count == 5
+    assert "in _load_rows_one_by_one" in record.location
+    assert record.location.startswith("tests/shared/perf/")
+
+
+def test_job_scope_logs_instead_of_raising_in_strict_mode(
+    caplog, monkeypatch, detector
+):
+    monkeypatch.setattr(perf.settings, "PERF_N_PLUS_ONE_STRICT", True)
+
+    with perf.track_job_perf(job_id="job-2", job_type="demo", attempt=1):
+        stats = perf._perf_ctx.get()
+        for _ in range(4):
+            stats.record_sql("select ? from tasks", 1.0)
+
+    assert perf._perf_ctx.get() is None
+    record = next(r for r in caplog.records if r.message == perf.N_PLUS_ONE_EVENT)
+    assert record.fingerprint == "select ? from tasks"
+
+
+def test_report_n_plus_one_raises_in_strict_mode_unless_disabled(monkeypatch, detector):
+    monkeypatch.setattr(perf.settings, "PERF_N_PLUS_ONE_STRICT", True)
+    stats = perf.PerfStats()
+    for _ in range(4):
+        stats.record_sql("select ? from tasks", 1.0)
+
+    with pytest.raises(perf.NPlusOneQueryError, match="select \\? from tasks"):
+        n_plus_one.report_n_plus_one(stats, job_type="demo")
+    assert n_plus_one.report_n_plus_one(stats, raise_strict=False, job_type="demo")
+
+
+@pytest.mark.asyncio
+async def test_request_middleware_reports_route_template(caplog, monkeypatch, detector):
+    caplog.set_level(logging.INFO, logger="app.shared.perf")
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def _item(item_id: int):
+        stats = perf._perf_ctx.get()
+        for _ in range(item_id):
+            stats.record_sql("select ? from items", 0.5)
+        return {"ok": True}
+
+    app.add_middleware(perf.RequestPerfMiddleware)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        quiet = await client.get("/items/2")
+        assert not [r for r in caplog.records if r.message == perf.N_PLUS_ONE_EVENT]
+        noisy = await client.get("/items/6")
+
+    assert quiet.status_code == noisy.status_code == 200
+    record = next(r for r in caplog.records if r.message == perf.N_PLUS_ONE_EVENT)
+    assert record.path_template == "/items/{item_id}"
+    assert record.method == "GET"
+    assert record.count == 6
+
+    monkeypatch.setattr(perf.settings, "PERF_N_PLUS_ONE_STRICT", True)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        with pytest.raises(perf.NPlusOneQueryError):
+            await client.get("/items/6")
+
+
+@pytest.mark.asyncio
+async def test_request_middleware_strict_mode_keeps_the_original_error(
+    monkeypatch, detector
+):
+    monkeypatch.setattr(perf.settings, "PERF_N_PLUS_ONE_STRICT", True)
+    app = FastAPI()
+
+    @app.get("/broken")
+    async def _broken():
+        stats = perf._perf_ctx.get()
+        for _ in range(6):
+            stats.record_sql("select ? from items", 0.5)
+        raise LookupError("handler failed")
+
+    app.add_middleware(perf.RequestPerfMiddleware)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        with pytest.raises(LookupError, match="handler failed"):
+            await client.get("/broken")
@@ -0,0 +1,145 @@
+import threading
+import time
+from datetime import UTC, datetime
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.shared.perf import shared_perf_profiler_utils as profiler_utils
+from app.shared.perf.shared_perf_profile_sessions_repository import (
+    cancel_profile_session,
+    create_profile_session,
+    get_profile_session,
+)
+from app.shared.utils import shared_utils_perf_utils as perf
+
+
+@pytest.fixture
+def profiler_enabled(monkeypatch):
+    monkeypatch.setattr(perf.settings, "DEBUG_PERF", False)
+    monkeypatch.setattr(perf.settings, "PERF_SPANS_ENABLED", False)
+    monkeypatch.setattr(perf.settings, "PERF_PROFILER_ENABLED", True)
+    perf.profiler.reset()
+    yield
+    perf.profiler.reset()
+    perf.profiler.session_maker = None
+
+
+@pytest.fixture
+def session_maker(db_engine, db_session):
+    maker = async_sessionmaker(
+        bind=db_engine, expire_on_commit=False, autoflush=False, class_=AsyncSession
+    )
+    perf.profiler.session_maker = maker
+    return maker
+
+
+def _busy_spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def _arm(maker, **overrides):
+    values = {
+        "target_kind": "route",
+        "target": "/items/{item_id}",
+        "method": None,
+        "requested_count": 1,
+        "interval_ms": 1,
+        "ttl_seconds": 600,
+        "created_by": "operator",
+        "now": datetime.now(UTC),
+    }
+    values.update(overrides)
+    async with maker() as db:
+        return await create_profile_session(db, **values)
+
+
+def test_collapsed_stacks_round_trip_and_merge():
+    text = profiler_utils.render_collapsed_stacks({"a;b": 2, "a;c": 1, "z": 0})
+    assert text == "a;b 2\na;c 1\n"
+    assert profiler_utils.parse_collapsed_stacks(text) == {"a;b": 2, "a;c": 1}
+    assert profiler_utils.merge_collapsed_stacks(text, {"a;b": 3, "d": 1}) == (
+        "a;b 5\na;c 1\nd 1\n"
+    )
+
+
+def test_stack_sampler_records_root_first_labels():
+    sampler = profiler_utils.StackSampler(
+        thread_id=threading.get_ident(), interval_seconds=0.001
+    ).start()
+    _busy_spin(0.1)
+    sampler.stop()
+
+    assert sampler.sample_count > 0
+    hot = [stack for stack in sampler.stacks if stack.endswith(":_busy_spin")]
+    assert hot
+    assert "test_stack_sampler_records_root_first_labels;" in hot[0]
+
+
+async def test_request_profile_captures_next_matching_request(
+    monkeypatch, profiler_enabled, session_maker
+):
+    armed = await _arm(session_maker, method="get")
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def _item(item_id: int):
+        _busy_spin(0.05)
+        return {"ok": True}
+
+    @app.get("/other")
+    async def _other():
+        return {"ok": True}
+
+    app.add_middleware(perf.RequestPerfMiddleware)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        assert (await client.get("/other")).status_code == 200
+        assert (await client.get("/items/1")).status_code == 200
+        perf.profiler.reset()
+        assert (await client.get("/items/2")).status_code == 200
+
+    async with session_maker() as db:
+        session = await get_profile_session(db, armed.id)
+    assert session.status == "completed"
+    assert session.claimed_count == session.captured_count == 1
+    assert session.sample_count > 0
+    assert ":_busy_spin " in session.collapsed_stacks
+    assert "_other" not in session.collapsed_stacks
+
+
+async def test_request_profile_is_inert_when_disabled(monkeypatch, session_maker):
+    monkeypatch.setattr(perf.settings, "PERF_PROFILER_ENABLED", False)
+    perf.profiler.reset()
+    await _arm(session_maker)
+
+    async with perf.profile_request({"type": "http", "path": "/items/1"}) as sampler:
+        assert sampler is None
+    assert not perf.profiler.has_targets("route")
+
+
+async def test_job_profile_matches_job_type_and_skips_cancelled(
+    profiler_enabled, session_maker
+):
+    armed = await _arm(
+        session_maker, target_kind="job", target="demo_job", requested_count=2
+    )
+    cancelled = await _arm(session_maker, target_kind="job", target="other_job")
+    async with session_maker() as db:
+        await cancel_profile_session(db, cancelled.id, now=datetime.now(UTC))
+
+    async with perf.profile_job("other_job") as sampler:
+        assert sampler is None
+    async with perf.profile_job("demo_job") as sampler:
+        assert sampler is not None
+        _busy_spin(0.02)
+
+    async with session_maker() as db:
+        session = await get_profile_session(db, armed.id)
+    assert session.status == "armed"
+    assert session.captured_count == 1
+    assert ":_busy_spin " in session.collapsed_stacks
@@ -0,0 +1,107 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.shared.perf import shared_perf_route_histograms_utils as histograms
+from app.shared.utils import shared_utils_perf_utils as perf
+
+
+def test_status_class_collapses_codes():
+    assert histograms.status_class(204) == "2xx"
+    assert histograms.status_class(503) == "5xx"
+    assert histograms.status_class(None) == "unknown"
+    assert histograms.status_class("bogus") == "unknown"
+
+
+def test_store_records_percentiles_and_drains_per_window():
+    store = histograms.RouteLatencyHistograms()
+    for duration in [3.0] * 90 + [40.0] * 9 + [45_000.0]:
+        store.record(
+            method="get",
+            path_template="/api/trials/{trial_id}",
+            status_code=200,
+            duration_ms=duration,
+            db_count=4,
+            db_time_ms=1.5,
+        )
+    store.record(
+        method="GET",
+        path_template="/api/trials/{trial_id}",
+        status_code=404,
+        duration_ms=2.0,
+        db_count=1,
+        db_time_ms=0.2,
+    )
+
+    window = store.drain()
+
+    assert [(r.method, r.statusClass) for r in window.routes] == [
+        ("GET", "2xx"),
+        ("GET", "4xx"),
+    ]
+    ok = window.routes[0]
+    assert ok.latencyMs.count == 100
+    assert sum(ok.latencyMs.bucketCounts) == 100
+    assert 2.5 <= ok.latencyMs.p50 <= 5.0
+    assert 25.0 <= ok.latencyMs.p95 <= 50.0
+    assert ok.latencyMs.p99 == 50.0
+    assert ok.dbCount.p50 == pytest.approx(4.0, abs=3.0)
+    assert ok.dbTimeMs.sum == pytest.approx(150.0)
+    assert store.snapshot().routes == []
+
+    overflow = histograms._Histogram(histograms.LATENCY_BUCKETS_MS)
+    overflow.record(45_000.0)
+    assert 30_000.0 <= overflow.quantile(0.99) <= 45_000.0
+    assert store.drain().windowStartedAt == window.windowEndedAt
+
+
+def test_render_prometheus_emits_cumulative_buckets():
+    store = histograms.RouteLatencyHistograms()
+    store.record(
+        method="GET",
+        path_template='/a/"quoted"',
+        status_code=200,
+        duration_ms=7.0,
+        db_count=0,
+        db_time_ms=0.0,
+    )
+
+    text = perf.render_route_histograms_prometheus(store.snapshot())
+
+    assert "# TYPE winoe_http_request_duration_ms histogram" in text
+    labels = 'method="GET",route="/a/\\"quoted\\"",status_class="2xx"'
+    assert f'winoe_http_request_duration_ms_bucket{{{labels},le="5"}} 0' in text
+    assert f'winoe_http_request_duration_ms_bucket{{{labels},le="10"}} 1' in text
+    assert f'winoe_http_request_db_queries_bucket{{{labels},le="0"}} 1' in text
+    assert f"winoe_http_request_db_time_ms_count{{{labels}}} 1" in text
+
+
+@pytest.mark.asyncio
+async def test_middleware_records_histograms_without_request_logs(caplog, monkeypatch):
+    monkeypatch.setattr(perf.settings, "DEBUG_PERF", False)
+    monkeypatch.setattr(perf.settings, "PERF_SPANS_ENABLED", False)
+    monkeypatch.setattr(perf.settings, "PERF_ROUTE_HISTOGRAMS_ENABLED", True)
+    store = histograms.RouteLatencyHistograms()
+    monkeypatch.setattr(
+        "app.shared.perf.shared_perf_middleware.route_latency_histograms", store
+    )
+    caplog.set_level(logging.INFO, logger="app.shared.perf")
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def _item(item_id: int):
+        return {"id": item_id}
+
+    app.add_middleware(perf.RequestPerfMiddleware)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        await client.get("/items/1")
+        await client.get("/items/2")
+
+    routes = store.drain().routes
+    assert len(routes) == 1
+    assert routes[0].pathTemplate == "/items/{item_id}"
+    assert routes[0].latencyMs.count == 2
+    assert not [r for r in caplog.records if r.message == "perf_request"]
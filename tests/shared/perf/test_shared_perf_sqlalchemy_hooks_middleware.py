@@ -99,3 +99,27 @@ def test_sql_normalization_reduces_literal_noise():
     assert "42" not in normalized
     assert "jane@example.com" not in normalized
     assert "?" in normalized
+
+
+def test_sql_normalization_is_memoized_per_raw_statement():
+    perf.clear_sql_fingerprint_cache()
+    statement = "SELECT * FROM tasks WHERE trial_id = ? AND day_index IN (?, ?, ?)"
+
+    first = perf.normalize_sql_statement(statement)
+    second = perf.normalize_sql_statement(statement)
+    perf.normalize_sql_statement("SELECT 1")
+
+    assert (
+        first
+        == second
+        == ("select * from tasks where trial_id = ? and day_index in (?)")
+    )
+    info = perf.sql_fingerprint_cache_info()
+    assert info["hits"] == 1
+    assert info["misses"] == 2
+    assert info["size"] == 2
+    assert info["maxsize"] > 0
+    assert perf.normalize_sql_statement(None) == ""
+
+    perf.clear_sql_fingerprint_cache()
+    assert perf.sql_fingerprint_cache_info()["size"] == 0
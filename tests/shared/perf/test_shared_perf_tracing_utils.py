@@ -0,0 +1,273 @@
+import json
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.shared.jobs.repositories.shared_jobs_repositories_models_repository import (
+    Job,
+)
+from app.shared.jobs.repositories.shared_jobs_repositories_repository_shared_repository import (
+    IdempotentJobSpec,
+    apply_idempotent_job_updates,
+)
+from app.shared.jobs.repositories.shared_jobs_repositories_repository_specs_repository import (
+    job_from_spec,
+    job_insert_row,
+)
+from app.shared.perf import shared_perf_tracing_utils as tracing
+from app.shared.utils import shared_utils_perf_utils as perf
+
+custom_exporter = perf.InMemorySpanExporter()
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    monkeypatch.setattr(perf.settings, "DEBUG_PERF", False)
+    monkeypatch.setattr(perf.settings, "PERF_SPANS_ENABLED", False)
+    monkeypatch.setattr(perf.settings, "PERF_SPAN_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(perf.settings, "PERF_TRACE_EXPORTER", "memory")
+    memory = perf.InMemorySpanExporter()
+    perf.set_span_exporter(memory)
+    yield memory
+    perf.set_span_exporter(None)
+
+
+def test_parse_traceparent_validates_format():
+    trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+    assert perf.parse_traceparent(f"00-{trace_id}-00f067aa0ba902b7-01") == (
+        trace_id,
+        "00f067aa0ba902b7",
+    )
+    assert perf.parse_traceparent(f"00-{'0' * 32}-00f067aa0ba902b7-01") is None
+    assert perf.parse_traceparent("trial:12") is None
+    assert perf.parse_traceparent(None) is None
+
+
+def test_spans_are_noop_when_tracing_disabled(monkeypatch):
+    monkeypatch.setattr(perf.settings, "PERF_TRACE_EXPORTER", "")
+    with perf.start_trace_span("noop") as span:
+        assert span is None
+        assert perf.current_traceparent() is None
+
+
+@pytest.mark.asyncio
+async def test_request_span_parents_sql_and_external_spans(exporter):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    perf.register_listeners(engine, perf_ctx=perf._perf_ctx, perf_module=perf)
+    app = FastAPI()
+
+    @app.get("/trials/{trial_id}")
+    async def _trial(trial_id: int):
+        async with engine.connect() as conn:
+            await conn.execute(text(f"SELECT {trial_id}"))
+        perf.record_external_wait("github", 12.5)
+        return {"id": trial_id}
+
+    app.add_middleware(perf.RequestPerfMiddleware)
+    remote_trace = "4bf92f3577b34da6a3ce929d0e0e4736"
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://testserver"
+        ) as client:
+            response = await client.get(
+                "/trials/7",
+                headers={"traceparent": f"00-{remote_trace}-00f067aa0ba902b7-01"},
+            )
+    finally:
+        await engine.dispose()
+
+    assert response.status_code == 200
+    spans = {span.name: span for span in exporter.spans}
+    root = spans["GET /trials/{trial_id}"]
+    assert root.kind == tracing.SPAN_KIND_SERVER
+    assert root.trace_id == remote_trace
+    assert root.parent_span_id == "00f067aa0ba902b7"
+    assert root.attributes["http.response.status_code"] == 200
+    sql = spans["db.query"]
+    assert sql.parent_span_id == root.span_id
+    assert sql.attributes["db.statement"] == "select ?"
+    assert sql.attributes["db.system"] == "sqlite"
+    external = spans["external github"]
+    assert external.parent_span_id == root.span_id
+    assert external.duration_ms == pytest.approx(12.5, abs=0.01)
+
+
+def test_job_span_joins_enqueuing_request_trace(exporter):
+    spec = IdempotentJobSpec(
+        job_type="scenario_generation",
+        idempotency_key="trial:9:scenario",
+        payload_json={},
+        correlation_id="trial:9",
+    )
+    with perf.start_trace_span("POST /api/trials", kind="server") as request_span:
+        job = job_from_spec(company_id=1, spec=spec)
+        row = job_insert_row(company_id=1, spec=spec)
+    untraced = job_from_spec(company_id=1, spec=spec)
+    assert job.correlation_id == "trial:9"
+    assert job.traceparent == request_span.traceparent
+    assert row["traceparent"] == request_span.traceparent
+    assert untraced.traceparent is None
+
+    with perf.track_job_perf(
+        job_id="job-1",
+        job_type="scenario_generation",
+        attempt=1,
+        correlation_id=job.correlation_id,
+        traceparent=job.traceparent,
+    ) as scope:
+        perf.record_external_wait("openai", 40.0)
+        scope[perf.JOB_PERF_OUTCOME_KEY] = "succeeded"
+    with perf.track_job_perf(
+        job_id="job-2", job_type="day_close", attempt=1, correlation_id="trial:9"
+    ):
+        pass
+
+    job_span = next(s for s in exporter.spans if s.name == "job scenario_generation")
+    assert job_span.trace_id == request_span.trace_id
+    assert job_span.parent_span_id == request_span.span_id
+    assert job_span.attributes["winoe.job_outcome"] == "succeeded"
+    assert job_span.attributes["winoe.correlation_id"] == "trial:9"
+    ai_span = next(s for s in exporter.spans if s.name == "external openai")
+    assert ai_span.parent_span_id == job_span.span_id
+    other = next(s for s in exporter.spans if s.name == "job day_close")
+    assert other.trace_id != request_span.trace_id
+    assert other.parent_span_id is None
+    assert other.attributes["winoe.correlation_id"] == "trial:9"
+
+
+def test_idempotent_update_keeps_the_enqueuing_traceparent(exporter):
+    traceparent = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+    job = Job(correlation_id="trial:9", traceparent=traceparent)
+    with perf.start_trace_span("POST /api/trials", kind="server"):
+        apply_idempotent_job_updates(
+            job,
+            payload_json={},
+            candidate_session_id=None,
+            max_attempts=3,
+            correlation_id=None,
+            next_run_at=None,
+        )
+    assert job.correlation_id is None
+    assert job.traceparent == traceparent
+
+
+def test_trace_keeps_a_bounded_number_of_child_spans(exporter, monkeypatch):
+    monkeypatch.setattr(tracing, "MAX_SPANS_PER_TRACE", 3)
+    with perf.start_trace_span("job long") as root:
+        for _ in range(4):
+            perf.record_external_wait("openai", 1.0)
+        with perf.start_trace_span("step"):
+            pass
+
+    assert [span.name for span in exporter.spans] == [
+        "external openai",
+        "external openai",
+        "external openai",
+        "job long",
+    ]
+    assert root.attributes["winoe.dropped_spans"] == 2
+
+
+def test_unsampled_traces_are_not_exported(exporter, monkeypatch):
+    monkeypatch.setattr(perf.settings, "PERF_SPAN_SAMPLE_RATE", 0.0)
+    monkeypatch.setattr(tracing.random, "random", lambda: 0.5)
+    with perf.start_trace_span("GET /x") as span:
+        assert span is None
+    assert exporter.spans == []
+
+
+def test_span_errors_are_marked(exporter):
+    with pytest.raises(RuntimeError), perf.start_trace_span("boom"):
+        raise RuntimeError("boom")
+    assert exporter.spans[0].status == "error"
+    assert exporter.spans[0].to_otlp()["status"] == {"code": 2}
+
+
+def test_file_exporter_writes_otlp_json_lines(monkeypatch, tmp_path):
+    path = tmp_path / "traces.jsonl"
+    monkeypatch.setattr(perf.settings, "PERF_SPAN_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(perf.settings, "PERF_TRACE_EXPORTER", "file")
+    monkeypatch.setattr(perf.settings, "PERF_TRACE_FILE_PATH", str(path))
+    monkeypatch.setattr(perf.settings, "PERF_TRACE_SERVICE_NAME", "winoe-test")
+    perf.set_span_exporter(None)
+    try:
+        with perf.start_trace_span("GET /health", attributes={"http.route": "/h"}):
+            perf.record_external_wait("storage", 3.0)
+        assert isinstance(perf.get_span_exporter(), perf.JsonLinesSpanExporter)
+    finally:
+        perf.set_span_exporter(None)
+
+    [line] = path.read_text().splitlines()
+    document = json.loads(line)
+    resource = document["resourceSpans"][0]
+    assert resource["resource"]["attributes"][0]["value"] == {
+        "stringValue": "winoe-test"
+    }
+    spans = resource["scopeSpans"][0]["spans"]
+    assert [span["name"] for span in spans] == ["external storage", "GET /health"]
+    assert spans[0]["parentSpanId"] == spans[1]["spanId"]
+    assert spans[1]["attributes"] == [
+        {"key": "http.route", "value": {"stringValue": "/h"}}
+    ]
+
+
+def test_file_exporter_writes_off_the_calling_thread(monkeypatch, tmp_path):
+    path = tmp_path / "traces.jsonl"
+    file_exporter = perf.JsonLinesSpanExporter(
+        path, service_name="winoe-test", max_queue_size=1
+    )
+    writer_threads: list[str] = []
+    original_write = file_exporter._write
+
+    def recording_write(spans):
+        writer_threads.append(tracing.threading.current_thread().name)
+        original_write(spans)
+
+    monkeypatch.setattr(file_exporter, "_write", recording_write)
+    span = tracing._new_span(
+        "GET /x",
+        kind="server",
+        trace_id="a" * 32,
+        parent_span_id=None,
+        start_ns=1,
+        attributes=None,
+    )
+    file_exporter.export([span])
+    file_exporter.flush()
+    file_exporter.shutdown()
+
+    assert writer_threads == ["perf-trace-exporter"]
+    assert len(path.read_text().splitlines()) == 1
+
+
+def test_file_exporter_drops_traces_when_queue_is_full(tmp_path):
+    file_exporter = perf.JsonLinesSpanExporter(
+        tmp_path / "traces.jsonl", service_name="winoe-test", max_queue_size=1
+    )
+    file_exporter._ensure_writer = lambda: None
+    span = tracing._new_span(
+        "GET /x",
+        kind="server",
+        trace_id="a" * 32,
+        parent_span_id=None,
+        start_ns=1,
+        attributes=None,
+    )
+    file_exporter.export([span])
+    file_exporter.export([span])
+
+    assert file_exporter.dropped_traces == 1
+
+
+def test_exporter_can_be_loaded_from_module_path(monkeypatch):
+    monkeypatch.setattr(
+        perf.settings, "PERF_TRACE_EXPORTER", f"{__name__}:custom_exporter"
+    )
+    perf.set_span_exporter(None)
+    try:
+        assert perf.get_span_exporter() is custom_exporter
+    finally:
+        perf.set_span_exporter(None)
@@ -30,7 +30,8 @@ async def test_talent_partner_list_includes_links(
     )
     assert resp.status_code == 200, resp.text
     body = resp.json()
-    assert set(body.keys()) == {"items"}
+    assert set(body.keys()) == {"items", "nextCursor"}
+    assert body["nextCursor"] is None
     items = body["items"]
     found = next(i for i in items if i["submissionId"] == sub.id)
     assert found["repoFullName"] == "org/repo"
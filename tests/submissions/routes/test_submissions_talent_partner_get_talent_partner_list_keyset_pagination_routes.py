@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from tests.submissions.routes.submissions_talent_partner_get_api_utils import *
+
+
+@pytest.mark.asyncio
+async def test_talent_partner_list_pages_with_cursor(
+    async_client, async_session: AsyncSession
+):
+    talent_partner = await create_talent_partner(async_session, email="pager@test.com")
+    sim, tasks = await create_trial(async_session, created_by=talent_partner)
+    base = datetime(2026, 3, 20, 12, 0, tzinfo=UTC)
+    created = []
+    for index in range(5):
+        cs = await create_candidate_session(
+            async_session, trial=sim, invite_email=f"pager{index}@test.com"
+        )
+        # Two rows share a timestamp so the id tiebreaker is exercised.
+        submitted_at = base + timedelta(minutes=min(index, 3))
+        created.append(
+            await create_submission(
+                async_session,
+                candidate_session=cs,
+                task=tasks[0],
+                submitted_at=submitted_at,
+            )
+        )
+    expected = [
+        sub.id
+        for sub in sorted(
+            created, key=lambda sub: (sub.submitted_at, sub.id), reverse=True
+        )
+    ]
+    headers = {"x-dev-user-email": talent_partner.email}
+
+    seen: list[int] = []
+    cursor = None
+    for _ in range(3):
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        resp = await async_client.get(
+            "/api/submissions", params=params, headers=headers
+        )
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        seen.extend(item["submissionId"] for item in body["items"])
+        cursor = body["nextCursor"]
+        if cursor is None:
+            break
+
+    assert seen == expected
+    assert cursor is None
+
+
+@pytest.mark.asyncio
+async def test_talent_partner_list_rejects_invalid_cursor(
+    async_client, async_session: AsyncSession
+):
+    talent_partner = await create_talent_partner(
+        async_session, email="badcursor@test.com"
+    )
+
+    resp = await async_client.get(
+        "/api/submissions",
+        params={"cursor": "not-a-cursor"},
+        headers={"x-dev-user-email": talent_partner.email},
+    )
+
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Invalid cursor"
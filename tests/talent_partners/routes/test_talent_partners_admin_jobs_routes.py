@@ -336,3 +336,39 @@ def test_human_failure_reason_handles_provider_timeout_unknown_and_transcription
         )
         == "Media transcription failed: unsupported file format"
     )
+
+
+async def test_admin_can_read_job_queue_metrics(async_client, async_session):
+    await _failed_job_fixture(async_session)
+    admin = await _create_admin_user(async_session)
+    await async_session.commit()
+
+    response = await async_client.get(
+        "/api/admin/jobs/metrics", headers=_admin_headers(admin.email)
+    )
+
+    assert response.status_code == 200, response.text
+    queues = {entry["jobType"]: entry for entry in response.json()["queues"]}
+    assert queues["queued_job"]["queued"] == 1
+    assert queues["evaluation_run"]["deadLetterInWindow"] == 1
+
+    prometheus = await async_client.get(
+        "/api/admin/jobs/metrics/prometheus", headers=_admin_headers(admin.email)
+    )
+    assert prometheus.status_code == 200, prometheus.text
+    assert prometheus.headers["content-type"].startswith("text/plain")
+    assert 'winoe_jobs_queued{job_type="queued_job"} 1' in prometheus.text
+
+
+async def test_job_queue_metrics_require_admin(async_client, async_session):
+    talent_partner = await create_talent_partner(
+        async_session, email="metrics-talent-partner@test.com"
+    )
+    await async_session.commit()
+
+    response = await async_client.get(
+        "/api/admin/jobs/metrics",
+        headers=_talent_partner_headers(talent_partner.email),
+    )
+
+    assert response.status_code == 403
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from sqlalchemy import select
+
+from app.shared.database.shared_database_models_model import AdminActionAudit, User
+from app.shared.perf import (
+    loop_lag_monitor,
+    pool_checkout_stats,
+    route_latency_histograms,
+)
+from app.shared.perf.shared_perf_profile_sessions_model import PerfProfileSession
+
+
+async def _create_admin_user(async_session, email: str = "operator@test.com") -> User:
+    admin = User(
+        name=email.split("@")[0],
+        email=email,
+        role="admin",
+        company_id=None,
+        password_hash="",
+    )
+    async_session.add(admin)
+    await async_session.flush()
+    return admin
+
+
+def _record_sample() -> None:
+    route_latency_histograms.record(
+        method="GET",
+        path_template="/api/trials",
+        status_code=200,
+        duration_ms=12.0,
+        db_count=3,
+        db_time_ms=2.0,
+    )
+
+
+async def test_admin_route_latency_drains_window(async_client, async_session):
+    await _create_admin_user(async_session)
+    route_latency_histograms.reset()
+    _record_sample()
+
+    peek = await async_client.get(
+        "/api/admin/perf/routes",
+        params={"reset": "false"},
+        headers={"x-dev-user-email": "operator@test.com"},
+    )
+    drained = await async_client.get(
+        "/api/admin/perf/routes",
+        headers={"x-dev-user-email": "operator@test.com"},
+    )
+    empty = await async_client.get(
+        "/api/admin/perf/routes",
+        headers={"x-dev-user-email": "operator@test.com"},
+    )
+
+    assert peek.status_code == 200, peek.text
+    assert peek.json()["routes"] == drained.json()["routes"]
+    route = drained.json()["routes"][0]
+    assert route["pathTemplate"] == "/api/trials"
+    assert route["statusClass"] == "2xx"
+    assert route["latencyMs"]["count"] == 1
+    assert route["dbCount"]["sum"] == 3
+    assert empty.json()["routes"] == []
+
+
+async def test_admin_route_latency_prometheus(async_client, async_session):
+    await _create_admin_user(async_session)
+    route_latency_histograms.reset()
+    _record_sample()
+
+    response = await async_client.get(
+        "/api/admin/perf/routes/prometheus",
+        headers={"x-dev-user-email": "operator@test.com"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'winoe_http_request_duration_ms_count{method="GET",route="/api/trials",'
+        'status_class="2xx"} 1'
+    ) in response.text
+    assert "# TYPE winoe_db_pool_checkout_wait_ms histogram" in response.text
+
+
+async def test_admin_pool_checkout_snapshot(async_client, async_session):
+    await _create_admin_user(async_session)
+    pool_checkout_stats.reset()
+    pool_checkout_stats.record(0.2)
+    pool_checkout_stats.record(120.0, timed_out=True)
+
+    response = await async_client.get(
+        "/api/admin/perf/pool",
+        params={"reset": "true"},
+        headers={"x-dev-user-email": "operator@test.com"},
+    )
+    after = await async_client.get(
+        "/api/admin/perf/pool",
+        headers={"x-dev-user-email": "operator@test.com"},
+    )
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["role"] == "api"
+    assert body["timeouts"] == 1
+    assert body["waitMs"]["count"] == 2
+    assert body["poolSize"] == 10
+    assert after.json()["waitMs"]["count"] == 0
+
+
+async def test_admin_route_latency_requires_admin(async_client):
+    response = await async_client.get("/api/admin/perf/routes")
+    assert response.status_code in {401, 403}
+
+
+async def test_admin_loop_lag_snapshot(async_client, async_session):
+    await _create_admin_user(async_session)
+    loop_lag_monitor.reset()
+    loop_lag_monitor.record_lag(12.0)
+
+    response = await async_client.get(
+        "/api/admin/perf/loop-lag",
+        params={"reset": "true"},
+        headers={"x-dev-user-email": "operator@test.com"},
+    )
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["samples"] == 1
+    assert body["maxMs"] == 12.0
+    assert loop_lag_monitor.snapshot().samples == 0
+
+
+async def test_admin_profile_arm_list_download_and_cancel(async_client, async_session):
+    await _create_admin_user(async_session)
+    headers = {"x-dev-user-email": "operator@test.com"}
+
+    armed = await async_client.post(
+        "/api/admin/perf/profiles",
+        json={"targetKind": "route", "target": "/api/trials/{trial_id}", "count": 3},
+        headers=headers,
+    )
+    assert armed.status_code == 201, armed.text
+    profile = armed.json()
+    assert profile["status"] == "armed"
+    assert profile["requestedCount"] == 3
+    assert profile["claimedCount"] == 0
+
+    listed = await async_client.get("/api/admin/perf/profiles", headers=headers)
+    assert [item["id"] for item in listed.json()] == [profile["id"]]
+
+    session = await async_session.get(PerfProfileSession, profile["id"])
+    session.collapsed_stacks = "app.main:handler;app.svc:load 4\n"
+    await async_session.commit()
+    download = await async_client.get(
+        f"/api/admin/perf/profiles/{profile['id']}/collapsed", headers=headers
+    )
+    assert download.status_code == 200
+    assert download.text == "app.main:handler;app.svc:load 4\n"
+    assert "attachment" in download.headers["content-disposition"]
+
+    cancelled = await async_client.post(
+        f"/api/admin/perf/profiles/{profile['id']}/cancel", headers=headers
+    )
+    assert cancelled.json()["status"] == "cancelled"
+    audits = (
+        await async_session.execute(
+            select(AdminActionAudit)
+            .where(AdminActionAudit.target_id == profile["id"])
+            .order_by(AdminActionAudit.action)
+        )
+    ).scalars()
+    assert [(audit.action, audit.payload_json) for audit in audits] == [
+        (
+            action,
+            {
+                "targetKind": "route",
+                "target": "/api/trials/{trial_id}",
+                "method": None,
+                "count": 3,
+            },
+        )
+        for action in ("perf_profile_arm", "perf_profile_cancel")
+    ]
+
+    missing = await async_client.get(
+        "/api/admin/perf/profiles/nope/collapsed", headers=headers
+    )
+    assert missing.status_code == 404
+    assert missing.json()["errorCode"] == "PERF_PROFILE_NOT_FOUND"
+
+
+async def test_admin_profile_rejects_invalid_target(async_client, async_session):
+    await _create_admin_user(async_session)
+    response = await async_client.post(
+        "/api/admin/perf/profiles",
+        json={"targetKind": "socket", "target": "x", "count": 1},
+        headers={"x-dev-user-email": "operator@test.com"},
+    )
+    assert response.status_code == 422
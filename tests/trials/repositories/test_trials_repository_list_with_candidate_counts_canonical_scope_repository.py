@@ -20,12 +20,16 @@ class _FakeDB:
 
 
 @pytest.mark.asyncio
-async def test_list_with_candidate_counts_uses_canonical_trial_scope_and_distinct_counts():
+async def test_list_with_candidate_counts_reads_denormalized_counters():
     db = _FakeDB()
 
     await sim_repo.list_with_candidate_counts(db, user_id=123)
 
     sql = str(db.executed_stmt).lower().replace('"', "")
-    assert "join trials on trials.id = candidate_sessions.trial_id" in sql
-    assert "count(distinct(candidate_sessions.id))" in sql
+    assert (
+        "left outer join trial_candidate_counters "
+        "on trial_candidate_counters.trial_id = trials.id"
+    ) in sql
+    assert "candidate_sessions" not in sql
+    assert "group by" not in sql
     assert "trials.created_by" in sql
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from app.shared.database.shared_database_models_model import (
+    CandidateSession,
+    WinoeReport,
+)
+from app.trials.routes.trials_routes import (
+    trials_routes_trials_routes_trials_routes_candidates_routes as candidates_routes,
+)
+from tests.trials.routes.trials_candidates_api_utils import (
+    attach_active_scenario,
+    create_trial,
+    seed_talent_partner,
+)
+
+
+async def _seed(async_session, *, email: str, count: int):
+    user, company = await seed_talent_partner(
+        async_session, email=email, company_name=f"Co {email}", name="TP"
+    )
+    sim = await create_trial(
+        async_session, user_id=user.id, company_id=company.id, title="Big Trial"
+    )
+    scenario = await attach_active_scenario(async_session, sim)
+    sessions = [
+        CandidateSession(
+            trial_id=sim.id,
+            scenario_version_id=scenario.id,
+            candidate_name=f"Candidate {index}",
+            invite_email=f"c{index}@example.com",
+            token=f"{email}-tok-{index}",
+            status="completed" if index % 2 else "not_started",
+            invite_email_status="sent" if index < 3 else "failed",
+            expires_at=None,
+        )
+        for index in range(count)
+    ]
+    async_session.add_all(sessions)
+    await async_session.flush()
+    async_session.add(
+        WinoeReport(candidate_session_id=sessions[1].id, generated_at=datetime.now(UTC))
+    )
+    await async_session.commit()
+    return user, sim, sessions
+
+
+@pytest.mark.asyncio
+async def test_candidates_list_pages_with_next_cursor_header(
+    async_client, async_session
+):
+    user, sim, sessions = await _seed(async_session, email="pages@acme.com", count=5)
+    headers = {"x-dev-user-email": user.email}
+
+    seen: list[int] = []
+    params: dict[str, object] = {"limit": 2}
+    for _ in range(3):
+        resp = await async_client.get(
+            f"/api/trials/{sim.id}/candidates", params=params, headers=headers
+        )
+        assert resp.status_code == 200, resp.text
+        seen.extend(row["candidateSessionId"] for row in resp.json())
+        next_cursor = resp.headers.get("x-next-cursor")
+        if next_cursor is None:
+            break
+        params = {"limit": 2, "cursor": next_cursor}
+
+    assert seen == sorted((cs.id for cs in sessions), reverse=True)
+    assert next_cursor is None
+
+    bad = await async_client.get(
+        f"/api/trials/{sim.id}/candidates",
+        params={"cursor": "%%%"},
+        headers=headers,
+    )
+    assert bad.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_candidates_list_without_limit_or_cursor_is_unpaged(
+    async_client, async_session, monkeypatch
+):
+    monkeypatch.setattr(candidates_routes, "CANDIDATES_PAGE_SIZE_DEFAULT", 2)
+    user, sim, sessions = await _seed(async_session, email="all@acme.com", count=5)
+
+    resp = await async_client.get(
+        f"/api/trials/{sim.id}/candidates",
+        headers={"x-dev-user-email": user.email},
+    )
+
+    assert resp.status_code == 200, resp.text
+    assert [row["candidateSessionId"] for row in resp.json()] == sorted(
+        (cs.id for cs in sessions), reverse=True
+    )
+    assert "x-next-cursor" not in resp.headers
+
+
+@pytest.mark.asyncio
+async def test_candidates_list_applies_server_side_filters(async_client, async_session):
+    user, sim, sessions = await _seed(async_session, email="filters@acme.com", count=5)
+    url = f"/api/trials/{sim.id}/candidates"
+    headers = {"x-dev-user-email": user.email}
+
+    async def _ids(**params):
+        resp = await async_client.get(url, params=params, headers=headers)
+        assert resp.status_code == 200, resp.text
+        return {row["candidateSessionId"] for row in resp.json()}
+
+    assert await _ids(status="completed") == {sessions[1].id, sessions[3].id}
+    assert await _ids(inviteEmailStatus="failed") == {sessions[3].id, sessions[4].id}
+    assert await _ids(hasReport="true") == {sessions[1].id}
+    assert sessions[1].id not in await _ids(hasReport="false")
+    assert await _ids(status="completed", hasReport="false") == {sessions[3].id}
+
+
+@pytest.mark.asyncio
+async def test_candidates_list_streams_ndjson(async_client, async_session):
+    user, sim, sessions = await _seed(async_session, email="ndjson@acme.com", count=4)
+
+    resp = await async_client.get(
+        f"/api/trials/{sim.id}/candidates",
+        params={"format": "ndjson", "inviteEmailStatus": "sent"},
+        headers={"x-dev-user-email": user.email},
+    )
+
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert [row["candidateSessionId"] for row in rows] == [
+        sessions[2].id,
+        sessions[1].id,
+        sessions[0].id,
+    ]
+    assert rows[1]["hasWinoeReport"] is True
+    assert rows[0]["dayProgress"]["total"] == 5
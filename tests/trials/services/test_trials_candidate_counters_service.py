@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select, update
+
+from app.shared.database.shared_database_models_model import (
+    CandidateSession,
+    TrialCandidateCounters,
+    WinoeReport,
+)
+from app.trials import services as trial_service
+from app.trials.services import (
+    trials_services_trials_candidate_counters_jobs_service as counters_jobs,
+)
+from app.trials.services import (
+    trials_services_trials_candidate_counters_service as counters_service,
+)
+from tests.shared.factories import (
+    create_candidate_session,
+    create_talent_partner,
+    create_trial,
+)
+
+
+async def _counters(async_session, trial_id: int) -> tuple[int, int, int, int]:
+    row = (
+        await async_session.execute(
+            select(TrialCandidateCounters)
+            .where(TrialCandidateCounters.trial_id == trial_id)
+            .execution_options(populate_existing=True)
+        )
+    ).scalar_one()
+    return (
+        row.invited_count,
+        row.started_count,
+        row.completed_count,
+        row.report_ready_count,
+    )
+
+
+@pytest.mark.asyncio
+async def test_counters_follow_invite_start_complete_and_report(async_session):
+    talent_partner = await create_talent_partner(async_session, email="ctr@test.com")
+    trial, _ = await create_trial(async_session, created_by=talent_partner)
+    first = await create_candidate_session(
+        async_session, trial=trial, invite_email="a@example.com"
+    )
+    await create_candidate_session(
+        async_session, trial=trial, invite_email="b@example.com"
+    )
+    await async_session.commit()
+    assert await _counters(async_session, trial.id) == (2, 0, 0, 0)
+
+    now = datetime.now(UTC)
+    first.started_at = now
+    await async_session.flush()
+    assert await _counters(async_session, trial.id) == (2, 1, 0, 0)
+
+    first.completed_at = now
+    first.status = "completed"
+    async_session.add(WinoeReport(candidate_session_id=first.id, generated_at=now))
+    await async_session.commit()
+    assert await _counters(async_session, trial.id) == (2, 1, 1, 1)
+
+    rows = await trial_service.list_trials(async_session, talent_partner.id)
+    assert [tuple(row[1:]) for row in rows] == [(2, 1, 1, 1)]
+
+
+async def _load_session(async_session, candidate_session_id: int) -> CandidateSession:
+    return (
+        await async_session.execute(
+            select(CandidateSession)
+            .where(CandidateSession.id == candidate_session_id)
+            .execution_options(populate_existing=True)
+        )
+    ).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_counter_changes_apply_deltas_without_recounting(
+    async_session, monkeypatch
+):
+    talent_partner = await create_talent_partner(async_session, email="d@test.com")
+    trial, _ = await create_trial(async_session, created_by=talent_partner)
+    first = await create_candidate_session(
+        async_session, trial=trial, invite_email="a@example.com"
+    )
+    await create_candidate_session(
+        async_session, trial=trial, invite_email="b@example.com"
+    )
+    await async_session.commit()
+    first = await _load_session(async_session, first.id)
+
+    def _no_recount(*_args, **_kwargs):
+        raise AssertionError("counters were recounted")
+
+    monkeypatch.setattr(counters_service, "_count_candidates", _no_recount)
+    now = datetime.now(UTC)
+    first.started_at = now
+    await async_session.commit()
+    assert await _counters(async_session, trial.id) == (2, 1, 0, 0)
+
+    first.completed_at = now
+    async_session.add(WinoeReport(candidate_session_id=first.id, generated_at=now))
+    await create_candidate_session(
+        async_session, trial=trial, invite_email="c@example.com"
+    )
+    await async_session.commit()
+    assert await _counters(async_session, trial.id) == (3, 1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_uncounted_column_changes_leave_counters_alone(
+    async_session, monkeypatch
+):
+    talent_partner = await create_talent_partner(async_session, email="u@test.com")
+    trial, _ = await create_trial(async_session, created_by=talent_partner)
+    created = await create_candidate_session(
+        async_session, trial=trial, invite_email="a@example.com"
+    )
+    await async_session.commit()
+    candidate_session = await _load_session(async_session, created.id)
+    applied: list[set] = []
+    original = counters_service.apply_trial_candidate_counter_changes
+
+    def spy(connection, keys):
+        applied.append(set(keys))
+        return original(connection, keys)
+
+    monkeypatch.setattr(counters_service, "apply_trial_candidate_counter_changes", spy)
+    candidate_session.invite_email_status = "sent"
+    candidate_session.github_username = "octocat"
+    await async_session.commit()
+
+    assert applied == []
+    assert await _counters(async_session, trial.id) == (1, 0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_repairs_drifted_counters(async_session):
+    talent_partner = await create_talent_partner(async_session, email="drift@test.com")
+    trial, _ = await create_trial(async_session, created_by=talent_partner)
+    other, _ = await create_trial(async_session, created_by=talent_partner)
+    await create_candidate_session(async_session, trial=trial)
+    await async_session.commit()
+    trial_id, other_id = trial.id, other.id
+
+    await async_session.execute(
+        update(TrialCandidateCounters)
+        .where(TrialCandidateCounters.trial_id == trial_id)
+        .values(invited_count=7)
+    )
+    await async_session.execute(
+        CandidateSession.__table__.update()
+        .where(CandidateSession.trial_id == trial_id)
+        .values(started_at=datetime.now(UTC))
+    )
+    await async_session.commit()
+
+    result = await counters_service.reconcile_trial_candidate_counters(
+        async_session, batch_size=1
+    )
+
+    assert result.repaired_trial_ids == [trial_id, other_id]
+    assert result.scanned_count >= 2
+    assert await _counters(async_session, trial_id) == (1, 1, 0, 0)
+    assert await _counters(async_session, other_id) == (0, 0, 0, 0)
+    again = await counters_service.reconcile_trial_candidate_counters(async_session)
+    assert again.repaired_count == 0
+
+
+@pytest.mark.asyncio
+async def test_enqueue_reconcile_job_is_daily_per_company(async_session):
+    talent_partner = await create_talent_partner(async_session, email="job@test.com")
+    now = datetime(2026, 4, 24, 3, tzinfo=UTC)
+
+    first = await counters_jobs.enqueue_trial_candidate_counters_reconcile_job(
+        async_session, company_id=talent_partner.company_id, now=now, commit=True
+    )
+    second = await counters_jobs.enqueue_trial_candidate_counters_reconcile_job(
+        async_session, company_id=talent_partner.company_id, now=now, commit=True
+    )
+
+    assert first.id == second.id
+    assert first.job_type == counters_jobs.TRIAL_CANDIDATE_COUNTERS_RECONCILE_JOB_TYPE
+    assert first.payload_json == {
+        "companyId": talent_partner.company_id,
+        "batchSize": counters_service.RECONCILE_BATCH_SIZE,
+    }
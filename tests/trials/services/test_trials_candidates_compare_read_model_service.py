@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import select
+
+from app.shared.database.shared_database_models_model import (
+    CandidateCompareSummary,
+    Job,
+)
+from app.shared.jobs.repositories import repository as jobs_repo
+from app.trials.services import (
+    trials_services_trials_candidates_compare_read_model_service as read_model_service,
+)
+from app.trials.services import (
+    trials_services_trials_candidates_compare_summary_service as compare_summary_service,
+)
+from tests.trials.routes.trials_candidates_compare_api_utils import *
+
+
+async def _summaries(
+    async_session, trial_id: int
+) -> dict[int, CandidateCompareSummary]:
+    rows = (
+        await async_session.execute(
+            select(CandidateCompareSummary)
+            .where(CandidateCompareSummary.trial_id == trial_id)
+            .execution_options(populate_existing=True)
+        )
+    ).scalars()
+    return {row.candidate_session_id: row for row in rows}
+
+
+@pytest.mark.asyncio
+async def test_read_model_matches_live_compare_summary(async_session):
+    (
+        talent_partner,
+        trial,
+        candidate_a,
+        candidate_b,
+        candidate_c,
+    ) = await _seed_compare_candidates_scenario(async_session)
+    access = AsyncMock(return_value=SimpleNamespace(trial_id=trial.id))
+
+    live = await compare_summary_service.list_candidates_compare_summary(
+        async_session, trial_id=trial.id, user=talent_partner, require_access=access
+    )
+    stored = await read_model_service.list_candidates_compare_summary_from_read_model(
+        async_session, trial_id=trial.id, user=talent_partner, require_access=access
+    )
+
+    assert stored == live
+    assert [row["candidateSessionId"] for row in stored["candidates"]] == [
+        candidate_c.id
+    ]
+    summaries = await _summaries(async_session, trial.id)
+    assert set(summaries) == {candidate_a.id, candidate_b.id, candidate_c.id}
+    assert summaries[candidate_a.id].winoe_report_status == "none"
+    assert summaries[candidate_b.id].winoe_report_status == "generating"
+    assert summaries[candidate_b.id].day_completion["1"] is True
+
+
+@pytest.mark.asyncio
+async def test_core_job_status_changes_refresh_the_read_model(async_session):
+    _tp, trial, _a, candidate_b, _c = await _seed_compare_candidates_scenario(
+        async_session
+    )
+    job = (
+        await async_session.execute(
+            select(Job).where(Job.candidate_session_id == candidate_b.id)
+        )
+    ).scalar_one()
+
+    await jobs_repo.mark_dead_letter(
+        async_session, job_id=job.id, error_str="boom", now=datetime.now(UTC)
+    )
+
+    summaries = await _summaries(async_session, trial.id)
+    assert summaries[candidate_b.id].winoe_report_status == "none"
+
+
+@pytest.mark.asyncio
+async def test_core_job_requeue_refreshes_the_read_model(async_session):
+    _tp, trial, _a, candidate_b, _c = await _seed_compare_candidates_scenario(
+        async_session
+    )
+    job = (
+        await async_session.execute(
+            select(Job).where(Job.candidate_session_id == candidate_b.id)
+        )
+    ).scalar_one()
+    await async_session.execute(
+        CandidateCompareSummary.__table__.delete().where(
+            CandidateCompareSummary.candidate_session_id == candidate_b.id
+        )
+    )
+    await async_session.commit()
+
+    now = datetime.now(UTC)
+    await jobs_repo.requeue_nonterminal_idempotent_job(
+        async_session,
+        company_id=job.company_id,
+        job_type=job.job_type,
+        idempotency_key=job.idempotency_key,
+        next_run_at=now,
+        now=now,
+    )
+
+    summaries = await _summaries(async_session, trial.id)
+    assert summaries[candidate_b.id].winoe_report_status == "generating"
+
+
+@pytest.mark.asyncio
+async def test_core_bulk_job_insert_refreshes_the_read_model(async_session):
+    _tp, trial, candidate_a, _b, _c = await _seed_compare_candidates_scenario(
+        async_session
+    )
+
+    await jobs_repo.create_or_update_many_idempotent(
+        async_session,
+        company_id=trial.company_id,
+        jobs=[
+            jobs_repo.IdempotentJobSpec(
+                job_type="evaluation_run",
+                idempotency_key=f"evaluation_run:{candidate_a.id}:bulk",
+                payload_json={"candidateSessionId": candidate_a.id},
+                candidate_session_id=candidate_a.id,
+            )
+        ],
+    )
+
+    summaries = await _summaries(async_session, trial.id)
+    assert summaries[candidate_a.id].winoe_report_status == "generating"
+
+
+@pytest.mark.asyncio
+async def test_rebuild_and_rollback_keep_the_read_model_consistent(async_session):
+    _tp, trial, candidate_a, _b, _c = await _seed_compare_candidates_scenario(
+        async_session
+    )
+    trial_id, candidate_a_id = trial.id, candidate_a.id
+    await async_session.execute(
+        CandidateCompareSummary.__table__.delete().where(
+            CandidateCompareSummary.trial_id == trial_id
+        )
+    )
+    await async_session.commit()
+    assert await _summaries(async_session, trial_id) == {}
+
+    assert (
+        await read_model_service.rebuild_trial_compare_summaries(
+            async_session, [trial_id]
+        )
+        == 3
+    )
+    await async_session.commit()
+    assert len(await _summaries(async_session, trial_id)) == 3
+
+    await _create_ready_compare_run(
+        async_session, candidate_session=candidate_a, overall_winoe_score=0.5
+    )
+    await async_session.flush()
+    assert (await _summaries(async_session, trial_id))[
+        candidate_a_id
+    ].winoe_report_status == "ready"
+    await async_session.rollback()
+    assert (await _summaries(async_session, trial_id))[
+        candidate_a_id
+    ].winoe_report_status == "none"
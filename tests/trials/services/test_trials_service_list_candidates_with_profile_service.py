@@ -17,3 +17,35 @@ async def test_list_candidates_with_profile(async_session):
     )
     rows = await trial_service.list_candidates_with_profile(async_session, sim.id)
     assert rows and rows[0][0].id == cs.id
+
+
+@pytest.mark.asyncio
+async def test_stream_candidates_with_profile_yields_batches(async_session):
+    talent_partner = await create_talent_partner(async_session, email="stream@test.com")
+    sim, _ = await create_trial(async_session, created_by=talent_partner)
+    created = []
+    for index in range(3):
+        cs, _created = await trial_service.create_invite(
+            async_session,
+            trial_id=sim.id,
+            payload=type(
+                "P",
+                (),
+                {"candidateName": "a", "inviteEmail": f"s{index}@example.com"},
+            ),
+            scenario_version_id=sim.active_scenario_version_id,
+        )
+        created.append(cs.id)
+
+    batches = [
+        [cs.id for cs, _ in batch]
+        async for batch in trial_service.stream_candidates_with_profile(
+            async_session, sim.id, batch_size=2
+        )
+    ]
+    assert batches == [sorted(created, reverse=True)[:2], [min(created)]]
+
+    page = await trial_service.list_candidates_with_profile(
+        async_session, sim.id, after_id=max(created), limit=1
+    )
+    assert [cs.id for cs, _ in page] == [sorted(created, reverse=True)[1]]